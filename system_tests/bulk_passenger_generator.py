@@ -0,0 +1,196 @@
+"""
+High-throughput generator of realistic passenger import payloads (10k to 1M+ passengers).
+
+`StormxSystemVerification._generate_bulk_passenger_payload()` used to deep copy the passenger
+template and make four Faker calls per passenger, which made the harness, not StormX, the
+bottleneck of payload-size tests. `BulkPassengerGenerator` keeps the same population shape:
+
+* 80% adults, 10% young adults, 10% children.
+* one big group (5% of the passengers, all adults) sharing a pax_record_locator, half of it under
+  a second pax_record_locator_group.
+* the other adults in groups of 1 to 3, young adults and children spread over all groups at random.
+* a fifth of the small groups are families (same last name).
+* about 1% of the passengers are handicapped, one has a service pet.
+
+but draws names, phone numbers and emails from pools precomputed once per generator, decides the
+group layout up front in compact arrays, and yields the passengers one at a time (`generate()`)
+or in import sized batches (`generate_batches()`), so memory stays flat whatever the size.
+
+    generator = BulkPassengerGenerator(PASSENGER_TEMPLATE[0], fake=faker.Faker())
+    for passengers in generator.generate_batches(100000, batch_size=1000):
+        airline_client.import_passengers(passengers)
+"""
+from array import array
+import copy
+import itertools
+import random
+import string
+
+POOL_SIZE_BITS = 10  # name, email and phone prefix pools of 1024 entries, indexed by `getrandbits()`.
+POOL_SIZE = 1 << POOL_SIZE_BITS
+PHONE_SUFFIX_BITS = 23  # 7 digit phone number suffixes.
+
+ADULT_RATIO = 0.80
+YOUNG_ADULT_RATIO = 0.10
+BIG_GROUP_RATIO = 0.05
+HANDICAP_RATIO = 0.01
+FAMILY_RATIO = 0.2
+MIN_SMALL_GROUP_SIZE = 1
+MAX_SMALL_GROUP_SIZE = 3
+
+LOCATOR_LENGTH = 6
+_LOCATOR_CHARACTERS = string.ascii_uppercase + string.digits
+LOCATOR_SPACE = len(_LOCATOR_CHARACTERS) ** LOCATOR_LENGTH
+LOCATOR_SEQUENCE_LENGTH = 1 << 24
+_GENERATED_FIELDS = ('phone_numbers', 'emails')
+
+
+class BulkPassengerGenerator(object):
+
+    def __init__(self, template, fake=None, rng=None, generate_context_id=None, generate_pax_record_locator=None,
+                 generate_pax_record_locator_group=None):
+        """
+        :param template: dict - passenger template, e.g. `PASSENGER_TEMPLATE[0]`.
+        :param fake: faker.Faker or None - used once, to fill the name/email pools (placeholder pools when None).
+        :param rng: random.Random or None - source of every random choice (defaults to `fake.random`,
+                    or an unseeded random.Random).
+        :param generate_context_id: callable() -> string, or None for a uuid4 like id from `rng`.
+        :param generate_pax_record_locator: callable() -> string, or None for a unique 6 character locator.
+        :param generate_pax_record_locator_group: callable() -> string, or None for a unique 6 character locator.
+        """
+        self._rng = rng or (fake.random if fake is not None else random.Random())
+        self._generate_context_id = generate_context_id or self._random_context_id
+        self._generate_pax_record_locator = generate_pax_record_locator or self._next_locator
+        self._generate_pax_record_locator_group = generate_pax_record_locator_group or self._next_locator
+        # default locators count up from a random start: unique within the generator, and cheap.
+        self._locator_sequence = itertools.count(self._rng.randrange(LOCATOR_SPACE - LOCATOR_SEQUENCE_LENGTH))
+
+        # nested values (e.g. 'meals') are copied one level deep per passenger, much cheaper than `copy.deepcopy()`.
+        self._template = copy.deepcopy(template)
+        self._nested_template_items = [(key, value) for key, value in self._template.items()
+                                       if isinstance(value, (list, dict)) and key not in _GENERATED_FIELDS]
+
+        if fake is not None:
+            self._first_names = [fake.first_name() for i in range(POOL_SIZE)]
+            self._last_names = [fake.last_name() for i in range(POOL_SIZE)]
+            self._email_user_names = [fake.user_name() for i in range(POOL_SIZE)]
+            self._phone_prefixes = [fake.msisdn()[:6] for i in range(POOL_SIZE)]
+        else:
+            self._first_names = ['First' + str(i) for i in range(POOL_SIZE)]
+            self._last_names = ['Last' + str(i) for i in range(POOL_SIZE)]
+            self._email_user_names = ['passenger' + str(i) for i in range(POOL_SIZE)]
+            self._phone_prefixes = [str(self._rng.randrange(100000, 1000000)) for i in range(POOL_SIZE)]
+
+    def _random_context_id(self):
+        return '%032x' % self._rng.getrandbits(128)
+
+    def _next_locator(self):
+        number = next(self._locator_sequence)
+        characters = []
+        for i in range(LOCATOR_LENGTH):
+            number, digit = divmod(number, len(_LOCATOR_CHARACTERS))
+            characters.append(_LOCATOR_CHARACTERS[digit])
+        return ''.join(characters)
+
+    def _layout(self, size):
+        """
+        decide the group structure of `size` passengers.
+        :return: (big group size, array of adult counts per small group, array of dependent counts per group
+                 (index 0 is the big group), young adult count, child count)
+        """
+        rng = self._rng
+        adult_count = int(ADULT_RATIO * size)
+        young_adult_count = int((ADULT_RATIO + YOUNG_ADULT_RATIO) * size) - adult_count
+        child_count = size - adult_count - young_adult_count
+        big_group_size = int(BIG_GROUP_RATIO * size)
+
+        small_group_adult_counts = array('B')
+        remaining_adult_count = adult_count - big_group_size
+        while remaining_adult_count > 0:
+            group_adult_count = min(rng.randint(MIN_SMALL_GROUP_SIZE, MAX_SMALL_GROUP_SIZE), remaining_adult_count)
+            small_group_adult_counts.append(group_adult_count)
+            remaining_adult_count -= group_adult_count
+
+        group_count = len(small_group_adult_counts) + 1
+        dependent_counts = array('I', bytes(4 * group_count))
+        first_group_with_adults = 0 if big_group_size or group_count == 1 else 1
+        randrange = rng.randrange
+        for i in range(young_adult_count + child_count):
+            dependent_counts[randrange(first_group_with_adults, group_count)] += 1
+        return big_group_size, small_group_adult_counts, dependent_counts, young_adult_count, child_count
+
+    def _new_passenger(self, index, life_stage, last_name=None):
+        getrandbits = self._rng.getrandbits
+        passenger = dict(self._template)
+        for key, value in self._nested_template_items:
+            passenger[key] = dict(value) if isinstance(value, dict) else [
+                dict(item) if isinstance(item, dict) else item for item in value]
+        passenger['first_name'] = self._first_names[getrandbits(POOL_SIZE_BITS)]
+        passenger['last_name'] = last_name or self._last_names[getrandbits(POOL_SIZE_BITS)]
+        passenger['phone_numbers'] = [
+            self._phone_prefixes[getrandbits(POOL_SIZE_BITS)] + '%07d' % getrandbits(PHONE_SUFFIX_BITS)]
+        passenger['emails'] = ['%s.%d@x.blackhole' % (self._email_user_names[getrandbits(POOL_SIZE_BITS)], index)]
+        passenger['life_stage'] = life_stage
+        return passenger
+
+    def generate(self, size):
+        """
+        :param size: int - number of passengers.
+        :return: generator of passenger dicts, group after group (the big group first).
+        """
+        rng = self._rng
+        big_group_size, small_group_adult_counts, dependent_counts, young_adult_count, child_count = self._layout(size)
+        handicapped_indexes = set(rng.sample(range(size), int(HANDICAP_RATIO * size))) if size else set()
+        service_pet_index = rng.randrange(size) if size else None
+        small_group_count = len(small_group_adult_counts)
+        family_indexes = set(rng.sample(range(small_group_count), int(small_group_count * FAMILY_RATIO)))
+
+        remaining_young_adult_count, remaining_child_count = young_adult_count, child_count
+        index = 0
+        for group_index in range(small_group_count + 1):
+            if group_index == 0:
+                adult_count = big_group_size
+                split_group_size = big_group_size // 2
+            else:
+                adult_count = small_group_adult_counts[group_index - 1]
+                split_group_size = 0
+            pax_record_locator = self._generate_pax_record_locator()
+            pax_record_locator_group = self._generate_pax_record_locator_group()
+            split_pax_record_locator_group = self._generate_pax_record_locator_group() if split_group_size else None
+            family_name = self._last_names[rng.getrandbits(POOL_SIZE_BITS)] if (group_index - 1) in family_indexes else None
+
+            for member_index in range(adult_count + dependent_counts[group_index]):
+                if member_index < adult_count:
+                    life_stage = 'adult'
+                elif rng.random() * (remaining_young_adult_count + remaining_child_count) < remaining_young_adult_count:
+                    life_stage = 'young_adult'
+                    remaining_young_adult_count -= 1
+                else:
+                    life_stage = 'child'
+                    remaining_child_count -= 1
+                passenger = self._new_passenger(index, life_stage, family_name)
+                passenger['context_id'] = self._generate_context_id()
+                passenger['pax_record_locator'] = pax_record_locator
+                passenger['pax_record_locator_group'] = (
+                    split_pax_record_locator_group if member_index < split_group_size else pax_record_locator_group)
+                if index in handicapped_indexes:
+                    passenger['handicap'] = True
+                if index == service_pet_index:
+                    passenger['service_pet'] = True
+                index += 1
+                yield passenger
+
+    def generate_batches(self, size, batch_size):
+        """
+        :param size: int - total number of passengers.
+        :param batch_size: int - passengers per batch (groups may span two batches).
+        :return: generator of lists of passenger dicts.
+        """
+        batch = []
+        for passenger in self.generate(size):
+            batch.append(passenger)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -0,0 +1,74 @@
+#! /usr/bin/env python3
+"""
+Flag the latency regressions of a revision against the history kept by `--performance-db`
+(see `performance_history.py`).
+
+    ./compare_performance.py <environment> [--kind system_tests|load] [--revision REV] [--baseline REV]
+                             [--baseline-runs N] [--alpha P] [--min-ratio R] [--min-samples N]
+                             [--performance-db PATH] [--all]
+
+* `--kind` 'system_tests' (`run_system_tests.py` runs, default) or 'load' (`run_load_tests.py` runs).
+* `--revision REV` revision under test, all of its runs are pooled
+  (default `$STORMX_REVISION`, `$STORMX_BUILD` or the git revision).
+* `--baseline REV` revision to compare with, all of its runs are pooled
+  (default: the latest `--baseline-runs N` runs of any other revision, default 5).
+* `--alpha P` significance level of the one-sided Mann-Whitney U test (default 0.01).
+* `--min-ratio R` a regression must also grow the median by this factor (default 1.1).
+* `--min-samples N` metrics with fewer samples on either side are never flagged (default 3).
+* `--performance-db PATH` default `$STORMX_PERFORMANCE_DB` or `system_tests/system_test_performance.sqlite3`.
+* `--all` list every compared metric, not only the regressions.
+
+Exits with status 1 if any metric regressed, 2 if there is nothing to compare.
+"""
+import sys
+
+from parallel_test_runner import pop_command_line_option
+from performance_history import (
+    DEFAULT_ALPHA,
+    DEFAULT_BASELINE_RUN_COUNT,
+    DEFAULT_MIN_RATIO,
+    DEFAULT_MIN_SAMPLES,
+    DEFAULT_PERFORMANCE_DB_PATH,
+    SYSTEM_TESTS_KIND,
+    PerformanceHistory,
+    current_revision,
+    format_comparisons,
+)
+
+
+if __name__ == '__main__':
+    kind = pop_command_line_option(sys.argv, '--kind') or SYSTEM_TESTS_KIND
+    revision = pop_command_line_option(sys.argv, '--revision') or current_revision()
+    baseline_revision = pop_command_line_option(sys.argv, '--baseline')
+    baseline_run_count = int(pop_command_line_option(sys.argv, '--baseline-runs') or DEFAULT_BASELINE_RUN_COUNT)
+    alpha = float(pop_command_line_option(sys.argv, '--alpha') or DEFAULT_ALPHA)
+    min_ratio = float(pop_command_line_option(sys.argv, '--min-ratio') or DEFAULT_MIN_RATIO)
+    min_samples = int(pop_command_line_option(sys.argv, '--min-samples') or DEFAULT_MIN_SAMPLES)
+    performance_db_path = pop_command_line_option(sys.argv, '--performance-db') or DEFAULT_PERFORMANCE_DB_PATH
+    list_all = '--all' in sys.argv
+    if list_all:
+        sys.argv.remove('--all')
+
+    if len(sys.argv) < 2:
+        print('ERROR: must provide environment name.')
+        sys.exit(2)
+    environment_name = sys.argv[1]
+
+    performance_history = PerformanceHistory(performance_db_path)
+    comparisons = performance_history.compare_revisions(
+        environment_name, kind, revision, baseline_revision=baseline_revision, baseline_run_count=baseline_run_count,
+        alpha=alpha, min_ratio=min_ratio, min_samples=min_samples)
+    performance_history.close()
+    if not comparisons:
+        print('nothing to compare: no {0} runs of {1} in {2} for revision {3} and its baseline.'.format(
+            kind, environment_name, performance_db_path, revision))
+        sys.exit(2)
+
+    regressions = [comparison for comparison in comparisons if comparison.regression]
+    print('{0} {1}: revision {2} against {3}'.format(
+        environment_name, kind, revision, baseline_revision or 'the latest {0} runs'.format(baseline_run_count)))
+    if regressions or list_all:
+        print(format_comparisons(comparisons, regressions_only=not list_all))
+    print('{0} of {1} metrics regressed (p < {2:g}, median x{3:g} or more).'.format(
+        len(regressions), len(comparisons), alpha, min_ratio))
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,99 @@
+"""
+Per-test wall clock durations of previous system test runs, stored in a small JSON file.
+
+`parallel_test_runner.py` records the duration of every test it runs and uses the history to
+balance test classes over workers and shards (longest processing time first), so that a
+class full of `sleep(120)` calls does not end up on the same worker as everything else.
+
+Besides the tests, the history keeps the time of every test class spent outside of its tests
+(`setUpClass`, `tearDownClass`: sanity check, logins, warm up...) under '<test class id>.setUpClass'.
+
+NOTE: `--shard i/n` is only deterministic between CI boxes if every box reads the same
+      history file (e.g. commit it, or pass it around as a build artifact).
+"""
+import json
+import os
+import tempfile
+
+# next to this module whatever the working directory, so every run of a checkout shares the same history.
+DEFAULT_DURATIONS_FILE_PATH = os.getenv('STORMX_TEST_DURATIONS_FILE', os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'system_test_durations.json'))
+
+# weight of the newest measurement in the exponential moving average of a test's duration.
+SMOOTHING_FACTOR = 0.5
+
+# estimate for tests that never ran before, when there is no history at all.
+DEFAULT_UNKNOWN_TEST_DURATION = 5.0
+
+CLASS_SETUP_SUFFIX = '.setUpClass'
+
+
+def class_setup_id(class_id):
+    """
+    :param class_id: string like 'verify_api_ping.TestApiPing'
+    :return: string - the history key of the class setup time of the test class.
+    """
+    return class_id + CLASS_SETUP_SUFFIX
+
+
+class DurationHistory(object):
+
+    def __init__(self, file_path=DEFAULT_DURATIONS_FILE_PATH):
+        """
+        :param file_path: string
+        """
+        self.file_path = file_path
+        self._durations = {}  # test id -> seconds
+        if file_path and os.path.exists(file_path):
+            with open(file_path) as durations_file:
+                try:
+                    self._durations = json.load(durations_file)
+                except ValueError:
+                    self._durations = {}
+
+    def __len__(self):
+        return len(self._durations)
+
+    def get(self, test_id):
+        """
+        :param test_id: string like 'verify_api_ping.TestApiPing.test_ping__airlines_have_access'
+        :return: float seconds, or None if the test never ran.
+        """
+        return self._durations.get(test_id)
+
+    def default_duration(self):
+        """
+        :return: float - median of the known test durations, used as the estimate of unknown tests.
+        """
+        durations = sorted(duration for test_id, duration in self._durations.items()
+                           if not test_id.endswith(CLASS_SETUP_SUFFIX))
+        if not durations:
+            return DEFAULT_UNKNOWN_TEST_DURATION
+        return durations[len(durations) // 2]
+
+    def estimate(self, test_ids):
+        """
+        :param test_ids: list(string) - test ids, and `class_setup_id()`s (unknown ones count as 0).
+        :return: float - expected total seconds to run the tests.
+        """
+        default_duration = self.default_duration()
+        return sum(self._durations.get(test_id, 0.0 if test_id.endswith(CLASS_SETUP_SUFFIX) else default_duration)
+                   for test_id in test_ids)
+
+    def record(self, test_id, duration):
+        """
+        :param test_id: string
+        :param duration: float seconds
+        """
+        previous_duration = self._durations.get(test_id)
+        if previous_duration is None:
+            self._durations[test_id] = duration
+        else:
+            self._durations[test_id] = SMOOTHING_FACTOR * duration + (1 - SMOOTHING_FACTOR) * previous_duration
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'w') as durations_file:
+            json.dump(self._durations, durations_file, sort_keys=True, indent=1)
+        os.replace(temporary_path, self.file_path)
@@ -1,7 +1,62 @@
+from collections import namedtuple
+
 import requests
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver import ActionChains
 from e2e_selenium_tests.BaseClasses.constant import STORMX_URL, MAX_EXPLICIT_WAIT
+from login_cookie_cache import login_cookie_cache
+
+# browser sessions are cached apart from the framework's own API sessions (`login_to_stormx_cached()`): logging
+# the browser out must never end the session the framework helpers keep using.
+UI_SESSION_KEY_PREFIX = 'ui:'
+
+# the state of the page rendered in the browser, see `BasePage.get_page_state()`.
+PageState = namedtuple('PageState', ['url', 'title', 'ready_state', 'markers', 'embedded_json', 'html'])
+# a listing read by `BasePage.get_table()`: header texts and, for every row, its cell texts.
+Table = namedtuple('Table', ['headers', 'rows'])
+
+_PAGE_STATE_SCRIPT = """
+var markerSelectors = arguments[0], jsonSelectors = arguments[1];
+var markers = {}, embeddedJson = {};
+for (var i = 0; i < markerSelectors.length; i++) {
+    markers[markerSelectors[i]] = document.querySelector(markerSelectors[i]) !== null;
+}
+for (var j = 0; j < jsonSelectors.length; j++) {
+    var element = document.querySelector(jsonSelectors[j]);
+    try { embeddedJson[jsonSelectors[j]] = element ? JSON.parse(element.textContent) : null; }
+    catch (error) { embeddedJson[jsonSelectors[j]] = null; }
+}
+return {url: window.location.href, title: document.title, ready_state: document.readyState, markers: markers,
+        embedded_json: embeddedJson, html: document.documentElement.outerHTML};
+"""
+
+# `arguments`: row locator, cell css selector (or null), header locator (or null), locators are XPath (bool).
+# texts are like WebElement.text: one line per block, cells of a table row and runs of blanks as one space.
+_TABLE_SCRIPT = """
+var rowLocator = arguments[0], cellSelector = arguments[1], headerLocator = arguments[2], xpath = arguments[3];
+function find(locator) {
+    if (!xpath) { return Array.prototype.slice.call(document.querySelectorAll(locator)); }
+    var found = document.evaluate(locator, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var elements = [];
+    for (var i = 0; i < found.snapshotLength; i++) { elements.push(found.snapshotItem(i)); }
+    return elements;
+}
+function text(element) {
+    // like WebElement.text: '' for an element that is not rendered (display:none, ng-hide), options are shown
+    // with their select.
+    if ((element.closest('select') || element).getClientRects().length === 0) { return ''; }
+    return (element.innerText || '').replace(/[ \\t\\u00a0]+/g, ' ').split('\\n')
+        .map(function (line) { return line.trim(); })
+        .filter(function (line) { return line.length > 0; }).join('\\n');
+}
+var rows = find(rowLocator).map(function (row) {
+    if (!cellSelector) { return [text(row)]; }
+    return Array.prototype.slice.call(row.querySelectorAll(cellSelector)).map(text);
+});
+return {headers: headerLocator ? find(headerLocator).map(text) : [], rows: rows};
+"""
 
 
 class BasePage(object):
@@ -10,6 +65,16 @@ class BasePage(object):
         self.wait = WebDriverWait(driver, MAX_EXPLICIT_WAIT)
         self.actions = ActionChains(self.driver)
 
+    def forget_session(self):
+        """
+        drop the cached session the browser is logged in with (see `TestBaseClass.session_login()`), once it
+        logged out.
+        """
+        session = getattr(self.driver, 'stormx_session', None)
+        if session is not None:
+            login_cookie_cache.invalidate(*session)
+            self.driver.stormx_session = None
+
     def request(self):
         request = requests.Session()
         cookies = self.driver.get_cookies()
@@ -17,16 +82,91 @@ class BasePage(object):
             request.cookies.set(cookie['name'], cookie['value'])
         return request
 
-    def get_page_html_source(self):
-        """It will get the page response to verify that either it is the desired page or not.
+    def get_page_state(self, markers=(), embedded_json=()):
+        """
+        read the page already rendered in the browser, in a single script call (no HTTP request).
+        the page is read as it is, without waiting: see `has_title()` and `has_marker()` to wait for it.
+        :param markers: iterable of css selectors, `PageState.markers[selector]` is True if it matches an element.
+        :param embedded_json: iterable of css selectors of elements holding JSON, like
+                              'script[type="application/json"]', `PageState.embedded_json[selector]` is the parsed
+                              JSON (None if there is no such element or it is not JSON).
+        :return: PageState
+        """
+        state = self.driver.execute_script(_PAGE_STATE_SCRIPT, list(markers), list(embedded_json))
+        return PageState(**state)
+
+    def has_title(self, text):
+        """
+        :param text: string
+        :return: bool - the page title contains `text`, within `MAX_EXPLICIT_WAIT` seconds.
+        """
+        try:
+            self.wait.until(EC.title_contains(text))
+            return True
+        except TimeoutException:
+            return False
+
+    def has_marker(self, marker):
+        """
+        :param marker: string - css selector of an element the page has once loaded.
+        :return: bool - the page has such an element, within `MAX_EXPLICIT_WAIT` seconds.
+        """
+        try:
+            self.wait.until(lambda driver: self.get_page_state(markers=[marker]).markers[marker])
+            return True
+        except TimeoutException:
+            return False
+
+    def get_page_html_source(self, refetch=False):
+        """It will get the page source to verify that either it is the desired page or not.
+        :param refetch: bool - download the current URL again with the browser's cookies, to get the server's
+                        response as sent (before any script ran), instead of the page rendered in the browser.
         :return: string
         """
+        if not refetch:
+            return self.get_page_state().html
         current_url = self.driver.current_url
         resp = self.request().get(current_url)
         html_source = resp.content
         encode_html_source = str(html_source, encoding='utf8')
         return encode_html_source
 
+    def get_table(self, row_locator, cell_selector=None, header_locator=None, xpath=False, wait=False):
+        """
+        read a whole listing (a table or a grid of divs) in a single script call, instead of one WebDriver
+        request per cell.
+        :param row_locator: string - css selector (or XPath) of the rows.
+        :param cell_selector: string - css selector of the cells, within a row. None reads every row as one cell.
+        :param header_locator: string - css selector (or XPath) of the header cells, None for no headers.
+        :param xpath: bool - `row_locator` and `header_locator` are XPath expressions.
+        :param wait: bool - read the listing again until it has a row, up to `MAX_EXPLICIT_WAIT` seconds (like
+                     `find_elements` under an implicit wait: an empty listing is returned when none came).
+        :return: Table
+        """
+        def read_table(driver):
+            return driver.execute_script(_TABLE_SCRIPT, row_locator, cell_selector, header_locator, xpath)
+
+        def read_table_with_rows(driver):
+            table = read_table(driver)
+            return table if table['rows'] else None
+
+        table = read_table(self.driver)
+        if wait and not table['rows']:
+            try:
+                table = self.wait.until(read_table_with_rows)
+            except TimeoutException:
+                pass
+        return Table(table['headers'], table['rows'])
+
+    def get_texts(self, locator, xpath=False, wait=False):
+        """
+        :param locator: string - css selector (or XPath).
+        :param xpath: bool
+        :param wait: bool - see `get_table()`.
+        :return: list(string) - the text of every element matching `locator`, read in a single script call.
+        """
+        return [row[0] for row in self.get_table(locator, xpath=xpath, wait=wait).rows]
+
     def get_hotel_inventory(self, port_id, airline_id):
         """
         :param port_id: int
@@ -0,0 +1,205 @@
+"""
+Pool of warm Chrome instances, leased by `TestBaseClass` for every test.
+
+Launching Chrome takes seconds, resetting one takes milliseconds. When a test is done its browser is
+reset (extra windows closed, alert dismissed, cookies and web storage cleared, timeouts and window size
+set back to the ones of a new browser, 'about:blank' loaded) and kept for the next test. A browser that
+crashed, or that cannot be reset, is quit and replaced by a new one on the next lease.
+
+`STORMX_BROWSER_POOL_SIZE` is the number of idle browsers kept (default 1, one per test process is enough
+for serial runs). 0 launches a new browser for every test, like before the pool.
+
+Parallel runs (`run_selenium_tests.py --workers N`) use one process per browser: every worker process
+is set up by `initialize_browser_worker()`, with its own download directory and a headless browser
+(whatever the headless argument), and quits its browser when it exits. `default_browser_worker_count()`
+sizes the workers after the CPU cores and the available memory.
+"""
+import atexit
+import multiprocessing.util
+import os
+import threading
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from e2e_selenium_tests.BaseClasses.constant import RUN_TESTS_HEADLESS, STORMX_URL
+
+BROWSER_POOL_SIZE = int(os.getenv('STORMX_BROWSER_POOL_SIZE', '1'))
+BROWSER_DOWNLOAD_DIRECTORY_VARIABLE = 'STORMX_BROWSER_DOWNLOAD_DIR'
+BROWSER_HEADLESS_VARIABLE = 'STORMX_BROWSER_HEADLESS'  # '1' runs the browsers headless, e.g. in browser workers.
+BROWSER_WORKER_MEMORY_IN_BYTES = 1024 ** 3  # a headless Chrome, its driver and the test process.
+_CLEAR_WEB_STORAGE_SCRIPT = 'try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (error) {}'
+# timeouts and window size of a new browser, restored by `BrowserPool._reset()` (tests change the implicit wait).
+DEFAULT_PAGE_LOAD_TIMEOUT_IN_SECONDS = 300
+DEFAULT_SCRIPT_TIMEOUT_IN_SECONDS = 30
+WINDOW_SIZE = (1920, 1080)
+
+
+def create_chrome_browser():
+    """
+    :return: webdriver.Chrome
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--window-size={0},{1}".format(*WINDOW_SIZE))
+    options.add_argument("--start-maximized")
+    if RUN_TESTS_HEADLESS or os.getenv(BROWSER_HEADLESS_VARIABLE) == '1':
+        options.add_argument("--headless")
+    download_directory = os.getenv(BROWSER_DOWNLOAD_DIRECTORY_VARIABLE)
+    if download_directory:
+        options.add_experimental_option('prefs', {'download.default_directory': download_directory,
+                                                  'download.prompt_for_download': False})
+    browser = webdriver.Chrome(options=options)
+    browser.maximize_window()
+    return browser
+
+
+def _origin(url):
+    """
+    :return: string like 'https://stagingui.tvlinc.com'.
+    """
+    split_url = urlsplit(url)
+    return split_url.scheme + '://' + split_url.netloc
+
+
+def _quit(browser):
+    try:
+        browser.quit()
+    except Exception:  # the browser (or its driver) is already gone.
+        pass
+
+
+class BrowserPool(object):
+
+    def __init__(self, create_browser=create_chrome_browser, size=BROWSER_POOL_SIZE):
+        """
+        :param create_browser: callable() returning a new WebDriver.
+        :param size: int - maximum number of idle browsers kept, 0 to quit every browser when it is released.
+        """
+        self.create_browser = create_browser
+        self.size = size
+        self._idle_browsers = []
+        self._lock = threading.Lock()
+        self.created_count = 0
+
+    def lease(self):
+        """
+        :return: WebDriver - a reset browser, on 'about:blank'. give it back with `release()`.
+        """
+        while True:
+            with self._lock:
+                browser = self._idle_browsers.pop() if self._idle_browsers else None
+            if browser is None:
+                self.created_count += 1
+                return self.create_browser()
+            if self._is_alive(browser):
+                return browser
+            _quit(browser)
+
+    def release(self, browser):
+        """
+        reset `browser` and keep it for the next lease, or quit it if it cannot be reset or the pool is full.
+        :param browser: WebDriver returned by `lease()`.
+        """
+        if self.size <= 0 or not self._reset(browser):
+            _quit(browser)
+            return
+        with self._lock:
+            if len(self._idle_browsers) < self.size:
+                self._idle_browsers.append(browser)
+                return
+        _quit(browser)
+
+    def close(self):
+        """
+        quit every idle browser.
+        """
+        with self._lock:
+            browsers, self._idle_browsers = self._idle_browsers, []
+        for browser in browsers:
+            _quit(browser)
+
+    @staticmethod
+    def _is_alive(browser):
+        try:
+            return bool(browser.window_handles)
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(browser):
+        """
+        :return: bool - False if the browser crashed or could not be reset.
+        """
+        try:
+            window_handles = browser.window_handles
+            for window_handle in window_handles[1:]:
+                browser.switch_to.window(window_handle)
+                browser.close()
+            browser.switch_to.window(window_handles[0])
+            try:
+                browser.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+            browser.execute_script(_CLEAR_WEB_STORAGE_SCRIPT)  # storage of the page's origin.
+            browser.delete_all_cookies()
+            try:
+                browser.execute_cdp_cmd('Network.clearBrowserCookies', {})  # cookies of the other domains (SSO IdP).
+                # storage of StormX, whichever page is open.
+                browser.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': _origin(STORMX_URL),
+                                                                      'storageTypes': 'local_storage,session_storage'})
+            except (AttributeError, WebDriverException):
+                pass
+            browser.implicitly_wait(0)
+            browser.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT_IN_SECONDS)
+            browser.set_script_timeout(DEFAULT_SCRIPT_TIMEOUT_IN_SECONDS)
+            browser.set_window_size(*WINDOW_SIZE)
+            browser.get('about:blank')
+            return True
+        except WebDriverException:
+            return False
+
+
+browser_pool = BrowserPool()
+atexit.register(browser_pool.close)
+
+
+def _available_memory_in_bytes():
+    """
+    :return: int or None (unknown).
+    """
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def default_browser_worker_count():
+    """
+    :return: int - one browser worker per CPU core, as long as every worker gets `BROWSER_WORKER_MEMORY_IN_BYTES`.
+    """
+    worker_count = os.cpu_count() or 1
+    available_memory = _available_memory_in_bytes()
+    if available_memory is not None:
+        worker_count = min(worker_count, available_memory // BROWSER_WORKER_MEMORY_IN_BYTES)
+    return max(int(worker_count), 1)
+
+
+def initialize_browser_worker(download_root_directory):
+    """
+    `ProcessPoolExecutor` initializer of a browser worker process: its browsers run headless.
+    :param download_root_directory: string - the worker downloads into its own 'worker-<pid>' directory there.
+    """
+    download_directory = os.path.join(download_root_directory, 'worker-{0}'.format(os.getpid()))
+    os.makedirs(download_directory, exist_ok=True)
+    os.environ[BROWSER_DOWNLOAD_DIRECTORY_VARIABLE] = download_directory
+    os.environ[BROWSER_HEADLESS_VARIABLE] = '1'  # N visible Chromes would fight over the screen and the focus.
+    # pool workers do not run `atexit` handlers, multiprocessing finalizers run when they exit.
+    multiprocessing.util.Finalize(None, browser_pool.close, exitpriority=10)
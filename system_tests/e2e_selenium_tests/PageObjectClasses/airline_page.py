@@ -293,8 +293,7 @@ class AirlineMainPage(BasePage):
         return current_url
 
     def get_airline_user_roles(self):
-        roles_list = self.driver.find_elements_by_css_selector('[data-ng-model="data.userNew.role"] option')
-        return [user_role.text for user_role in roles_list]
+        return self.get_texts('[data-ng-model="data.userNew.role"] option', wait=True)
 
     def click_on_users_tab_from_airline_details(self):
         self.driver.find_element_by_css_selector(self.USERS_TAB).click()
@@ -400,8 +399,7 @@ class AirlineMainPage(BasePage):
     def get_serviced_port_list(self):
         self.wait.until(EC.visibility_of_all_elements_located((By.CSS_SELECTOR, self.SERVICED_PORTS_LIST)),
                         "Ports list is not loaded yet.")
-        serviced_ports_list = self.driver.find_elements_by_css_selector(self.SERVICED_PORTS_LIST)
-        return [serviced_port.text for serviced_port in serviced_ports_list]
+        return self.get_texts(self.SERVICED_PORTS_LIST)
 
     def adding_new_blog_message(self):
         self.driver.find_element_by_css_selector(self.NEW_MESSAGE_TEXTAREA).send_keys("Testing Blog Messages!")
@@ -491,6 +489,7 @@ class AirlineMainPage(BasePage):
                 self.driver.find_element_by_css_selector(self.LOGOUT_OTHER_USERS).click()
             else:
                 self.driver.find_element_by_css_selector(self.LOGOUT).click()
+        self.forget_session()
 
     def get_user_creation_error_messages(self):
         """
@@ -29,6 +29,7 @@ class DashBoardMainPage(BasePage):
     REQUESTING_PORT = 'label[for="vnPortRequesting"] '
     SEARCH_VOUCHER_TEXT_FIELD = '[placeholder="type voucher code here e.g 71003, 71002"]'
     TVA_USERS_TAB = 'a[href="users.php"]'
+    AIRLINE_DASHBOARD_METRICS_TABLE = '#metrics-markets-table'
     AIRLINE_DASHBOARD_HEADER_ROWS = '#metrics-markets-table .tablesorter-headerRow th'
     SEARCH_BUTTON_DISABLE = 'button[id="btnSearch"][disabled="disabled"]'
     USER_INFO_DROPDOWN = '.navbar-right>li:nth-of-type(5) >a'
@@ -695,8 +695,7 @@ class HotelMainPage(BasePage):
         return new_user_fields['user_id'], new_user_fields['user_password']
 
     def get_hotel_user_roles(self):
-        roles_list = self.driver.find_elements_by_css_selector('[data-ng-model="data.userNew.role"] option')
-        return [user_role.text for user_role in roles_list]
+        return self.get_texts('[data-ng-model="data.userNew.role"] option', wait=True)
 
     def click_on_save_user_button(self, sso_user_format=False):
         self.driver.find_element_by_css_selector(self.SAVE_NEW_USER_BUTTON).click()
@@ -1254,19 +1253,19 @@ class HotelMainPage(BasePage):
         :return: int
         """
         self.wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, self.SEARCH_BUTTON_DISABLE)))
-        rooms_count = self.driver.find_elements_by_xpath(self.AP_COUNTS % airline_prefix)
+        rooms_count = self.get_texts(self.AP_COUNTS % airline_prefix, xpath=True)
         # self.driver.execute_script("$('tbody tr td [class=\"rate-table\"] tr:contains(\"3K\") td:nth-of-type(2)')")
         # logger.info("Total room avails shown on Hotel listing page: %s", sum([int(room.text) for room in hotel_listing
         # _page_room_count]))
-        return sum([int(self.extract_room_number(room.text)) for room in rooms_count])
+        return sum([int(self.extract_room_number(room)) for room in rooms_count])
 
     def rooms_count_without_airline(self):
         """
         It will return the sum of ROH rooms avails for without airline on hotel listing page.
         :return: int
         """
-        room_count = self.driver.find_elements_by_xpath(self.AP_COUNTS)
-        return sum([int(room.text) for room in room_count])
+        room_count = self.get_texts(self.AP_COUNTS, xpath=True, wait=True)
+        return sum([int(room) for room in room_count])
         # return sum([int(self.extract_room_number(room.text)) for room in room_count])
 
     def rooms_count_of_specific_airline(self, airline_prefix):
@@ -1274,8 +1273,8 @@ class HotelMainPage(BasePage):
         It will get the total ROH room count of specific airline.
         :return: int
         """
-        room_count = self.driver.find_elements_by_xpath(self.AP_COUNT_SPECIFIC_AIRLINE % airline_prefix)
-        return sum([int(room.text) for room in room_count])
+        room_count = self.get_texts(self.AP_COUNT_SPECIFIC_AIRLINE % airline_prefix, xpath=True, wait=True)
+        return sum([int(room) for room in room_count])
         # return sum([int(self.extract_room_number(room.text)) for room in room_count])
 
     def hard_blocks_room_count(self, airline_prefix):
@@ -1283,16 +1282,16 @@ class HotelMainPage(BasePage):
         It will get the total Hard blocks room count of specific airline.
         :return: int
         """
-        room_count = self.driver.find_elements_by_xpath(self.AP_COUNT_HARD_BLOCKS % airline_prefix)
-        return sum([int(room.text) for room in room_count])
+        room_count = self.get_texts(self.AP_COUNT_HARD_BLOCKS % airline_prefix, xpath=True, wait=True)
+        return sum([int(room) for room in room_count])
         # return sum([int(self.extract_room_number(room.text)) for room in room_count])
 
     def extract_room_number(self, room_text):
         return re.search(r'\d+', room_text).group()
 
     def accessibility_room_count_from_hotel_page(self, airline_prefix):
-        room_count = self.driver.find_elements_by_xpath(self.AP_COUNT_FOR_ACCESSIBILITY_ROOM % airline_prefix)
-        return sum([int(room.text) for room in room_count])
+        room_count = self.get_texts(self.AP_COUNT_FOR_ACCESSIBILITY_ROOM % airline_prefix, xpath=True, wait=True)
+        return sum([int(room) for room in room_count])
         # return sum([int(self.extract_room_number(room.text)) for room in room_count])
 
     def click_on_update_button(self):
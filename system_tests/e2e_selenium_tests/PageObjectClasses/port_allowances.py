@@ -107,16 +107,15 @@ class PortAllowances(BasePage):
     def verify_newly_added_allowances_on_allowances_listing(self, port, airline, allowance, total_allowance, date):
         record_found = False
         self.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, self.ALLOWANCES_LISTING_RECORDS)))
-        allowance_listing_records = self.driver.find_elements_by_css_selector(self.ALLOWANCES_LISTING_RECORDS)
+        allowance_listing_records = self.get_texts(self.ALLOWANCES_LISTING_RECORDS)
         compare_string = port + " " + airline + " " + allowance + " " + '+add' + " " + total_allowance + " " + date[0]
         compare_string1 = port + " " + airline + " " + allowance + " " + '+add' + " " + total_allowance + " " + date[1]
         for allowance in allowance_listing_records:
-            self.driver.implicitly_wait(2)
-            if compare_string == allowance.text or compare_string1 == allowance.text:
+            if compare_string == allowance or compare_string1 == allowance:
                 record_found = True
                 break
         # if not record_found:
-        #     print([allowance_records.text for allowance_records in allowance_listing_records],
+        #     print(allowance_listing_records,
         #           [1, compare_string], [2, compare_string1])
         return record_found
 
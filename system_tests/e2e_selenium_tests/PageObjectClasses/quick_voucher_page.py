@@ -11,6 +11,7 @@ from e2e_selenium_tests.BaseClasses.helper import value_selector_for_searchable_
 
 class QuickVoucherMainPage(BasePage):
     VOUCHER_CREATION_DATE_VALUE = ""
+    VOUCHER_EDIT_TEMPLATE = '[ng-include*="template/voucher/edit.html"]'
     HOTEL_NAMES_LIST = 'table.table-condensed tr[title="Click to choose hotel"] td:nth-of-type(1) div:first-of-type'
     HOTEL_TAX_LIST = 'table.table-condensed tr[title="Click to choose hotel"] td:nth-of-type(3) medium'
     HOTEL_HARD_BLOCK_RATES_LIST = 'table.table-condensed tr[title="Click to choose hotel"] td:nth-of-type(3) strong'
@@ -88,6 +88,7 @@ class RoomCountReportMainPage(BasePage):
     HISTORY_DATA = 'table tr[ng-repeat="d in data.history"]:nth-of-type(1)'
     ROOM_COUNT_LISTING_FIELDS_NAME = '.page-listing-results div.grid-div-header div'
     ROOM_COUNT_LISTING_FIELDS_VALUE = '.page-listing-results div.grid-div-data div'
+    ROOM_COUNT_LISTING_ROWS = '.page-listing-results div.grid-div-data'
     COMM_LISTING_RECORDS = '//div[@class="row grid-div-data ng-scope"][div[2][contains(text(), \"{}\")] ' \
                            'and div[5][contains(text(), \"{}\")] and div[4][contains(text(), \"{}\")]]'
     NON_COMM_LISTING_RECORDS = '//div[@class="row grid-div-data ng-scope bg-danger"][div[2][contains(text(), \"{}\")]' \
@@ -185,24 +186,22 @@ class RoomCountReportMainPage(BasePage):
         return int(actual_count)
 
     def calculate_total_issued_count(self):
-        total_issued = self.driver.find_elements_by_xpath(self.ISSUED_TOTAL)
-        return sum([int(issued.text) for issued in total_issued])
+        total_issued = self.get_texts(self.ISSUED_TOTAL, xpath=True, wait=True)
+        return sum([int(issued) for issued in total_issued])
 
     def calculate_total_csa_count(self):
-        total_csa = self.driver.find_elements_by_xpath(self.CSA_TOTAL)
-        return sum([int(csa.text) if csa.text else 0 for csa in total_csa])
+        total_csa = self.get_texts(self.CSA_TOTAL, xpath=True, wait=True)
+        return sum([int(csa) if csa else 0 for csa in total_csa])
 
     def calculate_total_actual_count(self):
-        actual_counts = self.driver.find_elements_by_xpath(self.ACTUAL_COUNT_TOTAL)
-        return sum([int(actual_count.text) if actual_count.text else 0 for actual_count in actual_counts])
+        actual_counts = self.get_texts(self.ACTUAL_COUNT_TOTAL, xpath=True, wait=True)
+        return sum([int(actual_count) if actual_count else 0 for actual_count in actual_counts])
 
     def get_adjust_room_count_fields_name(self):
-        list_of_fields_name = self.driver.find_elements_by_css_selector(self.ADJUST_ROOM_COUNT_MODAL_FIELDS_NAME)
-        return [field_name.text for field_name in list_of_fields_name]
+        return self.get_texts(self.ADJUST_ROOM_COUNT_MODAL_FIELDS_NAME, wait=True)
 
     def get_adjust_room_count_fields_values(self):
-        list_of_fields_value = self.driver.find_elements_by_css_selector(self.ADJUST_ROOM_COUNT_MODAL_FIELDS_VALUES)
-        return [field_value.text for field_value in list_of_fields_value]
+        return self.get_texts(self.ADJUST_ROOM_COUNT_MODAL_FIELDS_VALUES, wait=True)
 
     def get_dictionary_of_input_values(self):
         input_keys = [
@@ -225,16 +224,14 @@ class RoomCountReportMainPage(BasePage):
         return room_count_fields
 
     def get_split_room_count_history_fields_name(self):
-        list_of_fields_name = self.driver.find_elements_by_css_selector(self.ROOM_COUNT_HISTORY_MODAL_FIELDS_NAME)
-        return [field_name.text for field_name in list_of_fields_name]
+        return self.get_texts(self.ROOM_COUNT_HISTORY_MODAL_FIELDS_NAME, wait=True)
 
     def get_split_room_count_history_fields_values(self):
-        list_of_fields_value = self.driver.find_elements_by_css_selector(self.ROOM_COUNT_HISTORY_MODAL_FIELDS_VALUES)
-        return [field_value.text for field_value in list_of_fields_value]
+        return self.get_texts(self.ROOM_COUNT_HISTORY_MODAL_FIELDS_VALUES, wait=True)
 
     def generate_dictionary_of_history_fields(self):
-        history_fields = dict(zip(self.get_split_room_count_history_fields_name(),
-                                  self.get_split_room_count_history_fields_values()))
+        history = self.get_table(self.HISTORY_DATA, 'td', self.ROOM_COUNT_HISTORY_MODAL_FIELDS_NAME, wait=True)
+        history_fields = dict(zip(history.headers, history.rows[0] if history.rows else []))
         return history_fields
 
     def compare_room_count_and_history_data(self, split_room_count, history):
@@ -246,16 +243,14 @@ class RoomCountReportMainPage(BasePage):
                 print("Unmatched data.")
 
     def get_room_count_listing_fields_name(self):
-        list_of_fields_name = self.driver.find_elements_by_css_selector(self.ROOM_COUNT_LISTING_FIELDS_NAME)
-        return [field_value.text for field_value in list_of_fields_name]
+        return self.get_texts(self.ROOM_COUNT_LISTING_FIELDS_NAME, wait=True)
 
     def get_room_count_listing_fields_value(self):
-        list_of_fields_value = self.driver.find_elements_by_css_selector(self.ROOM_COUNT_LISTING_FIELDS_VALUE)
-        return [field_value.text for field_value in list_of_fields_value]
+        return self.get_texts(self.ROOM_COUNT_LISTING_FIELDS_VALUE, wait=True)
 
     def generate_dictionary_of_room_count_listing_fields(self):
-        room_count_listing_fields = dict(zip(self.get_room_count_listing_fields_name(),
-                                         self.get_room_count_listing_fields_value()))
+        listing = self.get_table(self.ROOM_COUNT_LISTING_ROWS, 'div', self.ROOM_COUNT_LISTING_FIELDS_NAME, wait=True)
+        room_count_listing_fields = dict(zip(listing.headers, listing.rows[0] if listing.rows else []))
         return room_count_listing_fields
 
     def verify_newly_added_room_count_on_room_count_listing(self, date, port, airline, hotel, rate, issued, cb_count="0"
@@ -270,20 +265,17 @@ class RoomCountReportMainPage(BasePage):
             self.wait.until(EC.visibility_of_element_located((By.XPATH,
                                                               self.NON_COMM_LISTING_RECORDS.format(port, rate_type,
                                                                                                    hotel))))
-            listing_records = self.driver.find_elements_by_xpath(self.NON_COMM_LISTING_RECORDS
-                                                                 .format(port, rate_type, hotel))
+            listing_records = self.get_texts(self.NON_COMM_LISTING_RECORDS.format(port, rate_type, hotel), xpath=True)
         else:
             self.wait.until(EC.visibility_of_element_located((By.XPATH,
                                                               self.COMM_LISTING_RECORDS.format(port, rate_type,
                                                                                                hotel))))
-            listing_records = self.driver.find_elements_by_xpath(self.COMM_LISTING_RECORDS
-                                                                 .format(port, rate_type, hotel))
+            listing_records = self.get_texts(self.COMM_LISTING_RECORDS.format(port, rate_type, hotel), xpath=True)
         compare_string = date + "\n" + port + "\n" + airline + "\n" + hotel + "\n" + ("PP" if pp_pay_type else rate_type) \
                               + "\n" + "$" + rate + "\n" + issued + "\n" + cb_count + "\n" + hb_count + "\n" \
                               + (split_room_count_string if adjust_room_count else "") + "Adjust"
         for room_count in listing_records:
-            self.driver.implicitly_wait(2)
-            if compare_string == room_count.text:
+            if compare_string == room_count:
                 record_found = True
                 break
         return record_found
@@ -296,10 +288,9 @@ class RoomCountReportMainPage(BasePage):
                                  + actual_rate + " " + csa + " " + actual_count + " " + notes
         compare_string1 = date[1] + " " + user + " " + ("PP" if pp_pay_type else "AP") + " " + rate + " " + count + " "\
                                   + actual_rate + " " + csa + " " + actual_count + " " + notes
-        history_data_list = self.driver.find_elements_by_css_selector(self.HISTORY_DATA)
+        history_data_list = self.get_texts(self.HISTORY_DATA)
         for history_data in history_data_list:
-            self.driver.implicitly_wait(2)
-            assert compare_string1 == history_data.text or compare_string == history_data.text
+            assert compare_string1 == history_data or compare_string == history_data
             records_found = True
             break
         return records_found
@@ -337,8 +328,7 @@ class RoomCountReportMainPage(BasePage):
         self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.RATE_TYPE_MODAL_)))
         # self.driver.find_element_by_css_selector(self.RATE_TYPE_MODAL_).click()
         self.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, self.RATE_TYPE_LIST)))
-        get_rate_type_list = self.driver.find_elements_by_css_selector(self.RATE_TYPE_LIST)
-        rate_types = [pay_type.text for pay_type in get_rate_type_list]
+        rate_types = self.get_texts(self.RATE_TYPE_LIST)
         for rate_type in rate_types:
             value_selector_for_drop_downs(self, self.RATE_TYPE_MODAL, rate_type)
             selected_rate_type = self.driver.find_element_by_css_selector(self.SELECTED_RATE_TYPE).text
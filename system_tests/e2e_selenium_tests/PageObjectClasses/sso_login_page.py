@@ -168,6 +168,7 @@ class SsoLoginMainPage(BasePage):
         else:
             self.driver.find_element_by_css_selector(self.LOGOUT_BUTTON).click()
         self.driver.find_element_by_css_selector(self.LOGOUT).click()
+        self.forget_session()
         # assert "logout" in self.driver.current_url
         # self.wait.until(EC.url_to_be(TARGET_URL +
         #                              "/admin/index.php?logout=true&continue=admin%2Fquick-room-transfer.php"))
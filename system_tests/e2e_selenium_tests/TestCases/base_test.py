@@ -1,29 +1,34 @@
 import unittest
-from selenium import webdriver
 from e2e_selenium_tests.PageObjectClasses import transports_page
 from e2e_selenium_tests.PageObjectClasses import login_page
 from e2e_selenium_tests.PageObjectClasses import sso_login_page
 from e2e_selenium_tests.PageObjectClasses import dashboard_page, stormx_api_methods
 from e2e_selenium_tests.PageObjectClasses import quick_room_transfer_page, hotel_page, airline_page, quick_voucher_page, \
     room_count_report_page, tva_users_page, vouchers_listing_page, port_allowances, configuration_page
-from e2e_selenium_tests.BaseClasses.constant import STORMX_URL, RUN_TESTS_HEADLESS
+from e2e_selenium_tests.BaseClasses.base import UI_SESSION_KEY_PREFIX
+from e2e_selenium_tests.BaseClasses.browser_pool import browser_pool
+from e2e_selenium_tests.BaseClasses.constant import STORMX_URL
+from login_cookie_cache import login_cookie_cache
 # from system_tests.run_selenium_tests import RUN_TESTS_HEADLESS
 """Without headless option chromium crashed"""
 from stormx_verification_framework import StormxSystemVerification
 
 
 class TestBaseClass(StormxSystemVerification):
+    """
+    every test logs in with `session_login()` (or `api_login()`): the session cookies of a user are logged in
+    once, through the PHP login endpoint, cached in `login_cookie_cache` (under 'ui:<username>', apart from
+    the framework's own sessions) and injected into the browser.
+    only the login page tests (`test_login_page.py`, `test_sso_login_page.py`) drive the login forms.
+    """
 
     def setUp(self):
         super(TestBaseClass, self).setUp()
-        options = webdriver.ChromeOptions()
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--start-maximized")
-        if RUN_TESTS_HEADLESS:
-            options.add_argument("--headless")
-        self.browser = webdriver.Chrome(options=options)
+        # a warm browser of the pool, given back (reset) when the test is done, see `browser_pool.py`.
+        self.browser = browser_pool.lease()
+        self.addCleanup(browser_pool.release, self.browser)
+        self.browser.stormx_session = None  # (environment name, cache key) of the session it is logged in with.
         self.browser.get(STORMX_URL)
-        self.browser.maximize_window()
         self.login_page = login_page.LoginMainPage(self.browser)
         self.sso_login_page = sso_login_page.SsoLoginMainPage(self.browser)
         self.dashboard_page = dashboard_page.DashBoardMainPage(self.browser)
@@ -49,26 +54,66 @@ class TestBaseClass(StormxSystemVerification):
         self.login_page.provide_credentials(user_name, password)
         self.assertTrue(self.login_page.click_on_login_button(new_password),
                         "There is a problem while logging-in. UN: " + user_name + " P:" + password)
-        self.login_page.get_page_html_source()
 
-    def api_login(self, username, password, resetpassword, desired_page):
-        cookies_dict = {}
-        cookies = self.login_to_stormx(username, password, resetpassword)
-        # cookies = stormx_api_methods.StormxApiMethods.login_to_stormx(username, password, resetpassword)
-        for cookie in cookies:
-            cookie_dict = {
-                'name': cookie.name,
-                'value': cookie.value,
-                'path': cookie.path,
-                'expires': cookie.expires
-            }
-            cookies_dict.update(cookie_dict)
-            self.browser.add_cookie(cookie_dict)
-        self.browser.get(desired_page)
+    def session_login(self, username="support", password="test", resetpassword="", desired_page=None, sso=False):
+        """
+        log `username` in by injecting its session cookies into the browser, then open `desired_page`.
+        the cookies of an earlier login of the same user (by any test) are reused; they are logged in again
+        if the browser still lands on the login form (the session expired or was logged out).
+        :param username: string
+        :param password: string
+        :param resetpassword: string - new password, if the user must change its password on first login.
+        :param desired_page: string - URL, default: the StormX home page.
+        :param sso: bool - the user logs in through the SSO identity provider.
+        :return: dict of the session cookies (name -> value), usable with `requests` like `api_logout()`.
+        """
+        desired_page = desired_page or STORMX_URL
+        session = (self.selected_environment_name, UI_SESSION_KEY_PREFIX + username)
+        cookies = login_cookie_cache.get(*session)
+        if cookies is not None:
+            self._inject_session_cookies(cookies, desired_page)
+            if not self._on_login_form():
+                self.browser.stormx_session = session
+                return cookies
+            login_cookie_cache.invalidate(*session)
+        if sso:
+            cookies = self._sso_session_cookies(username, password)
+        else:
+            cookies = self.login_to_stormx(username, password, resetpassword).get_dict()
+        login_cookie_cache.set(*session, cookies)
+        self._inject_session_cookies(cookies, desired_page)
+        self.browser.stormx_session = session
         return cookies
 
+    def _inject_session_cookies(self, cookies, desired_page):
+        if not self.browser.current_url.startswith(STORMX_URL):
+            self.browser.get(STORMX_URL)  # cookies can only be added for the domain of the current page.
+        self.browser.delete_all_cookies()
+        for name, value in cookies.items():
+            self.browser.add_cookie({'name': name, 'value': value, 'path': '/'})
+        self.browser.get(desired_page)
+
+    def _on_login_form(self):
+        return bool(self.browser.find_elements_by_css_selector(login_page.USERNAME))
+
+    def _sso_session_cookies(self, username, password):
+        """
+        the SSO login only works through the identity provider's form: log in once with the browser and keep
+        the StormX cookies it ends up with.
+        :return: dict
+        """
+        self.browser.get(STORMX_URL)
+        self.login_user(username, password)
+        self.sso_login_user(username, password)
+        self.browser.get(STORMX_URL)
+        return {cookie['name']: cookie['value'] for cookie in self.browser.get_cookies()}
+
+    def api_login(self, username, password, resetpassword, desired_page):
+        return self.session_login(username, password, resetpassword, desired_page)
+
     def api_logout(self, cookies):
         stormx_api_methods.StormxApiMethods().logout(cookies=cookies)
+        self.login_page.forget_session()
 
     def search_hotel_by_api(self, hotel_id, cookies, port_id):
         api_response = stormx_api_methods.StormxApiMethods().search_hotel(hotel_id=hotel_id, cookies=cookies,
@@ -77,6 +122,7 @@ class TestBaseClass(StormxSystemVerification):
 
     def logout_user(self, url):
         self.browser.get(url)
+        self.login_page.forget_session()
 
     def select_port_filter_by_url(self, url):
         self.browser.get(url)
@@ -95,28 +141,23 @@ class TestBaseClass(StormxSystemVerification):
     def go_to_quick_voucher_page(self):
         self.dashboard_page.click_on_quick_voucher_button()
         self.quick_voucher_page.verify_browser_on_the_page()
-        self.quick_voucher_page.get_page_html_source()
 
     def go_to_room_count_report_page(self):
         self.dashboard_page.click_on_reports_tab()
         self.dashboard_page.click_on_room_count_report()
         self.room_count_report_page.verify_browser_on_the_page()
-        self.room_count_report_page.get_page_html_source()
 
     def go_to_hotel_page(self):
         self.dashboard_page.click_on_hotel_tab()
         self.hotel_page.verify_browser_on_the_page()
-        self.hotel_page.get_page_html_source()
 
     def go_to_transport_page(self):
         self.dashboard_page.click_on_transport_tab()
         self.transport_page.verify_browser_on_the_page()
-        self.transport_page.get_page_html_source()
 
     def go_to_quick_room_transfer_page(self):
         self.dashboard_page.click_on_quick_room_transfer_tab()
         self.quick_room_transfer.verify_browser_on_the_page()
-        self.quick_room_transfer.get_page_html_source()
 
     def go_to_airline_page(self):
         self.dashboard_page.click_on_airline_tab()
@@ -129,7 +170,6 @@ class TestBaseClass(StormxSystemVerification):
         self.dashboard_page.click_on_ports_tab()
         self.dashboard_page.click_on_port_allowances_tab()
         self.port_allowance_page.verify_browser_on_the_page()
-        self.port_allowance_page.get_page_html_source()
 
     def go_to_tva_users_page(self):
         self.dashboard_page.click_on_tva_users_tab()
@@ -140,26 +180,34 @@ class TestBaseClass(StormxSystemVerification):
         self.configurations_page.verify_browser_on_the_page()
         self.configurations_page.click_on_rate_caps_tab()
 
+    def assert_page_marker(self, page, marker, msg):
+        """
+        :param page: BasePage
+        :param marker: string - css selector of an element the page has once loaded.
+        """
+        self.assertTrue(page.has_marker(marker), msg)
+
     def verify_tvl_login_dashboard(self):
-        self.assertIn("Ops Dashboard", self.login_page.get_page_html_source(), "Dashboard page is not fully loaded!")
+        self.assertTrue(self.login_page.has_title("Ops Dashboard"), "Dashboard page is not fully loaded!")
 
     def verify_other_airline_users_dashboard(self):
-        self.assertIn("MY DASHBOARD", self.login_page.get_page_html_source(), "Dashboard page is not fully loaded!")
+        self.assert_page_marker(self.dashboard_page, self.dashboard_page.AIRLINE_DASHBOARD_METRICS_TABLE,
+                                "Dashboard page is not fully loaded!")
 
     def verify_quick_room_transfer_page(self):
-        self.assertIn("Quick Room Transfer | Travelliance", self.quick_room_transfer.get_page_html_source(),
-                      "Quick Room Transfer page is not fully loaded!")
+        self.assertTrue(self.quick_room_transfer.has_title("Quick Room Transfer | Travelliance"),
+                        "Quick Room Transfer page is not fully loaded!")
 
     def verify_hotel_page(self):
-        self.assertIn("Hotels | Travelliance", self.hotel_page.get_page_html_source(), "Hotel page is not fully loaded")
+        self.assertTrue(self.hotel_page.has_title("Hotels | Travelliance"), "Hotel page is not fully loaded")
 
     def verify_room_count_report_page(self):
-        self.assertIn("Room Counts | Travelliance", self.room_count_report_page.get_page_html_source(),
-                      "Room count report page is not fully loaded")
+        self.assertTrue(self.room_count_report_page.has_title("Room Counts | Travelliance"),
+                        "Room count report page is not fully loaded")
 
     def verify_quick_voucher_page(self):
-        self.assertIn("'template/voucher/edit.html'", self.quick_voucher_page.get_page_html_source(),
-                      "Quick voucher page is not fully loaded.")
+        self.assert_page_marker(self.quick_voucher_page, self.quick_voucher_page.VOUCHER_EDIT_TEMPLATE,
+                                "Quick voucher page is not fully loaded.")
 
     def verify_dashboard_page(self):
         self.dashboard_page.verify_browser_on_the_page()
@@ -168,12 +216,12 @@ class TestBaseClass(StormxSystemVerification):
         self.dashboard_page.verify_airline_dashboard_page()
 
     def verify_airline_page(self):
-        self.assertIn("Airlines | Travelliance", self.airline_page.get_page_html_source(),
-                      "Airline page is not fully loaded")
+        self.assertTrue(self.airline_page.has_title("Airlines | Travelliance"),
+                        "Airline page is not fully loaded")
         self.assertTrue(self.airline_page.verify_default_selected_status_filter_airlines_on_page(),
                         "Inactive airlines are shown on airline page loading. "
                         "It should be shown only Active status airlines on page loading.")
 
     def verify_configurations_page(self):
-        self.assertIn("Global Configurations | Travelliance", self.configurations_page.get_page_html_source(),
-                      "Configurations page is not fully loaded.")
+        self.assertTrue(self.configurations_page.has_title("Global Configurations | Travelliance"),
+                        "Configurations page is not fully loaded.")
@@ -154,7 +154,7 @@ class TestAirline(TestBaseClass):
             self.assertListEqual(self.airline_page.get_user_creation_error_messages(), [])
             self.airline_page.logout_user()
             """Login with Employee at Port credentials"""
-            self.login_user(AIRLINE_USERS_DATA[0][0], AIRLINE_USERS_DATA[0][1], new_password=self.NEW_PASSWORD)
+            self.session_login(AIRLINE_USERS_DATA[0][0], AIRLINE_USERS_DATA[0][1], resetpassword=self.NEW_PASSWORD)
             self.verify_airline_dashboard_page()
             # self.verify_quick_room_transfer_page()
             # self.sso_login_page.verify_employe_at_port_dashboard()
@@ -166,7 +166,7 @@ class TestAirline(TestBaseClass):
                             "PNR button is still visible for airline user.")
             self.sso_login_page.logout_user()
             """Login with Port Manager credentials"""
-            self.login_user(AIRLINE_USERS_DATA[1][0], AIRLINE_USERS_DATA[1][1], new_password=self.NEW_PASSWORD)
+            self.session_login(AIRLINE_USERS_DATA[1][0], AIRLINE_USERS_DATA[1][1], resetpassword=self.NEW_PASSWORD)
             self.verify_airline_dashboard_page()
             self.go_to_hotel_page()
             self.assertTrue(self.hotel_page.hide_buttons_on_hotel_listing_for_airline_user(),
@@ -176,7 +176,7 @@ class TestAirline(TestBaseClass):
                             "PNR button is still visible for airline user.")
             self.sso_login_page.logout_user()
             """Login with Corporate Representative credentials"""
-            self.login_user(AIRLINE_USERS_DATA[2][0], AIRLINE_USERS_DATA[2][1], new_password=self.NEW_PASSWORD)
+            self.session_login(AIRLINE_USERS_DATA[2][0], AIRLINE_USERS_DATA[2][1], resetpassword=self.NEW_PASSWORD)
             self.verify_airline_dashboard_page()
             self.go_to_hotel_page()
             self.assertTrue(self.hotel_page.hide_buttons_on_hotel_listing_for_airline_user(),
@@ -186,7 +186,7 @@ class TestAirline(TestBaseClass):
                             "PNR button is still visible for airline user.")
             self.sso_login_page.logout_user()
             """Login with Account Finance credentials"""
-            self.login_user(AIRLINE_USERS_DATA[3][0], AIRLINE_USERS_DATA[3][1], new_password=self.NEW_PASSWORD)
+            self.session_login(AIRLINE_USERS_DATA[3][0], AIRLINE_USERS_DATA[3][1], resetpassword=self.NEW_PASSWORD)
             self.verify_airline_dashboard_page()
             self.go_to_hotel_page()
             self.assertTrue(self.hotel_page.hide_buttons_on_hotel_listing_for_airline_user(),
@@ -207,6 +207,3 @@ class TestAirline(TestBaseClass):
                   " message below")
             print(str(e))
             return False, str(e)
-
-    def tearDown(self):
-        self.browser.close()
@@ -142,6 +142,3 @@ class TestExpediaHotels(TestBaseClass):
                   " message below")
             print(str(e))
             return False, e
-
-    def tearDown(self):
-        self.browser.close()
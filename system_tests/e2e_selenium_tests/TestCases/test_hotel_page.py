@@ -394,6 +394,3 @@ class TestHotel(TestBaseClass):
                   " message below")
             print(str(e))
             return False, e
-
-    def tearDown(self):
-        self.browser.close()
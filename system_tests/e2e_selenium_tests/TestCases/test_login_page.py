@@ -20,7 +20,7 @@ class TestLoginPage(TestBaseClass):
         Verify that user is successfully logged in with valid credentials and Dashboard is fully loaded.
         """
         self.login_user(TVL_USER_NAME, TVL_USER_PASSWORD)
-        self.assertIn("Ops Dashboard", self.login_page.get_page_html_source(), "Dashboard page is not fully loaded!")
+        self.verify_tvl_login_dashboard()
         self.dashboard_page.verify_browser_on_the_page()
 
     @ignore_warnings
@@ -53,6 +53,3 @@ class TestLoginPage(TestBaseClass):
         self.login_user(TVL_USER_NAME, TVL_USER_PASSWORD)
         self.browser.get(STORMX_URL + INVALID_URL_PARAMS)
         self.assertEqual(self.login_page.invalid_url_redirection(), "Error 404")
-
-    def tearDown(self):
-        self.browser.close()
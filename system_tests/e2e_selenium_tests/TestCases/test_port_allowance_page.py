@@ -166,6 +166,3 @@ class TestPortAllowance(TestBaseClass):
         self.quick_room_transfer.click_on_refresh_button()
         self.assertEqual(self.TOTAL_ALLOWANCE, self.quick_room_transfer.max_allowed_on_qrt_page(),
                          "Max allowed should be equal to Total allowances in this case.")
-
-    def tearDown(self):
-        self.browser.close()
@@ -130,8 +130,7 @@ class TestQuickRoomTransfer(TestBaseClass):
         self.verify_voucher_modal_is_opened_by_clicking_voucher_number()
 
     def verify_page_title(self):
-        self.assertIn("Quick Room Transfer | Travelliance", self.quick_room_transfer.get_page_html_source(),
-                      "Quick Room Transfer page is not fully loaded!")
+        self.verify_quick_room_transfer_page()
 
     def fill_quick_room_transfer_fields_data(self):
         self.quick_room_transfer.fill_quick_room_transfer_fields(fill_quick_room_transfer_form())
@@ -199,7 +198,7 @@ class TestQuickRoomTransfer(TestBaseClass):
         """
         room_count_on_qrt = self.total_room_avails_count_from_stat_bar()
         self.go_to_hotel_page()
-        self.assertIn("Hotels | Travelliance", self.hotel_page.get_page_html_source(), "Hotel page is not fully loaded")
+        self.verify_hotel_page()
         room_count_on_hotel_listing = self.airline_room_count_from_hotel_page()
         self.assertEqual(room_count_on_qrt, room_count_on_hotel_listing,
                          'Room count at hotel listing page and quick room transfer page is not validated!')
@@ -258,6 +257,3 @@ class TestQuickRoomTransfer(TestBaseClass):
         expected_error = ['Inventory allowance exceeded. Please call (800) 642-7310 for assistance', 'No Record Found!',
                           'Hotel availability is insufficient for booking.']
         self.assertIn(self.quick_room_transfer.check_inventory_allowance_exceeded(), expected_error)
-
-    def tearDown(self):
-        self.browser.close()
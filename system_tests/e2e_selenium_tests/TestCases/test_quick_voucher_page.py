@@ -344,6 +344,3 @@ class TestQuickVoucher(TestBaseClass):
                   " message below")
             print(str(e))
             return False, str(e)
-
-    def tearDown(self):
-        self.browser.close()
@@ -210,6 +210,3 @@ class TestRateCaps(TestBaseClass):
                   " message below")
             print(str(e))
             return False, str(e)
-
-    def tearDown(self):
-        self.browser.close()
@@ -380,6 +380,3 @@ class TestRoomCountReport(TestBaseClass):
                   " message below")
             print(str(e))
             return False, str(e)
-
-    def tearDown(self):
-        self.browser.close()
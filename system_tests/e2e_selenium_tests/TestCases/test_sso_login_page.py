@@ -258,6 +258,3 @@ class TestSsoLogin(TestBaseClass):
                   " message below")
             print(str(e))
             return False
-
-    def tearDown(self):
-        self.browser.close()
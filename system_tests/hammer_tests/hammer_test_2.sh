@@ -1,42 +1,10 @@
 #! /bin/bash
+# sustained mixed load on the API, with latency percentiles per endpoint.
+# usage (from system_tests/): ./hammer_tests/hammer_test_2.sh <environment> [rate] [duration]
 environment=$1
+rate=${2:-10}
+duration=${3:-300}
 
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_import_passengers__bad_phone_number &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_import_passengers__bad_phone_number &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_book_hotel__tvl_inventory &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_open_offer_link_then_agent_book &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_open_offer_link_then_agent_book &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_open_offer_link_then_agent_book &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_open_offer_link_then_agent_book &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_import_passengers__bad_phone_number &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_open_offer_link_then_agent_book &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_open_offer_link_then_agent_book &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_open_offer_link_then_agent_book &
-./run_system_tests.py $environment web &
-./run_system_tests.py $environment web &
-./run_system_tests.py $environment web &
-
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_notifications_offered &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_notifications_offered &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_notifications_offered &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_notifications_offered &
-
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_passenger_notifications_offered &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
-./run_system_tests.py $environment TestAirlineAndPassengerAPI.test_validate_existing_open_pnr &
+./run_load_tests.py $environment --rate $rate --ramp-up 30 --duration $duration \
+    --mix book=5,passenger_import=2,decline=2,notifications=1,hotel_search=3 \
+    --histogram-file hammer_test_2_histograms.json
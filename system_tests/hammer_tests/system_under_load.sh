@@ -1,22 +1,18 @@
 #! /bin/bash
+# run the api and web system tests while the API is under a constant background load.
+# usage (from system_tests/): ./hammer_tests/system_under_load.sh <environment> [rate]
 environment=$1
+rate=${2:-10}
 
+./run_load_tests.py $environment --rate $rate --ramp-up 30 --duration 3600 &
+load_pid=$!
 
-./run_system_tests.py $environment web &
-./run_system_tests.py $environment web &
-./run_system_tests.py $environment web &
-./run_system_tests.py $environment web &
-./run_system_tests.py $environment web &
-./run_system_tests.py $environment web &
+./run_system_tests.py $environment api --workers 4
+api_status=$?
+./run_system_tests.py $environment web --workers 2
+web_status=$?
 
-./run_system_tests.py $environment api &
-./run_system_tests.py $environment api &
-./run_system_tests.py $environment api &
-./run_system_tests.py $environment api &
-./run_system_tests.py $environment api &
-./run_system_tests.py $environment api &
-./run_system_tests.py $environment api &
-./run_system_tests.py $environment api &
-
-wait
+kill $load_pid
+wait $load_pid 2>/dev/null
 echo "system_under_load complete."
+exit $(( api_status || web_status ))
@@ -0,0 +1,254 @@
+"""
+Per-test trace of the HTTP calls made through the shared `http_client`.
+
+Tells the tests that are slow because of the server apart from the tests that are slow because
+they make 150 calls. Every call is recorded with:
+
+* the test (or '<test class id>.setUpClass') it was made for,
+* its route template, e.g. 'GET /api/v1/passenger/*/state' or
+  'POST /admin/remote/helper.php?type=updateAvailsNew' (PHP helpers are told apart by their `type`),
+* its status code (or the exception name), request and response sizes and latency,
+* the framework helper it originates from, e.g. 'create_quick_voucher' (the outermost
+  `stormx_verification_framework.py` function on the stack; 'test' for calls made by a test directly).
+
+At the end of the run, calls are summarized per test, per route and per helper.
+
+    ./run_system_tests.py staging api --trace-http [--http-call-budget N] [--http-latency-budget SECONDS]
+
+(or set `STORMX_HTTP_TRACE=1`, `STORMX_HTTP_CALL_BUDGET`, `STORMX_HTTP_LATENCY_BUDGET`.)
+With a budget, a test making more calls, or waiting longer on HTTP in total, than the budget fails.
+Set `STORMX_HTTP_TRACE_FILE` to also save every call as JSON.
+
+The scope (test) is set per thread: calls of threads working for no test in particular, like the
+passenger pool filler (see `passenger_pool.py`), are attributed to '<background>', which no budget
+applies to. Threads working for a test get its scope with `scope_initializer()`.
+"""
+import collections
+import json
+import os
+import re
+import sys
+import threading
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+HELPER_SOURCE_FILES = ('stormx_verification_framework.py',)
+BACKGROUND_SCOPE = '<background>'  # calls of threads without a scope, not charged to any test.
+REPORTED_TEST_COUNT = 20
+
+# numbers, uuids/hashes and prefixed ids like 'tvl-80657', but not 'v1'.
+_ID_PATH_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F-]{16,}|[A-Za-z]+-\d+)$')
+
+HttpCall = collections.namedtuple(
+    'HttpCall', 'scope route status request_bytes response_bytes latency helper')
+
+
+def route_template(method, url, params=None):
+    """
+    :return: string like 'GET /api/v1/passenger/*/state' or 'GET /admin/remote/helper.php?type=blogs'.
+    """
+    split_url = urlsplit(url)
+    route = method.upper() + ' ' + '/'.join('*' if _ID_PATH_SEGMENT.match(segment) else segment
+                                            for segment in split_url.path.split('/'))
+    query = dict(parse_qsl(split_url.query))
+    if isinstance(params, dict):
+        query.update(params)
+    if 'type' in query and route.endswith('.php'):
+        route += '?type=' + str(query['type'])
+    return route
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, bytes):
+        return len(body)
+    return 0  # streamed/multipart generator bodies are not measured.
+
+
+def _originating_helper(frame):
+    """
+    :return: name of the outermost framework function on the stack, 'test' when there is none.
+    """
+    helper = None
+    while frame is not None:
+        file_name = frame.f_code.co_filename
+        if os.path.basename(file_name).startswith('verify_'):
+            break  # reached the test.
+        if file_name.endswith(HELPER_SOURCE_FILES):
+            helper = frame.f_code.co_name
+        frame = frame.f_back
+    if helper is None and threading.current_thread() is not threading.main_thread():
+        return threading.current_thread().name
+    return helper or 'test'
+
+
+class HttpCallTracer(object):
+
+    def __init__(self, call_budget=None, latency_budget=None, trace_file_path=None):
+        """
+        :param call_budget: int or None - maximum number of calls per test.
+        :param latency_budget: float seconds or None - maximum total HTTP latency per test.
+        :param trace_file_path: string or None - `save()` writes every call there as JSON.
+        """
+        self.call_budget = call_budget
+        self.latency_budget = latency_budget
+        self.trace_file_path = trace_file_path
+        self._local = threading.local()
+        self._calls = []
+        self._lock = threading.Lock()
+
+    def set_scope(self, scope):
+        """
+        :param scope: string - a test id, or '<test class id>.setUpClass'. calls of the calling thread are
+                      attributed to it.
+        """
+        self._local.scope = scope
+
+    def current_scope(self):
+        """
+        :return: string - scope of the calling thread, `BACKGROUND_SCOPE` if it has none.
+        """
+        return getattr(self._local, 'scope', BACKGROUND_SCOPE)
+
+    def scope_initializer(self):
+        """
+        :return: callable() giving the thread calling it the scope of the current thread, e.g. as the
+                 `initializer` of a `ThreadPoolExecutor` doing a test's calls.
+        """
+        scope = self.current_scope()
+        return lambda: self.set_scope(scope)
+
+    def trace(self, send, method, url, **kwargs):
+        """
+        :param send: callable(method, url, **kwargs) performing the request.
+        :return: requests.Response
+        """
+        helper = _originating_helper(sys._getframe(1))
+        route = route_template(method, url, kwargs.get('params'))
+        scope = self.current_scope()
+        started_at = time.perf_counter()
+        try:
+            response = send(method, url, **kwargs)
+        except Exception as exception:
+            self._record(HttpCall(scope, route, type(exception).__name__, 0, 0, time.perf_counter() - started_at,
+                                  helper))
+            raise
+        latency = time.perf_counter() - started_at
+        request_bytes = _body_size(response.request.body) if response.request is not None else 0
+        if kwargs.get('stream'):
+            response_bytes = int(response.headers.get('Content-Length') or 0)
+        else:
+            response_bytes = len(response.content or b'')
+        self._record(HttpCall(scope, route, response.status_code, request_bytes, response_bytes, latency, helper))
+        return response
+
+    def _record(self, call):
+        with self._lock:
+            self._calls.append(call)
+
+    def calls(self, scope=None):
+        """
+        :param scope: string or None (None for every scope).
+        :return: list(HttpCall)
+        """
+        with self._lock:
+            return [call for call in self._calls if scope is None or call.scope == scope]
+
+    def budget_violation(self, scope):
+        """
+        :param scope: string - a test id.
+        :return: string describing the exceeded budget, or None (always for `BACKGROUND_SCOPE`).
+        """
+        if scope == BACKGROUND_SCOPE:
+            return None
+        calls = self.calls(scope)
+        problems = []
+        if self.call_budget is not None and len(calls) > self.call_budget:
+            problems.append('{0} HTTP calls, budget is {1}'.format(len(calls), self.call_budget))
+        total_latency = sum(call.latency for call in calls)
+        if self.latency_budget is not None and total_latency > self.latency_budget:
+            problems.append('{0:.1f}s waiting on HTTP, budget is {1:g}s'.format(total_latency, self.latency_budget))
+        if not problems:
+            return None
+        busiest_routes = collections.Counter(call.route for call in calls).most_common(3)
+        return 'HTTP budget exceeded: {0} (busiest routes: {1})'.format(
+            ', '.join(problems), ', '.join('{0} x{1}'.format(route, count) for route, count in busiest_routes))
+
+    def drain(self):
+        """
+        :return: list of picklable call tuples, forgotten by this tracer (e.g. to send them to the parent process).
+        """
+        with self._lock:
+            calls, self._calls = self._calls, []
+        return [tuple(call) for call in calls]
+
+    def merge(self, call_tuples):
+        """
+        :param call_tuples: list - result of `drain()` of another tracer.
+        """
+        with self._lock:
+            self._calls.extend(HttpCall(*call) for call in call_tuples)
+
+    @staticmethod
+    def _is_error(call):
+        return not isinstance(call.status, int) or call.status >= 400
+
+    def format_report(self, test_count=REPORTED_TEST_COUNT):
+        """
+        :param test_count: int - number of tests listed (the ones making the most calls).
+        :return: string - per test, per route and per helper summaries.
+        """
+        calls = self.calls()
+        if not calls:
+            return 'no HTTP calls traced.'
+        lines = []
+
+        def add_table(title, key, limit=None):
+            groups = collections.OrderedDict()
+            for call in calls:
+                groups.setdefault(key(call), []).append(call)
+            rows = sorted(groups.items(), key=lambda item: (-len(item[1]), item[0]))[:limit]
+            header = '{0:>7} {1:>7} {2:>9} {3:>9} {4:>9} {5:>10}  {6}'.format(
+                'calls', 'errors', 'total s', 'mean ms', 'max ms', 'kB in/out', title)
+            lines.extend(['', header, '-' * len(header)])
+            for name, group_calls in rows:
+                total_latency = sum(call.latency for call in group_calls)
+                lines.append('{0:>7} {1:>7} {2:>9.2f} {3:>9.1f} {4:>9.1f} {5:>10}  {6}'.format(
+                    len(group_calls), sum(1 for call in group_calls if self._is_error(call)), total_latency,
+                    total_latency / len(group_calls) * 1000, max(call.latency for call in group_calls) * 1000,
+                    '{0:.1f}/{1:.1f}'.format(sum(call.response_bytes for call in group_calls) / 1024.0,
+                                             sum(call.request_bytes for call in group_calls) / 1024.0),
+                    name))
+
+        lines.append('HTTP calls: {0} in {1} tests, {2:.1f}s waiting on HTTP'.format(
+            len(calls), len(set(call.scope for call in calls) - {BACKGROUND_SCOPE}),
+            sum(call.latency for call in calls)))
+        add_table('test (top {0} by calls)'.format(test_count), lambda call: call.scope, limit=test_count)
+        add_table('route', lambda call: call.route)
+        add_table('helper', lambda call: call.helper)
+        return '\n'.join(lines)
+
+    def save(self):
+        """
+        write every call to `trace_file_path` (if set).
+        """
+        if not self.trace_file_path:
+            return
+        with open(self.trace_file_path, 'w') as trace_file:
+            json.dump([call._asdict() for call in self.calls()], trace_file)
+
+
+def tracer_from_environment():
+    """
+    :return: HttpCallTracer configured by the `STORMX_HTTP_TRACE*` / `STORMX_HTTP_*_BUDGET` variables, or None.
+    """
+    call_budget = os.getenv('STORMX_HTTP_CALL_BUDGET')
+    latency_budget = os.getenv('STORMX_HTTP_LATENCY_BUDGET')
+    if os.getenv('STORMX_HTTP_TRACE', '0') == '0' and not call_budget and not latency_budget:
+        return None
+    return HttpCallTracer(call_budget=int(call_budget) if call_budget else None,
+                          latency_budget=float(latency_budget) if latency_budget else None,
+                          trace_file_path=os.getenv('STORMX_HTTP_TRACE_FILE') or None)
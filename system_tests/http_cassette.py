@@ -0,0 +1,265 @@
+"""
+Record-and-replay ("cassette") mode of the shared HTTP client.
+
+record: every request/response pair that goes through `http_client` is saved to a cassette
+        directory, one gzipped JSON file per test class.
+replay: the same requests are answered from the cassette, without any network access, so
+        iterating on assertion logic takes seconds instead of minutes.
+
+    ./run_system_tests.py staging TestApiHotelSearch --record cassettes/
+    ./run_system_tests.py staging TestApiHotelSearch --replay cassettes/
+
+(or set `STORMX_HTTP_CASSETTE_DIR` and `STORMX_HTTP_CASSETTE_MODE=record|replay`.)
+
+matching:
+    interactions are recorded per scope (a test id, or '<test class id>.setUpClass'; see
+    `StormxSystemVerification.run`) in call order. A replayed request is answered with the
+    first unused interaction of the current scope with the same fingerprint (method, URL with
+    sorted query parameters, body, Authorization header); failing that, with the first unused
+    interaction of any scope with the same fingerprint (for calls that are only made once per
+    process, like the environment sanity check); failing that, with the first unused interaction
+    of the current scope with the same shape (method and path with the ids blanked out), since
+    generated ids (`uuid4()`) differ from one run to the next. Anything else raises `CassetteMiss`.
+
+    `random` and faker are seeded per test with `generator_seed()`: a new seed salt is drawn for every
+    recording and saved in the cassette, so replays generate the payloads of their recording while
+    every re-recording generates new context ids, PNRs and usernames (no collisions with the data an
+    earlier recording left on the environment).
+
+limitations: calls that do not go through `http_client` or an `AsyncStormxClient` (boto3/SQS,
+`SandboxApiClient`, Selenium) are not recorded, and fixed `sleep()` calls in tests still sleep.
+concurrent calls (`AsyncStormxClient`) are replayed by fingerprint, whatever order they complete in.
+"""
+import base64
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import uuid
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.cookies import cookiejar_from_dict
+from requests.structures import CaseInsensitiveDict
+
+RECORD_MODE = 'record'
+REPLAY_MODE = 'replay'
+CASSETTE_FILE_SUFFIX = '.json.gz'
+DEFAULT_SCOPE = '__module__'
+
+_ID_LIKE_PATH_SEGMENT = re.compile(r'\d|^[0-9a-fA-F-]{16,}$')
+
+
+class CassetteMiss(Exception):
+    """
+    raised in replay mode when a request was not recorded.
+    """
+
+
+def _sorted_query(url, params):
+    split_url = urlsplit(url)
+    query = parse_qsl(split_url.query, keep_blank_values=True)
+    if isinstance(params, dict):
+        for key, value in params.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            query.extend((key, str(item)) for item in values if item is not None)
+    elif params:
+        query.extend((key, str(value)) for key, value in params)
+    return split_url, sorted(query)
+
+
+def _canonical_body(data=None, json_payload=None):
+    if json_payload is not None:
+        return json.dumps(json_payload, sort_keys=True, default=str)
+    if isinstance(data, dict):
+        return urlencode(sorted((str(key), str(value)) for key, value in data.items()))
+    if isinstance(data, bytes):
+        return data.decode('utf-8', 'replace')
+    return '' if data is None else str(data)
+
+
+def request_fingerprint(method, url, params=None, data=None, json_payload=None, headers=None):
+    """
+    :return: string - stable hash of everything that identifies a request.
+    """
+    split_url, query = _sorted_query(url, params)
+    authorization = next((value for key, value in (headers or {}).items() if key.lower() == 'authorization'), '')
+    canonical_request = '\n'.join([
+        method.upper(),
+        urlunsplit((split_url.scheme, split_url.netloc, split_url.path, urlencode(query), '')),
+        _canonical_body(data, json_payload),
+        authorization,
+    ])
+    return hashlib.sha1(canonical_request.encode('utf-8')).hexdigest()
+
+
+def request_shape(method, url):
+    """
+    :return: string like 'GET /api/v1/passenger/*/state' - the request with its ids blanked out.
+    """
+    path_segments = ['*' if _ID_LIKE_PATH_SEGMENT.search(segment) else segment
+                     for segment in urlsplit(url).path.split('/')]
+    return method.upper() + ' ' + '/'.join(path_segments)
+
+
+class HttpCassette(object):
+
+    def __init__(self, directory, mode):
+        """
+        :param directory: string - one `<test class id>.json.gz` file per test class is kept there.
+        :param mode: 'record' or 'replay'
+        """
+        if mode not in (RECORD_MODE, REPLAY_MODE):
+            raise ValueError('cassette mode must be {0!r} or {1!r}, not {2!r}.'.format(RECORD_MODE, REPLAY_MODE, mode))
+        self.directory = directory
+        self.mode = mode
+        self._scope = DEFAULT_SCOPE
+        self._lock = threading.RLock()
+        self._recorded = {}  # file name -> {scope: [interaction]} (record mode)
+        self._unsaved_file_names = set()  # files of `_recorded` with interactions not saved yet (record mode)
+        self._seed_salt = uuid.uuid4().hex  # of this recording (record mode)
+        self._seed_salts = {}  # file name -> seed salt of its recording (replay mode)
+        self._interactions = None  # scope -> [interaction], loaded lazily (replay mode)
+        self._used = set()  # (scope, index) of replayed interactions
+
+    @property
+    def is_replaying(self):
+        return self.mode == REPLAY_MODE
+
+    def set_scope(self, scope):
+        """
+        :param scope: string - a test id, or '<test class id>.setUpClass'.
+        """
+        with self._lock:
+            self._scope = scope
+
+    def generator_seed(self, scope):
+        """
+        :param scope: string
+        :return: string - seed of the test data generators for `scope`, the same when recording and replaying.
+        """
+        with self._lock:
+            if self.mode == RECORD_MODE:
+                return self._seed_salt + '|' + scope
+            if self._interactions is None:
+                self._load()
+            seed_salt = self._seed_salts.get(self._file_name(scope))
+        return scope if seed_salt is None else seed_salt + '|' + scope  # cassettes recorded without a salt.
+
+    @staticmethod
+    def _file_name(scope):
+        parts = scope.split('.')
+        class_id = '.'.join(parts[:-1]) if len(parts) > 2 else scope
+        return re.sub(r'[^\w.-]', '_', class_id) + CASSETTE_FILE_SUFFIX
+
+    # recording ---------------------------------------------------------------------------------
+
+    def _record(self, fingerprint, shape, response):
+        try:
+            body = {'text': response.content.decode('utf-8')}
+        except UnicodeDecodeError:
+            body = {'base64': base64.b64encode(response.content).decode('ascii')}
+        interaction = dict(
+            body, fingerprint=fingerprint, shape=shape, url=response.url, status_code=response.status_code,
+            reason=response.reason, headers=dict(response.headers), cookies=response.cookies.get_dict(),
+            encoding=response.encoding, elapsed=response.elapsed.total_seconds())
+        with self._lock:
+            file_name = self._file_name(self._scope)
+            self._recorded.setdefault(file_name, {}).setdefault(self._scope, []).append(interaction)
+            self._unsaved_file_names.add(file_name)
+
+    def save(self):
+        """
+        write the files with interactions recorded since the last save (record mode).
+        """
+        with self._lock:
+            if self.mode != RECORD_MODE or not self._unsaved_file_names:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            for file_name in sorted(self._unsaved_file_names):
+                temporary_path = os.path.join(self.directory, file_name + '.tmp')
+                with gzip.open(temporary_path, 'wt', encoding='utf-8') as cassette_file:
+                    json.dump({'version': 1, 'seed_salt': self._seed_salt, 'scopes': self._recorded[file_name]},
+                              cassette_file, separators=(',', ':'))
+                os.replace(temporary_path, os.path.join(self.directory, file_name))
+            self._unsaved_file_names.clear()
+
+    # replaying ---------------------------------------------------------------------------------
+
+    def _load(self):
+        self._interactions = {}
+        if not os.path.isdir(self.directory):
+            raise CassetteMiss('no cassette directory ' + repr(self.directory) + ', record one first.')
+        for file_name in sorted(os.listdir(self.directory)):
+            if file_name.endswith(CASSETTE_FILE_SUFFIX):
+                with gzip.open(os.path.join(self.directory, file_name), 'rt', encoding='utf-8') as cassette_file:
+                    cassette = json.load(cassette_file)
+                self._interactions.update(cassette['scopes'])
+                self._seed_salts[file_name] = cassette.get('seed_salt')
+
+    def _iterate_unused(self, scopes):
+        for scope in scopes:
+            for index, interaction in enumerate(self._interactions.get(scope, [])):
+                if (scope, index) not in self._used:
+                    yield scope, index, interaction
+
+    def _replay(self, method, url, fingerprint, shape):
+        with self._lock:
+            if self._interactions is None:
+                self._load()
+            other_scopes = [scope for scope in self._interactions if scope != self._scope]
+            for scopes, key, value in (([self._scope], 'fingerprint', fingerprint),
+                                       (other_scopes, 'fingerprint', fingerprint),
+                                       ([self._scope], 'shape', shape)):
+                for scope, index, interaction in self._iterate_unused(scopes):
+                    if interaction[key] == value:
+                        self._used.add((scope, index))
+                        return self._build_response(method, interaction)
+        raise CassetteMiss('{0} {1} was not recorded in scope {2!r} of cassette {3!r}.'.format(
+            method, url, self._scope, self.directory))
+
+    @staticmethod
+    def _build_response(method, interaction):
+        response = requests.Response()
+        response.status_code = interaction['status_code']
+        response.reason = interaction['reason']
+        response.url = interaction['url']
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.encoding = interaction['encoding']
+        response.cookies = cookiejar_from_dict(interaction['cookies'])
+        response.elapsed = datetime.timedelta(seconds=interaction['elapsed'])
+        if 'base64' in interaction:
+            response._content = base64.b64decode(interaction['base64'])
+        else:
+            response._content = interaction['text'].encode('utf-8')
+        response.request = requests.Request(method, interaction['url']).prepare()
+        return response
+
+    # entry point -------------------------------------------------------------------------------
+
+    def request(self, send, method, url, **kwargs):
+        """
+        :param send: callable(method, url, **kwargs) performing the real request.
+        :return: requests.Response
+        """
+        fingerprint = request_fingerprint(method, url, params=kwargs.get('params'), data=kwargs.get('data'),
+                                          json_payload=kwargs.get('json'), headers=kwargs.get('headers'))
+        shape = request_shape(method, url)
+        if self.mode == REPLAY_MODE:
+            return self._replay(method, url, fingerprint, shape)
+        response = send(method, url, **kwargs)
+        self._record(fingerprint, shape, response)
+        return response
+
+
+def cassette_from_environment():
+    """
+    :return: HttpCassette configured by `STORMX_HTTP_CASSETTE_DIR`/`STORMX_HTTP_CASSETTE_MODE`, or None.
+    """
+    directory = os.getenv('STORMX_HTTP_CASSETTE_DIR')
+    if not directory:
+        return None
+    return HttpCassette(directory, os.getenv('STORMX_HTTP_CASSETTE_MODE', REPLAY_MODE))
@@ -0,0 +1,121 @@
+"""
+Import time per module, to keep the start up of ad-hoc test runs and load workers short.
+
+    ./run_system_tests.py staging TestApiPing --import-profile
+    ./run_load_tests.py stand_in --duration 5 --import-profile
+
+When the process exits, every module imported after the runner started is listed with its own import time
+and its cumulative one (including the modules it imported), slowest first, like `python -X importtime`
+but summarized. Modules imported lazily (see `lazy_import.py`) show up when they are first used.
+"""
+import atexit
+import importlib.abc
+import sys
+import threading
+import time
+
+IMPORT_PROFILE_OPTION = '--import-profile'
+REPORTED_MODULE_COUNT = 30
+
+
+class _TimedLoader(importlib.abc.Loader):
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__)
+
+    def __getattr__(self, attribute):
+        return getattr(self._loader, attribute)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    `sys.meta_path` finder timing the execution of every module imported while it is installed.
+    """
+
+    def __init__(self):
+        self.timings = []  # (module name, self seconds, cumulative seconds)
+        self._local = threading.local()
+        self.started_at = time.perf_counter()
+
+    def find_spec(self, fullname, path, target=None):
+        finding = getattr(self._local, 'finding', None)
+        if finding is None:
+            finding = self._local.finding = set()
+        if fullname in finding:
+            return None
+        finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            finding.discard(fullname)
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def _enter(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append([time.perf_counter(), 0.0])  # started at, seconds spent importing nested modules
+
+    def _exit(self, module_name):
+        stack = self._local.stack
+        started_at, nested_time = stack.pop()
+        cumulative_time = time.perf_counter() - started_at
+        if stack:
+            stack[-1][1] += cumulative_time
+        self.timings.append((module_name, cumulative_time - nested_time, cumulative_time))
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def format_report(self, module_count=REPORTED_MODULE_COUNT):
+        """
+        :param module_count: int - number of modules listed (the slowest, by cumulative time).
+        :return: string - times in milliseconds.
+        """
+        top_level_time = sum(self_time for _, self_time, _ in self.timings)
+        header = '{0:>10} {1:>10}  {2}'.format('self ms', 'cumul. ms', 'module')
+        lines = ['{0} modules imported in {1:.0f} ms (process running for {2:.0f} ms)'.format(
+                     len(self.timings), top_level_time * 1000, (time.perf_counter() - self.started_at) * 1000),
+                 header, '-' * len(header)]
+        for module_name, self_time, cumulative_time in sorted(self.timings, key=lambda timing: -timing[2])[:module_count]:
+            lines.append('{0:>10.1f} {1:>10.1f}  {2}'.format(self_time * 1000, cumulative_time * 1000, module_name))
+        return '\n'.join(lines)
+
+
+def profile_imports_if_requested(argv):
+    """
+    call before the runner's own imports. with `--import-profile` in `argv` (removed from it), time every
+    following import and print the report when the process exits.
+    :return: ImportProfiler or None
+    """
+    if IMPORT_PROFILE_OPTION not in argv:
+        return None
+    argv.remove(IMPORT_PROFILE_OPTION)
+    profiler = ImportProfiler()
+    profiler.install()
+    atexit.register(lambda: sys.stderr.write('\n' + profiler.format_report() + '\n'))
+    return profiler
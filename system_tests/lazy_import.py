@@ -0,0 +1,59 @@
+"""
+Modules imported on first use.
+
+`boto3`, `faker`, `pytz` and the StormxApp test utilities take a good part of a second to import, and most
+processes (a single `TestApiPing` run, a load worker) never touch them.
+
+    boto3 = lazy_import('boto3')  # nothing imported yet
+    boto3.Session(...)            # imports boto3
+
+The module is imported by the first attribute access, in whatever thread that happens.
+"""
+import importlib
+import sys
+import threading
+
+
+class LazyModule(object):
+    """
+    stands in for a module until one of its attributes is used.
+    """
+
+    def __init__(self, name):
+        """
+        :param name: string - absolute module name, e.g. 'StormxApp.tests.data_utilities'.
+        """
+        self.__dict__['_lazy_name'] = name
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            with self._lazy_lock:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    module = self.__dict__['_lazy_module'] = importlib.import_module(self._lazy_name)
+        return module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __setattr__(self, attribute, value):
+        setattr(self._load(), attribute, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self.__dict__['_lazy_module'] is None:
+            return '<lazy module {0!r} (not imported yet)>'.format(self._lazy_name)
+        return repr(self.__dict__['_lazy_module'])
+
+
+def lazy_import(name):
+    """
+    :param name: string - absolute module name.
+    :return: the module if it is already imported, else a LazyModule importing it on first use.
+    """
+    return sys.modules.get(name) or LazyModule(name)
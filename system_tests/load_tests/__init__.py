@@ -0,0 +1,7 @@
+"""
+Load testing of a StormX environment.
+
+Drives the same scenarios as the system tests (passenger import, hotel search, booking,
+decline, notifications) at configurable open-loop arrival rates and reports throughput and
+latency percentiles per endpoint. See `run_load_tests.py` for the command line interface.
+"""
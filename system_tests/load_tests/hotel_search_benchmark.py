@@ -0,0 +1,263 @@
+"""
+Latency benchmark of the hotel searches over the search dimensions `verify_api_hotel_search.py` covers.
+
+Every combination of the selected dimension values is searched, on two endpoints:
+
+* 'airline': `GET /api/v1/hotels` - port, provider, room_count, number_of_nights, is_premium,
+  handicap and service_pet are query parameters.
+* 'offer': `GET /api/v1/offer/hotels` - room_count is a query parameter, the other dimensions are
+  fields of the passenger whose access keys are used (premium is a 'first' ticket_level). One
+  passenger is imported per distinct set of passenger fields, before the clock starts.
+
+Dimensions that do not apply to an endpoint ('pet' for the airline search, 'provider' for the
+offer search) are left out of its combinations. Repetitions are interleaved (every combination
+once, then every combination again...), so a slow minute of the server is spread over all
+combinations instead of skewing one of them.
+
+Every combination gets its own latency histogram (see `latency_recorder.py`), so regressions like
+slow multi-night or pet filtering show up as numbers per combination rather than timeouts.
+`inventory_plan()` builds the `StormxSystemVerification.seed_inventory()` plan that gives every port
+a controlled inventory volume before the sweep.
+"""
+from collections import OrderedDict
+import datetime
+import itertools
+import time
+
+from stormx_http import PooledHttpClient
+from stormx_verification_framework import StormxSystemVerification
+
+from load_tests.latency_recorder import LatencyRecorder
+
+AIRLINE_ENDPOINT = 'airline'
+OFFER_ENDPOINT = 'offer'
+ENDPOINTS = (AIRLINE_ENDPOINT, OFFER_ENDPOINT)
+
+SEARCH_DIMENSIONS = OrderedDict([
+    ('port', ('LAX', 'ORD')),
+    ('provider', ('', 'tvl', 'ean')),
+    ('room_count', (1, 5)),
+    ('number_of_nights', (1, 3)),
+    ('premium', (False, True)),
+    ('handicap', (False, True)),
+    ('service_pet', (False, True)),
+    ('pet', (False, True)),
+])
+ENDPOINT_DIMENSIONS = {
+    AIRLINE_ENDPOINT: ('port', 'provider', 'room_count', 'number_of_nights', 'premium', 'handicap', 'service_pet'),
+    OFFER_ENDPOINT: ('port', 'room_count', 'number_of_nights', 'premium', 'handicap', 'service_pet', 'pet'),
+}
+ENDPOINT_PATHS = {
+    AIRLINE_ENDPOINT: '/api/v1/hotels',
+    OFFER_ENDPOINT: '/api/v1/offer/hotels',
+}
+
+# port -> (airline id, hotel ids): the hotels and airline `verify_api_hotel_search.py` gives inventory to,
+# Purple Rain Airlines (294) at LAX, airline 72 at ORD.
+DEFAULT_INVENTORY_HOTELS = OrderedDict([
+    ('LAX', (294, (98730, 80657))),
+    ('ORD', (72, (85725, 85765))),
+])
+DEFAULT_REPETITIONS = 5
+DEFAULT_TIMEOUT_IN_SECONDS = 60
+
+
+class SearchCase(object):
+    """
+    one combination of dimension values, searched on one endpoint.
+    """
+
+    def __init__(self, endpoint, combination):
+        """
+        :param endpoint: 'airline' or 'offer'
+        :param combination: OrderedDict - dimension name -> value.
+        """
+        self.endpoint = endpoint
+        self.combination = combination
+
+    @property
+    def label(self):
+        values = ' '.join('{0}={1}'.format(name, value if value != '' else 'any')
+                          for name, value in self.combination.items())
+        return 'GET ' + ENDPOINT_PATHS[self.endpoint] + ' ' + values
+
+    @property
+    def passenger_fields(self):
+        """
+        :return: dict - fields of the passenger searching for hotels ('offer' endpoint), or None.
+        """
+        if self.endpoint != OFFER_ENDPOINT:
+            return None
+        combination = self.combination
+        fields = {'port_accommodation': combination['port'], 'notify': False}
+        for name in ('number_of_nights', 'handicap', 'service_pet', 'pet'):
+            if name in combination:
+                fields[name] = combination[name]
+        if combination.get('premium'):
+            fields['ticket_level'] = 'first'
+        return fields
+
+    def query_parameters(self, passenger=None):
+        combination = self.combination
+        if self.endpoint == OFFER_ENDPOINT:
+            return dict(ak1=passenger['ak1'], ak2=passenger['ak2'], room_count=combination['room_count'])
+
+        query_parameters = dict(port=combination['port'], room_count=combination['room_count'],
+                                number_of_nights=combination['number_of_nights'])
+        for name, parameter in (('premium', 'is_premium'), ('handicap', 'handicap'), ('service_pet', 'service_pet')):
+            if combination.get(name):
+                query_parameters[parameter] = 'true'
+        if combination.get('provider'):
+            query_parameters['provider'] = combination['provider']
+        return query_parameters
+
+
+def build_search_matrix(dimensions=SEARCH_DIMENSIONS, endpoints=ENDPOINTS):
+    """
+    :param dimensions: OrderedDict - dimension name -> values (see `SEARCH_DIMENSIONS`).
+    :param endpoints: iterable of 'airline'/'offer'.
+    :return: list(SearchCase) - every combination of the dimensions that apply to each endpoint.
+    """
+    cases = []
+    for endpoint in endpoints:
+        names = [name for name in dimensions if name in ENDPOINT_DIMENSIONS[endpoint]]
+        for values in itertools.product(*(dimensions[name] for name in names)):
+            cases.append(SearchCase(endpoint, OrderedDict(zip(names, values))))
+    return cases
+
+
+def inventory_plan(event_dates_by_port, hotels_by_port=DEFAULT_INVENTORY_HOTELS, blocks=10, number_of_nights=1,
+                   room_types=(1, 2)):
+    """
+    :param event_dates_by_port: dict - port IATA code -> first inventory date (the port's event date).
+    :param hotels_by_port: dict - port IATA code -> (airline id, hotel ids), like `DEFAULT_INVENTORY_HOTELS`.
+    :param blocks: int - rooms per hotel, night and room type.
+    :param number_of_nights: int - consecutive nights given inventory, for multi-night searches.
+    :param room_types: iterable(int) - 1 standard, 2 handicap.
+    :return: list(dict) - plan of `StormxSystemVerification.seed_inventory()`.
+    """
+    plan = []
+    for port, event_date in event_dates_by_port.items():
+        airline_id, hotel_ids = hotels_by_port.get(port, (None, ()))
+        for hotel_id, night, room_type in itertools.product(hotel_ids, range(number_of_nights), room_types):
+            plan.append(dict(hotel_id=hotel_id, airline_id=airline_id,
+                             availability_date=event_date + datetime.timedelta(days=night), blocks=blocks,
+                             block_price='100.00', ap_block_type=1, room_type=room_type, pay_type='0'))
+    return plan
+
+
+def parse_dimension_values(name, values_text):
+    """
+    :param name: string - a dimension of `SEARCH_DIMENSIONS`.
+    :param values_text: string like '1,5', 'true,false' or 'any,tvl'.
+    :return: tuple of values typed like the `SEARCH_DIMENSIONS` ones.
+    """
+    if name not in SEARCH_DIMENSIONS:
+        raise ValueError('unknown dimension {0!r}, expected one of {1}.'.format(name, ', '.join(SEARCH_DIMENSIONS)))
+    default_value = SEARCH_DIMENSIONS[name][0]
+    values = []
+    for value in values_text.split(','):
+        value = value.strip()
+        if isinstance(default_value, bool):
+            values.append(value.lower() in ('1', 'true', 'yes'))
+        elif isinstance(default_value, int):
+            values.append(int(value))
+        else:
+            values.append('' if value == 'any' else value)
+    return tuple(values)
+
+
+def _passenger_key(fields):
+    return repr(sorted(fields.items()))
+
+
+def _import_search_passengers(http, api_host, airline_headers, cases):
+    """
+    :return: dict - passenger fields key -> imported passenger, one per distinct `SearchCase.passenger_fields`.
+    """
+    passengers = {}
+    for case in cases:
+        fields = case.passenger_fields
+        if fields is None or _passenger_key(fields) in passengers:
+            continue
+        payload = StormxSystemVerification._generate_n_passenger_payload(1, **fields)
+        response = http.post(api_host + '/api/v1/passenger', headers=airline_headers, json=payload)
+        if response.status_code != 201:
+            raise Exception('could not import a passenger with {0!r}: {1} {2}'.format(
+                fields, response.status_code, response.text))
+        passengers[_passenger_key(fields)] = response.json()['data'][0]
+    return passengers
+
+
+def run_hotel_search_benchmark(api_host, cases, customer='Purple Rain Airlines', repetitions=DEFAULT_REPETITIONS,
+                               timeout=DEFAULT_TIMEOUT_IN_SECONDS, progress=None):
+    """
+    :param api_host: string
+    :param cases: list(SearchCase), see `build_search_matrix()`.
+    :param customer: string - airline customer searching, and importing the passengers of the offer searches.
+    :param repetitions: int - searches per case.
+    :param timeout: float seconds - a search taking longer counts as failed.
+    :param progress: callable(repetition number) or None, called after every sweep of the matrix.
+    :return: (LatencyRecorder keyed by `SearchCase.label`, dict label -> list of hotel counts, elapsed seconds)
+    """
+    http = PooledHttpClient(pool_size=1)
+    airline_headers = StormxSystemVerification._generate_airline_headers(customer=customer)
+    passenger_headers = StormxSystemVerification._generate_passenger_headers()
+    passengers = _import_search_passengers(http, api_host, airline_headers, cases)
+
+    recorder = LatencyRecorder()
+    hotel_counts = {case.label: [] for case in cases}
+    started_at = time.perf_counter()
+    for repetition in range(repetitions):
+        for case in cases:
+            fields = case.passenger_fields
+            passenger = passengers[_passenger_key(fields)] if fields is not None else None
+            headers = passenger_headers if passenger else airline_headers
+            search_started_at = time.perf_counter()
+            try:
+                response = http.get(api_host + ENDPOINT_PATHS[case.endpoint], headers=headers,
+                                    params=case.query_parameters(passenger), timeout=timeout)
+            except Exception:  # timeouts and connection errors are what this benchmark is looking for.
+                recorder.record(case.label, time.perf_counter() - search_started_at, success=False)
+                continue
+            recorder.record(case.label, time.perf_counter() - search_started_at, success=response.status_code == 200)
+            if response.status_code == 200:
+                hotel_counts[case.label].append(len(response.json().get('data') or []))
+        if progress:
+            progress(repetition + 1)
+    elapsed_time = time.perf_counter() - started_at
+    http.close()
+    return recorder, hotel_counts, elapsed_time
+
+
+def format_matrix_report(cases, recorder, hotel_counts, slowest=10):
+    """
+    :return: string - one line per case (latencies in milliseconds), then the `slowest` cases by p95.
+    """
+    summary_rows = {row['endpoint']: row for row in recorder.summary(1.0)}
+    lines = []
+    for endpoint in ENDPOINTS:
+        endpoint_cases = [case for case in cases if case.endpoint == endpoint]
+        if not endpoint_cases:
+            continue
+        names = list(endpoint_cases[0].combination)
+        header = ' '.join('{0:>{1}}'.format(name, max(len(name), 5)) for name in names)
+        header += ' {0:>6} {1:>6} {2:>7} {3:>9} {4:>9} {5:>9} {6:>9}'.format(
+            'count', 'errors', 'hotels', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms')
+        lines.extend(['', ENDPOINT_PATHS[endpoint], header, '-' * len(header)])
+        for case in endpoint_cases:
+            row = summary_rows.get(case.label)
+            if row is None:
+                continue
+            counts = hotel_counts[case.label]
+            line = ' '.join('{0:>{1}}'.format(str(value) if value != '' else 'any', max(len(name), 5))
+                            for name, value in case.combination.items())
+            line += ' {0:>6} {1:>6} {2:>7} {3:>9.1f} {4:>9.1f} {5:>9.1f} {6:>9.1f}'.format(
+                row['count'], row['errors'], '{0:.0f}'.format(sum(counts) / float(len(counts))) if counts else '-',
+                row['p50'] * 1000, row['p95'] * 1000, row['p99'] * 1000, row['max'] * 1000)
+            lines.append(line)
+
+    slowest_rows = sorted(summary_rows.values(), key=lambda row: row['p95'], reverse=True)[:slowest]
+    lines.extend(['', 'slowest combinations (p95):'])
+    lines.extend('{0:>9.1f} ms  {1}'.format(row['p95'] * 1000, row['endpoint']) for row in slowest_rows)
+    return '\n'.join(lines).lstrip('\n')
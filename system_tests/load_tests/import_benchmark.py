@@ -0,0 +1,218 @@
+"""
+Payload-size scaling benchmark of the passenger import (`POST /api/v1/passenger`).
+
+Payloads of increasing size (1, 10, 100, 300, 1000 passengers by default) are imported one after
+the other, several times each, in one or both payload shapes:
+
+* 'uniform': `StormxSystemVerification._generate_n_passenger_payload()`, every passenger in one PNR.
+* 'bulk': `BulkPassengerGenerator`, groups, families, life stages (see `bulk_passenger_generator.py`).
+
+Calls are sequential on purpose: the benchmark measures how one import scales with its size, not
+how the server copes with concurrency (that is `load_generator.py`'s job). Payloads are generated
+and serialized before the clock starts, so only the server (and the network) is measured.
+
+Per shape and size, the report gives latency percentiles, latency per passenger, passengers
+imported per second, request/response sizes and failures. Once every repetition of a size failed,
+larger sizes of that shape are skipped, and that size is reported as the failure threshold.
+Results are saved per build (`to_dict()`) and can be compared with a baseline report of another build.
+"""
+import collections
+import json
+import time
+
+import faker
+
+from bulk_passenger_generator import BulkPassengerGenerator
+from stormx_http import PooledHttpClient
+from stormx_verification_framework import PASSENGER_TEMPLATE, StormxSystemVerification
+
+from load_tests.latency_histogram import LatencyHistogram
+
+DEFAULT_PAYLOAD_SIZES = (1, 10, 100, 300, 1000)
+DEFAULT_REPETITIONS = 5
+DEFAULT_TIMEOUT_IN_SECONDS = 300
+PAYLOAD_SHAPES = ('uniform', 'bulk')
+REPORT_VERSION = 1
+
+
+class PayloadSizeResult(object):
+    """
+    measurements of the imports of one payload shape and size.
+    """
+
+    def __init__(self, shape, size):
+        self.shape = shape
+        self.size = size
+        self.latencies = LatencyHistogram()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.error_count = 0
+        self.status_codes = collections.Counter()
+
+    def record(self, latency, status_code, request_bytes, response_bytes, success):
+        """
+        :param latency: float seconds
+        :param status_code: int, or an error name when no response was received.
+        """
+        self.latencies.record(latency)
+        self.status_codes[str(status_code)] += 1
+        self.request_bytes = max(self.request_bytes, request_bytes)
+        self.response_bytes = max(self.response_bytes, response_bytes)
+        if not success:
+            self.error_count += 1
+
+    @property
+    def count(self):
+        return self.latencies.total_count
+
+    @property
+    def failed(self):
+        """
+        every import of this size failed.
+        """
+        return bool(self.count) and self.error_count == self.count
+
+    def to_dict(self):
+        p50 = self.latencies.value_at_percentile(50)
+        return {
+            'shape': self.shape,
+            'size': self.size,
+            'count': self.count,
+            'errors': self.error_count,
+            'status_codes': dict(self.status_codes),
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'p50': p50,
+            'p95': self.latencies.value_at_percentile(95),
+            'max': self.latencies.max,
+            'mean': self.latencies.mean,
+            'p50_per_passenger': p50 / self.size,
+            'passengers_per_second': self.size / p50 if p50 else 0.0,
+            'histogram': self.latencies.to_dict(),
+        }
+
+
+def _generate_payload(shape, size, port, bulk_passenger_generator):
+    if shape == 'uniform':
+        return StormxSystemVerification._generate_n_passenger_payload(size, port_accommodation=port)
+    passengers = list(bulk_passenger_generator.generate(size))
+    for passenger in passengers:
+        passenger['port_accommodation'] = port
+    return passengers
+
+
+def run_import_benchmark(api_host, customer='Purple Rain Airlines', port='LAX', sizes=DEFAULT_PAYLOAD_SIZES,
+                         repetitions=DEFAULT_REPETITIONS, shapes=PAYLOAD_SHAPES, timeout=DEFAULT_TIMEOUT_IN_SECONDS,
+                         progress=None):
+    """
+    :param api_host: string
+    :param customer: string - airline customer the passengers are imported for.
+    :param port: string - IATA code of the `port_accommodation` of the passengers.
+    :param sizes: iterable(int) - payload sizes, in passengers, benchmarked in increasing order.
+    :param repetitions: int - imports per shape and size.
+    :param shapes: iterable(string) - names of `PAYLOAD_SHAPES`.
+    :param timeout: float seconds - an import taking longer counts as failed.
+    :param progress: callable(PayloadSizeResult) or None, called after every shape and size.
+    :return: list(PayloadSizeResult)
+    """
+    http = PooledHttpClient(pool_size=1)
+    headers = StormxSystemVerification._generate_airline_headers(customer=customer)
+    headers['Content-Type'] = 'application/json'
+    bulk_passenger_generator = BulkPassengerGenerator(PASSENGER_TEMPLATE[0], fake=faker.Faker())
+    results = []
+    for shape in shapes:
+        if shape not in PAYLOAD_SHAPES:
+            raise ValueError('unknown payload shape {0!r}, expected one of {1}.'.format(shape, PAYLOAD_SHAPES))
+        for size in sorted(sizes):
+            result = PayloadSizeResult(shape, size)
+            for repetition in range(repetitions):
+                body = json.dumps(_generate_payload(shape, size, port, bulk_passenger_generator)).encode('utf-8')
+                started_at = time.perf_counter()
+                try:
+                    response = http.post(api_host + '/api/v1/passenger', headers=headers, data=body, timeout=timeout)
+                except Exception as exception:  # timeouts, connection resets: the payload was too much as well.
+                    result.record(time.perf_counter() - started_at, type(exception).__name__, len(body), 0, False)
+                    continue
+                result.record(time.perf_counter() - started_at, response.status_code, len(body),
+                              len(response.content), response.status_code == 201)
+            results.append(result)
+            if progress:
+                progress(result)
+            if result.failed:
+                break  # larger payloads of this shape would fail as well.
+    http.close()
+    return results
+
+
+def failure_thresholds(results):
+    """
+    :param results: list(PayloadSizeResult)
+    :return: dict - shape -> smallest size of which every import failed (None if none did).
+    """
+    thresholds = {}
+    for result in results:
+        thresholds.setdefault(result.shape, None)
+        if result.failed and thresholds[result.shape] is None:
+            thresholds[result.shape] = result.size
+    return thresholds
+
+
+def benchmark_report(results, build, environment_name):
+    """
+    :param build: string - identifies the StormX build under test, e.g. a version or commit.
+    :return: dict - JSON serializable report, see `format_comparison()`.
+    """
+    return {
+        'version': REPORT_VERSION,
+        'build': build,
+        'environment': environment_name,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'failure_thresholds': failure_thresholds(results),
+        'results': [result.to_dict() for result in results],
+    }
+
+
+def format_results(results):
+    """
+    :return: string - table of the results, latencies in milliseconds.
+    """
+    header = '{0:<8} {1:>6} {2:>6} {3:>7} {4:>10} {5:>9} {6:>9} {7:>9} {8:>12} {9:>10} {10:>10}'.format(
+        'shape', 'size', 'count', 'errors', 'request kB', 'p50 ms', 'p95 ms', 'max ms', 'p50 ms/pax', 'pax/s',
+        'statuses')
+    lines = [header, '-' * len(header)]
+    for result in results:
+        row = result.to_dict()
+        lines.append('{0:<8} {1:>6} {2:>6} {3:>7} {4:>10.1f} {5:>9.1f} {6:>9.1f} {7:>9.1f} {8:>12.2f} {9:>10.1f} {10}'.format(
+            row['shape'], row['size'], row['count'], row['errors'], row['request_bytes'] / 1024.0, row['p50'] * 1000,
+            row['p95'] * 1000, row['max'] * 1000, row['p50_per_passenger'] * 1000, row['passengers_per_second'],
+            ','.join('{0}x{1}'.format(status, count) for status, count in sorted(row['status_codes'].items()))))
+    for shape, size in sorted(failure_thresholds(results).items()):
+        lines.append('{0}: {1}'.format(shape, 'every import of {0} passengers failed'.format(size) if size
+                                       else 'no failure threshold reached'))
+    return '\n'.join(lines)
+
+
+def format_comparison(report, baseline_report):
+    """
+    :param report: dict - `benchmark_report()` of the build under test.
+    :param baseline_report: dict - `benchmark_report()` of the build to compare with.
+    :return: string - p50/p95 of both builds per shape and size, and their ratio.
+    """
+    baseline_rows = {(row['shape'], row['size']): row for row in baseline_report['results']}
+    header = '{0:<8} {1:>6} {2:>14} {3:>14} {4:>8} {5:>14} {6:>14} {7:>8}'.format(
+        'shape', 'size', 'base p50 ms', 'p50 ms', 'ratio', 'base p95 ms', 'p95 ms', 'ratio')
+    lines = ['{0} ({1}) compared with {2} ({3})'.format(report['build'], report['created_at'],
+                                                        baseline_report['build'], baseline_report['created_at']),
+             header, '-' * len(header)]
+    for row in report['results']:
+        baseline_row = baseline_rows.get((row['shape'], row['size']))
+        if baseline_row is None:
+            continue
+        columns = [row['shape'], row['size']]
+        for key in ('p50', 'p95'):
+            ratio = row[key] / baseline_row[key] if baseline_row[key] else float('nan')
+            columns.extend([baseline_row[key] * 1000, row[key] * 1000, ratio])
+        lines.append('{0:<8} {1:>6} {2:>14.1f} {3:>14.1f} {4:>8.2f} {5:>14.1f} {6:>14.1f} {7:>8.2f}'.format(*columns))
+    lines.append('failure thresholds: {0} (baseline {1})'.format(report['failure_thresholds'],
+                                                                 baseline_report['failure_thresholds']))
+    return '\n'.join(lines)
@@ -0,0 +1,169 @@
+"""
+HDR-style latency histogram.
+
+Latencies are stored in microseconds in log-linear buckets: every power of two range is split
+into `2 ** sub_bucket_magnitude` equal sub buckets, so every recorded value is kept with a
+relative precision better than `10 ** -significant_figures`, whatever its magnitude, in a
+few kilobytes. Only non-empty buckets are stored, as a dict, so histograms are cheap to
+serialize (`to_dict()`/`from_dict()`) and to merge (`merge()`) across worker processes.
+"""
+import math
+
+MICROSECONDS_PER_SECOND = 1000000
+DEFAULT_SIGNIFICANT_FIGURES = 3
+DEFAULT_PERCENTILE_TICKS_PER_HALF_DISTANCE = 5
+
+
+class LatencyHistogram(object):
+
+    def __init__(self, significant_figures=DEFAULT_SIGNIFICANT_FIGURES):
+        """
+        :param significant_figures: int between 1 and 5 - precision of the recorded values.
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError('significant_figures must be between 1 and 5.')
+        self.significant_figures = significant_figures
+        sub_bucket_magnitude = int(math.ceil(math.log(2 * 10 ** significant_figures, 2)))
+        self._sub_bucket_half_magnitude = sub_bucket_magnitude - 1
+        self._sub_bucket_mask = (1 << sub_bucket_magnitude) - 1
+        self._counts = {}  # lowest equivalent value in microseconds -> count
+        self.total_count = 0
+        self._min_value = None
+        self._max_value = None
+        self._total_value = 0
+
+    def _bucket_shift(self, value):
+        return max((value | self._sub_bucket_mask).bit_length() - self._sub_bucket_half_magnitude - 1, 0)
+
+    def _lowest_equivalent_value(self, value):
+        shift = self._bucket_shift(value)
+        return (value >> shift) << shift
+
+    def _highest_equivalent_value(self, lowest_equivalent_value):
+        return lowest_equivalent_value + (1 << self._bucket_shift(lowest_equivalent_value)) - 1
+
+    def record(self, latency, count=1):
+        """
+        :param latency: float seconds, negative values are recorded as 0.
+        :param count: int - number of times the value occurred.
+        """
+        value = max(int(round(latency * MICROSECONDS_PER_SECOND)), 0)
+        key = self._lowest_equivalent_value(value)
+        self._counts[key] = self._counts.get(key, 0) + count
+        self.total_count += count
+        self._total_value += value * count
+        self._min_value = value if self._min_value is None else min(self._min_value, value)
+        self._max_value = value if self._max_value is None else max(self._max_value, value)
+
+    def merge(self, other):
+        """
+        add the values recorded by `other` to this histogram.
+        :param other: LatencyHistogram with the same `significant_figures`.
+        """
+        if other.significant_figures != self.significant_figures:
+            raise ValueError('cannot merge histograms of different precisions.')
+        for key, count in other._counts.items():
+            self._counts[key] = self._counts.get(key, 0) + count
+        self.total_count += other.total_count
+        self._total_value += other._total_value
+        for value in (other._min_value, other._max_value):
+            if value is not None:
+                self._min_value = value if self._min_value is None else min(self._min_value, value)
+                self._max_value = value if self._max_value is None else max(self._max_value, value)
+
+    @property
+    def min(self):
+        return (self._min_value or 0) / float(MICROSECONDS_PER_SECOND)
+
+    @property
+    def max(self):
+        return (self._max_value or 0) / float(MICROSECONDS_PER_SECOND)
+
+    @property
+    def mean(self):
+        if not self.total_count:
+            return 0.0
+        return self._total_value / float(self.total_count) / MICROSECONDS_PER_SECOND
+
+    def _value_at_percentile(self, percentile):
+        """
+        :return: int microseconds
+        """
+        count_at_percentile = max(int(math.ceil(min(percentile, 100.0) / 100.0 * self.total_count)), 1)
+        running_count = 0
+        for key in sorted(self._counts):
+            running_count += self._counts[key]
+            if running_count >= count_at_percentile:
+                return min(self._highest_equivalent_value(key), self._max_value)
+        return self._max_value
+
+    def value_at_percentile(self, percentile):
+        """
+        :param percentile: float between 0 and 100, e.g. 99.9
+        :return: float seconds - highest value (within the histogram precision) that `percentile`
+                 percent of the recorded values are smaller than or equal to. 0 when empty.
+        """
+        if not self.total_count:
+            return 0.0
+        return self._value_at_percentile(percentile) / float(MICROSECONDS_PER_SECOND)
+
+    def value_counts(self):
+        """
+        :return: dict - float seconds -> count, one entry per non-empty bucket (at its highest equivalent value).
+        """
+        return {min(self._highest_equivalent_value(key), self._max_value) / float(MICROSECONDS_PER_SECOND): count
+                for key, count in self._counts.items()}
+
+    def percentile_distribution(self, ticks_per_half_distance=DEFAULT_PERCENTILE_TICKS_PER_HALF_DISTANCE):
+        """
+        percentiles at increasingly fine steps towards 100 (the HdrHistogram "percentile distribution").
+        :return: list of (percentile, value in seconds, count of values <= value) tuples.
+        """
+        rows = []
+        if not self.total_count:
+            return rows
+        percentile = 0.0
+        while True:
+            value = self._value_at_percentile(percentile)
+            count = sum(count for key, count in self._counts.items() if key <= value)
+            rows.append((percentile, value / float(MICROSECONDS_PER_SECOND), count))
+            if count >= self.total_count:
+                return rows
+            half_distance = 2 ** int(math.log(100.0 / (100.0 - percentile), 2) + 1)
+            percentile += 100.0 / (half_distance * ticks_per_half_distance)
+
+    def format_percentile_distribution(self, title=None):
+        """
+        :param title: string or None
+        :return: string - percentile table, values in milliseconds.
+        """
+        lines = [title] if title else []
+        lines.append('{0:>12} {1:>14} {2:>10} {3:>14}'.format('value ms', 'percentile', 'count', '1/(1-p)'))
+        for percentile, value, count in self.percentile_distribution():
+            inverse = '{0:>14.2f}'.format(100.0 / (100.0 - percentile)) if percentile < 100 else '{0:>14}'.format('inf')
+            lines.append('{0:>12.3f} {1:>14.6f} {2:>10} {3}'.format(value * 1000, percentile / 100.0, count, inverse))
+        lines.append('#[mean = {0:.3f} ms, max = {1:.3f} ms, total count = {2}]'.format(
+            self.mean * 1000, self.max * 1000, self.total_count))
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        """
+        :return: dict - JSON serializable state, see `from_dict()`.
+        """
+        return {
+            'significant_figures': self.significant_figures,
+            'counts': {str(key): count for key, count in self._counts.items()},
+            'min': self._min_value,
+            'max': self._max_value,
+            'total': self._total_value,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        histogram = cls(significant_figures=state['significant_figures'])
+        histogram._counts = {int(key): count for key, count in state['counts'].items()}
+        histogram.total_count = sum(histogram._counts.values())
+        histogram._min_value = state['min']
+        histogram._max_value = state['max']
+        histogram._total_value = state['total']
+        return histogram
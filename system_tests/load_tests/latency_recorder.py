@@ -0,0 +1,162 @@
+"""
+Per-endpoint latency histograms of a load run.
+
+Two latencies are recorded for every call:
+
+* the service time, measured from the moment the call was actually sent.
+* the response time, measured from the moment the call was *supposed* to be sent according to
+  the open-loop schedule. When the load generator falls behind (all concurrency slots busy,
+  a stalled server, a GC pause...), calls leave late, and the service time alone hides that
+  wait: the stall is recorded once instead of once per call that was held back
+  ("coordinated omission"). The response time is what a user arriving on schedule would see,
+  so the reported percentiles are computed from it; the service time p99 is reported next to
+  it to show how much of the tail is queueing.
+
+Recorders are mergeable (`merge()`, `to_dict()`/`from_dict()`), so runs spread over several
+processes report percentiles over all of their samples, not averages of percentiles.
+"""
+import threading
+
+from load_tests.latency_histogram import LatencyHistogram
+
+REPORTED_PERCENTILES = (50, 95, 99, 99.9)
+
+
+class EndpointLatencies(object):
+
+    def __init__(self, response_times=None, service_times=None, error_count=0):
+        self.response_times = response_times or LatencyHistogram()
+        self.service_times = service_times or LatencyHistogram()
+        self.error_count = error_count
+
+    def merge(self, other):
+        self.response_times.merge(other.response_times)
+        self.service_times.merge(other.service_times)
+        self.error_count += other.error_count
+
+    def to_dict(self):
+        return {
+            'response_times': self.response_times.to_dict(),
+            'service_times': self.service_times.to_dict(),
+            'errors': self.error_count,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(LatencyHistogram.from_dict(state['response_times']),
+                   LatencyHistogram.from_dict(state['service_times']), state['errors'])
+
+
+class LatencyRecorder(object):
+    """
+    thread safe collection of per-endpoint latency histograms.
+    """
+
+    def __init__(self):
+        self._endpoints = {}  # endpoint -> EndpointLatencies
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, latency, success=True, scheduled_latency=None):
+        """
+        :param endpoint: string like 'POST /api/v1/passenger'
+        :param latency: float seconds - service time, from the actual send time.
+        :param success: bool
+        :param scheduled_latency: float seconds or None - response time, from the intended send time.
+                                  None when the call had no intended send time of its own (same as `latency`).
+        """
+        with self._lock:
+            latencies = self._endpoints.get(endpoint)
+            if latencies is None:
+                latencies = self._endpoints[endpoint] = EndpointLatencies()
+            latencies.service_times.record(latency)
+            latencies.response_times.record(latency if scheduled_latency is None else max(scheduled_latency, latency))
+            if not success:
+                latencies.error_count += 1
+
+    def endpoints(self):
+        with self._lock:
+            return sorted(self._endpoints)
+
+    def histogram(self, endpoint, corrected=True):
+        """
+        :param endpoint: string
+        :param corrected: bool - response times (True) or service times (False).
+        :return: LatencyHistogram
+        """
+        with self._lock:
+            latencies = self._endpoints[endpoint]
+            return latencies.response_times if corrected else latencies.service_times
+
+    def merge(self, other):
+        """
+        :param other: LatencyRecorder, e.g. of another worker process.
+        """
+        with self._lock:
+            for endpoint, other_latencies in other._endpoints.items():
+                latencies = self._endpoints.get(endpoint)
+                if latencies is None:
+                    latencies = self._endpoints[endpoint] = EndpointLatencies()
+                latencies.merge(other_latencies)
+
+    def to_dict(self):
+        """
+        :return: dict - JSON serializable (and picklable) state, see `from_dict()`.
+        """
+        with self._lock:
+            return {endpoint: latencies.to_dict() for endpoint, latencies in self._endpoints.items()}
+
+    @classmethod
+    def from_dict(cls, state):
+        recorder = cls()
+        recorder._endpoints = {endpoint: EndpointLatencies.from_dict(latencies) for endpoint, latencies in state.items()}
+        return recorder
+
+    def summary(self, elapsed_time):
+        """
+        :param elapsed_time: float - seconds the load run lasted, to compute throughput.
+        :return: list of dicts, one per endpoint. percentiles are of the response times
+                 (corrected for coordinated omission), 'p99_service' is of the service times.
+        """
+        rows = []
+        with self._lock:
+            for endpoint in sorted(self._endpoints):
+                latencies = self._endpoints[endpoint]
+                row = {
+                    'endpoint': endpoint,
+                    'count': latencies.response_times.total_count,
+                    'errors': latencies.error_count,
+                    'throughput': latencies.response_times.total_count / elapsed_time if elapsed_time else 0.0,
+                    'max': latencies.response_times.max,
+                    'p99_service': latencies.service_times.value_at_percentile(99),
+                }
+                for percentile in REPORTED_PERCENTILES:
+                    row['p{0:g}'.format(percentile)] = latencies.response_times.value_at_percentile(percentile)
+                rows.append(row)
+        return rows
+
+    def format_report(self, elapsed_time):
+        """
+        :return: string - table of the summary, latencies in milliseconds.
+        """
+        header = '{0:<50} {1:>7} {2:>7} {3:>8} {4:>9} {5:>9} {6:>9} {7:>9} {8:>9} {9:>12}'.format(
+            'endpoint', 'count', 'errors', 'req/s', 'p50 ms', 'p95 ms', 'p99 ms', 'p99.9 ms', 'max ms',
+            'p99 svc ms')
+        lines = [header, '-' * len(header)]
+        for row in self.summary(elapsed_time):
+            lines.append(
+                '{0:<50} {1:>7} {2:>7} {3:>8.2f} {4:>9.1f} {5:>9.1f} {6:>9.1f} {7:>9.1f} {8:>9.1f} {9:>12.1f}'.format(
+                    row['endpoint'], row['count'], row['errors'], row['throughput'], row['p50'] * 1000,
+                    row['p95'] * 1000, row['p99'] * 1000, row['p99.9'] * 1000, row['max'] * 1000,
+                    row['p99_service'] * 1000))
+        lines.append('percentiles are corrected for coordinated omission (measured from the scheduled send time), '
+                     '"p99 svc" is measured from the actual send time.')
+        return '\n'.join(lines)
+
+    def format_percentile_tables(self):
+        """
+        :return: string - full percentile distribution of the response times of every endpoint.
+        """
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+        return '\n\n'.join(latencies.response_times.format_percentile_distribution(title=endpoint)
+                           for endpoint, latencies in endpoints)
@@ -0,0 +1,177 @@
+"""
+Open-loop load generator.
+
+Scenario starts are scheduled ahead of time from the arrival rate, independently of how fast
+the server answers (open loop), so a slow server receives the same offered load as a fast one
+instead of being given a break. The rate ramps up linearly from 0 to `arrival_rate` during
+`ramp_up` seconds and then stays constant until `duration` seconds have passed.
+
+Latencies are measured from the scheduled start times, see `latency_recorder.py`.
+`run_load_in_processes()` spreads the schedule over several processes (when a single Python
+process cannot keep up with the arrival rate) and merges their histograms.
+"""
+import math
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from stormx_http import PooledHttpClient
+
+from load_tests.latency_recorder import LatencyRecorder
+from load_tests.scenarios import SCENARIOS, LoadContext
+
+
+class LoadProfile(object):
+
+    def __init__(self, arrival_rate, duration, ramp_up=0.0, scenario_mix=None, poisson_arrivals=False, seed=None,
+                 phase=0.0):
+        """
+        :param arrival_rate: float - scenario starts per second once ramped up.
+        :param duration: float - seconds, including the ramp up.
+        :param ramp_up: float - seconds to linearly increase the rate from 0 to `arrival_rate`.
+        :param scenario_mix: dict - scenario name -> relative weight. defaults to every scenario, equally weighted.
+        :param poisson_arrivals: bool - exponentially distributed inter-arrival times instead of evenly spaced ones.
+        :param seed: int or None - seed of the random arrival times and scenario picks.
+        :param phase: float in [0, 1) - shift of the evenly spaced arrivals, as a fraction of the inter-arrival time.
+        """
+        if arrival_rate <= 0:
+            raise ValueError('arrival_rate must be positive.')
+        if not 0 <= ramp_up <= duration:
+            raise ValueError('ramp_up must be between 0 and duration.')
+        scenario_mix = scenario_mix or {name: 1 for name in SCENARIOS}
+        unknown_scenarios = set(scenario_mix) - set(SCENARIOS)
+        if unknown_scenarios:
+            raise ValueError('unknown scenarios: ' + ', '.join(sorted(unknown_scenarios)) +
+                             '. available: ' + ', '.join(sorted(SCENARIOS)))
+
+        self.arrival_rate = float(arrival_rate)
+        self.duration = float(duration)
+        self.ramp_up = float(ramp_up)
+        self.scenario_mix = scenario_mix
+        self.poisson_arrivals = poisson_arrivals
+        self.seed = seed
+        self.phase = phase
+        self.random = random.Random(seed)
+
+    def split(self, part_count):
+        """
+        :param part_count: int
+        :return: list of `part_count` LoadProfile whose arrivals together follow this profile.
+        """
+        return [LoadProfile(self.arrival_rate / part_count, self.duration, ramp_up=self.ramp_up,
+                            scenario_mix=self.scenario_mix, poisson_arrivals=self.poisson_arrivals,
+                            seed=None if self.seed is None else self.seed + part_index,
+                            phase=(self.phase + part_index) / float(part_count))
+                for part_index in range(part_count)]
+
+    def _arrivals_until(self, offset):
+        """
+        :return: float - expected number of arrivals between 0 and `offset` seconds.
+        """
+        if offset <= self.ramp_up:
+            return self.arrival_rate * offset * offset / (2 * self.ramp_up)
+        return self.arrival_rate * (self.ramp_up / 2 + (offset - self.ramp_up))
+
+    def _offset_of_arrival(self, arrivals):
+        """
+        inverse of `_arrivals_until`.
+        """
+        ramp_up_arrivals = self.arrival_rate * self.ramp_up / 2
+        if arrivals <= ramp_up_arrivals:
+            return math.sqrt(2 * self.ramp_up * arrivals / self.arrival_rate)
+        return self.ramp_up + (arrivals - ramp_up_arrivals) / self.arrival_rate
+
+    def schedule(self):
+        """
+        :return: generator of (intended start offset in seconds, scenario name), in time order.
+        """
+        names = sorted(self.scenario_mix)
+        weights = [self.scenario_mix[name] for name in names]
+        arrivals = self.phase - 1.0 if not self.poisson_arrivals else 0.0
+        while True:
+            arrivals += self.random.expovariate(1.0) if self.poisson_arrivals else 1.0
+            offset = self._offset_of_arrival(arrivals)
+            if offset >= self.duration:
+                return
+            yield offset, self.random.choices(names, weights)[0]
+
+
+def run_load(api_host, profile, max_concurrency=200, customer='Purple Rain Airlines', port='LAX', recorder=None):
+    """
+    generate load against `api_host` following `profile`.
+    :param api_host: string
+    :param profile: LoadProfile
+    :param max_concurrency: int - maximum number of scenarios running at the same time. scenarios
+                            that are due while all slots are busy start late (and are reported as such).
+    :param customer: string
+    :param port: string
+    :param recorder: LatencyRecorder or None
+    :return: (recorder, elapsed seconds, number of late scenario starts) tuple.
+    """
+    recorder = recorder or LatencyRecorder()
+    http = PooledHttpClient(pool_size=max_concurrency)
+    context = LoadContext(api_host, http, recorder, customer=customer, port=port)
+    late_starts = [0]
+    late_starts_lock = threading.Lock()
+
+    def run_scenario(scenario_name, scheduled_start):
+        started_at = time.perf_counter()
+        if started_at - scheduled_start > 1.0:
+            with late_starts_lock:
+                late_starts[0] += 1
+        context.start_scenario(scheduled_start)
+        success = True
+        try:
+            SCENARIOS[scenario_name](context)
+        except Exception:  # ScenarioAborted, or anything else: counted as an error of the scenario either way.
+            success = False
+        finished_at = time.perf_counter()
+        recorder.record('scenario: ' + scenario_name, finished_at - started_at, success=success,
+                        scheduled_latency=finished_at - scheduled_start)
+
+    run_started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for offset, scenario_name in profile.schedule():
+            scheduled_start = run_started_at + offset
+            delay = scheduled_start - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(run_scenario, scenario_name, scheduled_start)
+    elapsed_time = time.perf_counter() - run_started_at
+    http.close()
+
+    return recorder, elapsed_time, late_starts[0]
+
+
+def _run_load_worker(api_host, profile, max_concurrency, customer, port):
+    """
+    worker process entry point.
+    :return: (recorder state dict, elapsed seconds, number of late scenario starts) tuple.
+    """
+    recorder, elapsed_time, late_starts = run_load(api_host, profile, max_concurrency=max_concurrency,
+                                                   customer=customer, port=port)
+    return recorder.to_dict(), elapsed_time, late_starts
+
+
+def run_load_in_processes(api_host, profile, processes, max_concurrency=200, customer='Purple Rain Airlines',
+                          port='LAX'):
+    """
+    same as `run_load()`, with the arrivals and the concurrency split over `processes` worker processes.
+    :return: (merged recorder, elapsed seconds, number of late scenario starts) tuple.
+    """
+    if processes <= 1:
+        return run_load(api_host, profile, max_concurrency=max_concurrency, customer=customer, port=port)
+
+    recorder = LatencyRecorder()
+    elapsed_time, late_starts = 0.0, 0
+    concurrency_per_process = max(max_concurrency // processes, 1)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_run_load_worker, api_host, part, concurrency_per_process, customer, port)
+                   for part in profile.split(processes)]
+        for future in futures:
+            recorder_state, worker_elapsed_time, worker_late_starts = future.result()
+            recorder.merge(LatencyRecorder.from_dict(recorder_state))
+            elapsed_time = max(elapsed_time, worker_elapsed_time)
+            late_starts += worker_late_starts
+    return recorder, elapsed_time, late_starts
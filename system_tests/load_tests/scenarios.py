@@ -0,0 +1,133 @@
+"""
+Load test scenarios. Each scenario is a function taking a `LoadContext`, replaying the
+HTTP calls of one user journey that the system tests also exercise.
+
+Every call is recorded under its route template (e.g. 'PUT /api/v1/passenger/{context_id}/decline'),
+so latencies of the same endpoint are aggregated no matter which passenger was used.
+"""
+import threading
+import time
+
+from stormx_verification_framework import StormxSystemVerification
+
+
+class ScenarioAborted(Exception):
+    """
+    raised when a call of a scenario failed, and the rest of the scenario cannot run.
+    """
+
+
+class LoadContext(object):
+    """
+    everything a scenario needs: hosts, credentials, the HTTP client and the latency recorder.
+    """
+
+    def __init__(self, api_host, http, recorder, customer='Purple Rain Airlines', port='LAX'):
+        """
+        :param api_host: string
+        :param http: PooledHttpClient
+        :param recorder: LatencyRecorder
+        :param customer: string - airline customer the load is generated for.
+        :param port: string - IATA code of the port used for hotel searches.
+        """
+        self.api_host = api_host
+        self.http = http
+        self.recorder = recorder
+        self.customer = customer
+        self.port = port
+        self.airline_headers = StormxSystemVerification._generate_airline_headers(customer=customer)
+        self.passenger_headers = StormxSystemVerification._generate_passenger_headers()
+        self._thread_state = threading.local()
+
+    def start_scenario(self, scheduled_start):
+        """
+        :param scheduled_start: float `time.perf_counter()` time the scenario was scheduled to start at.
+                                the first call of the scenario is measured from that time as well.
+        """
+        self._thread_state.scheduled_send_time = scheduled_start
+
+    def call(self, endpoint, method, path, expected_status_code=200, **kwargs):
+        """
+        perform and record one HTTP call.
+        :param endpoint: string - route template used to aggregate latencies.
+        :param method: string
+        :param path: string - path under the API host.
+        :param expected_status_code: int
+        :return: requests.Response
+        raises ScenarioAborted if the call failed.
+        """
+        scheduled_at = getattr(self._thread_state, 'scheduled_send_time', None)
+        self._thread_state.scheduled_send_time = None
+        started_at = time.perf_counter()
+        response, error = None, None
+        try:
+            response = self.http.request(method, self.api_host + path, **kwargs)
+        except Exception as exception:
+            error = exception
+        finished_at = time.perf_counter()
+        success = error is None and response.status_code == expected_status_code
+        self.recorder.record(endpoint, finished_at - started_at, success=success,
+                             scheduled_latency=finished_at - scheduled_at if scheduled_at is not None else None)
+
+        if error is not None:
+            raise ScenarioAborted(endpoint + ': ' + repr(error))
+        if not success:
+            raise ScenarioAborted(endpoint + ': unexpected status code ' + str(response.status_code))
+        return response
+
+    def import_passengers(self, number_of_passengers=2, **kwargs):
+        """
+        :return: list(dict) - the imported passengers.
+        """
+        passengers = StormxSystemVerification._generate_n_passenger_payload(
+            number_of_passengers, port_accommodation=self.port, **kwargs)
+        response = self.call('POST /api/v1/passenger', 'POST', '/api/v1/passenger', expected_status_code=201,
+                             headers=self.airline_headers, json=passengers)
+        return response.json()['data']
+
+
+def passenger_import(context):
+    context.import_passengers()
+
+
+def hotel_search(context):
+    context.call('GET /api/v1/hotels', 'GET', '/api/v1/hotels', headers=context.airline_headers,
+                 params=dict(port=context.port, room_count='1'))
+
+
+def book(context):
+    passengers = context.import_passengers()
+    offer_parameters = dict(ak1=passengers[0]['ak1'], ak2=passengers[0]['ak2'])
+
+    response = context.call('GET /api/v1/offer/hotels', 'GET', '/api/v1/offer/hotels',
+                            headers=context.passenger_headers, params=dict(offer_parameters, room_count='1'))
+    hotels = response.json()['data']
+    if not hotels:
+        raise ScenarioAborted('no hotel inventory at ' + context.port)
+
+    context.call('POST /api/v1/offer/hotels', 'POST', '/api/v1/offer/hotels',
+                 headers=context.passenger_headers, params=offer_parameters,
+                 json=dict(context_ids=[passenger['context_id'] for passenger in passengers],
+                           hotel_id=hotels[0]['hotel_id'], room_count=1))
+
+
+def decline(context):
+    passengers = context.import_passengers()
+    context.call('PUT /api/v1/passenger/{context_id}/decline', 'PUT',
+                 '/api/v1/passenger/' + passengers[0]['context_id'] + '/decline', headers=context.airline_headers)
+
+
+def notifications(context):
+    passengers = context.import_passengers(notify=True, emails=['load.test@blackhole.tvlinc.com'])
+    context.call('POST /api/v1/passenger/{context_id}/notifications', 'POST',
+                 '/api/v1/passenger/' + passengers[0]['context_id'] + '/notifications',
+                 headers=context.airline_headers, data={'email': 'load.test@blackhole.tvlinc.com'})
+
+
+SCENARIOS = {
+    'passenger_import': passenger_import,
+    'hotel_search': hotel_search,
+    'book': book,
+    'decline': decline,
+    'notifications': notifications,
+}
@@ -0,0 +1,109 @@
+"""
+Process-wide (and optionally on-disk) cache of StormX PHP login session cookies.
+
+Every `StormxSystemVerification` subclass used to log in the 'support' user (including the
+password reset dance) in its own `setUpClass`. With this cache, only the first class of a run
+logs in; later classes reuse the session cookies, keyed by environment name and username.
+
+Cached cookies expire after `STORMX_LOGIN_COOKIE_CACHE_TTL` seconds (default 1200, shorter than
+the default PHP session lifetime). Set `STORMX_LOGIN_COOKIE_CACHE_FILE` to a file path to share
+the cookies between processes (parallel workers, consecutive runs) through a small JSON file.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEFAULT_TTL_IN_SECONDS = int(os.getenv('STORMX_LOGIN_COOKIE_CACHE_TTL', '1200'))
+DEFAULT_CACHE_FILE_PATH = os.getenv('STORMX_LOGIN_COOKIE_CACHE_FILE') or None
+
+
+class LoginCookieCache(object):
+
+    def __init__(self, ttl_in_seconds=DEFAULT_TTL_IN_SECONDS, file_path=DEFAULT_CACHE_FILE_PATH):
+        """
+        :param ttl_in_seconds: int
+        :param file_path: string or None (None keeps the cache in memory only)
+        """
+        self.ttl_in_seconds = ttl_in_seconds
+        self.file_path = file_path
+        self._entries = {}  # key -> {'cookies': dict, 'created_at': float}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(environment_name, username):
+        return str(environment_name) + '|' + str(username)
+
+    def _is_fresh(self, entry):
+        return entry is not None and (time.time() - entry['created_at']) < self.ttl_in_seconds
+
+    def _read_file(self):
+        if not self.file_path or not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path) as cache_file:
+                return json.load(cache_file)
+        except ValueError:
+            return {}  # a corrupt or half written cache file is just a cache miss.
+
+    def _write_file(self, entries):
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'w') as cache_file:
+            json.dump(entries, cache_file)
+        os.replace(temporary_path, self.file_path)  # atomic, concurrent readers never see a partial file.
+
+    def get(self, environment_name, username):
+        """
+        :param environment_name: string
+        :param username: string
+        :return: dict of cookies, or None if nothing fresh is cached.
+        """
+        key = self._key(environment_name, username)
+        with self._lock:
+            entry = self._entries.get(key)
+            if not self._is_fresh(entry) and self.file_path:
+                entry = self._read_file().get(key)
+                if self._is_fresh(entry):
+                    self._entries[key] = entry
+            if not self._is_fresh(entry):
+                return None
+            return dict(entry['cookies'])
+
+    def set(self, environment_name, username, cookies):
+        """
+        :param environment_name: string
+        :param username: string
+        :param cookies: dict
+        """
+        key = self._key(environment_name, username)
+        entry = {'cookies': dict(cookies), 'created_at': time.time()}
+        with self._lock:
+            self._entries[key] = entry
+            if self.file_path:
+                entries = {cached_key: cached_entry for cached_key, cached_entry in self._read_file().items()
+                           if self._is_fresh(cached_entry)}
+                entries[key] = entry
+                self._write_file(entries)
+
+    def invalidate(self, environment_name, username):
+        """
+        forget the cookies of a user, e.g. after the user logged out or changed password.
+        """
+        key = self._key(environment_name, username)
+        with self._lock:
+            self._entries.pop(key, None)
+            if self.file_path:
+                entries = self._read_file()
+                if entries.pop(key, None) is not None:
+                    self._write_file(entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            if self.file_path and os.path.exists(self.file_path):
+                os.remove(self.file_path)
+
+
+login_cookie_cache = LoginCookieCache()
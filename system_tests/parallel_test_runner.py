@@ -0,0 +1,343 @@
+"""
+Parallel and sharded execution of the system tests.
+
+`run_system_tests.py` hands a regular `unittest` suite to this module. The suite is split
+into "units" (one unit per test class, so `setUpClass` still runs once per class), the
+units are optionally narrowed down to a single shard, then fanned out over a process pool.
+Every worker process imports the test modules itself, binds the environment under test to
+the test class and runs the unit with a plain `unittest.TextTestRunner`.
+The results of all units are merged and reported at the end of the run.
+
+scheduling:
+    the duration of every test, and the time every test class spends outside of its tests
+    (`setUpClass`...), is recorded in a `DurationHistory` (see `duration_history.py`).
+    Units are handed to the workers longest first, and `--shard i/n` splits the units into n
+    shards of roughly equal expected duration with longest-processing-time-first bin packing.
+    Every CI box can run `--shard 1/4`, `--shard 2/4`, ... and the shards together cover the
+    whole suite exactly once.
+"""
+import heapq
+import importlib
+import io
+import sys
+import time
+import traceback
+import unittest
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from duration_history import class_setup_id
+
+
+class SuiteUnit(object):
+    """
+    a test class plus the test methods of that class to run, in one worker, in one go.
+    """
+
+    def __init__(self, module_name, class_name, method_names):
+        """
+        :param module_name: string
+        :param class_name: string
+        :param method_names: list(string)
+        """
+        self.module_name = module_name
+        self.class_name = class_name
+        self.method_names = list(method_names)
+
+    @property
+    def name(self):
+        return self.module_name + '.' + self.class_name
+
+    def test_ids(self):
+        return [self.name + '.' + method_name for method_name in self.method_names]
+
+    def duration_ids(self):
+        """
+        :return: list(string) - `DurationHistory` keys of the unit: its class setup and its tests.
+        """
+        return [class_setup_id(self.name)] + self.test_ids()
+
+    def __repr__(self):
+        return 'SuiteUnit({0}, {1} tests)'.format(self.name, len(self.method_names))
+
+
+def iterate_test_cases(suite):
+    """
+    flatten a (nested) `unittest.TestSuite`.
+    :param suite: unittest.TestSuite or unittest.TestCase
+    :return: generator of unittest.TestCase
+    """
+    if isinstance(suite, unittest.TestSuite):
+        for test in suite:
+            for test_case in iterate_test_cases(test):
+                yield test_case
+    else:
+        yield suite
+
+
+def collect_test_units(suite):
+    """
+    group the tests of a suite by test class.
+    :param suite: unittest.TestSuite
+    :return: list(SuiteUnit) sorted by name.
+    """
+    grouped_method_names = OrderedDict()
+    for test_case in iterate_test_cases(suite):
+        test_class = type(test_case)
+        key = (test_class.__module__, test_class.__name__)
+        grouped_method_names.setdefault(key, []).append(test_case._testMethodName)
+
+    units = [SuiteUnit(module_name, class_name, method_names)
+             for (module_name, class_name), method_names in grouped_method_names.items()]
+    return sorted(units, key=lambda unit: unit.name)
+
+
+def parse_shard(shard_text):
+    """
+    :param shard_text: string like '2/5'
+    :return: (shard_index, shard_count) tuple of ints, shard_index is 1-based.
+    """
+    try:
+        shard_index, shard_count = (int(part) for part in shard_text.split('/'))
+    except ValueError:
+        raise ValueError('invalid shard ' + repr(shard_text) + ', expected the form "i/n", e.g. "1/4".')
+    if shard_count < 1 or not (1 <= shard_index <= shard_count):
+        raise ValueError('invalid shard ' + repr(shard_text) + ', expected 1 <= i <= n.')
+    return shard_index, shard_count
+
+
+def order_longest_first(units, duration_history):
+    """
+    :param units: list(SuiteUnit)
+    :param duration_history: DurationHistory
+    :return: list(SuiteUnit) sorted by expected duration, longest first (ties broken by name).
+    """
+    return sorted(units, key=lambda unit: (-duration_history.estimate(unit.duration_ids()), unit.name))
+
+
+def partition_units(units, bin_count, duration_history):
+    """
+    longest processing time first bin packing: every unit, longest first, goes to the
+    bin with the smallest expected total duration so far.
+    :param units: list(SuiteUnit)
+    :param bin_count: int
+    :param duration_history: DurationHistory
+    :return: list of `bin_count` lists of SuiteUnit.
+    """
+    bins = [[] for _ in range(bin_count)]
+    bin_heap = [(0.0, bin_index) for bin_index in range(bin_count)]  # (expected duration, bin index)
+    for unit in order_longest_first(units, duration_history):
+        expected_duration, bin_index = heapq.heappop(bin_heap)
+        bins[bin_index].append(unit)
+        heapq.heappush(bin_heap, (expected_duration + duration_history.estimate(unit.duration_ids()), bin_index))
+    return bins
+
+
+def select_shard(units, shard_index, shard_count, duration_history):
+    """
+    :param units: list(SuiteUnit)
+    :param shard_index: int (1-based)
+    :param shard_count: int
+    :param duration_history: DurationHistory - must be the same for every shard.
+    :return: list(SuiteUnit) belonging to the shard.
+    """
+    return partition_units(units, shard_count, duration_history)[shard_index - 1]
+
+
+class _TimedTextTestResult(unittest.TextTestResult):
+    """
+    text test result that also records the wall clock duration of every test.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_TimedTextTestResult, self).__init__(*args, **kwargs)
+        self.test_durations = []
+        self._test_started_at = None
+
+    def startTest(self, test):
+        self._test_started_at = time.time()
+        super(_TimedTextTestResult, self).startTest(test)
+
+    def stopTest(self, test):
+        super(_TimedTextTestResult, self).stopTest(test)
+        self.test_durations.append((test.id(), time.time() - self._test_started_at))
+
+
+def _run_test_unit(environment_name, environment_config, module_name, class_name, method_names):
+    """
+    worker process entry point.
+    :return: dict - picklable summary of the unit's test result.
+    """
+    from stormx_http import http_client
+    from stormx_verification_framework import SUPPORTED_ENVIRONMENTS
+    from test_registry import bind_environment
+
+    SUPPORTED_ENVIRONMENTS.setdefault(environment_name, environment_config)
+    bind_environment(environment_name)
+    test_class = getattr(importlib.import_module(module_name), class_name)
+
+    suite = unittest.TestSuite(test_class(method_name) for method_name in method_names)
+    stream = io.StringIO()
+    started_at = time.time()
+    result = unittest.TextTestRunner(stream=stream, verbosity=2, resultclass=_TimedTextTestResult).run(suite)
+    duration = time.time() - started_at
+
+    return {
+        'name': module_name + '.' + class_name,
+        'tests_run': result.testsRun,
+        'failures': [(test.id(), test_traceback) for test, test_traceback in result.failures],
+        'errors': [(test.id(), test_traceback) for test, test_traceback in result.errors],
+        'skipped': [(test.id(), reason) for test, reason in result.skipped],
+        'expected_failures': len(result.expectedFailures),
+        'unexpected_successes': [test.id() for test in result.unexpectedSuccesses],
+        'duration': duration,
+        # `setUpClass`, `tearDownClass` and whatever else the unit spent outside of its tests.
+        'class_setup_duration': max(duration - sum(test_duration for _, test_duration in result.test_durations), 0.0),
+        'test_durations': result.test_durations,
+        'http_calls': http_client.tracer.drain() if http_client.tracer is not None else [],
+        'output': stream.getvalue(),
+    }
+
+
+def _failed_unit_result(unit, exception_traceback):
+    """
+    :param unit: SuiteUnit whose worker raised instead of returning its result (import error, unpicklable
+                 result, killed worker...).
+    :param exception_traceback: string
+    :return: dict - unit summary with the failure recorded as an error of the unit.
+    """
+    return {
+        'name': unit.name,
+        'tests_run': 0,
+        'failures': [],
+        'errors': [(unit.name, exception_traceback)],
+        'skipped': [],
+        'expected_failures': 0,
+        'unexpected_successes': [],
+        'duration': 0.0,
+        'class_setup_duration': 0.0,
+        'test_durations': [],
+        'http_calls': [],
+        'output': '',
+    }
+
+
+class MergedTestResult(object):
+    """
+    accumulates the unit summaries returned by the worker processes.
+    """
+
+    def __init__(self):
+        self.unit_results = []
+
+    def add(self, unit_result):
+        self.unit_results.append(unit_result)
+
+    def _total(self, key):
+        return sum(len(unit_result[key]) for unit_result in self.unit_results)
+
+    @property
+    def test_durations(self):
+        """
+        :return: list of (test id, seconds) tuples.
+        """
+        return [test_duration for unit_result in self.unit_results for test_duration in unit_result['test_durations']]
+
+    @property
+    def tests_run(self):
+        return sum(unit_result['tests_run'] for unit_result in self.unit_results)
+
+    def was_successful(self):
+        return (self._total('failures') == 0 and self._total('errors') == 0 and
+                self._total('unexpected_successes') == 0)
+
+    def print_report(self, elapsed_time, stream=sys.stderr):
+        separator = '=' * 70
+        for unit_result in self.unit_results:
+            for kind, key in (('ERROR', 'errors'), ('FAIL', 'failures')):
+                for test_id, test_traceback in unit_result[key]:
+                    stream.write(separator + '\n' + kind + ': ' + test_id + '\n' + '-' * 70 + '\n' + test_traceback +
+                                 '\n')
+
+        stream.write('-' * 70 + '\n')
+        stream.write('Ran {0} tests in {1:.3f}s ({2} test classes)\n\n'.format(
+            self.tests_run, elapsed_time, len(self.unit_results)))
+
+        details = []
+        for label, key in (('failures', 'failures'), ('errors', 'errors'), ('skipped', 'skipped'),
+                           ('unexpected successes', 'unexpected_successes')):
+            if self._total(key):
+                details.append('{0}={1}'.format(label, self._total(key)))
+        expected_failures = sum(unit_result['expected_failures'] for unit_result in self.unit_results)
+        if expected_failures:
+            details.append('expected failures={0}'.format(expected_failures))
+
+        stream.write(('OK' if self.was_successful() else 'FAILED') +
+                     (' (' + ', '.join(details) + ')' if details else '') + '\n')
+
+
+def run_test_units(environment_name, environment_config, units, workers, duration_history, stream=sys.stderr,
+                   http_call_tracer=None, worker_initializer=None, worker_initializer_arguments=()):
+    """
+    run the units over a pool of `workers` processes, longest expected duration first.
+    the measured test durations are saved to `duration_history`.
+    :param environment_name: string
+    :param environment_config: dict - the `SUPPORTED_ENVIRONMENTS` entry for `environment_name`.
+    :param units: list(SuiteUnit)
+    :param workers: int
+    :param duration_history: DurationHistory
+    :param http_call_tracer: HttpCallTracer or None - collects the HTTP calls traced by the workers.
+    :param worker_initializer: callable or None - called in every worker process before its first unit.
+    :param worker_initializer_arguments: tuple - arguments of `worker_initializer`.
+    :return: MergedTestResult
+    """
+    merged_result = MergedTestResult()
+    started_at = time.time()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=worker_initializer,
+                                 initargs=worker_initializer_arguments) as executor:
+            units_by_future = {executor.submit(_run_test_unit, environment_name, environment_config,
+                                               unit.module_name, unit.class_name, unit.method_names): unit
+                               for unit in order_longest_first(units, duration_history)}
+            for future in as_completed(units_by_future):
+                try:
+                    unit_result = future.result()
+                except Exception:
+                    # one broken unit (or worker) must not lose the results of the others.
+                    unit_result = _failed_unit_result(units_by_future[future], traceback.format_exc())
+                for test_id, duration in unit_result['test_durations']:
+                    duration_history.record(test_id, duration)
+                if unit_result['tests_run']:
+                    duration_history.record(class_setup_id(unit_result['name']), unit_result['class_setup_duration'])
+                if http_call_tracer is not None:
+                    http_call_tracer.merge(unit_result['http_calls'])
+                stream.write(unit_result['output'])
+                stream.write('--- finished {0} in {1:.1f}s\n'.format(unit_result['name'], unit_result['duration']))
+                stream.flush()
+                merged_result.add(unit_result)
+    finally:
+        duration_history.save()
+    merged_result.print_report(time.time() - started_at, stream=stream)
+    return merged_result
+
+
+def pop_command_line_option(argv, option_name):
+    """
+    remove `option_name` and its value from `argv` (in place), so the remaining arguments
+    can still be handed to `unittest.main()`.
+    :param argv: list(string)
+    :param option_name: string like '--workers'
+    :return: string value of the option, or None if the option is not present.
+    """
+    for position, argument in enumerate(argv):
+        if argument == option_name:
+            if position + 1 >= len(argv):
+                raise ValueError('missing value for ' + option_name)
+            value = argv[position + 1]
+            del argv[position:position + 2]
+            return value
+        if argument.startswith(option_name + '='):
+            del argv[position]
+            return argument[len(option_name) + 1:]
+    return None
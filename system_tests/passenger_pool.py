@@ -0,0 +1,186 @@
+"""
+Process-wide pools of freshly imported passengers, per environment, customer and passenger fields.
+
+Many tests start with `_create_2_passengers(customer)` only to get valid context ids and access
+keys, and pay a full passenger import (offer generation included) each time.
+`StormxSystemVerification._lease_2_passengers()` hands out passengers from a pool instead: a
+lease finding the pool empty imports its group, a background thread imports groups ahead of the next leases while the
+tests run, in batches of up to `STORMX_PASSENGER_POOL_BATCH_SIZE` groups per `POST /api/v1/passenger`.
+
+The pools follow the demand: a pool keeps half as many groups ready as it leased so far, up to
+`STORMX_PASSENGER_POOL_SIZE` (default: the batch size): the groups a pool imports for nothing are
+at most half of the groups its tests leased. A pool stops refilling when no lease came for
+`STORMX_PASSENGER_POOL_IDLE_TIMEOUT` seconds (the tests using it are done), and the pools are closed
+when the process exits, waiting for an import in progress to finish.
+
+Every group is a whole PNR (all of its passengers share a `pax_record_locator`), and it is leased
+exactly once: leased groups are removed from the pool and never imported again. Groups older than
+`STORMX_PASSENGER_POOL_MAX_AGE` seconds are dropped rather than leased, so tests never get
+passengers whose offers went stale.
+
+Set `STORMX_PASSENGER_POOL=0` to disable the pools (every lease imports its own passengers).
+"""
+import collections
+import json
+import multiprocessing.util
+import os
+import threading
+import time
+
+PASSENGER_POOL_ENABLED = os.getenv('STORMX_PASSENGER_POOL', '1') != '0'
+DEFAULT_BATCH_SIZE = int(os.getenv('STORMX_PASSENGER_POOL_BATCH_SIZE', '5'))
+DEFAULT_POOL_SIZE = int(os.getenv('STORMX_PASSENGER_POOL_SIZE', str(DEFAULT_BATCH_SIZE)))
+DEFAULT_MAX_AGE_IN_SECONDS = int(os.getenv('STORMX_PASSENGER_POOL_MAX_AGE', '900'))
+DEFAULT_IDLE_TIMEOUT_IN_SECONDS = int(os.getenv('STORMX_PASSENGER_POOL_IDLE_TIMEOUT', '30'))
+CLOSE_TIMEOUT_IN_SECONDS = 60  # waited at exit for an import in progress.
+
+
+class PassengerPool(object):
+
+    def __init__(self, import_passengers, generate_group, size=DEFAULT_POOL_SIZE, batch_size=DEFAULT_BATCH_SIZE,
+                 max_age_in_seconds=DEFAULT_MAX_AGE_IN_SECONDS,
+                 idle_timeout_in_seconds=DEFAULT_IDLE_TIMEOUT_IN_SECONDS):
+        """
+        :param import_passengers: callable(list of passenger payloads) -> list of imported passenger dicts.
+        :param generate_group: callable() -> list of passenger payloads imported together (one PNR).
+        :param size: int - maximum number of groups the background thread keeps ready (it keeps half as
+                     many as were leased so far).
+        :param batch_size: int - maximum number of groups imported per call.
+        :param max_age_in_seconds: int - groups imported longer ago than that are not leased.
+        :param idle_timeout_in_seconds: int - the background thread stops when no lease came for that long.
+        """
+        self._import_passengers = import_passengers
+        self._generate_group = generate_group
+        self.size = size
+        self.batch_size = max(batch_size, 1)
+        self.max_age_in_seconds = max_age_in_seconds
+        self.idle_timeout_in_seconds = idle_timeout_in_seconds
+        self._last_lease_at = time.time()
+        self._groups = collections.deque()  # (imported at, [passenger dict])
+        self._condition = threading.Condition()
+        self._filler = None
+        self._closed = False
+        self.leased_count = 0
+        self.imported_count = 0
+        self.refill_error = None
+
+    def _import_batch(self, group_count):
+        """
+        :return: list of (imported at, [passenger dict]), in the order of the generated groups.
+        """
+        groups = [self._generate_group() for i in range(group_count)]
+        imported_passengers = self._import_passengers([passenger for group in groups for passenger in group])
+        imported_at = time.time()
+        imported_by_context_id = {passenger['context_id']: passenger for passenger in imported_passengers}
+        with self._condition:
+            self.imported_count += sum(len(group) for group in groups)
+        return [(imported_at, [imported_by_context_id[passenger['context_id']] for passenger in group])
+                for group in groups]
+
+    def _discard_stale_groups(self):
+        oldest_fresh_import = time.time() - self.max_age_in_seconds
+        while self._groups and self._groups[0][0] < oldest_fresh_import:
+            self._groups.popleft()
+
+    def _start_filler(self):
+        if self._filler is None and not self._closed and self.refill_error is None and self.size > 0:
+            self._filler = threading.Thread(target=self._fill, name='passenger-pool-filler', daemon=True)
+            self._filler.start()
+
+    def _target_size(self):
+        return min(self.size, self.leased_count // 2)
+
+    def _is_idle(self):
+        return time.time() - self._last_lease_at >= self.idle_timeout_in_seconds
+
+    def _fill(self):
+        while True:
+            with self._condition:
+                self._discard_stale_groups()
+                while not self._closed and not self._is_idle() and len(self._groups) >= self._target_size():
+                    self._condition.wait(timeout=self.idle_timeout_in_seconds)
+                    self._discard_stale_groups()
+                if self._closed or self._is_idle():
+                    self._filler = None  # the next lease starts a new one.
+                    return
+                missing_group_count = min(self.batch_size, self._target_size() - len(self._groups))
+            try:
+                batch = self._import_batch(missing_group_count)
+            except Exception as exception:
+                # leases fall back to importing in the test's own thread, where the failure is reported.
+                with self._condition:
+                    self.refill_error = exception
+                    self._filler = None
+                return
+            with self._condition:
+                self._groups.extend(batch)
+
+    def lease(self):
+        """
+        :return: list of passenger dicts (one group, as returned by the import), never handed out before.
+        """
+        with self._condition:
+            self._discard_stale_groups()
+            group = self._groups.popleft()[1] if self._groups else None
+            self._last_lease_at = time.time()
+            self.leased_count += 1
+            self._start_filler()
+            self._condition.notify_all()
+        if group is None:
+            group = self._import_batch(1)[0][1]
+        return group
+
+    def close(self, timeout=CLOSE_TIMEOUT_IN_SECONDS):
+        """
+        stop the background thread, waiting up to `timeout` seconds for an import in progress to finish.
+        passengers still in the pool are left alone.
+        """
+        with self._condition:
+            self._closed = True
+            filler = self._filler
+            self._condition.notify_all()
+        if filler is not None and filler is not threading.current_thread():
+            filler.join(timeout)
+
+
+class PassengerPools(object):
+
+    def __init__(self, enabled=PASSENGER_POOL_ENABLED):
+        """
+        :param enabled: bool - see `STORMX_PASSENGER_POOL`.
+        """
+        self.enabled = enabled
+        self._pools = {}  # (environment name, customer, passenger fields) -> PassengerPool
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(environment_name, customer, passenger_fields):
+        return environment_name, customer, json.dumps(passenger_fields, sort_keys=True, default=str)
+
+    def get(self, environment_name, customer, passenger_fields, import_passengers, generate_group):
+        """
+        :param environment_name: string
+        :param customer: string
+        :param passenger_fields: dict - fields set in every pooled passenger (part of the pool key).
+        :param import_passengers: see `PassengerPool`, only used when the pool is created.
+        :param generate_group: see `PassengerPool`, only used when the pool is created.
+        :return: PassengerPool
+        """
+        key = self._key(environment_name, customer, passenger_fields)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                if not self._pools:
+                    # at the exit of this process, a test runner or a parallel worker (which skips `atexit`).
+                    multiprocessing.util.Finalize(None, self.close, exitpriority=10)
+                pool = self._pools[key] = PassengerPool(import_passengers, generate_group)
+            return pool
+
+    def close(self):
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+
+passenger_pools = PassengerPools()
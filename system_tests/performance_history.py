@@ -0,0 +1,257 @@
+"""
+Historical timings of system test and load runs, in a local SQLite database, and detection of
+latency regressions between revisions.
+
+Every run stores its samples under a run row (environment, revision, kind, time):
+
+* 'system_tests' runs: the duration of every test ('test: <test id>', `--workers`/`--shard` runs),
+  and, with `--trace-http`, the latency of every HTTP call ('endpoint: <route template>').
+* 'load' runs: the response times of every endpoint and scenario of `run_load_tests.py`
+  ('endpoint: <endpoint>'), taken from the latency histograms as (value, count) pairs.
+
+`compare_revisions()` pools the samples of the runs of a candidate revision and of a baseline
+(a given revision, or the latest runs of other revisions), and flags a metric as a regression when a
+one-sided Mann-Whitney U test says the candidate samples are larger with p < `alpha`, *and* the
+median grew by at least `min_ratio` (so a statistically significant 2% drift on thousands of
+samples does not fail a build). See `compare_performance.py`.
+
+The revision defaults to `$STORMX_REVISION`, or `$STORMX_BUILD`, or the git revision of this repository.
+"""
+import collections
+import math
+import os
+import sqlite3
+import subprocess
+import time
+
+# next to this module whatever the working directory, like `duration_history.DEFAULT_DURATIONS_FILE_PATH`.
+DEFAULT_PERFORMANCE_DB_PATH = os.getenv('STORMX_PERFORMANCE_DB', os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'system_test_performance.sqlite3'))
+SYSTEM_TESTS_KIND = 'system_tests'
+LOAD_KIND = 'load'
+
+DEFAULT_ALPHA = 0.01
+DEFAULT_MIN_RATIO = 1.1
+DEFAULT_MIN_SAMPLES = 3
+DEFAULT_BASELINE_RUN_COUNT = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    environment TEXT NOT NULL,
+    revision TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS samples_by_run ON samples (run_id, metric);
+CREATE INDEX IF NOT EXISTS runs_by_environment ON runs (environment, kind, revision);
+"""
+
+Comparison = collections.namedtuple(
+    'Comparison', 'metric baseline_count candidate_count baseline_median candidate_median ratio p_value regression')
+
+
+def current_revision():
+    """
+    :return: string - `$STORMX_REVISION`, `$STORMX_BUILD`, the short git revision of this repository, or 'unknown'.
+    """
+    revision = os.getenv('STORMX_REVISION') or os.getenv('STORMX_BUILD')
+    if revision:
+        return revision
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _weighted_median(value_counts):
+    """
+    :param value_counts: dict - value -> count
+    """
+    total_count = sum(value_counts.values())
+    running_count = 0
+    for value in sorted(value_counts):
+        running_count += value_counts[value]
+        if running_count * 2 >= total_count:
+            return value
+    return None
+
+
+def mann_whitney_u(baseline, candidate):
+    """
+    one-sided Mann-Whitney U test (normal approximation, with tie and continuity corrections)
+    of "candidate values tend to be larger than baseline values".
+    :param baseline: dict - value -> count
+    :param candidate: dict - value -> count
+    :return: (U statistic of the candidate, p value)
+    """
+    baseline_count = sum(baseline.values())
+    candidate_count = sum(candidate.values())
+    total_count = baseline_count + candidate_count
+    if not baseline_count or not candidate_count:
+        return 0.0, 1.0
+
+    candidate_rank_sum = 0.0
+    tie_correction = 0.0
+    rank = 0
+    for value in sorted(set(baseline) | set(candidate)):
+        tied_count = baseline.get(value, 0) + candidate.get(value, 0)
+        average_rank = rank + (tied_count + 1) / 2.0
+        candidate_rank_sum += candidate.get(value, 0) * average_rank
+        tie_correction += tied_count ** 3 - tied_count
+        rank += tied_count
+
+    u_statistic = candidate_rank_sum - candidate_count * (candidate_count + 1) / 2.0
+    mean_u = baseline_count * candidate_count / 2.0
+    variance_u = baseline_count * candidate_count / 12.0 * (
+        (total_count + 1) - tie_correction / float(total_count * (total_count - 1)))
+    if variance_u <= 0:
+        return u_statistic, 1.0
+    z_score = (u_statistic - mean_u - 0.5) / math.sqrt(variance_u)
+    return u_statistic, 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+class PerformanceHistory(object):
+
+    def __init__(self, file_path=DEFAULT_PERFORMANCE_DB_PATH):
+        """
+        :param file_path: string - SQLite database, created if missing.
+        """
+        self.file_path = file_path
+        self._connection = sqlite3.connect(file_path)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def record_run(self, environment_name, kind, samples, revision=None):
+        """
+        :param environment_name: string
+        :param kind: string - 'system_tests' or 'load'.
+        :param samples: dict - metric -> list of values, or dict value -> count (e.g. histogram buckets).
+        :param revision: string or None (None for `current_revision()`).
+        :return: int - id of the run.
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                'INSERT INTO runs (environment, revision, kind, created_at) VALUES (?, ?, ?, ?)',
+                (environment_name, revision or current_revision(), kind, time.time()))
+            run_id = cursor.lastrowid
+            rows = []
+            for metric, values in samples.items():
+                value_counts = values if isinstance(values, dict) else collections.Counter(values)
+                rows.extend((run_id, metric, value, count) for value, count in value_counts.items())
+            self._connection.executemany('INSERT INTO samples (run_id, metric, value, count) VALUES (?, ?, ?, ?)',
+                                         rows)
+        return run_id
+
+    def runs(self, environment_name, kind, revision=None, exclude_revision=None, limit=None):
+        """
+        :return: list of (run id, revision, created_at) tuples, newest first.
+        """
+        query = 'SELECT id, revision, created_at FROM runs WHERE environment = ? AND kind = ?'
+        parameters = [environment_name, kind]
+        if revision is not None:
+            query += ' AND revision = ?'
+            parameters.append(revision)
+        if exclude_revision is not None:
+            query += ' AND revision != ?'
+            parameters.append(exclude_revision)
+        query += ' ORDER BY created_at DESC, id DESC'
+        if limit:
+            query += ' LIMIT ?'
+            parameters.append(limit)
+        return self._connection.execute(query, parameters).fetchall()
+
+    def pooled_samples(self, run_ids):
+        """
+        :param run_ids: list(int)
+        :return: dict - metric -> {value: count} over all the runs.
+        """
+        pooled = collections.defaultdict(collections.Counter)
+        if not run_ids:
+            return pooled
+        query = 'SELECT metric, value, SUM(count) FROM samples WHERE run_id IN ({0}) GROUP BY metric, value'.format(
+            ', '.join('?' * len(run_ids)))
+        for metric, value, count in self._connection.execute(query, list(run_ids)):
+            pooled[metric][value] += count
+        return pooled
+
+    def compare_revisions(self, environment_name, kind, candidate_revision, baseline_revision=None,
+                          baseline_run_count=DEFAULT_BASELINE_RUN_COUNT, alpha=DEFAULT_ALPHA,
+                          min_ratio=DEFAULT_MIN_RATIO, min_samples=DEFAULT_MIN_SAMPLES):
+        """
+        :param candidate_revision: string - revision under test (all of its runs are pooled).
+        :param baseline_revision: string or None - revision to compare with (all of its runs are pooled),
+                                  None for the latest `baseline_run_count` runs of any other revision.
+        :param alpha: float - significance level of the one-sided Mann-Whitney U test.
+        :param min_ratio: float - minimum candidate/baseline median ratio of a regression.
+        :param min_samples: int - metrics with fewer samples on either side are compared, never flagged.
+        :return: list(Comparison), regressions first, then by decreasing ratio.
+        """
+        candidate_runs = self.runs(environment_name, kind, revision=candidate_revision)
+        if baseline_revision is None:
+            baseline_runs = self.runs(environment_name, kind, exclude_revision=candidate_revision,
+                                      limit=baseline_run_count)
+        else:
+            baseline_runs = self.runs(environment_name, kind, revision=baseline_revision)
+        candidate_samples = self.pooled_samples([run[0] for run in candidate_runs])
+        baseline_samples = self.pooled_samples([run[0] for run in baseline_runs])
+
+        comparisons = []
+        for metric in sorted(set(candidate_samples) & set(baseline_samples)):
+            baseline, candidate = baseline_samples[metric], candidate_samples[metric]
+            baseline_median, candidate_median = _weighted_median(baseline), _weighted_median(candidate)
+            ratio = candidate_median / baseline_median if baseline_median else float('inf')
+            _, p_value = mann_whitney_u(baseline, candidate)
+            regression = (p_value < alpha and ratio >= min_ratio and
+                          sum(baseline.values()) >= min_samples and sum(candidate.values()) >= min_samples)
+            comparisons.append(Comparison(metric, sum(baseline.values()), sum(candidate.values()), baseline_median,
+                                          candidate_median, ratio, p_value, regression))
+        return sorted(comparisons, key=lambda comparison: (not comparison.regression, -comparison.ratio))
+
+
+def format_comparisons(comparisons, regressions_only=False):
+    """
+    :return: string - one line per metric, medians in milliseconds.
+    """
+    header = '{0:<11} {1:>8} {2:>8} {3:>12} {4:>12} {5:>7} {6:>9}  {7}'.format(
+        '', 'base n', 'new n', 'base med ms', 'new med ms', 'ratio', 'p', 'metric')
+    lines = [header, '-' * len(header)]
+    for comparison in comparisons:
+        if regressions_only and not comparison.regression:
+            continue
+        lines.append('{0:<11} {1:>8} {2:>8} {3:>12.1f} {4:>12.1f} {5:>7.2f} {6:>9.2g}  {7}'.format(
+            'REGRESSION' if comparison.regression else '', comparison.baseline_count, comparison.candidate_count,
+            comparison.baseline_median * 1000, comparison.candidate_median * 1000, comparison.ratio,
+            comparison.p_value, comparison.metric))
+    return '\n'.join(lines)
+
+
+def system_test_samples(test_durations=(), http_calls=()):
+    """
+    :param test_durations: iterable of (test id, seconds) tuples.
+    :param http_calls: iterable(HttpCall), see `http_call_tracer.py`.
+    :return: dict - samples of `PerformanceHistory.record_run()`.
+    """
+    samples = collections.defaultdict(list)
+    for test_id, duration in test_durations:
+        samples['test: ' + test_id].append(round(duration, 3))
+    for call in http_calls:
+        samples['endpoint: ' + call.route].append(round(call.latency, 4))
+    return samples
+
+
+def load_samples(recorder):
+    """
+    :param recorder: LatencyRecorder of a load run.
+    :return: dict - samples of `PerformanceHistory.record_run()`, response times of every endpoint and scenario.
+    """
+    return {'endpoint: ' + endpoint: recorder.histogram(endpoint).value_counts() for endpoint in recorder.endpoints()}
@@ -0,0 +1,96 @@
+"""
+Run-scoped (process-wide) cache of StormX reference data: ports and port timezones.
+
+Reference data does not change during a run, yet helpers like `_get_event_date(port_iata_code=...)`
+used to fetch the timezone of the same few ports from the server in nearly every test.
+Entries are keyed by environment name, category and key; a miss calls the loader once, later
+lookups are dictionary hits. `StormxSystemVerification.warm_up_reference_data()` bulk loads the
+ports up front.
+
+Only data no test changes belongs here: the cache lives in one process, so data a test changes (airlines,
+hotels serviced by a port...) would go stale in the other processes of a `--workers` run, and a reader
+racing the write could cache the old value again.
+
+Set `STORMX_REFERENCE_DATA_CACHE=0` to disable the cache (every lookup calls its loader).
+"""
+import copy
+import os
+import threading
+
+REFERENCE_DATA_CACHE_ENABLED = os.getenv('STORMX_REFERENCE_DATA_CACHE', '1') != '0'
+
+PORT_TIMEZONE_BY_IATA_CODE = 'port_timezone_by_iata_code'
+PORT_TIMEZONE_BY_PORT_ID = 'port_timezone_by_port_id'
+SANDBOX_PORT_TIMEZONE = 'sandbox_port_timezone'
+SANDBOX_OBJECTS = 'sandbox_objects'
+
+
+class ReferenceDataCache(object):
+
+    def __init__(self, enabled=REFERENCE_DATA_CACHE_ENABLED):
+        """
+        :param enabled: bool - when False, `get()` always calls the loader.
+        """
+        self.enabled = enabled
+        self._entries = {}  # (environment name, category) -> {key: value}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, environment_name, category, key, loader):
+        """
+        :param environment_name: string
+        :param category: string - one of the category constants of this module.
+        :param key: hashable
+        :param loader: callable with no arguments, called on a miss. a None result is not cached.
+        :return: the cached or loaded value (a copy, callers are free to modify it).
+        """
+        if not self.enabled:
+            return loader()
+        entries = self._entries.get((environment_name, category))
+        if entries is not None and key in entries:
+            self.hits += 1
+            return copy.deepcopy(entries[key])
+
+        self.misses += 1
+        value = loader()
+        if value is not None:
+            with self._lock:
+                self._entries.setdefault((environment_name, category), {})[key] = copy.deepcopy(value)
+        return value
+
+    def set_many(self, environment_name, category, values):
+        """
+        bulk load (warm up) a category.
+        :param values: dict - key -> value
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries.setdefault((environment_name, category), {}).update(values)
+
+    def is_loaded(self, environment_name, category):
+        return bool(self._entries.get((environment_name, category)))
+
+    def invalidate(self, environment_name, category=None, key=None):
+        """
+        forget cached values.
+        :param environment_name: string
+        :param category: string or None (None forgets every category of the environment).
+        :param key: hashable or None (None forgets the whole category).
+        """
+        with self._lock:
+            for entries_key in list(self._entries):
+                if entries_key[0] != environment_name or (category is not None and entries_key[1] != category):
+                    continue
+                if key is None:
+                    del self._entries[entries_key]
+                else:
+                    self._entries[entries_key].pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+
+
+reference_data_cache = ReferenceDataCache()
@@ -0,0 +1,115 @@
+#! /usr/bin/env python3
+"""
+Hotel search latency benchmark over the search dimensions (see `load_tests/hotel_search_benchmark.py`).
+
+    ./run_hotel_search_benchmark.py <environment> [--dimension NAME=VALUE,VALUE ...] [--endpoints airline,offer]
+                                    [--repetitions N] [--customer NAME] [--blocks N] [--timeout SECONDS]
+                                    [--histogram-file PATH] [--percentile-tables]
+
+* `--dimension NAME=VALUES` restrict a dimension of the matrix, e.g. `--dimension port=LAX`
+  `--dimension provider=any,tvl` `--dimension pet=true` (repeatable). dimensions and default values:
+  port=LAX,ORD provider=any,tvl,ean room_count=1,5 number_of_nights=1,3 premium, handicap,
+  service_pet and pet=false,true.
+* `--endpoints` 'airline' (`GET /api/v1/hotels`) and/or 'offer' (`GET /api/v1/offer/hotels`) (default both).
+* `--repetitions N` searches per combination (default 5).
+* `--blocks N` before the sweep, add N rooms per hotel, night and room type (standard and handicap)
+  at the benchmarked ports' test hotels (the stand-in hotels on the stand_in environment), for as many
+  nights as the largest number_of_nights (default 10, 0 to benchmark the inventory as it is).
+  the rooms are added on every run: the inventory of a shared environment grows with every benchmark.
+* `--timeout SECONDS` a search taking longer counts as failed (default 60).
+* `--histogram-file PATH` save the latency histogram of every combination as JSON, e.g. to compare StormX builds.
+* `--percentile-tables` also print the full percentile distribution of every combination.
+
+Exits with status 1 if any search failed.
+"""
+from collections import OrderedDict
+import json
+import sys
+
+from parallel_test_runner import pop_command_line_option
+from stormx_stand_in_server import resolve_environment, stand_in_hotel_ids
+from stormx_verification_framework import SUPPORTED_ENVIRONMENTS, StormxSystemVerification
+
+from load_tests.hotel_search_benchmark import (
+    DEFAULT_INVENTORY_HOTELS,
+    DEFAULT_REPETITIONS,
+    DEFAULT_TIMEOUT_IN_SECONDS,
+    ENDPOINTS,
+    SEARCH_DIMENSIONS,
+    build_search_matrix,
+    format_matrix_report,
+    inventory_plan,
+    parse_dimension_values,
+    run_hotel_search_benchmark,
+)
+
+
+def inventory_hotels(environment_name):
+    """
+    :return: dict - port -> (airline id, hotel ids) given inventory before the sweep: the stand-in hotels of the
+             `DEFAULT_INVENTORY_HOTELS` ports on a stand-in environment, `DEFAULT_INVENTORY_HOTELS` otherwise.
+    """
+    if not SUPPORTED_ENVIRONMENTS[environment_name].get('stand_in'):
+        return DEFAULT_INVENTORY_HOTELS
+    return OrderedDict((port, (airline_id, stand_in_hotel_ids(port)))
+                       for port, (airline_id, hotel_ids) in DEFAULT_INVENTORY_HOTELS.items())
+
+
+def seed_search_inventory(hotels_by_port, ports, blocks, number_of_nights):
+    """
+    add inventory to the test hotels of `ports`, through the PHP admin site.
+    :param hotels_by_port: dict - see `inventory_hotels()`.
+    """
+    StormxSystemVerification.setUpClass()
+    helper = StormxSystemVerification()
+    event_dates_by_port = {port: helper._get_event_date(port_iata_code=port) for port in ports
+                           if port in hotels_by_port}
+    plan = inventory_plan(event_dates_by_port, hotels_by_port=hotels_by_port, blocks=blocks,
+                          number_of_nights=number_of_nights)
+    helper.seed_inventory(plan, resolve_block_ids=False)
+    print('added {0} rooms to {1} hotel nights at {2}'.format(
+        blocks * len(plan), len(plan), ', '.join(sorted(event_dates_by_port))))
+
+
+if __name__ == '__main__':
+    dimensions = SEARCH_DIMENSIONS.copy()
+    dimension_option = pop_command_line_option(sys.argv, '--dimension')
+    while dimension_option:
+        name, _, values_text = dimension_option.partition('=')
+        dimensions[name] = parse_dimension_values(name, values_text)
+        dimension_option = pop_command_line_option(sys.argv, '--dimension')
+    endpoints = pop_command_line_option(sys.argv, '--endpoints')
+    endpoints = endpoints.split(',') if endpoints else ENDPOINTS
+    repetitions = int(pop_command_line_option(sys.argv, '--repetitions') or DEFAULT_REPETITIONS)
+    customer = pop_command_line_option(sys.argv, '--customer') or 'Purple Rain Airlines'
+    blocks = int(pop_command_line_option(sys.argv, '--blocks') or 10)
+    timeout = float(pop_command_line_option(sys.argv, '--timeout') or DEFAULT_TIMEOUT_IN_SECONDS)
+    histogram_file_path = pop_command_line_option(sys.argv, '--histogram-file')
+    percentile_tables = '--percentile-tables' in sys.argv
+    if percentile_tables:
+        sys.argv.remove('--percentile-tables')
+
+    environment_name = resolve_environment(sys.argv, SUPPORTED_ENVIRONMENTS)
+    StormxSystemVerification.selected_environment_name = environment_name
+    api_host = SUPPORTED_ENVIRONMENTS[environment_name]['host']
+
+    cases = build_search_matrix(dimensions, endpoints)
+    print('API URL under test: ' + api_host)
+    print('{0} combinations x {1} repetitions'.format(len(cases), repetitions))
+    if blocks:
+        seed_search_inventory(inventory_hotels(environment_name), dimensions['port'], blocks,
+                              max(dimensions['number_of_nights']))
+
+    recorder, hotel_counts, elapsed_time = run_hotel_search_benchmark(
+        api_host, cases, customer=customer, repetitions=repetitions, timeout=timeout,
+        progress=lambda repetition: print('  repetition {0}/{1} done'.format(repetition, repetitions)))
+    print(format_matrix_report(cases, recorder, hotel_counts))
+    if percentile_tables:
+        print('\n' + recorder.format_percentile_tables())
+    if histogram_file_path:
+        with open(histogram_file_path, 'w') as histogram_file:
+            json.dump({'environment': environment_name, 'elapsed_time': elapsed_time,
+                       'dimensions': dimensions, 'endpoints': recorder.to_dict()}, histogram_file)
+        print('histograms saved to ' + histogram_file_path)
+
+    sys.exit(1 if any(row['errors'] for row in recorder.summary(elapsed_time)) else 0)
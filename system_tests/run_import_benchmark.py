@@ -0,0 +1,77 @@
+#! /usr/bin/env python3
+"""
+Payload-size scaling benchmark of the passenger import (see `load_tests/import_benchmark.py`).
+
+    ./run_import_benchmark.py <environment> [--sizes 1,10,100,300,1000] [--repetitions N]
+                              [--shapes uniform,bulk] [--customer NAME] [--port IATA] [--timeout SECONDS]
+                              [--build NAME] [--report-file PATH] [--baseline PATH]
+
+* `--sizes` payload sizes, in passengers (default 1,10,100,300,1000).
+* `--repetitions N` imports per shape and size (default 5).
+* `--shapes` 'uniform' (one PNR) and/or 'bulk' (groups, families...) payloads (default both).
+* `--timeout SECONDS` an import taking longer counts as failed (default 300).
+* `--build NAME` StormX build under test, stored in the report (default `$STORMX_BUILD`, or 'unknown').
+* `--report-file PATH` save the results as JSON, to compare builds with `--baseline` later.
+* `--baseline PATH` report file of another build, printed side by side with this run.
+
+Exits with status 1 if any import failed.
+
+The environment name `stand_in` runs the benchmark against a local stand-in server
+(see `stormx_stand_in_server.py`).
+"""
+import json
+import os
+import sys
+
+from parallel_test_runner import pop_command_line_option
+from stormx_stand_in_server import resolve_environment
+from stormx_verification_framework import SUPPORTED_ENVIRONMENTS
+
+from load_tests.import_benchmark import (
+    DEFAULT_PAYLOAD_SIZES,
+    DEFAULT_REPETITIONS,
+    DEFAULT_TIMEOUT_IN_SECONDS,
+    PAYLOAD_SHAPES,
+    benchmark_report,
+    format_comparison,
+    format_results,
+    run_import_benchmark,
+)
+
+
+if __name__ == '__main__':
+    sizes = pop_command_line_option(sys.argv, '--sizes')
+    sizes = [int(size) for size in sizes.split(',')] if sizes else DEFAULT_PAYLOAD_SIZES
+    repetitions = int(pop_command_line_option(sys.argv, '--repetitions') or DEFAULT_REPETITIONS)
+    shapes = pop_command_line_option(sys.argv, '--shapes')
+    shapes = shapes.split(',') if shapes else PAYLOAD_SHAPES
+    customer = pop_command_line_option(sys.argv, '--customer') or 'Purple Rain Airlines'
+    port = pop_command_line_option(sys.argv, '--port') or 'LAX'
+    timeout = float(pop_command_line_option(sys.argv, '--timeout') or DEFAULT_TIMEOUT_IN_SECONDS)
+    build = pop_command_line_option(sys.argv, '--build') or os.getenv('STORMX_BUILD', 'unknown')
+    report_file_path = pop_command_line_option(sys.argv, '--report-file')
+    baseline_file_path = pop_command_line_option(sys.argv, '--baseline')
+
+    environment_name = resolve_environment(sys.argv, SUPPORTED_ENVIRONMENTS)
+    api_host = SUPPORTED_ENVIRONMENTS[environment_name]['host']
+
+    print('API URL under test: ' + api_host)
+    print('build {0}: sizes {1}, {2} repetitions, shapes {3}'.format(
+        build, ','.join(str(size) for size in sizes), repetitions, ','.join(shapes)))
+
+    results = run_import_benchmark(
+        api_host, customer=customer, port=port, sizes=sizes, repetitions=repetitions, shapes=shapes, timeout=timeout,
+        progress=lambda result: print('  {0} x {1} passengers: {2} imports, {3} failed'.format(
+            result.shape, result.size, result.count, result.error_count)))
+    print(format_results(results))
+
+    report = benchmark_report(results, build, environment_name)
+    if report_file_path:
+        with open(report_file_path, 'w') as report_file:
+            json.dump(report, report_file, indent=1)
+        print('report saved to ' + report_file_path)
+    if baseline_file_path:
+        with open(baseline_file_path) as baseline_file:
+            print('\n' + format_comparison(report, json.load(baseline_file)))
+
+    sys.exit(1 if any(result.error_count for result in results) else 0)
@@ -0,0 +1,110 @@
+#! /usr/bin/env python3
+"""
+Open-loop load tests of the StormX API (see `load_tests/`).
+
+    ./run_load_tests.py <environment> [--rate N] [--ramp-up SECONDS] [--duration SECONDS]
+                        [--mix scenario=weight,...] [--poisson] [--max-concurrency N]
+                        [--customer NAME] [--port IATA] [--processes N]
+                        [--histogram-file PATH] [--percentile-tables] [--performance-db PATH] [--revision REV]
+                        [--import-profile]
+
+* `--rate N` scenario starts per second once ramped up (default 5).
+* `--ramp-up SECONDS` linearly increase the rate from 0 to N during this many seconds (default 0).
+* `--duration SECONDS` total length of the run, including the ramp up (default 60).
+* `--mix` relative weights of the scenarios, e.g. `--mix book=3,hotel_search=5,decline=1`.
+  scenarios: passenger_import, hotel_search, book, decline, notifications (default: all, equally weighted).
+* `--poisson` exponentially distributed arrivals instead of evenly spaced ones.
+* `--max-concurrency N` maximum number of scenarios in flight (default 200).
+* `--processes N` split the load over N processes, when one process cannot keep up with the rate (default 1).
+* `--histogram-file PATH` save the latency histograms of the run as JSON, e.g. to compare StormX builds.
+* `--percentile-tables` also print the full percentile distribution of every endpoint.
+* `--performance-db PATH` (or `$STORMX_PERFORMANCE_DB`) keep the response times of the run in a SQLite database,
+  under the environment and `--revision REV` (default `$STORMX_REVISION`, `$STORMX_BUILD` or the git revision),
+  to flag regressions with `./compare_performance.py <environment> --kind load` (see `performance_history.py`).
+* `--import-profile` print the import time of every module when the run exits (see `import_profiler.py`).
+
+Throughput and p50/p95/p99/p99.9 latency are reported per endpoint and per scenario. Latencies are
+measured from the scheduled send times, so they are corrected for coordinated omission
+(see `load_tests/latency_recorder.py`).
+Exits with status 1 if any call failed.
+
+The environment name `stand_in` generates the load against a local stand-in server
+(see `stormx_stand_in_server.py`), to benchmark the load generator itself.
+"""
+import json
+import os
+import sys
+
+from import_profiler import profile_imports_if_requested
+profile_imports_if_requested(sys.argv)  # before the other imports, to time them.
+
+from parallel_test_runner import pop_command_line_option
+from performance_history import LOAD_KIND, PerformanceHistory, load_samples
+from stormx_stand_in_server import resolve_environment
+from stormx_verification_framework import SUPPORTED_ENVIRONMENTS
+
+from load_tests.load_generator import LoadProfile, run_load_in_processes
+
+
+def parse_scenario_mix(mix_text):
+    """
+    :param mix_text: string like 'book=3,hotel_search=5' (a scenario without weight counts as 1).
+    :return: dict - scenario name -> weight.
+    """
+    scenario_mix = {}
+    for item in mix_text.split(','):
+        name, _, weight = item.strip().partition('=')
+        scenario_mix[name] = float(weight) if weight else 1.0
+    return scenario_mix
+
+
+if __name__ == '__main__':
+    rate = float(pop_command_line_option(sys.argv, '--rate') or 5)
+    ramp_up = float(pop_command_line_option(sys.argv, '--ramp-up') or 0)
+    duration = float(pop_command_line_option(sys.argv, '--duration') or 60)
+    mix = pop_command_line_option(sys.argv, '--mix')
+    max_concurrency = int(pop_command_line_option(sys.argv, '--max-concurrency') or 200)
+    customer = pop_command_line_option(sys.argv, '--customer') or 'Purple Rain Airlines'
+    port = pop_command_line_option(sys.argv, '--port') or 'LAX'
+    processes = int(pop_command_line_option(sys.argv, '--processes') or 1)
+    histogram_file_path = pop_command_line_option(sys.argv, '--histogram-file')
+    performance_db_path = pop_command_line_option(sys.argv, '--performance-db') or os.getenv('STORMX_PERFORMANCE_DB')
+    revision = pop_command_line_option(sys.argv, '--revision')
+    poisson_arrivals = '--poisson' in sys.argv
+    if poisson_arrivals:
+        sys.argv.remove('--poisson')
+    percentile_tables = '--percentile-tables' in sys.argv
+    if percentile_tables:
+        sys.argv.remove('--percentile-tables')
+
+    environment_name = resolve_environment(sys.argv, SUPPORTED_ENVIRONMENTS)
+    api_host = SUPPORTED_ENVIRONMENTS[environment_name]['host']
+
+    profile = LoadProfile(rate, duration, ramp_up=ramp_up, scenario_mix=parse_scenario_mix(mix) if mix else None,
+                          poisson_arrivals=poisson_arrivals)
+    print('API URL under load: ' + api_host)
+    print('{0} scenarios/s ({1}), {2}s ramp up, {3}s total, mix: {4}'.format(
+        rate, 'poisson' if poisson_arrivals else 'constant', ramp_up, duration,
+        ', '.join('{0}={1:g}'.format(name, weight) for name, weight in sorted(profile.scenario_mix.items()))))
+
+    recorder, elapsed_time, late_starts = run_load_in_processes(api_host, profile, processes,
+                                                                max_concurrency=max_concurrency,
+                                                                customer=customer, port=port)
+    print(recorder.format_report(elapsed_time))
+    if percentile_tables:
+        print('\n' + recorder.format_percentile_tables())
+    if histogram_file_path:
+        with open(histogram_file_path, 'w') as histogram_file:
+            json.dump({'environment': environment_name, 'elapsed_time': elapsed_time,
+                       'endpoints': recorder.to_dict()}, histogram_file)
+        print('histograms saved to ' + histogram_file_path)
+    if performance_db_path:
+        performance_history = PerformanceHistory(performance_db_path)
+        run_id = performance_history.record_run(environment_name, LOAD_KIND, load_samples(recorder), revision=revision)
+        performance_history.close()
+        print('response times of run {0} saved to {1}'.format(run_id, performance_db_path))
+    if late_starts:
+        print('WARNING: {0} scenarios started more than 1s late, all {1} concurrency slots were busy. '
+              'The offered load was lower than requested.'.format(late_starts, max_concurrency))
+
+    sys.exit(1 if any(row['errors'] for row in recorder.summary(elapsed_time)) else 0)
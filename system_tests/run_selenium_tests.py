@@ -1,12 +1,29 @@
 #! /usr/bin/env python3
 """
+Selenium UI tests of the StormX PHP site (see `e2e_selenium_tests/`).
 
+    ./run_selenium_tests.py <environment> <headless: true|false> <all|sso|TestName ...> [--workers N|auto]
+                            [--download-dir PATH]
+
+* `--workers N` runs the UI test classes over N processes, each driving its own headless Chrome (even with
+  headless `false`, see `e2e_selenium_tests/BaseClasses/browser_pool.py`), and merges their results.
+  `auto` picks one worker per CPU core, as long as every worker gets 1 GB of available memory.
+* `--download-dir PATH` every worker downloads into its own sub directory there (default: a temporary directory,
+  removed at exit).
 """
+import atexit
+import shutil
 import unittest
 import sys
+import tempfile
 sys.path.insert(1, '/vagrant/Stormx')
 sys.path.insert(1, '/vagrant')
 
+from parallel_test_runner import pop_command_line_option
+
+# before importing the tests: `e2e_selenium_tests/BaseClasses/constant.py` reads its positional arguments.
+workers = pop_command_line_option(sys.argv, '--workers')
+download_root_directory = pop_command_line_option(sys.argv, '--download-dir')
 
 from stormx_ui_test_suite import (
     stormx_ui_suite,
@@ -48,7 +65,30 @@ if __name__ == '__main__':
     print('Stormx URL under test: ' +
           SUPPORTED_ENVIRONMENTS[environment_name]['php_host'])
 
-    if len(sys.argv) > 3 and sys.argv[3] == 'all':
+    if workers:
+        from duration_history import DEFAULT_DURATIONS_FILE_PATH, DurationHistory
+        from parallel_test_runner import collect_test_units, run_test_units
+        from e2e_selenium_tests.BaseClasses.browser_pool import default_browser_worker_count, initialize_browser_worker
+
+        if len(sys.argv) > 3 and sys.argv[3] not in ('all', 'sso'):
+            selected_tests = unittest.defaultTestLoader.loadTestsFromNames(sys.argv[3:], sys.modules[__name__])
+        else:
+            selected_tests = stormx_ui_suite(environment_name, unittest)
+        worker_count = default_browser_worker_count() if workers == 'auto' else int(workers)
+        if not download_root_directory:
+            download_root_directory = tempfile.mkdtemp(prefix='stormx_ui_downloads_')
+            atexit.register(shutil.rmtree, download_root_directory, ignore_errors=True)
+        if len(sys.argv) > 2 and sys.argv[2].lower() == 'false':
+            print('NOTE: browser workers always run headless.')
+        print('{0} browser workers, downloads in {1}'.format(worker_count, download_root_directory))
+
+        result = run_test_units(environment_name, SUPPORTED_ENVIRONMENTS[environment_name],
+                                collect_test_units(selected_tests), workers=worker_count,
+                                duration_history=DurationHistory(DEFAULT_DURATIONS_FILE_PATH),
+                                worker_initializer=initialize_browser_worker,
+                                worker_initializer_arguments=(download_root_directory,))
+        sys.exit(0 if result.was_successful() else 1)
+    elif len(sys.argv) > 3 and sys.argv[3] == 'all':
         runner = unittest.TextTestRunner()
         runner.run(stormx_ui_suite(environment_name, unittest))
     else:
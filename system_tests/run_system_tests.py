@@ -19,86 +19,129 @@ DEVELOPER TIPS:
   utility to pretty print a response object.
 
 
+PARALLEL AND SHARDED RUNS:
+
+    ./run_system_tests.py <environment> [api|web|TestName ...] [--workers N] [--shard i/n]
+
+* `--workers N` runs the test classes over a pool of N processes (see `parallel_test_runner.py`).
+* `--shard i/n` only runs the i-th of n deterministic slices of the selected test classes.
+* `--durations-file PATH` is where test durations are kept between runs, to balance workers and shards
+  (default: `system_tests/system_test_durations.json`, see `duration_history.py`).
+
+
+RECORD AND REPLAY:
+
+* `--record DIR` saves every HTTP request/response of the run to DIR, `--replay DIR` answers the same requests
+  from DIR without network access, to iterate on assertions in seconds (see `http_cassette.py`).
+
+
+HTTP CALL TRACING:
+
+* `--trace-http` prints, at the end of the run, the HTTP calls made per test, per route and per framework helper.
+  `--http-call-budget N` / `--http-latency-budget SECONDS` fail tests making more calls, or waiting longer on
+  HTTP, than that (see `http_call_tracer.py`).
+
+
+PERFORMANCE HISTORY:
+
+* `--performance-db PATH` (or `$STORMX_PERFORMANCE_DB`) keeps the test durations (`--workers`/`--shard` runs) and, with `--trace-http`, the HTTP
+  latencies per route of the run in a SQLite database, under the environment and `--revision REV` (default
+  `$STORMX_REVISION`, `$STORMX_BUILD` or the git revision). `./compare_performance.py <environment>` then flags the
+  latency regressions of a revision (see `performance_history.py`).
+
+
+START UP TIME:
+
+* `--import-profile` prints, when the run exits, the import time of every module, slowest first
+  (see `import_profiler.py`). Heavy dependencies of the framework are only imported on first use (see `lazy_import.py`).
+
+
+OFFLINE BENCHMARKING:
+
+* the environment name `stand_in` starts a local stand-in StormX server (see `stormx_stand_in_server.py`)
+  to measure the harness itself without a staging host, e.g. `./run_system_tests.py stand_in TestApiPing --workers 4`.
+
+
 """
+import atexit
+import os
 import sys
 import unittest
 
-from web_system_test_suite import (
-    web_suite,
-    TestPassengerPayAPI,
-    TestStormxUI,
-    TestPortAllowance,
-    TestQuickRoomTransfer,
-    UserPasswordResetTestCase,
-    TestSystemPorts,
-    TestExpediaLinking,
-    SUPPORTED_ENVIRONMENTS,
-    StormxSystemVerification,
-    TestBlogMessages,
-    AvailabilityOnPortTimezone,
-    TestHotelPassengerNotes,
-    TestAdditionalContacts,
-    TestReconcilliation,
-    TestHMTRecon,
-    TestRateCap,
-    TestHotelContracts,
-    TestAvailability,
-    TestPhpAmenities,
-    TestTransportOnlyVoucher,
-)
+from import_profiler import profile_imports_if_requested
+profile_imports_if_requested(sys.argv)  # before the other imports, to time them.
 
-from api_system_test_suite import (
-    api_suite,
-    TestAirlineAndPassengerAPI,
-    TestTvlInternalAPI,
-    TestPassengerPay,
-    TestApiHealth,
-    TestApiPing,
-    TestApiHotelAmenities,
-    TestApiHotelBooking,
-    TestApiHotelBookingBlocks,
-    TestApiHotelBookingCancel,
-    TestApiHotelBookingDecline,
-    TestApiHotelBookingDirectBilling,
-    TestApiHotelBookingExpedia,
-    TestApiHotelBookingInternal,
-    TestApiHotelBookingPets,
-    TestApiHotelImages,
-    TestApiHotelSearch,
-    TestApiHotelSearchInternal,
-    TestApiMealsICoupon,
-    TestApiNotifications,
-    TestApiPassengerImport,
-    TestApiCustomFields,
-    TestApiPassengerRetrieval,
-    TestApiShuttleTracker,
-    TestHotelPortal,
-    TestHotelVoucherUnlock,
-    TestMealVoucherActiveDateRange,
-    TestPassengerApp,
-    TestQrCodes,
-    TestTaxes,
-    TestHotelAllowances
+from duration_history import DEFAULT_DURATIONS_FILE_PATH, DurationHistory
+from http_call_tracer import HttpCallTracer
+from http_cassette import RECORD_MODE, REPLAY_MODE, HttpCassette
+from parallel_test_runner import (
+    collect_test_units,
+    parse_shard,
+    pop_command_line_option,
+    run_test_units,
+    select_shard,
 )
+from performance_history import SYSTEM_TESTS_KIND, PerformanceHistory, system_test_samples
+from stormx_http import http_client
+from stormx_stand_in_server import resolve_environment
+
+from api_system_test_suite import api_suite
+from web_system_test_suite import web_suite
+from stormx_verification_framework import SUPPORTED_ENVIRONMENTS
+from test_registry import bind_environment, test_registry
+
+
+def report_http_calls():
+    print(http_client.tracer.format_report())
+    http_client.tracer.save()
+
+
+def record_performance(performance_db_path, environment_name, revision, result=None):
+    """
+    :param result: MergedTestResult of a parallel run, or None (`unittest.main()` runs only record HTTP latencies).
+    """
+    samples = system_test_samples(result.test_durations if result is not None else (),
+                                  http_client.tracer.calls() if http_client.tracer is not None else ())
+    if not samples:
+        return
+    performance_history = PerformanceHistory(performance_db_path)
+    run_id = performance_history.record_run(environment_name, SYSTEM_TESTS_KIND, samples, revision=revision)
+    performance_history.close()
+    print('performance of run {0} ({1} metrics) saved to {2}'.format(run_id, len(samples), performance_db_path))
 
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print('ERROR: must provide environment name.\n\nCanned environments:\n\t' +
-              '\n\t'.join(
-                  tuple(sorted(SUPPORTED_ENVIRONMENTS.keys()))) + '\n\n'
-              '...Or you may supply your own environment name.\n' +
-              'Example: "superman" would be the environment name of the URL https://supermanapi.tvlinc.com .\n'
-              )
-        sys.exit(1)
-    environment_name = sys.argv[1]
-    if environment_name not in SUPPORTED_ENVIRONMENTS:
-        SUPPORTED_ENVIRONMENTS[environment_name] = {
-            'host': 'https://{environment_name}api.tvlinc.com'.format(environment_name=environment_name),
-            'php_host': 'https://{environment_name}ui.tvlinc.com'.format(environment_name=environment_name),
-            'purple_rain_airline_queue': None,
-            'purple_rain_transaction_queue': None,
-        }
+    for cassette_option, cassette_mode in (('--record', RECORD_MODE), ('--replay', REPLAY_MODE)):
+        cassette_directory = pop_command_line_option(sys.argv, cassette_option)
+        if cassette_directory:
+            http_client.cassette = HttpCassette(cassette_directory, cassette_mode)
+            # for worker processes that import the framework from scratch.
+            os.environ['STORMX_HTTP_CASSETTE_DIR'] = cassette_directory
+            os.environ['STORMX_HTTP_CASSETTE_MODE'] = cassette_mode
+
+    http_call_budget = pop_command_line_option(sys.argv, '--http-call-budget')
+    http_latency_budget = pop_command_line_option(sys.argv, '--http-latency-budget')
+    trace_http = '--trace-http' in sys.argv
+    if trace_http:
+        sys.argv.remove('--trace-http')
+    if trace_http or http_call_budget or http_latency_budget:
+        http_client.tracer = HttpCallTracer(
+            call_budget=int(http_call_budget) if http_call_budget else None,
+            latency_budget=float(http_latency_budget) if http_latency_budget else None,
+            trace_file_path=os.getenv('STORMX_HTTP_TRACE_FILE') or None)
+        # for worker processes that import the framework from scratch.
+        os.environ['STORMX_HTTP_TRACE'] = '1'
+        os.environ['STORMX_HTTP_CALL_BUDGET'] = http_call_budget or ''
+        os.environ['STORMX_HTTP_LATENCY_BUDGET'] = http_latency_budget or ''
+        atexit.register(report_http_calls)  # when `unittest.main()` or the parallel runner exits.
+
+    workers = pop_command_line_option(sys.argv, '--workers')
+    shard = pop_command_line_option(sys.argv, '--shard')
+    durations_file_path = pop_command_line_option(sys.argv, '--durations-file') or DEFAULT_DURATIONS_FILE_PATH
+    performance_db_path = pop_command_line_option(sys.argv, '--performance-db') or os.getenv('STORMX_PERFORMANCE_DB')
+    revision = pop_command_line_option(sys.argv, '--revision')
+
+    environment_name = resolve_environment(sys.argv, SUPPORTED_ENVIRONMENTS)
     print('API URL under test: ' +
           SUPPORTED_ENVIRONMENTS[environment_name]['host'])
     print('PHP URL under test: ' +
@@ -116,67 +159,44 @@ if __name__ == '__main__':
     else:
         print('Purple Rain transaction queue under test: ' + 'N/A')
 
-    if len(sys.argv) > 2 and sys.argv[2] == 'api':
+    if performance_db_path and not (workers or shard):
+        atexit.register(record_performance, performance_db_path, environment_name, revision)
+
+    if workers or shard:
+        if len(sys.argv) > 2 and sys.argv[2] == 'api':
+            selected_tests = api_suite(environment_name, unittest)
+        elif len(sys.argv) > 2 and sys.argv[2] == 'web':
+            selected_tests = web_suite(environment_name, unittest)
+        elif len(sys.argv) > 2:
+            selected_tests = test_registry.load_tests(sys.argv[2:])
+        else:
+            selected_tests = test_registry.load_tests()
+
+        duration_history = DurationHistory(durations_file_path)
+        units = collect_test_units(selected_tests)
+        if shard:
+            shard_index, shard_count = parse_shard(shard)
+            units = select_shard(units, shard_index, shard_count, duration_history)
+            print('Shard {0}/{1}: {2} test classes'.format(shard_index, shard_count, len(units)))
+
+        result = run_test_units(environment_name, SUPPORTED_ENVIRONMENTS[environment_name], units,
+                                workers=int(workers) if workers else 1, duration_history=duration_history,
+                                http_call_tracer=http_client.tracer)
+        if performance_db_path:
+            record_performance(performance_db_path, environment_name, revision, result)
+        sys.exit(0 if result.was_successful() else 1)
+    elif len(sys.argv) > 2 and sys.argv[2] == 'api':
         runner = unittest.TextTestRunner()
         runner.run(api_suite(environment_name, unittest))
     elif len(sys.argv) > 2 and sys.argv[2] == 'web':
         runner = unittest.TextTestRunner()
         runner.run(web_suite(environment_name, unittest))
     else:
-        StormxSystemVerification.selected_environment_name = environment_name
-        # TODO: remove hacky monkey patching
-        TestAirlineAndPassengerAPI.selected_environment_name = environment_name
-        # TODO: remove hacky monkey patching
-        TestStormxUI.selected_environment_name = environment_name
-        # TODO: remove hacky monkey patching
-        TestPassengerPayAPI.selected_environment_name = environment_name
-        # TODO: remove hacky monkey patching
-        TestPortAllowance.selected_environment_name = environment_name
-        # TODO: remove hacky monkey patching
-        TestQuickRoomTransfer.selected_environment_name = environment_name
-        TestHotelContracts.selected_environment_name = environment_name
-        UserPasswordResetTestCase.selected_environment_name = environment_name
-        TestTvlInternalAPI.selected_environment_name = environment_name
-        TestSystemPorts.selected_environment_name = environment_name
-        TestExpediaLinking.selected_environment_name = environment_name
-        TestBlogMessages.selected_environment_name = environment_name
-        AvailabilityOnPortTimezone.selected_environment_name = environment_name
-        TestAvailability.selected_environment_name = environment_name
-        TestHotelPassengerNotes.selected_environment_name = environment_name
-        TestAdditionalContacts.selected_environment_name = environment_name
-        TestReconcilliation.selected_environment_name = environment_name
-        TestHMTRecon.selected_environment_name = environment_name
-        TestRateCap.selected_environment_name = environment_name
-        TestPassengerPay.selected_environment_name = environment_name
-        TestPhpAmenities.selected_environment_name = environment_name
-        TestApiHealth.selected_environment_name = environment_name
-        TestApiPing.selected_environment_name = environment_name
-        TestApiHotelAmenities.selected_environment_name = environment_name
-        TestApiHotelBooking.selected_environment_name = environment_name
-        TestApiHotelBookingBlocks.selected_environment_name = environment_name
-        TestApiHotelBookingCancel.selected_environment_name = environment_name
-        TestApiHotelBookingDecline.selected_environment_name = environment_name
-        TestApiHotelBookingDirectBilling.selected_environment_name = environment_name
-        TestApiHotelBookingExpedia.selected_environment_name = environment_name
-        TestApiHotelBookingInternal.selected_environment_name = environment_name
-        TestApiHotelBookingPets.selected_environment_name = environment_name
-        TestApiHotelImages.selected_environment_name = environment_name
-        TestApiHotelSearch.selected_environment_name = environment_name
-        TestApiHotelSearchInternal.selected_environment_name = environment_name
-        TestApiMealsICoupon.selected_environment_name = environment_name
-        TestApiNotifications.selected_environment_name = environment_name
-        TestApiPassengerImport.selected_environment_name = environment_name
-        TestApiCustomFields.selected_environment_name = environment_name
-        TestApiPassengerRetrieval.selected_environment_name = environment_name
-        TestApiShuttleTracker.selected_environment_name = environment_name
-        TestHotelVoucherUnlock.selected_environment_name = environment_name
-        TestMealVoucherActiveDateRange.selected_environment_name = environment_name
-        TestPassengerApp.selected_environment_name = environment_name
-        TestQrCodes.selected_environment_name = environment_name
-        TestTaxes.selected_environment_name = environment_name
-        TestHotelAllowances.selected_environment_name = environment_name
-        TestTransportOnlyVoucher.selected_environment_name = environment_name
+        bind_environment(environment_name)
         # remove so that unittest.main() will see standard unit test parameters and not get confused by the environment parameter.
         del sys.argv[1]
 
-        unittest.main()
+        # only the modules of the selected tests are imported (see `test_registry.py`).
+        sys.argv[1:] = [test_registry.qualified_name(argument) for argument in sys.argv[1:]]
+        unittest.main(module=None, defaultTest=[test_registry.qualified_name(class_name)
+                                                for class_name in test_registry.class_names()])
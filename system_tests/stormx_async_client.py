@@ -0,0 +1,192 @@
+"""
+asyncio counterpart of the airline, passenger, sandbox and PHP helpers of `StormxSystemVerification`.
+
+The synchronous helpers make one round trip at a time, so a bulk verification step such as
+"fetch the full state of 300 imported passengers" takes 300 round trips. With this client the
+calls are issued concurrently (at most `concurrency` in flight), so the step takes roughly
+`300 / concurrency` round trip times.
+
+The HTTP calls still go through `requests` (on a thread pool, via a dedicated `PooledHttpClient`
+sized to `concurrency`), so responses are the same `requests.Response` objects the synchronous
+tests assert on, and no extra HTTP library is needed. The calls are traced like the ones of the shared
+`http_client` (see `http_call_tracer.py`), under the scope of the test that created the client, and
+recorded or replayed by its cassette (see `http_cassette.py`).
+
+usage (from a synchronous test method):
+
+    client = self.get_async_api_client(concurrency=20)
+    responses = client.run(client.get_passenger_full_states(customer, context_ids))
+    for response in responses:
+        self.assertEqual(response.status_code, 200)
+    client.close()
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from stormx_http import PooledHttpClient, http_client
+
+DEFAULT_CONCURRENCY = 20
+
+
+class AsyncStormxClient(object):
+
+    def __init__(self, api_host, php_host, airline_headers_factory, passenger_headers=None,
+                 php_headers=None, concurrency=DEFAULT_CONCURRENCY):
+        """
+        :param api_host: string
+        :param php_host: string
+        :param airline_headers_factory: callable(customer) returning the API headers of an airline.
+        :param passenger_headers: dict - headers for passenger facing (offer) endpoints.
+        :param php_headers: dict - headers for PHP endpoints.
+        :param concurrency: int - maximum number of requests in flight.
+        """
+        self.api_host = api_host
+        self.php_host = php_host
+        self.concurrency = concurrency
+        self._airline_headers_factory = airline_headers_factory
+        self._passenger_headers = dict(passenger_headers or {})
+        self._php_headers = dict(php_headers or {})
+        tracer = http_client.tracer
+        self._http = PooledHttpClient(pool_size=concurrency, cassette=http_client.cassette, tracer=tracer)
+        # the pool threads' calls are traced as the current test's.
+        self._executor = ThreadPoolExecutor(max_workers=concurrency,
+                                            initializer=tracer.scope_initializer() if tracer is not None else None)
+        self._semaphores = {}  # event loop -> asyncio.Semaphore
+
+    def _semaphore(self):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphores = {loop: semaphore}  # forget semaphores of finished event loops.
+        return semaphore
+
+    @staticmethod
+    def run(coroutine):
+        """
+        run a coroutine to completion from synchronous code (e.g. a unittest test method).
+        """
+        return asyncio.run(coroutine)
+
+    async def call(self, function, *args, **kwargs):
+        """
+        run any blocking callable (e.g. a `SandboxApiClient` method) on the client's thread pool,
+        counting against the concurrency limit.
+        """
+        async with self._semaphore():
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(function, *args, **kwargs))
+
+    async def request(self, method, url, **kwargs):
+        """
+        same arguments as `requests.request()`.
+        :return: requests.Response
+        """
+        return await self.call(self._http.request, method, url, **kwargs)
+
+    async def gather(self, coroutines):
+        """
+        :param coroutines: iterable of coroutines
+        :return: list of results, in order.
+        """
+        return list(await asyncio.gather(*coroutines))
+
+    # airline API ----------------------------------------------------------------------
+
+    async def import_passengers(self, customer, passengers):
+        """
+        :param customer: string
+        :param passengers: list(dict) - passenger payload.
+        :return: requests.Response of `POST /api/v1/passenger`.
+        """
+        return await self.request('POST', self.api_host + '/api/v1/passenger',
+                                  headers=self._airline_headers_factory(customer), json=passengers)
+
+    async def import_passenger_batches(self, customer, passenger_batches):
+        """
+        :param customer: string
+        :param passenger_batches: list of passenger payloads (list of lists of dicts).
+        :return: list(requests.Response)
+        """
+        return await self.gather(self.import_passengers(customer, passengers) for passengers in passenger_batches)
+
+    async def get_passenger(self, customer, context_id):
+        return await self.request('GET', self.api_host + '/api/v1/passenger/' + context_id,
+                                  headers=self._airline_headers_factory(customer))
+
+    async def get_passenger_full_state(self, customer, context_id):
+        return await self.request('GET', self.api_host + '/api/v1/passenger/' + context_id + '/state',
+                                  headers=self._airline_headers_factory(customer))
+
+    async def get_passenger_full_states(self, customer, context_ids):
+        """
+        :param customer: string
+        :param context_ids: list(string)
+        :return: list(requests.Response), in the order of `context_ids`.
+        """
+        return await self.gather(self.get_passenger_full_state(customer, context_id) for context_id in context_ids)
+
+    async def search_hotels(self, customer, port, room_count=1, **query_parameters):
+        """
+        :return: requests.Response of `GET /api/v1/hotels`.
+        """
+        query_parameters.update(port=port, room_count=str(int(room_count)))
+        return await self.request('GET', self.api_host + '/api/v1/hotels',
+                                  headers=self._airline_headers_factory(customer), params=query_parameters)
+
+    async def book_hotel(self, customer, context_ids, hotel_id, room_count=1):
+        """
+        :return: requests.Response of `POST /api/v1/hotels`.
+        """
+        payload = dict(context_ids=context_ids, hotel_id=hotel_id, room_count=room_count)
+        return await self.request('POST', self.api_host + '/api/v1/hotels',
+                                  headers=self._airline_headers_factory(customer), json=payload)
+
+    async def decline_passenger(self, customer, context_id):
+        return await self.request('PUT', self.api_host + '/api/v1/passenger/' + context_id + '/decline',
+                                  headers=self._airline_headers_factory(customer))
+
+    # passenger (offer) API --------------------------------------------------------------
+
+    async def get_offer_hotels(self, ak1, ak2, room_count=1):
+        query_parameters = dict(ak1=ak1, ak2=ak2, room_count=str(int(room_count)))
+        return await self.request('GET', self.api_host + '/api/v1/offer/hotels',
+                                  headers=self._passenger_headers, params=query_parameters)
+
+    async def passenger_book_hotel(self, ak1, ak2, context_ids, hotel_id, room_count=1):
+        payload = dict(context_ids=context_ids, hotel_id=hotel_id, room_count=room_count)
+        return await self.request('POST', self.api_host + '/api/v1/offer/hotels', headers=self._passenger_headers,
+                                  params=dict(ak1=ak1, ak2=ak2), json=payload)
+
+    async def passenger_decline_offer(self, ak1, ak2):
+        return await self.request('PUT', self.api_host + '/api/v1/offer/decline', headers=self._passenger_headers,
+                                  params=dict(ak1=ak1, ak2=ak2))
+
+    # sandbox API ------------------------------------------------------------------------
+
+    async def sandbox(self, sandbox_api_client, method_name, *args, **kwargs):
+        """
+        call a `SandboxApiClient` method concurrently, e.g.
+            `await client.sandbox(self._sandbox_api_client, 'get_object_field', 'PortMaster', 'port_timezone', port_prefix='LAX')`
+        """
+        return await self.call(getattr(sandbox_api_client, method_name), *args, **kwargs)
+
+    # PHP ---------------------------------------------------------------------------------
+
+    async def php_get(self, path, cookies, params=None):
+        """
+        :param path: string like '/admin/hotels.php'
+        :param cookies: dict of session cookies (see `login_to_stormx`).
+        :return: requests.Response
+        """
+        headers = dict(self._php_headers, **{'X-TVA-Internal': '1'})
+        return await self.request('GET', self.php_host + path, headers=headers, cookies=cookies, params=params)
+
+    async def php_post(self, path, cookies, data=None):
+        headers = dict(self._php_headers, **{'X-TVA-Internal': '1'})
+        return await self.request('POST', self.php_host + path, headers=headers, cookies=cookies, data=data)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._http.close()
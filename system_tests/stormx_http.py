@@ -0,0 +1,159 @@
+"""
+Pooled keep-alive HTTP layer shared by the system test framework.
+
+Every helper in `stormx_verification_framework.py` and every `verify_*.py` test
+sends its HTTP calls through the module level `http_client` instead of the module
+level `requests.get/post/...` functions. `requests.get()` builds (and throws away)
+a brand new `requests.Session` per call, which means a fresh TCP + TLS handshake on
+every one of the thousands of calls of a full system test run.
+
+`http_client` keeps one `requests.Session` per host (the PHP host and the API host end up
+in separate pools), each mounted with an `HTTPAdapter` sized by `pool_size`.
+
+NOTE: the sessions never store cookies. Tests pass `cookies=` explicitly and several tests
+      verify what happens *without* cookies, so cookie persistence between calls would silently
+      change behavior. `response.cookies` is still populated as usual.
+
+With a cassette (see `http_cassette.py`), calls are recorded to disk or replayed from it.
+With a tracer (see `http_call_tracer.py`), every call is recorded for the per-test HTTP report.
+
+usage:
+    from stormx_http import http_client
+
+    response = http_client.get(url, headers=headers, params=query_parameters)
+"""
+import atexit
+import functools
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_call_tracer import tracer_from_environment
+from http_cassette import cassette_from_environment
+
+DEFAULT_POOL_SIZE = int(os.getenv('STORMX_HTTP_POOL_SIZE', '20'))
+
+
+class _RejectAllCookiesPolicy(DefaultCookiePolicy):
+    """
+    cookie policy that keeps the session cookie jar empty.
+    """
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+class PooledHttpClient(object):
+    """
+    drop-in replacement for the `requests.get/post/put/patch/delete/head` functions,
+    routing every call through a keep-alive `requests.Session` for the url's host.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, cassette=None, tracer=None):
+        """
+        :param pool_size: int - maximum number of connections kept alive per host.
+        :param cassette: HttpCassette or None - records or replays every call.
+        :param tracer: HttpCallTracer or None - records method, route, status, sizes and latency of every call.
+        """
+        self._pool_size = pool_size
+        self.cassette = cassette
+        self.tracer = tracer
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_replaying(self):
+        """
+        True when responses come from a cassette instead of the network.
+        """
+        return self.cassette is not None and self.cassette.is_replaying
+
+    @property
+    def pool_size(self):
+        return self._pool_size
+
+    def configure(self, pool_size):
+        """
+        change the pool size. existing sessions are closed, new ones are created on demand.
+        :param pool_size: int
+        """
+        self.close()
+        self._pool_size = int(pool_size)
+
+    @staticmethod
+    def _host_key(url):
+        split_url = urlsplit(url)
+        return split_url.scheme + '://' + split_url.netloc
+
+    def _create_session(self):
+        session = requests.Session()
+        session.cookies.set_policy(_RejectAllCookiesPolicy())
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def session_for(self, url):
+        """
+        :param url: string
+        :return: `requests.Session` shared by every call to the url's host.
+        """
+        host_key = self._host_key(url)
+        session = self._sessions.get(host_key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(host_key)
+                if session is None:
+                    session = self._create_session()
+                    self._sessions[host_key] = session
+        return session
+
+    def request(self, method, url, **kwargs):
+        """
+        same signature as `requests.request()`.
+        :return: `requests.Response`
+        """
+        send = self._send if self.cassette is None else functools.partial(self.cassette.request, self._send)
+        if self.tracer is not None:
+            return self.tracer.trace(send, method, url, **kwargs)
+        return send(method, url, **kwargs)
+
+    def _send(self, method, url, **kwargs):
+        return self.session_for(url).request(method=method, url=url, **kwargs)
+
+    def get(self, url, params=None, **kwargs):
+        return self.request('GET', url, params=params, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url, data=data, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return self.request('PATCH', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def close(self):
+        """
+        close every pooled connection.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+        for session in sessions:
+            session.close()
+
+
+http_client = PooledHttpClient(cassette=cassette_from_environment(), tracer=tracer_from_environment())
+if http_client.cassette is not None:
+    atexit.register(http_client.cassette.save)
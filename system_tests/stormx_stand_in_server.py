@@ -0,0 +1,557 @@
+#! /usr/bin/env python3
+"""
+Local, in-process stand-in for a StormX environment (API and PHP), for offline benchmarking.
+
+The stand-in implements, with in-memory state, the endpoints the framework and the load
+generator use the most:
+
+    GET  /                                          PHP home page
+    POST /admin/index.php                           PHP login (sets a PHPSESSID cookie)
+    GET  /admin/index.php?logout=true               PHP logout
+    POST /admin/remote/helper.php?type=updateAvailsNew   add hotel availability
+    GET  /health-check-api?from=...                 API health check (404 without `from`)
+    GET  /api/v1/ping                               (403 unless the Authorization token is a customer's)
+    POST /api/v1/passenger                          import passengers
+    GET  /api/v1/passenger/{context_id}[/state]
+    PUT  /api/v1/passenger/{context_id}/decline
+    GET  /api/v1/hotels, POST /api/v1/hotels        airline hotel search and booking
+    GET  /api/v1/offer/hotels, POST /api/v1/offer/hotels, PUT /api/v1/offer/decline
+    POST /api/v1/tvl/control/flush-internal-queue
+    POST /sandbox/transaction
+    GET  /sandbox/objects/{model_name}              used by `StandInSandboxApiClient`
+
+It is meant to measure the test harness itself (HTTP client, runners, load generator), not
+StormX: responses have the shape of the real ones but the business rules are minimal.
+Every response can be delayed to simulate a remote server (`latency` and `jitter`, optionally
+per path prefix with `route_latencies`).
+
+selecting the stand-in: use the environment name `stand_in`, e.g.
+
+    ./run_system_tests.py stand_in TestApiPing
+    ./run_load_tests.py stand_in --rate 50 --duration 30
+
+The server is started in the process of the runner (worker processes talk to it over HTTP).
+`STORMX_STAND_IN_LATENCY_MS` and `STORMX_STAND_IN_JITTER_MS` configure the injected latency.
+To share one stand-in between several runners, start it on its own:
+
+    ./stormx_stand_in_server.py --port 8765 --latency-ms 50
+
+and set `STORMX_STAND_IN_URL=http://127.0.0.1:8765` for the runners.
+"""
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from lazy_import import lazy_import
+from stormx_http import http_client
+
+environments = lazy_import('stormx_api_client.environments')
+
+STAND_IN_ENVIRONMENT_NAME = 'stand_in'
+DEFAULT_LATENCY_IN_SECONDS = float(os.getenv('STORMX_STAND_IN_LATENCY_MS', '0')) / 1000
+DEFAULT_JITTER_IN_SECONDS = float(os.getenv('STORMX_STAND_IN_JITTER_MS', '0')) / 1000
+
+STAND_IN_PORT_TIMEZONES = {
+    'DFW': 'America/Chicago',
+    'EUG': 'America/Los_Angeles',
+    'JFK': 'America/New_York',
+    'KOA': 'Pacific/Honolulu',
+    'LAX': 'America/Los_Angeles',
+    'LHR': 'Europe/London',
+    'ORD': 'America/Chicago',
+    'YYZ': 'America/Toronto',
+}
+INVALID_CUSTOMER_NAMES = ('INVALID_CREDENTIALS',)  # `CUSTOMER_TOKENS` entries of customers that do not exist.
+STAND_IN_HOTELS_PER_PORT = 3
+STAND_IN_ROOMS_PER_HOTEL = 1000
+
+
+def stand_in_hotel_ids(port_prefix):
+    """
+    :param port_prefix: string - a port of `STAND_IN_PORT_TIMEZONES`, e.g. 'LAX'.
+    :return: tuple(string) - ids of the stand-in hotels of the port, e.g. ('tvl-13', 'tvl-14', 'tvl-15').
+    """
+    first_hotel_number = sorted(STAND_IN_PORT_TIMEZONES).index(port_prefix) * STAND_IN_HOTELS_PER_PORT + 1
+    return tuple('tvl-{0}'.format(first_hotel_number + hotel_index) for hotel_index in range(STAND_IN_HOTELS_PER_PORT))
+
+
+class StandInState(object):
+    """
+    in-memory data of the stand-in, shared by all request threads.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.passengers = {}  # context_id -> passenger dict
+        self.passengers_by_access_key = {}  # (ak1, ak2) -> context_id
+        self.ports = [dict(id=port_id, port_prefix=prefix, port_timezone=port_timezone, port_is_available=1)
+                      for port_id, (prefix, port_timezone) in enumerate(sorted(STAND_IN_PORT_TIMEZONES.items()), 1)]
+        self.hotels = {}  # hotel_id -> hotel dict
+        for port in self.ports:
+            for hotel_index, hotel_id in enumerate(stand_in_hotel_ids(port['port_prefix'])):
+                self.hotels[hotel_id] = dict(
+                    hotel_id=hotel_id, hotel_name='Stand-in Hotel {0} {1}'.format(port['port_prefix'], hotel_index + 1),
+                    port=port['port_prefix'], provider='tvl', rate='{0}.00'.format(79 + 20 * hotel_index),
+                    tax='{0}.00'.format(9 + 2 * hotel_index), currency_code='USD', distance=1.5 + hotel_index,
+                    available_rooms=STAND_IN_ROOMS_PER_HOTEL)
+        self.vouchers = {}  # voucher_id -> voucher dict
+        self.transactions = []
+
+    def models(self):
+        """
+        :return: dict - model name -> list of dicts, for the sandbox object endpoints.
+        """
+        return {
+            'PortMaster': self.ports,
+            'Hotel': list(self.hotels.values()),
+            'Passenger': list(self.passengers.values()),
+            'Voucher': list(self.vouchers.values()),
+        }
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real load balancer.
+    server_version = 'StormxStandIn/1.0'
+    disable_nagle_algorithm = True  # headers and body are written separately, avoid the delayed ACK stall.
+
+    def log_message(self, format, *args):
+        pass  # one line per request on stderr would dominate a benchmark.
+
+    # plumbing -------------------------------------------------------------------------------
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if not body:
+            return None
+        if (self.headers.get('Content-Type') or '').startswith('application/json'):
+            return json.loads(body.decode('utf-8'))
+        return {key: values[-1] for key, values in parse_qs(body.decode('utf-8')).items()}
+
+    def _send(self, status_code, body, content_type='application/json', headers=None):
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status_code, data, message='OK', error=False):
+        self._send(status_code, json.dumps({'error': error, 'meta': {'message': message}, 'data': data}))
+
+    def _send_error(self, status_code, message):
+        self._send_json(status_code, None, message=message, error=True)
+
+    def _is_customer_authorized(self):
+        """
+        :return: bool - the Authorization header ('Basic <token>' or 'Token <token>') has a customer's token.
+        """
+        scheme, _, token = (self.headers.get('Authorization') or '').partition(' ')
+        if scheme not in ('Basic', 'Token') or not token:
+            return False
+        return token in {customer_token for customer, customer_token in environments.CUSTOMER_TOKENS.items()
+                         if customer not in INVALID_CUSTOMER_NAMES}
+
+    def _handle(self, method):
+        self.server.stand_in.inject_latency(self.path)
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            body = self._read_body() if method in ('POST', 'PUT') else None
+        except ValueError:
+            return self._send_error(400, 'invalid request body.')
+
+        path_parts = [part for part in url.path.split('/') if part]
+        for route_method, route, handler in _ROUTES:
+            if route_method == method and _route_matches(route, path_parts):
+                arguments = [part for part, route_part in zip(path_parts, route) if route_part == '*']
+                return handler(self, query, body, *arguments)
+        self._send_error(404, 'stand-in: no route for ' + method + ' ' + url.path)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    # PHP ---------------------------------------------------------------------------------------
+
+    def php_home(self, query, body):
+        self._send(200, '<html><body>StormX stand-in</body></html>', content_type='text/html')
+
+    def php_login_page(self, query, body):
+        if query.get('logout') == 'true':
+            return self._send(200, '<html><body>logged out</body></html>', content_type='text/html')
+        self._send(200, '<html><body>login</body></html>', content_type='text/html')
+
+    def php_login(self, query, body):
+        body = body or {}
+        if not body.get('uID') or not body.get('uPwd'):
+            return self._send(200, '<html><body>Incorrect Username or Password</body></html>', content_type='text/html')
+        self._send(200, '<html><body>Please wait redirecting...</body></html>', content_type='text/html',
+                   headers={'Set-Cookie': 'PHPSESSID={0}; path=/'.format(uuid.uuid4().hex)})
+
+    def php_helper(self, query, body):
+        if query.get('type') != 'updateAvailsNew':
+            return self._send(200, json.dumps({'success': '1'}))
+        body = body or {}
+        state = self.server.stand_in.state
+        with state.lock:
+            hotel = state.hotels.get(body.get('id')) or state.hotels.get('tvl-' + str(body.get('id')))
+            if hotel is None:
+                return self._send(200, json.dumps({'success': '0', 'message': 'unknown hotel.'}))
+            hotel['available_rooms'] += int(body.get('blocks') or 0)
+        self._send(200, json.dumps({'success': '1'}))
+
+    # airline API ------------------------------------------------------------------------------
+
+    def health_check(self, query, body):
+        if not query.get('from'):
+            return self._send_error(404, 'not found.')
+        self._send_json(200, dict(status='ok'))
+
+    def api_ping(self, query, body):
+        if not self._is_customer_authorized():
+            return self._send_error(403, 'invalid credentials.')
+        self._send_json(200, 'pong')
+
+    def import_passengers(self, query, body):
+        if not isinstance(body, list) or not body:
+            return self._send_error(400, 'expected a list of passengers.')
+        state = self.server.stand_in.state
+        api_host = self.server.stand_in.url
+        imported = []
+        with state.lock:
+            for payload in body:
+                passenger = dict(payload)
+                ak1, ak2 = uuid.uuid4().hex, uuid.uuid4().hex
+                passenger.update(
+                    ak1=ak1, ak2=ak2, id=len(state.passengers) + 1, voucher_id=None, offer_opened_date=None,
+                    offer_url=api_host + '/offer?ak1={0}&ak2={1}'.format(ak1, ak2),
+                    hotel_accommodation_status='offered' if passenger.get('hotel_accommodation') else 'not_offered',
+                    meal_accommodation_status='offered' if passenger.get('meal_accommodation') else 'not_offered',
+                    transport_accommodation_status='not_offered', canceled=False, declined=False, notifications=[])
+                state.passengers[passenger['context_id']] = passenger
+                state.passengers_by_access_key[(ak1, ak2)] = passenger['context_id']
+                imported.append(dict(passenger))
+        self._send_json(201, imported)
+
+    def get_passenger(self, query, body, context_id):
+        passenger = self.server.stand_in.state.passengers.get(context_id)
+        if passenger is None:
+            return self._send_error(404, 'passenger not found.')
+        self._send_json(200, dict(passenger))
+
+    def get_passenger_state(self, query, body, context_id):
+        state = self.server.stand_in.state
+        passenger = state.passengers.get(context_id)
+        if passenger is None:
+            return self._send_error(404, 'passenger not found.')
+        voucher = state.vouchers.get(passenger['voucher_id'])
+        self._send_json(200, dict(passenger=dict(passenger), voucher=voucher,
+                                  voucher_id=passenger['voucher_id'], offer_opened_date=passenger['offer_opened_date']))
+
+    def decline_passenger(self, query, body, context_id):
+        state = self.server.stand_in.state
+        with state.lock:
+            passenger = state.passengers.get(context_id)
+            if passenger is None:
+                return self._send_error(404, 'passenger not found.')
+            passenger['declined'] = True
+            passenger['hotel_accommodation_status'] = 'declined'
+        self._send_json(200, dict(passenger))
+
+    def _search_hotels(self, port, room_count):
+        state = self.server.stand_in.state
+        return [dict(hotel) for hotel in state.hotels.values()
+                if hotel['port'] == port and hotel['available_rooms'] >= room_count]
+
+    def search_hotels(self, query, body):
+        if not query.get('port') or not query.get('room_count', '').isdigit():
+            return self._send_error(400, 'port and room_count are required.')
+        self._send_json(200, self._search_hotels(query['port'], int(query['room_count'])))
+
+    def _book(self, context_ids, hotel_id, room_count):
+        """
+        :return: (status code, data or error message) tuple.
+        """
+        state = self.server.stand_in.state
+        with state.lock:
+            passengers = [state.passengers.get(context_id) for context_id in context_ids or []]
+            hotel = state.hotels.get(hotel_id)
+            if not passengers or None in passengers or hotel is None:
+                return 400, 'unknown passenger or hotel.'
+            if any(passenger['voucher_id'] for passenger in passengers):
+                return 409, 'passenger already booked.'
+            if hotel['available_rooms'] < room_count:
+                return 409, 'hotel is sold out.'
+            hotel['available_rooms'] -= room_count
+            voucher_id = str(uuid.uuid4())
+            voucher = dict(voucher_id=voucher_id, hotel_id=hotel_id, hotel_name=hotel['hotel_name'],
+                           room_count=room_count, status='active', context_ids=list(context_ids))
+            state.vouchers[voucher_id] = voucher
+            for passenger in passengers:
+                passenger['voucher_id'] = voucher_id
+                passenger['hotel_accommodation_status'] = 'accepted'
+        return 200, dict(hotel_voucher=dict(hotel_id=hotel_id, hotel_name=hotel['hotel_name'], room_count=room_count),
+                         passengers=[dict(passenger) for passenger in passengers])
+
+    def book_hotel(self, query, body):
+        body = body or {}
+        status_code, data = self._book(body.get('context_ids'), body.get('hotel_id'), int(body.get('room_count') or 1))
+        if status_code != 200:
+            return self._send_error(status_code, data)
+        self._send_json(200, data)
+
+    # passenger (offer) API -------------------------------------------------------------------
+
+    def _offer_passenger(self, query):
+        state = self.server.stand_in.state
+        context_id = state.passengers_by_access_key.get((query.get('ak1'), query.get('ak2')))
+        return state.passengers.get(context_id) if context_id else None
+
+    def get_offer_hotels(self, query, body):
+        passenger = self._offer_passenger(query)
+        if passenger is None:
+            return self._send_error(401, 'invalid access keys.')
+        passenger['offer_opened_date'] = passenger['offer_opened_date'] or time.strftime('%Y-%m-%d %H:%M:%S')
+        room_count = int(query.get('room_count') or 1)
+        self._send_json(200, self._search_hotels(passenger['port_accommodation'], room_count))
+
+    def offer_book_hotel(self, query, body):
+        if self._offer_passenger(query) is None:
+            return self._send_error(401, 'invalid access keys.')
+        self.book_hotel(query, body)
+
+    def offer_decline(self, query, body):
+        passenger = self._offer_passenger(query)
+        if passenger is None:
+            return self._send_error(401, 'invalid access keys.')
+        self.decline_passenger(query, body, passenger['context_id'])
+
+    def send_notifications(self, query, body, context_id):
+        if context_id not in self.server.stand_in.state.passengers:
+            return self._send_error(404, 'passenger not found.')
+        self._send_json(200, dict(context_id=context_id, queued=True))
+
+    # internal and sandbox ---------------------------------------------------------------------
+
+    def flush_internal_queue(self, query, body):
+        self._send_json(200, dict(flushed=0))
+
+    def sandbox_transaction(self, query, body):
+        state = self.server.stand_in.state
+        with state.lock:
+            transaction = dict(body or {}, transaction_id=str(uuid.uuid4()), status='approved')
+            state.transactions.append(transaction)
+        self._send(200, json.dumps(transaction))
+
+    def sandbox_objects(self, query, body, model_name):
+        state = self.server.stand_in.state
+        objects = state.models().get(model_name)
+        if objects is None:
+            return self._send_error(404, 'stand-in: unknown model ' + model_name)
+        fields = query.pop('fields', None)
+        limit = int(query.pop('limit')) if query.get('limit') else None
+        with state.lock:
+            matching = [dict(row) for row in objects
+                        if all(str(row.get(key)) == value for key, value in query.items())]
+        if fields:
+            matching = [{field: row.get(field) for field in fields.split(',')} for row in matching]
+        self._send_json(200, matching[:limit] if limit else matching)
+
+
+def _route_matches(route, path_parts):
+    return len(route) == len(path_parts) and all(
+        route_part in ('*', path_part) for route_part, path_part in zip(route, path_parts))
+
+
+_ROUTES = [(method, tuple(part for part in route.split('/') if part), handler) for method, route, handler in (
+    ('GET', '/', _StandInRequestHandler.php_home),
+    ('GET', '/admin/index.php', _StandInRequestHandler.php_login_page),
+    ('POST', '/admin/index.php', _StandInRequestHandler.php_login),
+    ('POST', '/admin/remote/helper.php', _StandInRequestHandler.php_helper),
+    ('GET', '/health-check-api', _StandInRequestHandler.health_check),
+    ('GET', '/api/v1/ping', _StandInRequestHandler.api_ping),
+    ('POST', '/api/v1/passenger', _StandInRequestHandler.import_passengers),
+    ('GET', '/api/v1/passenger/*', _StandInRequestHandler.get_passenger),
+    ('GET', '/api/v1/passenger/*/state', _StandInRequestHandler.get_passenger_state),
+    ('PUT', '/api/v1/passenger/*/decline', _StandInRequestHandler.decline_passenger),
+    ('POST', '/api/v1/passenger/*/notifications', _StandInRequestHandler.send_notifications),
+    ('GET', '/api/v1/hotels', _StandInRequestHandler.search_hotels),
+    ('POST', '/api/v1/hotels', _StandInRequestHandler.book_hotel),
+    ('GET', '/api/v1/offer/hotels', _StandInRequestHandler.get_offer_hotels),
+    ('POST', '/api/v1/offer/hotels', _StandInRequestHandler.offer_book_hotel),
+    ('PUT', '/api/v1/offer/decline', _StandInRequestHandler.offer_decline),
+    ('POST', '/api/v1/tvl/control/flush-internal-queue', _StandInRequestHandler.flush_internal_queue),
+    ('POST', '/sandbox/transaction', _StandInRequestHandler.sandbox_transaction),
+    ('GET', '/sandbox/objects/*', _StandInRequestHandler.sandbox_objects),
+)]
+
+
+class StandInServer(object):
+
+    def __init__(self, latency=DEFAULT_LATENCY_IN_SECONDS, jitter=DEFAULT_JITTER_IN_SECONDS, route_latencies=None,
+                 host='127.0.0.1', port=0):
+        """
+        :param latency: float seconds added to every response.
+        :param jitter: float seconds - up to this much more, uniformly distributed, is added to every response.
+        :param route_latencies: dict - path prefix -> float seconds, replaces `latency` for matching paths,
+                                e.g. {'/api/v1/hotels': 0.4}.
+        :param host: string - interface to listen on.
+        :param port: int - 0 picks a free port.
+        """
+        self.state = StandInState()
+        self._http_server = ThreadingHTTPServer((host, port), _StandInRequestHandler)
+        self._http_server.daemon_threads = True
+        self._http_server.stand_in = self
+        self._thread = None
+        self.configure_latency(latency, jitter, route_latencies)
+
+    @property
+    def url(self):
+        host, port = self._http_server.server_address[:2]
+        return 'http://{0}:{1}'.format(host, port)
+
+    def configure_latency(self, latency=0.0, jitter=0.0, route_latencies=None):
+        self.latency = latency
+        self.jitter = jitter
+        # longest prefixes first, so '/api/v1/hotels' wins over '/api'.
+        self.route_latencies = sorted((route_latencies or {}).items(), key=lambda item: -len(item[0]))
+
+    def inject_latency(self, path):
+        delay = next((route_latency for prefix, route_latency in self.route_latencies if path.startswith(prefix)),
+                     self.latency)
+        if self.jitter:
+            delay += random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def start(self):
+        """
+        serve in a background (daemon) thread.
+        :return: string - base URL of the server.
+        """
+        self._thread = threading.Thread(target=self._http_server.serve_forever, name='stormx-stand-in', daemon=True)
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self):
+        """
+        serve in the current thread, until `stop()` or KeyboardInterrupt.
+        """
+        self._http_server.serve_forever()
+
+    def stop(self):
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+
+def start_stand_in_environment(supported_environments, environment_name=STAND_IN_ENVIRONMENT_NAME, **server_kwargs):
+    """
+    start a stand-in server (unless `STORMX_STAND_IN_URL` points to one) and register it as an environment.
+    :param supported_environments: dict - usually `SUPPORTED_ENVIRONMENTS`.
+    :param environment_name: string
+    :param server_kwargs: see `StandInServer`.
+    :return: StandInServer, or None when an external stand-in is used.
+    """
+    server, url = None, os.getenv('STORMX_STAND_IN_URL')
+    if not url:
+        server = StandInServer(**server_kwargs)
+        url = server.start()
+    supported_environments[environment_name] = {
+        'host': url,
+        'php_host': url,
+        'purple_rain_airline_queue': None,
+        'purple_rain_transaction_queue': None,
+        'stand_in': True,
+    }
+    return server
+
+
+def resolve_environment(argv, supported_environments):
+    """
+    the environment of a runner, from its first positional argument: a canned environment, `stand_in`
+    (a stand-in server is started, see `start_stand_in_environment()`) or any other name `<name>`, for the
+    hosts https://<name>api.tvlinc.com and https://<name>ui.tvlinc.com. exits with the list of canned
+    environments when `argv` has no environment name.
+    :param argv: list(string) - usually `sys.argv`.
+    :param supported_environments: dict - usually `SUPPORTED_ENVIRONMENTS`, the environment is added to it.
+    :return: string - the environment name.
+    """
+    if len(argv) < 2:
+        print('ERROR: must provide environment name.\n\nCanned environments:\n\t' +
+              '\n\t'.join(tuple(sorted(supported_environments.keys()))) + '\n\n'
+              '...Or you may supply your own environment name.\n' +
+              'Example: "superman" would be the environment name of the URL https://supermanapi.tvlinc.com .\n'
+              )
+        sys.exit(1)
+    environment_name = argv[1]
+    if environment_name == STAND_IN_ENVIRONMENT_NAME:
+        start_stand_in_environment(supported_environments)
+    elif environment_name not in supported_environments:
+        supported_environments[environment_name] = {
+            'host': 'https://{environment_name}api.tvlinc.com'.format(environment_name=environment_name),
+            'php_host': 'https://{environment_name}ui.tvlinc.com'.format(environment_name=environment_name),
+            'purple_rain_airline_queue': None,
+            'purple_rain_transaction_queue': None,
+        }
+    return environment_name
+
+
+class StandInSandboxApiClient(object):
+    """
+    replaces `SandboxApiClient` for the stand-in environment (same methods the framework uses).
+    """
+
+    def __init__(self, host):
+        self.host = host
+
+    def get_objects(self, model_name, fields=None, limit=None, **filter):
+        params = dict(filter)
+        if fields:
+            params['fields'] = ','.join(fields)
+        if limit:
+            params['limit'] = str(limit)
+        response = http_client.get(self.host + '/sandbox/objects/' + model_name, params=params)
+        response.raise_for_status()
+        return response.json()['data']
+
+    def get_object(self, model_name, fields=None, **filter):
+        objects = self.get_objects(model_name, fields=fields, limit=1, **filter)
+        return objects[0] if objects else None
+
+    def get_object_field(self, model_name, field, **filter):
+        stand_in_object = self.get_object(model_name, fields=[field], **filter)
+        return stand_in_object[field] if stand_in_object else None
+
+    def get_port_timezone(self, port_iata_code):
+        return self.get_object_field('PortMaster', 'port_timezone', port_prefix=port_iata_code)
+
+
+if __name__ == '__main__':
+    from parallel_test_runner import pop_command_line_option
+
+    port = int(pop_command_line_option(sys.argv, '--port') or 8765)
+    latency_ms = float(pop_command_line_option(sys.argv, '--latency-ms') or DEFAULT_LATENCY_IN_SECONDS * 1000)
+    jitter_ms = float(pop_command_line_option(sys.argv, '--jitter-ms') or DEFAULT_JITTER_IN_SECONDS * 1000)
+
+    stand_in_server = StandInServer(latency=latency_ms / 1000, jitter=jitter_ms / 1000, port=port)
+    print('StormX stand-in listening on ' + stand_in_server.url + ' (latency {0}ms, jitter {1}ms)'.format(
+        latency_ms, jitter_ms))
+    try:
+        stand_in_server.serve_forever()
+    except KeyboardInterrupt:
+        stand_in_server.stop()
@@ -28,32 +28,45 @@ sys.path.append(STORMX_PACKAGES_DIR)
 
 import copy
 import datetime
+import functools
 import json
 import time
 import unittest
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
 
-import boto3
-import faker
-import requests
-from pytz import timezone
 import uuid
 import random
 import string
 
-from StormxApp.tests.data_utilities import (
-    generate_context_id,
-    generate_pax_record_locator,
-    generate_pax_record_locator_group,
-    MOST_PASSENGERS_IN_LARGEST_AIRCRAFT
-)
-
 from stormx_api_client.environments import CUSTOMER_TOKENS, SUPPORTED_ENVIRONMENTS
-from stormx_api_client.airline_api_client import AirlineApiClient
-from stormx_api_client.sandbox_api_client import SandboxApiClient
+
+from bulk_passenger_generator import BulkPassengerGenerator
+from lazy_import import lazy_import
+from login_cookie_cache import login_cookie_cache
+from passenger_pool import passenger_pools
+from reference_data_cache import (
+    PORT_TIMEZONE_BY_IATA_CODE,
+    PORT_TIMEZONE_BY_PORT_ID,
+    SANDBOX_OBJECTS,
+    SANDBOX_PORT_TIMEZONE,
+    reference_data_cache,
+)
+from stormx_http import http_client
 
 from uuid import UUID
 
+# heavy or rarely used, imported on first use (see `lazy_import.py`).
+boto3 = lazy_import('boto3')
+faker = lazy_import('faker')
+pytz = lazy_import('pytz')
+data_utilities = lazy_import('StormxApp.tests.data_utilities')
+airline_api_client = lazy_import('stormx_api_client.airline_api_client')
+sandbox_api_client = lazy_import('stormx_api_client.sandbox_api_client')
+stormx_async_client = lazy_import('stormx_async_client')
+stormx_stand_in_server = lazy_import('stormx_stand_in_server')
+
 
 REGION_NAME = 'us-west-2'
 
@@ -159,6 +172,34 @@ def uses_expedia(func):
     return func
 
 
+def wait_until(predicate, timeout=120, initial_delay=1.0, backoff=1.5, max_delay=10.0, description='condition'):
+    """
+    poll `predicate` until it returns a truthy value, sleeping between attempts with exponential backoff.
+    use instead of a fixed `sleep()` when waiting on asynchronous StormX processing (queues, Roomstorm, etc.).
+
+    param predicate: callable with no arguments.
+    param timeout: float - seconds before giving up.
+    param initial_delay: float - seconds to sleep after the first unsuccessful attempt.
+    param backoff: float - multiplier applied to the delay after every unsuccessful attempt.
+    param max_delay: float - upper bound of the delay between two attempts.
+    param description: string - used in the failure message.
+    return: the first truthy value returned by `predicate`.
+    raises AssertionError if the predicate is still falsy after `timeout` seconds (fails the calling test).
+    """
+    deadline = time.time() + timeout
+    delay = initial_delay
+    while True:
+        result = predicate()
+        if result:
+            return result
+        remaining_time = deadline - time.time()
+        if remaining_time <= 0:
+            raise AssertionError('timed out after {0} seconds waiting for {1}.'.format(timeout, description))
+        if not http_client.is_replaying:  # replayed responses arrive in the recorded order, no need to wait.
+            time.sleep(min(delay, max_delay, remaining_time))
+        delay *= backoff
+
+
 def random_chunk(fake, li, min_chunk=1, max_chunk=3):
     """
     randomly chunk a list
@@ -215,6 +256,30 @@ def log_error_system_tests_output(json_resp):
         error_output.write(json_resp + '\n\n')
 
 
+_SANE_ENVIRONMENT_NAMES = set()  # environments that passed the sanity check in this process.
+
+SEED_INVENTORY_CONCURRENCY = 8  # parallel PHP calls of `seed_inventory()`.
+
+REFERENCE_MODEL_NAMES = ('PortMaster',)  # sandbox models whose lookups are served from `reference_data_cache`.
+
+
+def _enter_cassette_scope(scope):
+    """
+    when a cassette is in use (see `http_cassette.py`), record/replay the next HTTP calls under `scope`,
+    and seed the test data generators so the payloads generated while recording and replaying match
+    (with a new seed for every recording, see `HttpCassette.generator_seed()`).
+    when HTTP calls are traced (see `http_call_tracer.py`), attribute the next ones to `scope`.
+    param scope: string - test id, or '<test class id>.setUpClass'.
+    """
+    if http_client.tracer is not None:
+        http_client.tracer.set_scope(scope)
+    if http_client.cassette is None:
+        return
+    http_client.cassette.set_scope(scope)
+    seed = http_client.cassette.generator_seed(scope)
+    random.seed(seed)
+    faker.Faker.seed(seed)
+
 # TODO remove but should not be here but when in setUpClass the file does not save
 with open(ERROR_SYSTEM_TESTS_OUTPUT, 'w') as error_output:
     error_output.write('')
@@ -226,13 +291,55 @@ class StormxSystemVerification(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
+        _enter_cassette_scope(cls.__module__ + '.' + cls.__name__ + '.setUpClass')
+        cls._php_host = SUPPORTED_ENVIRONMENTS[cls.selected_environment_name]['php_host']
+        cls._api_host = SUPPORTED_ENVIRONMENTS[cls.selected_environment_name]['host']
+
+        # run a sanity check before diving into all of the tests (once per run) ----
+        is_first_class_of_environment = cls.selected_environment_name not in _SANE_ENVIRONMENT_NAMES
+        if is_first_class_of_environment:
+            cls._verify_environment_is_sane()
+            _SANE_ENVIRONMENT_NAMES.add(cls.selected_environment_name)
 
         # stormx php system test setup ----------------------------------------------------
-        cls._php_host = SUPPORTED_ENVIRONMENTS[cls.selected_environment_name]['php_host']
-        # run a sanity check before diving into all of the tests ----
+        cls._support_cookies = cls.login_to_stormx_cached()  # cookies for the stormx user 'support'
+
+        # stormx api system test setup ------------------------------------------------------
+        cls._passenger_faker = None  # see `_get_passenger_faker()`.
+        if SUPPORTED_ENVIRONMENTS[cls.selected_environment_name].get('stand_in'):
+            cls._sandbox_api_client = stormx_stand_in_server.StandInSandboxApiClient(cls._api_host)
+        else:
+            cls._sandbox_api_client = sandbox_api_client.SandboxApiClient(cls._api_host)
+
+        if is_first_class_of_environment:
+            cls.warm_up_reference_data()
+
+    def run(self, result=None):
+        _enter_cassette_scope(self.id())
+        if http_client.tracer is not None:
+            self.addCleanup(self._verify_http_call_budget)
+        try:
+            return super(StormxSystemVerification, self).run(result)
+        finally:
+            if http_client.cassette is not None:
+                http_client.cassette.save()
+
+    def _verify_http_call_budget(self):
+        """
+        fail the test if it exceeded the HTTP call count or latency budget (see `http_call_tracer.py`).
+        """
+        violation = http_client.tracer.budget_violation(self.id())
+        if violation:
+            self.fail(violation)
+
+    @classmethod
+    def _verify_environment_is_sane(cls):
+        """
+        simple PHP access to "/" and an API ping. raises an exception if the environment under test is not usable.
+        """
         url = cls._php_host + '/'
         headers = {}
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         if response.status_code != 200:
             display_response(response)
             raise Exception(
@@ -240,14 +347,10 @@ class StormxSystemVerification(unittest.TestCase):
                 'ERROR: Test environment is not sane! could not perform a simple PHP access to "/"' +
                 'response code & reason: <{0} - {1}>.'.format(response.status_code, response.reason)
             )
-        cls._support_cookies = cls.login_to_stormx()  # cookies for the stormx user 'support'
 
-        # stormx api system test setup ------------------------------------------------------
-        cls._api_host = SUPPORTED_ENVIRONMENTS[cls.selected_environment_name]['host']
-        # run a sanity check before diving into all of the tests ----
         url = cls._api_host + '/api/v1/ping'
         headers = cls._generate_airline_headers(customer='American Airlines')
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         if response.status_code != 200:
             display_response(response)
             raise Exception(
@@ -256,10 +359,6 @@ class StormxSystemVerification(unittest.TestCase):
                 'could not perform a simple API ping command for American Airlines. ' +
                 'response code & reason: <{0} - {1}>.'.format(response.status_code, response.reason)
             )
-        cls._passenger_faker = faker.Faker()
-
-        # stormx api system test setup ------------------------------------------------------
-        cls._sandbox_api_client = SandboxApiClient(cls._api_host)
 
     @classmethod
     def get_airline_api_client(cls, customer):
@@ -268,7 +367,20 @@ class StormxSystemVerification(unittest.TestCase):
         return AirlineApiClient
         """
         token = CUSTOMER_TOKENS[customer]
-        return AirlineApiClient(host=cls._api_host, customer_token=token)
+        return airline_api_client.AirlineApiClient(host=cls._api_host, customer_token=token)
+
+    @classmethod
+    def get_async_api_client(cls, concurrency=None):
+        """
+        concurrency - int, maximum number of requests in flight (None for `stormx_async_client.DEFAULT_CONCURRENCY`).
+        return AsyncStormxClient (remember to `close()` it)
+        """
+        if concurrency is None:
+            concurrency = stormx_async_client.DEFAULT_CONCURRENCY
+        return stormx_async_client.AsyncStormxClient(
+            api_host=cls._api_host, php_host=cls._php_host, airline_headers_factory=cls._generate_airline_headers,
+            passenger_headers=cls._generate_passenger_headers(), php_headers=cls._generate_stormx_php_headers(),
+            concurrency=concurrency)
 
     @classmethod
     def login_user_to_stormx(cls, username='support', password='test'):
@@ -298,7 +410,7 @@ class StormxSystemVerification(unittest.TestCase):
             'content-type': "application/x-www-form-urlencoded",
         }
 
-        return requests.post(url, data=form_data, headers=headers)
+        return http_client.post(url, data=form_data, headers=headers)
 
     @classmethod
     def login_to_stormx(cls, username='support', password='test', resetpassword='aTest!23', verbose_logging=False):
@@ -342,7 +454,7 @@ class StormxSystemVerification(unittest.TestCase):
                 'user-agent': "stormx_system_test",
                 'content-type': "application/x-www-form-urlencoded",
             }
-            response = requests.post(url, data=form_data, headers=headers)
+            response = http_client.post(url, data=form_data, headers=headers)
             if response.status_code == 200 and 'Please wait redirecting...' in response.text:
                 pass  # successful password reset
             else:
@@ -359,6 +471,22 @@ class StormxSystemVerification(unittest.TestCase):
         session_cookies = response.cookies
         return session_cookies
 
+    @classmethod
+    def login_to_stormx_cached(cls, username='support', password='test'):
+        """
+        same as `login_to_stormx()`, but reuses the session cookies of an earlier login of the same user
+        on the same environment (see `login_cookie_cache.py`).
+        only use for users whose login behavior is not under test.
+        param username: string
+        param password: string
+        :return: dict of cookies to pass to the `requests` library.
+        """
+        cookies = login_cookie_cache.get(cls.selected_environment_name, username)
+        if cookies is None:
+            cookies = cls.login_to_stormx(username, password).get_dict()
+            login_cookie_cache.set(cls.selected_environment_name, username, cookies)
+        return cookies
+
 
     @staticmethod
     def _generate_airline_headers(customer='American Airlines'):
@@ -438,21 +566,76 @@ class StormxSystemVerification(unittest.TestCase):
             'X-Stormx-User-ID': user_id
         }
 
+    @classmethod
+    def _get_reference_data(cls, category, key, loader):
+        return reference_data_cache.get(cls.selected_environment_name, category, key, loader)
+
+    @classmethod
+    def _get_sandbox_objects_cached(cls, method_name, model_name, *args, **kwargs):
+        """
+        call a `SandboxApiClient` lookup, through `reference_data_cache` for reference models.
+        """
+        lookup = functools.partial(getattr(cls._sandbox_api_client, method_name), model_name, *args, **kwargs)
+        if model_name not in REFERENCE_MODEL_NAMES:
+            return lookup()
+        key = (method_name, model_name, repr(args), repr(sorted(kwargs.items())))
+        return cls._get_reference_data(SANDBOX_OBJECTS, key, lookup)
+
     @classmethod
     def get_object(cls, model_name, fields=None, **filter):
-        return cls._sandbox_api_client.get_object(model_name, fields=fields, **filter)
+        return cls._get_sandbox_objects_cached('get_object', model_name, fields=fields, **filter)
 
     @classmethod
     def get_object_field(cls, model_name, field, **filter):
-        return cls._sandbox_api_client.get_object_field(model_name, field, **filter)
+        if model_name == 'PortMaster' and field == 'port_timezone' and list(filter) == ['port_prefix']:
+            return cls.get_cached_port_timezone(filter['port_prefix'])
+        return cls._get_sandbox_objects_cached('get_object_field', model_name, field, **filter)
 
     @classmethod
     def get_objects(cls, model_name, fields=None, limit=None, **filter):
-        return cls._sandbox_api_client.get_objects(model_name, fields=fields, limit=limit, **filter)
+        return cls._get_sandbox_objects_cached('get_objects', model_name, fields=fields, limit=limit, **filter)
+
+    @classmethod
+    def get_cached_port_timezone(cls, port_iata_code):
+        """
+        param port_iata_code: string like 'LAX'
+        return: string like 'America/Los_Angeles' (the `port_timezone` field of the port's PortMaster).
+        """
+        return cls._get_reference_data(
+            PORT_TIMEZONE_BY_IATA_CODE, port_iata_code,
+            lambda: cls._sandbox_api_client.get_object_field('PortMaster', 'port_timezone', port_prefix=port_iata_code))
 
     @classmethod
     def get_port_timezone_by_iata_code(cls, port_iata_code):
-        return cls._sandbox_api_client.get_port_timezone(port_iata_code)
+        return cls._get_reference_data(SANDBOX_PORT_TIMEZONE, port_iata_code,
+                                       lambda: cls._sandbox_api_client.get_port_timezone(port_iata_code))
+
+    @classmethod
+    def warm_up_reference_data(cls):
+        """
+        bulk load the timezone of every available port into `reference_data_cache` with a single sandbox call.
+        a failure is not fatal: the ports are then loaded one by one, on first use.
+        """
+        if reference_data_cache.is_loaded(cls.selected_environment_name, PORT_TIMEZONE_BY_IATA_CODE):
+            return
+        try:
+            ports = cls._sandbox_api_client.get_objects('PortMaster', fields=('port_prefix', 'port_timezone'),
+                                                        port_is_available=1, limit=10000)
+        except Exception as exception:
+            print('WARNING: could not warm up the reference data cache: ' + repr(exception))
+            return
+        reference_data_cache.set_many(cls.selected_environment_name, PORT_TIMEZONE_BY_IATA_CODE,
+                                      {port['port_prefix']: port['port_timezone'] for port in ports or []
+                                       if port.get('port_timezone')})
+
+    @classmethod
+    def invalidate_reference_data(cls, category=None, key=None):
+        """
+        forget cached reference data of the environment under test, e.g. after a test changed a port.
+        param category: string or None - a category of `reference_data_cache.py` (None for all of them).
+        param key: key within the category, or None for the whole category.
+        """
+        reference_data_cache.invalidate(cls.selected_environment_name, category, key)
 
     def get_hotel_availability(self, hotel_id, availability_date=None):
         """
@@ -478,7 +661,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=self._support_cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=self._support_cookies, params=query_parameters)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -547,9 +730,66 @@ class StormxSystemVerification(unittest.TestCase):
             'hotel_soft_block_id' : hotel_soft_block_id
         }
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         return response
 
+    def seed_inventory(self, plan, concurrency=SEED_INVENTORY_CONCURRENCY, resolve_block_ids=True):
+        """
+        add many hotel availability blocks at once, e.g.
+
+            block_ids = self.seed_inventory([
+                dict(hotel_id=97224, airline_id=261, availability_date=event_date, blocks=2, block_price='20.00', ap_block_type=1),
+                dict(hotel_id=97228, airline_id=261, availability_date=event_date, blocks=2, block_price='30.00', ap_block_type=1),
+            ])
+
+        blocks of different hotels/dates are added concurrently. blocks of the same hotel and date are added
+        one after the other, in plan order, because StormX uses blocks by ap_block_type, price, then creation order.
+
+        :param plan: list of dicts of `add_hotel_availability()` keyword arguments
+                     (hotel_id, airline_id and availability_date are required).
+                     entries without a comment get a unique one, used to find the created blocks.
+        :param concurrency: int - maximum number of PHP calls in flight.
+        :param resolve_block_ids: bool - look up the `hotel_availability_id` of the created blocks
+                                  (one `get_hotel_availability()` call per hotel and date).
+        :return: list of `hotel_availability_id`s in plan order, or None if `resolve_block_ids` is False.
+        """
+        entries = []
+        for entry in plan:
+            entry = dict(entry)
+            entry.setdefault('comment', 'seed_inventory ' + str(uuid.uuid4()))
+            entry.pop('verify_response_success', None)
+            entries.append(entry)
+
+        entry_indexes_by_hotel_date = OrderedDict()
+        for index, entry in enumerate(entries):
+            hotel_date = (str(entry['hotel_id']), str(entry['availability_date']))
+            entry_indexes_by_hotel_date.setdefault(hotel_date, []).append(index)
+
+        def add_blocks_of_hotel_date(entry_indexes):
+            return [(index, self.create_hotel_availability(**entries[index])) for index in entry_indexes]
+
+        # the pool threads' HTTP calls are traced as this test's (see `http_call_tracer.py`).
+        initializer = http_client.tracer.scope_initializer() if http_client.tracer is not None else None
+        with ThreadPoolExecutor(max_workers=concurrency, initializer=initializer) as executor:
+            responses = sorted(response for hotel_date_responses in
+                               executor.map(add_blocks_of_hotel_date, entry_indexes_by_hotel_date.values())
+                               for response in hotel_date_responses)
+            for index, response in responses:
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()['success'], '1',
+                                 'could not add availability ' + repr(entries[index]) + ': ' + response.text)
+
+            if not resolve_block_ids:
+                return None
+            hotel_dates = list(entry_indexes_by_hotel_date)
+            availabilities = dict(zip(hotel_dates, executor.map(
+                lambda hotel_date: self.get_hotel_availability(*hotel_date), hotel_dates)))
+
+        return [self.find_hotel_availability_block_by_comment(
+                    availabilities[(str(entry['hotel_id']), str(entry['availability_date']))],
+                    entry['comment'])['hotel_availability_id']
+                for entry in entries]
+
     def _load_queue_resource(self, testing_environment_queue_name):
         queue_info = SUPPORTED_ENVIRONMENTS[self.selected_environment_name][testing_environment_queue_name]
         if not queue_info:
@@ -732,7 +972,7 @@ class StormxSystemVerification(unittest.TestCase):
             'mode': 'saveCont',
         }
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         #print('response.text=', response.text)
         response_json = response.json()
         if verify_response_success:
@@ -799,7 +1039,7 @@ class StormxSystemVerification(unittest.TestCase):
             'mode': 'saveCont',
         }
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         # display_response(response)
         response_json = response.json()
         return response_json
@@ -880,7 +1120,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers = self._generate_stormx_php_headers()
         headers['X-TVA-Internal'] = '1'
 
-        response = requests.post(url, headers=headers, cookies=cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=form_data)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         return response_json
@@ -905,7 +1145,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers = self._generate_stormx_php_headers()
         headers['X-TVA-Internal'] = '1'
 
-        response = requests.post(url, headers=headers, cookies=cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=form_data)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         return response_json
@@ -938,7 +1178,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=cookies, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         return response_json
@@ -957,7 +1197,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers = self._generate_stormx_php_headers()
         headers['X-TVA-Internal'] = '1'
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=post_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=post_data)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         return response_json
@@ -971,7 +1211,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         # headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies)
         self.assertEqual(response.status_code, 200)
 
         return self._extract_embedded_app_vdata(response)['voucher']
@@ -985,7 +1225,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         # headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies)
         self.assertEqual(response.status_code, 200)
 
         return response.json()['result']
@@ -1007,7 +1247,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=cookies, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         #self.assertIsInstance(response_json, dict)
@@ -1027,7 +1267,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=cookies, params=query_parameters)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -1057,7 +1297,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=cookies, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         self.assertIsInstance(response_json, list)
@@ -1084,7 +1324,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=cookies, params=query_parameters)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -1147,7 +1387,7 @@ class StormxSystemVerification(unittest.TestCase):
 
 
         form_data = json.dumps(form_data, separators=(',', ':'))
-        response = requests.post(url, headers=headers, cookies=cookies, data={'data': form_data})
+        response = http_client.post(url, headers=headers, cookies=cookies, data={'data': form_data})
         response_json = response.json()
         if response_json and response_json.get('success') == True:
             self.assertEqual(response.status_code, 200)
@@ -1221,7 +1461,7 @@ class StormxSystemVerification(unittest.TestCase):
             url = self._php_host + '/admin/airline_detail.php?airlineId=' + str(record_id) + '&type=saveUsers'
         else:
             url = self._php_host + '/admin/hotel_detail.php?hotelId=' + str(record_id) + '&type=saveUsers'
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=user_form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=user_form_data)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -1241,12 +1481,12 @@ class StormxSystemVerification(unittest.TestCase):
         headers['Accept'] = 'application/json, text/plain, */*'
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
-        requests.post(url, headers=headers, cookies=cls._support_cookies, data=form_data)
+        http_client.post(url, headers=headers, cookies=cls._support_cookies, data=form_data)
         user_list = []
         url = cls._php_host + '/admin/airline_detail.php?airlineId=' + str(airline_id) + '&type=saveUsers'
         for i in range(11, 15):
             user_form_data = cls.get_create_user_post_data(port_id=port_id, role=i,is_invalid=False)
-            response = requests.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
+            response = http_client.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
             if response.status_code== 200 and "There is an error while saving user." not in response.text:
                 response_json = response.json()
                 user_id = response_json['id']
@@ -1259,7 +1499,7 @@ class StormxSystemVerification(unittest.TestCase):
                     user_form_data['delete'] = True
                     user_form_data['access'] = 10
                     user_form_data['updated_by_user'] = 'support'
-                    response = requests.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
+                    response = http_client.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
                     if response.status_code == 200:
                         try:
                             user_list.append({'username': user_form_data.get('user_id'),'role_id': i,
@@ -1285,7 +1525,7 @@ class StormxSystemVerification(unittest.TestCase):
 
         url = cls._php_host + '/admin/hotel_detail.php?hotelId=' + str(hotel_id) + '&type=saveUsers'
 
-        response = requests.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
+        response = http_client.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
         return True if response.status_code is 200 else False
 
     @classmethod
@@ -1311,7 +1551,7 @@ class StormxSystemVerification(unittest.TestCase):
             'newUserP': password,
             'newUserPCnf': password,
         }
-        response = requests.post(url, headers=cls._generate_stormx_php_headers(), cookies=cls._support_cookies,
+        response = http_client.post(url, headers=cls._generate_stormx_php_headers(), cookies=cls._support_cookies,
                                  data=user_data)
         response_data = response.json()
         user_data['user_id'] = response_data['data']['id']
@@ -1324,7 +1564,7 @@ class StormxSystemVerification(unittest.TestCase):
         data = {
             'user_id': user_id,
         }
-        requests.post(url, headers=cls._generate_stormx_php_headers(), cookies=cls._support_cookies,
+        http_client.post(url, headers=cls._generate_stormx_php_headers(), cookies=cls._support_cookies,
                                  data=data)
 
     def logout(self,redirect = "&continue=admin/quick-room-transfer.php"):
@@ -1336,8 +1576,9 @@ class StormxSystemVerification(unittest.TestCase):
         headers['Accept'] = 'application/json, text/plain, */*'
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
-        response = requests.get(url, headers=headers, cookies=self._support_cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=self._support_cookies, params=query_parameters)
         self.assertEqual(response.status_code, 200)
+        login_cookie_cache.invalidate(self.selected_environment_name, 'support')
 
     def _get_event_date(self, time_zone_region=None, port_iata_code=None):
         """
@@ -1349,9 +1590,9 @@ class StormxSystemVerification(unittest.TestCase):
         if not time_zone_region:
             if not port_iata_code:
                 raise Exception('must provide time_zone_region or port!')
-            time_zone_region = self.get_object_field('PortMaster', 'port_timezone', port_prefix=port_iata_code)
+            time_zone_region = self.get_cached_port_timezone(port_iata_code)
 
-        tz = timezone(time_zone_region)
+        tz = pytz.timezone(time_zone_region)
         tz_now = datetime.datetime.now(tz)
 
         if tz_now.hour < 5:  # force inventory for previous day
@@ -1367,7 +1608,7 @@ class StormxSystemVerification(unittest.TestCase):
         :param time_zone_region: str, example: America/Los_Angeles
         :return: datetime
         """
-        tz = timezone(time_zone_region)
+        tz = pytz.timezone(time_zone_region)
         tz_now = datetime.datetime.now(tz)
 
         if tz_now.hour < 5:  # force inventory for previous day
@@ -1385,7 +1626,7 @@ class StormxSystemVerification(unittest.TestCase):
         event_date: datetime
         return: date time
         """
-        tz = timezone(time_zone_region)
+        tz = pytz.timezone(time_zone_region)
         tz_now = datetime.datetime.now(tz)
 
         if tz_now.hour < 5:  # set datetime to 23:45 of previous day
@@ -1401,7 +1642,7 @@ class StormxSystemVerification(unittest.TestCase):
         param time_zone_region: string
         return: date
         """
-        tz = timezone(time_zone_region)
+        tz = pytz.timezone(time_zone_region)
         tz_now = datetime.datetime.now(tz)
 
         return tz_now.hour < 5
@@ -1413,17 +1654,24 @@ class StormxSystemVerification(unittest.TestCase):
         param time_zone_region: string
         return: date
         """
-        tz = timezone(time_zone_region)
+        tz = pytz.timezone(time_zone_region)
         tz_now = datetime.datetime.now(tz)
         return tz_now
 
-    def flush_stormx_internal_queue_now(self):
+    def flush_stormx_internal_queue_now(self, wait_for=None, timeout=120):
+        """
+        param wait_for: None or callable with no arguments - if provided, the method only returns once
+                        `wait_for()` returns a truthy value (see `wait_until`).
+        param timeout: float - seconds to wait for `wait_for`.
+        return: None, or the truthy value returned by `wait_for`.
+        """
         # NOTE: this method could still prove unreliable if another process
         #       has already grabbed the messages and they are still pending processing.
+        #       pass `wait_for` to verify the outcome of the processing instead of hoping for it.
 
         url = self._api_host + '/api/v1/tvl/control/flush-internal-queue'
         stormx_headers = self._generate_tvl_stormx_headers()
-        response = requests.post(url, headers=stormx_headers)
+        response = http_client.post(url, headers=stormx_headers)
         if response.status_code != 200:
             display_response(response)
             raise Exception('unexpected response when flushing queue: ' + str(response.status_code))
@@ -1431,6 +1679,71 @@ class StormxSystemVerification(unittest.TestCase):
         if response.json()['error']:
             raise Exception('failed to flush internal queue. giving up on continuing test.')
 
+        if wait_for is not None:
+            return wait_until(wait_for, timeout=timeout, description='internal queue processing')
+
+    def get_passenger_full_state(self, customer, context_id):
+        """
+        param customer: string
+        param context_id: string
+        return: dict - the data portion of `GET /api/v1/passenger/{context_id}/state`.
+        """
+        url = self._api_host + '/api/v1/passenger/' + context_id + '/state'
+        headers = self._generate_airline_headers(customer=customer)
+        response = http_client.get(url, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def wait_for_passenger_full_state(self, customer, context_id, predicate, timeout=240):
+        """
+        poll the passenger full state until `predicate(full_state)` is truthy.
+        param customer: string
+        param context_id: string
+        param predicate: callable receiving the data portion of the full state.
+        param timeout: float - seconds
+        return: dict - the first full state that satisfied `predicate`.
+        """
+        def probe():
+            full_state = self.get_passenger_full_state(customer, context_id)
+            return full_state if predicate(full_state) else None
+
+        return wait_until(probe, timeout=timeout,
+                          description='passenger full state of context_id ' + repr(context_id))
+
+    def wait_for_voucher_state(self, customer, voucher_id, predicate, timeout=120):
+        """
+        poll `GET /api/v1/voucher/{voucher_id}` until `predicate(voucher)` is truthy.
+        param customer: string
+        param voucher_id: string
+        param predicate: callable receiving the data portion of the voucher response.
+        param timeout: float - seconds
+        return: dict - the first voucher that satisfied `predicate`.
+        """
+        url = self._api_host + '/api/v1/voucher/' + voucher_id
+        headers = self._generate_airline_headers(customer=customer)
+
+        def probe():
+            response = http_client.get(url, headers=headers)
+            self.assertEqual(response.status_code, 200)
+            voucher = response.json()['data']
+            return voucher if predicate(voucher) else None
+
+        return wait_until(probe, timeout=timeout, description='voucher ' + repr(voucher_id))
+
+    def wait_for_transaction_status(self, transaction_id, predicate, timeout=120):
+        """
+        poll the card transaction history (PHP reconciliation helper) until `predicate(transaction_history)` is truthy.
+        param transaction_id: int
+        param predicate: callable receiving the transaction history dictionary.
+        param timeout: float - seconds
+        return: dict - the first transaction history that satisfied `predicate`.
+        """
+        def probe():
+            transaction_history = self.get_transaction_history(transaction_id)
+            return transaction_history if predicate(transaction_history) else None
+
+        return wait_until(probe, timeout=timeout, description='transaction ' + repr(transaction_id))
+
     def add_edit_amenity(self, amenity_name="", amenity_id="0", is_available="0", operating_hours_allowed = "1",
                         fee_allowed = "1", show_icon_on_hotel_listing="0", icon=""):
         """
@@ -1460,7 +1773,7 @@ class StormxSystemVerification(unittest.TestCase):
         ]
         amenities = json.dumps(amenities, separators=(',', ':'))
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies,
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies,
                                  data={'amenities': amenities})
         response = response.json()
         return response
@@ -1503,7 +1816,7 @@ class StormxSystemVerification(unittest.TestCase):
 
         hotel_amenities = json.dumps(hotel_amenities, separators=(',', ':'))
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies,
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies,
                                  data={'amenities': hotel_amenities})
         self.assertEqual(response.status_code, 200)
         response = response.json()
@@ -1523,7 +1836,7 @@ class StormxSystemVerification(unittest.TestCase):
 
         hotel_amenities = json.dumps(hotel_amenities, separators=(',', ':'))
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies,
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies,
                                  data={'amenities': hotel_amenities})
         self.assertEqual(response.status_code, 200)
         response = response.json()
@@ -1540,7 +1853,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=self._support_cookies)
+        response = http_client.get(url, headers=headers, cookies=self._support_cookies)
         response = response.json()
         return response
 
@@ -1559,7 +1872,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['Accept'] = 'application/json, text/plain, */*'
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
-        response = requests.post(url, headers=headers, cookies=cookies, data=hotel_post_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=hotel_post_data)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -1590,7 +1903,7 @@ class StormxSystemVerification(unittest.TestCase):
             'ranking': ranking,
         }
 
-        response = requests.post(url, headers=headers,
+        response = http_client.post(url, headers=headers,
                                  cookies=cookies, data=form_data)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
@@ -1622,7 +1935,7 @@ class StormxSystemVerification(unittest.TestCase):
             'ranking': ranking,
         }
 
-        response = requests.post(url, headers=headers,
+        response = http_client.post(url, headers=headers,
                                  cookies=cookies, data=form_data)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
@@ -1649,7 +1962,7 @@ class StormxSystemVerification(unittest.TestCase):
             'remove': 1,
         }
 
-        response = requests.post(url, headers=headers,
+        response = http_client.post(url, headers=headers,
                                  cookies=cookies, data=form_data)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
@@ -1674,7 +1987,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers = self._generate_stormx_php_headers()
         headers['X-TVA-Internal'] = '1'
         form_data = json.dumps(form_data, separators=(',', ':'))
-        response = requests.post(url, headers=headers, cookies=cookies, data={'data': form_data})
+        response = http_client.post(url, headers=headers, cookies=cookies, data={'data': form_data})
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
         return response_json
@@ -1774,7 +2087,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=self._support_cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=self._support_cookies, params=query_parameters)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -1799,7 +2112,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['Accept'] = 'application/json, text/plain, */*'
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
-        response = requests.get(url, headers=headers, cookies=cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=cookies, params=query_parameters)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -1822,7 +2135,7 @@ class StormxSystemVerification(unittest.TestCase):
             'expedia_rapid_id': expedia_rapid_id
         }
 
-        response = requests.post(url, headers=headers, cookies=cookies, data=post_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=post_data)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
         return response_json
@@ -1863,7 +2176,7 @@ class StormxSystemVerification(unittest.TestCase):
             headers['Accept'] = 'application/json, text/plain, */*'
             headers['X-TVA-Internal'] = '1'
             headers['Accept-Language'] = 'en-US,en;q=0.9'
-            requests.post(add_serviced_port_url, headers=headers, cookies=cls._support_cookies, data=form_data)
+            http_client.post(add_serviced_port_url, headers=headers, cookies=cls._support_cookies, data=form_data)
             for user in cls.create_and_login_users_with_different_roles(port_id, id, add_user_url, roles, type, headers):
                 user_list.append(user)
 
@@ -1884,7 +2197,7 @@ class StormxSystemVerification(unittest.TestCase):
         fake = faker.Faker()
         for i in roles:
             user_form_data = cls.get_create_user_post_data(port_id=port_id, role=i,is_invalid=False)
-            response = requests.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
+            response = http_client.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
             if response.status_code== 200 and "There is an error while saving user." not in response.text:
                 response_json = response.json()
                 user_id = response_json['id']
@@ -1902,7 +2215,7 @@ class StormxSystemVerification(unittest.TestCase):
                     user_form_data['delete'] = True
                     user_form_data['access'] = 10
                     user_form_data['updated_by_user'] = 'support'
-                    response = requests.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
+                    response = http_client.post(url, headers=headers, cookies=cls._support_cookies, data=user_form_data)
                     if response.status_code == 200:
                         try:
                             user_list.append({'username': user_form_data.get('user_id'),'role_id': i, 'user_type': type,
@@ -1932,7 +2245,7 @@ class StormxSystemVerification(unittest.TestCase):
             'message': message
         }
 
-        response = requests.post(url, headers=headers, cookies=cookies, data=post_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=post_data)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
         return response_json
@@ -1958,7 +2271,7 @@ class StormxSystemVerification(unittest.TestCase):
             'isRead': isRead
         }
 
-        response = requests.post(url, headers=headers, cookies=cookies, data=post_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=post_data)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
         return response_json
@@ -1984,7 +2297,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.get(url, headers=headers, cookies=cookies, params=query_parameters)
+        response = http_client.get(url, headers=headers, cookies=cookies, params=query_parameters)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -1992,10 +2305,10 @@ class StormxSystemVerification(unittest.TestCase):
     @staticmethod
     def _generate_n_passenger_payload(number_of_passengers, **kwargs):
         passengers = [copy.deepcopy(PASSENGER_TEMPLATE[0]) for i in range(0, number_of_passengers)]
-        pax_record_locator = generate_pax_record_locator()
-        pax_record_locator_group = generate_pax_record_locator_group()
+        pax_record_locator = data_utilities.generate_pax_record_locator()
+        pax_record_locator_group = data_utilities.generate_pax_record_locator_group()
         for passenger in passengers:
-            passenger['context_id'] = generate_context_id()
+            passenger['context_id'] = data_utilities.generate_context_id()
             passenger['pax_record_locator'] = pax_record_locator
             passenger['pax_record_locator_group'] = pax_record_locator_group
             passenger.update(kwargs)
@@ -2004,89 +2317,62 @@ class StormxSystemVerification(unittest.TestCase):
     @staticmethod
     def _generate_2_passenger_payload(**kwargs):
         passengers = copy.deepcopy(PASSENGER_TEMPLATE)
-        pax_record_locator = generate_pax_record_locator()
-        pax_record_locator_group = generate_pax_record_locator_group()
+        pax_record_locator = data_utilities.generate_pax_record_locator()
+        pax_record_locator_group = data_utilities.generate_pax_record_locator_group()
         for passenger in passengers:
-            passenger['context_id'] = generate_context_id()
+            passenger['context_id'] = data_utilities.generate_context_id()
             passenger['pax_record_locator'] = pax_record_locator
             passenger['pax_record_locator_group'] = pax_record_locator_group
             passenger.update(kwargs)
         return passengers
 
-    def _generate_bulk_passenger_payload(self, size=MOST_PASSENGERS_IN_LARGEST_AIRCRAFT):
-        fake = self._passenger_faker
-        # def generate_distinct_random_indexes(fake, list_size, ratio_to_pick):
-        #     picked = set()
-        #     number_to_pick = int(list_size*ratio_to_pick)
-        #     list_size_minus_one = list_size - 1
-        #
-        #     # use `max_tries` to make sure the function will never get stuck in an infinite loop if unlucky.
-        #     max_tries = int(number_to_pick * 2.1)
-        #
-        #     while (max_tries > 0) and len(picked) < number_to_pick:
-        #         picked.add(fake.random.randint(0, list_size_minus_one))
-        #         max_tries -= 1
-        #     return picked
-        passengers = [self._generate_passenger_incomplete() for i in range(0, size)]
-        one_percent = int(0.01*size)
-        five_percent = int(0.05*size)
-        eighty_percent = int(0.80*size)
-        ninty_percent = int(0.90*size)
-        adults = passengers[0:eighty_percent]
-        young_adults = passengers[eighty_percent:ninty_percent]
-        children = passengers[ninty_percent:]
-
-        # group all passengers in `groups`
-        big_group = adults[0:five_percent]
-        small_groups = list(random_chunk(fake, adults[five_percent:], min_chunk=1, max_chunk=3))
-        groups =  [big_group] + small_groups
-        # assign young adults and children to groups of adults, and set their stage of life.
-        for passenger in young_adults:
-            passenger['life_stage'] = 'young_adult'
-            fake.random.choice(groups).append(passenger)
-        for passenger in children:
-            passenger['life_stage'] = 'child'
-            # remove/blank out fields children are not likely to have
-
-            fake.random.choice(groups).append(passenger)
-
-        # make roughly one percent of the passengers handicapped.
-        for i in range(0, one_percent):
-            fake.random.choice(passengers)['handicap'] = True
-
-        # add one service pet.
-        fake.random.choice(passengers)['service_pet'] = True
-
-        # make a few of the groups families with the same last name and address
-        for i in range(0, len(small_groups)//5):
-            group = fake.random.choice(small_groups)
-            primary_passenger = group[0]
-            for passenger in group[1:]:
-                passenger['last_name'] = primary_passenger['last_name']
-
-        flat_passengers = []
-        for group in groups:
-            pax_record_locator = generate_pax_record_locator()
-            pax_record_locator_group = generate_pax_record_locator_group()
-            for passenger in group:
-                passenger['context_id'] = generate_context_id()
-                passenger['pax_record_locator'] = pax_record_locator
-                passenger['pax_record_locator_group'] = pax_record_locator_group
-                flat_passengers.append(passenger)
-
-        # split out half of the passengers in `big_group` to be under a different pax_record_locator_group, but
-        # still the same pax_record_locator
-        different_pax_record_locator_group = generate_pax_record_locator_group()
-        for passenger in big_group[0:len(big_group)//2]:
-            passenger['pax_record_locator_group'] = different_pax_record_locator_group
-
-        return flat_passengers
+    @classmethod
+    def _get_passenger_faker(cls):
+        """
+        :return: faker.Faker, created once per test class on first use (importing faker is slow).
+        """
+        if cls.__dict__.get('_passenger_faker') is None:
+            cls._passenger_faker = faker.Faker()
+        return cls._passenger_faker
+
+    def _get_bulk_passenger_generator(self):
+        """
+        :return: BulkPassengerGenerator, created once per test class (its name/email pools come from faker).
+        """
+        cls = type(self)
+        if cls.__dict__.get('_bulk_passenger_generator') is None:
+            cls._bulk_passenger_generator = BulkPassengerGenerator(
+                PASSENGER_TEMPLATE[0], fake=self._get_passenger_faker(),
+                generate_context_id=data_utilities.generate_context_id,
+                generate_pax_record_locator=data_utilities.generate_pax_record_locator,
+                generate_pax_record_locator_group=data_utilities.generate_pax_record_locator_group)
+        return cls._bulk_passenger_generator
+
+    def _generate_bulk_passenger_payload(self, size=None):
+        """
+        generate a semi-realistic passenger load (groups, families, life stages, handicaps, a service pet).
+        see `bulk_passenger_generator.py`.
+        :param size: int - number of passengers (None for `MOST_PASSENGERS_IN_LARGEST_AIRCRAFT`).
+        :return: list of passenger dicts
+        """
+        if size is None:
+            size = data_utilities.MOST_PASSENGERS_IN_LARGEST_AIRCRAFT
+        return list(self._get_bulk_passenger_generator().generate(size))
+
+    def _generate_bulk_passenger_batches(self, size, batch_size):
+        """
+        stream a large passenger load (10k to 1M+ passengers) in import sized batches.
+        :param size: int - total number of passengers.
+        :param batch_size: int - passengers per batch.
+        :return: generator of lists of passenger dicts
+        """
+        return self._get_bulk_passenger_generator().generate_batches(size, batch_size)
 
     def _generate_passenger_incomplete(self):
         """
         generate a reasonable, semi-realistic set of data about a passenger.
         """
-        fake = self._passenger_faker
+        fake = self._get_passenger_faker()
         passenger = copy.deepcopy(PASSENGER_TEMPLATE[0])
         passenger.update({
             'first_name': fake.first_name(),
@@ -2110,6 +2396,25 @@ class StormxSystemVerification(unittest.TestCase):
 
         return airline_client.import_passengers(passengers)
 
+    def _lease_2_passengers(self, customer, **kwargs):
+        """
+        like `_create_2_passengers()`, but the passengers are taken from a pool of passengers imported ahead of
+        time, in batches (see `passenger_pool.py`). each leased pair is handed out only once.
+        use it when a test only needs valid passengers, not when it verifies the import itself or what happens
+        at import time (e.g. notifications).
+        :param: kwargs - keys to set in every passenger (passengers with different keys come from different pools).
+        :return: list of dictionaries of the created customers
+        """
+        if not passenger_pools.enabled or http_client.cassette is not None:
+            return self._create_2_passengers(customer, **kwargs)
+
+        cls = type(self)
+        pool = passenger_pools.get(
+            cls.selected_environment_name, customer, kwargs,
+            import_passengers=lambda passengers: cls.get_airline_api_client(customer).import_passengers(passengers),
+            generate_group=lambda: cls._generate_2_passenger_payload(**kwargs))
+        return pool.lease()
+
     def _get_passenger_hotel_offerings(self, passenger_dictionary, room_count=1):
         """
         utility to look up a passenger's hotel offerings.
@@ -2125,7 +2430,7 @@ class StormxSystemVerification(unittest.TestCase):
             ak2=passenger_dictionary['ak2'],
             room_count=room_count_string,
         )
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         returned_hotels = response.json()['data']
 
@@ -2146,7 +2451,7 @@ class StormxSystemVerification(unittest.TestCase):
             room_count=str(int(room_count)),
         )
 
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         hotels = response_json['data']
@@ -2169,7 +2474,7 @@ class StormxSystemVerification(unittest.TestCase):
             hotel_id=hotel_dictionary['hotel_id'],
             room_count=room_count,
         )
-        response = requests.post(url, headers=headers, params=booking_query_parameters, json=booking_payload)
+        response = http_client.post(url, headers=headers, params=booking_query_parameters, json=booking_payload)
         if (response.status_code != 200):
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -2202,7 +2507,7 @@ class StormxSystemVerification(unittest.TestCase):
             ak2 = passenger_dictionary['ak2']
         )
 
-        response = requests.put(decline_url, headers=passenger_headers, params=query_parameters)
+        response = http_client.put(decline_url, headers=passenger_headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         return response_json['data']
@@ -2289,17 +2594,23 @@ class StormxSystemVerification(unittest.TestCase):
             sic_mcc_code=sic_mcc_code,
             note=note,
         )
-        response = requests.post(url, headers=headers, data=json_payload)
+        response = http_client.post(url, headers=headers, data=json_payload)
         response.raise_for_status()
         return response.json()
 
     def get_port_timezone(self, port_id, cookies=None):
         """
         :param port_id: int
+        :param cookies: session of the user asking, e.g. to test its access to the port (never cached).
+                        default: the support user's session, whose answers are cached.
         :return: json
         """
-        if cookies is None:
-            cookies = self._support_cookies
+        if cookies is not None:
+            return self._load_port_timezone(port_id, cookies)
+        return self._get_reference_data(PORT_TIMEZONE_BY_PORT_ID, int(port_id),
+                                        lambda: self._load_port_timezone(port_id, self._support_cookies))
+
+    def _load_port_timezone(self, port_id, cookies):
         url = self._php_host + '/admin/port_detail.php?type=get_port_timezone'
         headers = self._generate_stormx_php_headers()
         headers['X-TVA-Internal'] = '1'
@@ -2308,7 +2619,7 @@ class StormxSystemVerification(unittest.TestCase):
             'port_id':port_id
         }
 
-        response = requests.post(url, headers=headers, cookies=cookies, data=post_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=post_data)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
 
@@ -2337,7 +2648,7 @@ class StormxSystemVerification(unittest.TestCase):
             'now':now,
             'pid':port_id
         }
-        response = requests.post(url, headers=headers, cookies=cookies, data=post_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=post_data)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
         return response_json
@@ -2366,7 +2677,7 @@ class StormxSystemVerification(unittest.TestCase):
         else:
             cookie = self.login_to_stormx(username=test_user['username'], password=test_user['newUserP'])
 
-        response = requests.post(url, headers=headers, cookies=cookie, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=cookie, data=form_data)
         response_json = response.json()
         return response_json
 
@@ -2394,7 +2705,7 @@ class StormxSystemVerification(unittest.TestCase):
             'page_number': str(page_number),
             'recon_for': recon_for,
         }
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data= form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data= form_data)
         response_json = response.json()
         return response_json
 
@@ -2410,7 +2721,7 @@ class StormxSystemVerification(unittest.TestCase):
         form_data = {
             'aid': airline_id,
         }
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         response_json = response.json()
         return response_json
 
@@ -2432,7 +2743,7 @@ class StormxSystemVerification(unittest.TestCase):
             form_data = {'idList[' + str(i) + ']': transactions_ids[i] for i in range(len(transactions_ids))}
             form_data['idStatus']= status
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data= form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data= form_data)
         response_json = response.json()
         return response_json
 
@@ -2449,7 +2760,7 @@ class StormxSystemVerification(unittest.TestCase):
             'transaction_id': transaction_id,
         }
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         response_json = response.json()
         return response_json
 
@@ -2472,7 +2783,7 @@ class StormxSystemVerification(unittest.TestCase):
             'airline_prefix': airline_prfix,
         }
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         response_json = response.json()
         return response_json
 
@@ -2495,7 +2806,7 @@ class StormxSystemVerification(unittest.TestCase):
             'page_number': str(page_number),
             'recon_for': recon_for,
         }
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data= form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data= form_data)
         response_json = response.json()
         return response_json
 
@@ -2511,7 +2822,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies)
         response_json = response.json()
         return response_json
 
@@ -2529,7 +2840,7 @@ class StormxSystemVerification(unittest.TestCase):
             'currency': str(rate_cap_currency),
             'id': rate_cap_id,
         }
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         response_json = response.json()
         return response_json
 
@@ -2545,7 +2856,7 @@ class StormxSystemVerification(unittest.TestCase):
         form_data = {
             'id': str(rate_cap_id),
         }
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         response_json = response.json()
         return response_json
 
@@ -2558,7 +2869,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=None)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=None)
         response_json = response.json()
         return response_json
 
@@ -2577,7 +2888,7 @@ class StormxSystemVerification(unittest.TestCase):
         headers['Accept'] = 'application/json, text/plain, */*'
         headers['X-TVA-Internal'] = '1'
         headers['Accept-Language'] = 'en-US,en;q=0.9'
-        response = requests.post(url, headers=headers, cookies=cookies, data=contact_post_data)
+        response = http_client.post(url, headers=headers, cookies=cookies, data=contact_post_data)
 
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -2673,7 +2984,7 @@ class StormxSystemVerification(unittest.TestCase):
             'consume_blocks' : consume_blocks
         }
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         return response
 
     def update_hotel_availability(self, hotel_id, hotel_availability_id, airline_id, availability_date,
@@ -2710,7 +3021,7 @@ class StormxSystemVerification(unittest.TestCase):
             'action_type':'edit'
         }
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         return response
 
     def save_transport_only_voucher(self, voucher_id, airline_id, transport, airport_id, voucher_date,
@@ -2760,7 +3071,7 @@ class StormxSystemVerification(unittest.TestCase):
             'mode': mode,
         }
 
-        response = requests.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
+        response = http_client.post(url, headers=headers, cookies=self._support_cookies, data=form_data)
         response_json = response.json()
         if verify_response_success:
             if not (response.status_code == 200 and response_json.get('success') == '1'):
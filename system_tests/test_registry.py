@@ -0,0 +1,96 @@
+"""
+Lazy registry of the system test classes.
+
+The `verify_*.py` modules are scanned for `StormxSystemVerification` subclasses as text, without
+importing them, and a module is only imported once one of its classes is selected: running
+`./run_system_tests.py staging TestApiPing` imports `verify_api_ping.py` and nothing else.
+
+Test names can be given as 'TestApiPing', 'TestApiPing.test_ping' or the importable
+'verify_api_ping.TestApiPing.test_ping'.
+
+The environment is bound once, with `bind_environment()`, on `StormxSystemVerification`, which
+every test class inherits `selected_environment_name` from.
+"""
+from collections import OrderedDict
+import glob
+import importlib
+import os
+import re
+import unittest
+
+TEST_MODULE_PATTERN = 'verify_*.py'
+_TEST_CLASS_DEFINITION = re.compile(r'^class\s+(\w+)\(\s*StormxSystemVerification\s*\)', re.MULTILINE)
+
+
+def bind_environment(environment_name):
+    """
+    :param environment_name: string - a `SUPPORTED_ENVIRONMENTS` key, used by every test class.
+    """
+    from stormx_verification_framework import StormxSystemVerification
+    StormxSystemVerification.selected_environment_name = environment_name
+
+
+class TestRegistry(object):
+
+    def __init__(self, directory=os.path.dirname(os.path.abspath(__file__))):
+        """
+        :param directory: string - directory of the `verify_*.py` modules.
+        """
+        self.directory = directory
+        self._module_names_by_class_name = None
+
+    def _scan(self):
+        if self._module_names_by_class_name is None:
+            module_names_by_class_name = {}
+            for file_path in glob.glob(os.path.join(self.directory, TEST_MODULE_PATTERN)):
+                with open(file_path) as module_file:
+                    source = module_file.read()
+                module_name = os.path.splitext(os.path.basename(file_path))[0]
+                for class_name in _TEST_CLASS_DEFINITION.findall(source):
+                    module_names_by_class_name[class_name] = module_name
+            self._module_names_by_class_name = OrderedDict(sorted(module_names_by_class_name.items()))
+        return self._module_names_by_class_name
+
+    def class_names(self):
+        """
+        :return: list(string) - every test class name, sorted.
+        """
+        return list(self._scan())
+
+    def module_name(self, class_name):
+        """
+        :return: string - name of the module defining `class_name`.
+        """
+        try:
+            return self._scan()[class_name]
+        except KeyError:
+            raise ValueError('unknown test class {0!r}, expected one of {1}.'.format(
+                class_name, ', '.join(self.class_names())))
+
+    def load_class(self, class_name):
+        """
+        :return: the test class, importing its module.
+        """
+        return getattr(importlib.import_module(self.module_name(class_name)), class_name)
+
+    def qualified_name(self, name):
+        """
+        :param name: string like 'TestApiPing', 'TestApiPing.test_ping' or 'verify_api_ping.TestApiPing'.
+        :return: string - importable name like 'verify_api_ping.TestApiPing.test_ping'.
+        """
+        class_name = name.split('.', 1)[0]
+        if class_name in self._scan():
+            return self.module_name(class_name) + '.' + name
+        return name
+
+    def load_tests(self, names=None, loader=unittest.defaultTestLoader):
+        """
+        :param names: iterable of test names (see `qualified_name()`), or None for every test class.
+        :return: unittest.TestSuite - only the modules of the selected tests are imported.
+        """
+        if names is None:
+            names = self.class_names()
+        return loader.loadTestsFromNames([self.qualified_name(name) for name in names])
+
+
+test_registry = TestRegistry()
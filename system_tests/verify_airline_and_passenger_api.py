@@ -1,5 +1,5 @@
 
-import requests
+from stormx_http import http_client
 
 from uuid import UUID
 
@@ -18,7 +18,6 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
     """
     Verify StormX Airline API and StormX Passenger API functionality.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -51,12 +50,12 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
         pnr_url = self._api_host + '/api/v1/tvl/airline/' + airline_id + '/pnr'
         hotel_url = self._api_host + '/api/v1/tvl/airline/' + airline_id + '/hotels'
 
-        resp = requests.get(url=passenger_url, headers=stormx_headers_bad)
+        resp = http_client.get(url=passenger_url, headers=stormx_headers_bad)
         self.assertEqual(resp.status_code, 403)
         resp_json = resp.json()
         self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
 
-        resp = requests.get(url=passenger_url, headers=stormx_headers)
+        resp = http_client.get(url=passenger_url, headers=stormx_headers)
 
         resp_json = resp.json()
         self.assertEqual(resp_json, {
@@ -74,12 +73,12 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
         })
         self.assertEqual(resp.status_code, 404)
 
-        resp = requests.get(url=pnr_url, headers=stormx_headers_bad)
+        resp = http_client.get(url=pnr_url, headers=stormx_headers_bad)
         self.assertEqual(resp.status_code, 403)
         resp_json = resp.json()
         self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
 
-        resp = requests.get(url=pnr_url, headers=stormx_headers)
+        resp = http_client.get(url=pnr_url, headers=stormx_headers)
         resp_json = resp.json()
         self.assertEqual(resp_json, {
             "data": None,
@@ -96,12 +95,12 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
         })
         self.assertEqual(resp.status_code, 404)
 
-        resp = requests.get(url=hotel_url, headers=stormx_headers_bad)
+        resp = http_client.get(url=hotel_url, headers=stormx_headers_bad)
         self.assertEqual(resp.status_code, 403)
         resp_json = resp.json()
         self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
 
-        resp = requests.post(url=hotel_url, headers=stormx_headers)
+        resp = http_client.post(url=hotel_url, headers=stormx_headers)
 
         resp_json = resp.json()
         # sort 'error_detail' to make comparison deterministic.
@@ -148,7 +147,7 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
             ('LGW', 'Europe/London')
         ])
 
-        hotel_resp = requests.get(url=hotel_url + '?room_count=1&port='+ port +'&provider=ean', headers=headers)
+        hotel_resp = http_client.get(url=hotel_url + '?room_count=1&port='+ port +'&provider=ean', headers=headers)
         self.assertEqual(hotel_resp.status_code, 200)
         hotel_json = hotel_resp.json()['data']
         self.assertGreater(len(hotel_json), 0, msg='no expedia hotels in ' + repr(port))
@@ -166,7 +165,7 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
             hotel_id=hotel_json[0]['hotel_id']
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()['data']
         UUID(book_resp_json['voucher_id'], version=4)
@@ -185,17 +184,18 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
 
         # add inventory
         event_date = self._get_event_date('America/New_York')
-        self.add_hotel_availability(97224, 261, event_date, ap_block_type=1, block_price='20.00', blocks=2, pay_type='0')
-        self.add_hotel_availability(97228, 261, event_date, ap_block_type=1, block_price='30.00', blocks=2, pay_type='0')
-        self.add_hotel_availability(85440, 261, event_date, ap_block_type=1, block_price='35.00', blocks=2, pay_type='0')
-        self.add_hotel_availability(85441, 261, event_date, ap_block_type=1, block_price='25.00', blocks=2, pay_type='0')
+        self.seed_inventory([
+            dict(hotel_id=hotel_id, airline_id=261, availability_date=event_date, ap_block_type=1,
+                 block_price=block_price, blocks=2, pay_type='0')
+            for hotel_id, block_price in ((97224, '20.00'), (97228, '30.00'), (85440, '35.00'), (85441, '25.00'))
+        ], resolve_block_ids=False)
 
         passenger_payload = self._generate_n_passenger_payload(1)
         passenger_payload[0].update(dict(
             port_accommodation='EWR'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -209,7 +209,7 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response = requests.get(offer_hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(offer_hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -228,7 +228,7 @@ class TestAirlineAndPassengerAPI(StormxSystemVerification):
             hotel_id='tvl-85440'
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()['data']
         UUID(book_resp_json['voucher_id'], version=4)
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-import requests
+from stormx_http import http_client
 
 from StormxApp.tests.data_utilities import (
     generate_flight_number,
@@ -18,7 +18,6 @@ class TestApiCustomFields(StormxSystemVerification):
     """
     Verify passenger import input validation and functionality for custom fields.
     """
-    selected_environment_name = None
     ALWAYS_PRESENT_CUSTOM_FIELD_NAMES = [
         'disrupt_type',
     ]
@@ -68,7 +67,7 @@ class TestApiCustomFields(StormxSystemVerification):
 
         CUSTOM_VALUE = 'Lorem ipsum dolor sit amet, <BLAH BLAH 234 -)#%^cZ'
         passenger_with_custom_field[custom_field_name] = CUSTOM_VALUE
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
 
@@ -85,9 +84,9 @@ class TestApiCustomFields(StormxSystemVerification):
 
         # verify field is properly returned/hidden in the passenger lookup response ----
         url_pattern = self._api_host + '/api/v1/passenger/{context_id}'
-        response_json = requests.get(url_pattern.format(context_id=context_id_custom), headers=headers).json()
+        response_json = http_client.get(url_pattern.format(context_id=context_id_custom), headers=headers).json()
         self.assertEqual(response_json['data'][custom_field_name], CUSTOM_VALUE)
-        response_json = requests.get(url_pattern.format(context_id=context_id_not_custom), headers=headers).json()
+        response_json = http_client.get(url_pattern.format(context_id=context_id_not_custom), headers=headers).json()
         if field_always_present:
             self.assertEqual(response_json['data'][custom_field_name], '')
         else:
@@ -95,20 +94,20 @@ class TestApiCustomFields(StormxSystemVerification):
 
         # verify field is properly returned/hidden in the related passenger lookup response ----
         url_pattern = self._api_host + '/api/v1/passenger/{context_id}/related'
-        response_json = requests.get(url_pattern.format(context_id=context_id_custom), headers=headers).json()
+        response_json = http_client.get(url_pattern.format(context_id=context_id_custom), headers=headers).json()
         if field_always_present:
             self.assertEqual(response_json['data'][0][custom_field_name], '')
         else:
             self.assertNotIn(custom_field_name, response_json['data'][0])
-        response_json = requests.get(url_pattern.format(context_id=context_id_not_custom), headers=headers).json()
+        response_json = http_client.get(url_pattern.format(context_id=context_id_not_custom), headers=headers).json()
         self.assertEqual(response_json['data'][0][custom_field_name], CUSTOM_VALUE)
 
 
         # verify field is properly returned/hidden in the passenger full state ----
         url_pattern = self._api_host + '/api/v1/passenger/{context_id}/state'
-        response_json = requests.get(url_pattern.format(context_id=context_id_custom), headers=headers).json()
+        response_json = http_client.get(url_pattern.format(context_id=context_id_custom), headers=headers).json()
         self.assertEqual(response_json['data']['passenger'][custom_field_name], CUSTOM_VALUE)
-        response_json = requests.get(url_pattern.format(context_id=context_id_not_custom), headers=headers).json()
+        response_json = http_client.get(url_pattern.format(context_id=context_id_not_custom), headers=headers).json()
         if field_always_present:
             self.assertEqual(response_json['data']['passenger'][custom_field_name], '')
         else:
@@ -118,7 +117,7 @@ class TestApiCustomFields(StormxSystemVerification):
         # verify field is properly returned/hidden in the PNR search ----
         url = self._api_host + '/api/v1/pnr'
         params = {'pax_record_locator_group': pax_record_locator_group, 'pnr_create_date': pnr_create_date}
-        response_json = requests.get(url, headers=headers, params=params).json()
+        response_json = http_client.get(url, headers=headers, params=params).json()
         first_passenger = [p for p in response_json['data']
                            if p['context_id'] == context_id_custom][0]
         second_passenger = [p for p in response_json['data']
@@ -132,7 +131,7 @@ class TestApiCustomFields(StormxSystemVerification):
         # verify field is properly returned/hidden in the PNR search ----
         url = self._api_host + '/api/v1/passenger'
 
-        response_json = requests.get(url, headers=headers, params=flight_search_params).json()
+        response_json = http_client.get(url, headers=headers, params=flight_search_params).json()
         first_passenger = [p for p in response_json['data']
                            if p['context_id'] == context_id_custom][0]
         second_passenger = [p for p in response_json['data']
@@ -146,7 +145,7 @@ class TestApiCustomFields(StormxSystemVerification):
 
         # verify that pax app is able to present/hide the custom field ----
         passenger_offer_url = first_passenger['offer_url']
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertEqual(embedded_json['passenger'][custom_field_name], CUSTOM_VALUE)
         if field_always_present:
@@ -155,7 +154,7 @@ class TestApiCustomFields(StormxSystemVerification):
             self.assertNotIn(custom_field_name, embedded_json['other_passengers'][0])
 
         passenger_offer_url = second_passenger['offer_url']
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         embedded_json = self._get_landing_page_embedded_json(response)
         if field_always_present:
             self.assertEqual(embedded_json['passenger'][custom_field_name], '')
@@ -189,7 +188,7 @@ class TestApiCustomFields(StormxSystemVerification):
 
         # verify field length is properly validated in the passenger import response ----
         passengers_payload = self._generate_n_passenger_payload(1, **{custom_field_name: 'X' * 51})  # too long.
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['meta']['error_description'], 'Invalid input criteria for passenger import.')
@@ -213,7 +212,7 @@ class TestApiCustomFields(StormxSystemVerification):
 
         # verify field length is properly validated in the passenger import response ----
         passengers_payload = self._generate_n_passenger_payload(1, **{custom_field_name: None})
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['meta']['error_description'], 'Invalid input criteria for passenger import.')
@@ -237,7 +236,7 @@ class TestApiCustomFields(StormxSystemVerification):
 
         # verify field length is properly validated in the passenger import response ----
         passengers_payload = self._generate_n_passenger_payload(1, **{custom_field_name: ''})
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['data'][0][custom_field_name], '')
@@ -1,5 +1,5 @@
 
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import StormxSystemVerification
 
@@ -8,7 +8,6 @@ class TestApiHealth(StormxSystemVerification):
     """
     Verify `/health-check-api` endpoint behavior.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -17,11 +16,11 @@ class TestApiHealth(StormxSystemVerification):
     def test_health_check__happy(self):
         url = self._api_host + '/health-check-api?from=system-test'
         headers = {'User-Agent': 'stormx_system_test'}
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         self.assertEqual(response.status_code, 200)
 
     def test_health_check__without_from_parameter(self):
         url = self._api_host + '/health-check-api'  # note: no `from` parameter
         headers = {'User-Agent': 'stormx_system_test'}
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         self.assertEqual(response.status_code, 404)
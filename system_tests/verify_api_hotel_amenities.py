@@ -1,6 +1,6 @@
 from uuid import UUID
 
-import requests
+from stormx_http import http_client
 
 
 from stormx_verification_framework import (
@@ -13,7 +13,6 @@ class TestApiHotelAmenities(StormxSystemVerification):
     """
     Verify hotel amenities are reported correctly in inventory, booking, and state check endpoints.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -36,7 +35,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_hotel_availability(hotel_id, 294, event_date, ap_block_type=1,
                                     block_price='150.00', blocks=5, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -65,7 +64,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_edit_hotel_amenity(hotel_id=hotel_id, hotel_amenity_id=hotel_amenity_id, available=0,
                                     amenity_id=amenity_master_id)
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -83,7 +82,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_edit_hotel_amenity(hotel_id=hotel_id, hotel_amenity_id=hotel_amenity_id, available=1,
                                     amenity_id=amenity_master_id)
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -101,7 +100,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_edit_amenity(amenity_id=amenity_master_id, amenity_name=amenity_object['amenity_name'],
                               is_available=0)
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -119,7 +118,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_edit_amenity(amenity_id=amenity_master_id, amenity_name=amenity_object['amenity_name'],
                               is_available=1)
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -152,7 +151,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_hotel_availability(hotel_id_with_amenity.split('-')[1], 294, event_date, ap_block_type=1, block_price='100.00', blocks=2, pay_type='0')
         self.add_hotel_availability(hotel_id_without_amenity.split('-')[1], 294, event_date, ap_block_type=1, block_price='100.00', blocks=2, pay_type='0')
 
-        hotel_resp = requests.get(url=hotel_url + '?room_count=1&port=LAX&provider=tvl', headers=headers)
+        hotel_resp = http_client.get(url=hotel_url + '?room_count=1&port=LAX&provider=tvl', headers=headers)
         self.assertEqual(hotel_resp.status_code, 200)
         hotel_json = hotel_resp.json()['data']
         self.assertGreater(len(hotel_json), 0)
@@ -187,19 +186,19 @@ class TestApiHotelAmenities(StormxSystemVerification):
             hotel_id=hotel_id_with_amenity
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()['data']
         UUID(book_resp_json['voucher_id'], version=4)
         self.assertEqual(book_resp_json['hotel_voucher']['restaurant_on_property'], True)
 
-        voucher_resp = requests.get(url=voucher_url + book_resp_json['voucher_id'], headers=headers)
+        voucher_resp = http_client.get(url=voucher_url + book_resp_json['voucher_id'], headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()['data']
         UUID(voucher_resp_json['voucher_id'], version=4)
         self.assertEqual(voucher_resp_json['hotel_voucher']['restaurant_on_property'], True)
 
-        full_state_resp = requests.get(url=passenger_url + passengers[0]['context_id'] +  '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passengers[0]['context_id'] +  '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()['data']
         self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['restaurant_on_property'], True)
@@ -213,19 +212,19 @@ class TestApiHotelAmenities(StormxSystemVerification):
             hotel_id=hotel_id_without_amenity
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()['data']
         UUID(book_resp_json['voucher_id'], version=4)
         self.assertEqual(book_resp_json['hotel_voucher']['restaurant_on_property'], False)
 
-        voucher_resp = requests.get(url=voucher_url + book_resp_json['voucher_id'], headers=headers)
+        voucher_resp = http_client.get(url=voucher_url + book_resp_json['voucher_id'], headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()['data']
         UUID(voucher_resp_json['voucher_id'], version=4)
         self.assertEqual(voucher_resp_json['hotel_voucher']['restaurant_on_property'], False)
 
-        full_state_resp = requests.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()['data']
         self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['restaurant_on_property'], False)
@@ -251,7 +250,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
             ('LGW', 'Europe/London')
         ])
 
-        hotel_resp = requests.get(url=hotel_url + '?room_count=1&port='+ port +'&provider=ean', headers=headers)
+        hotel_resp = http_client.get(url=hotel_url + '?room_count=1&port='+ port +'&provider=ean', headers=headers)
         self.assertEqual(hotel_resp.status_code, 200)
         hotel_json = hotel_resp.json()['data']
         self.assertGreater(len(hotel_json), 0, msg='no expedia inventory in port ' + repr(port))
@@ -294,19 +293,19 @@ class TestApiHotelAmenities(StormxSystemVerification):
             hotel_id=hotel_id_with_amenity
         )
 
-            book_resp = requests.post(hotel_url, headers=headers, json=payload)
+            book_resp = http_client.post(hotel_url, headers=headers, json=payload)
             self.assertEqual(book_resp.status_code, 200)
             book_resp_json = book_resp.json()['data']
             UUID(book_resp_json['voucher_id'], version=4)
             self.assertEqual(book_resp_json['hotel_voucher']['restaurant_on_property'], True)
 
-            voucher_resp = requests.get(url=voucher_url + book_resp_json['voucher_id'], headers=headers)
+            voucher_resp = http_client.get(url=voucher_url + book_resp_json['voucher_id'], headers=headers)
             self.assertEqual(voucher_resp.status_code, 200)
             voucher_resp_json = voucher_resp.json()['data']
             UUID(voucher_resp_json['voucher_id'], version=4)
             self.assertEqual(voucher_resp_json['hotel_voucher']['restaurant_on_property'], True)
 
-            full_state_resp = requests.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
+            full_state_resp = http_client.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
             self.assertEqual(full_state_resp.status_code, 200)
             full_state_resp_json = full_state_resp.json()['data']
             self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['restaurant_on_property'], True)
@@ -323,19 +322,19 @@ class TestApiHotelAmenities(StormxSystemVerification):
             hotel_id=hotel_id_without_amenity
         )
 
-            book_resp = requests.post(hotel_url, headers=headers, json=payload)
+            book_resp = http_client.post(hotel_url, headers=headers, json=payload)
             self.assertEqual(book_resp.status_code, 200)
             book_resp_json = book_resp.json()['data']
             UUID(book_resp_json['voucher_id'], version=4)
             self.assertEqual(book_resp_json['hotel_voucher']['restaurant_on_property'], False)
 
-            voucher_resp = requests.get(url=voucher_url + book_resp_json['voucher_id'], headers=headers)
+            voucher_resp = http_client.get(url=voucher_url + book_resp_json['voucher_id'], headers=headers)
             self.assertEqual(voucher_resp.status_code, 200)
             voucher_resp_json = voucher_resp.json()['data']
             UUID(voucher_resp_json['voucher_id'], version=4)
             self.assertEqual(voucher_resp_json['hotel_voucher']['restaurant_on_property'], False)
 
-            full_state_resp = requests.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
+            full_state_resp = http_client.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
             self.assertEqual(full_state_resp.status_code, 200)
             full_state_resp_json = full_state_resp.json()['data']
             self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['restaurant_on_property'], False)
@@ -375,7 +374,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_hotel_availability(hotel_id, 294, event_date, ap_block_type=1, block_price='150.00',
                                     blocks=5, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
 
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
@@ -428,7 +427,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_hotel_availability(hotel_id, 294, event_date, ap_block_type=1, block_price='150.00',
                                     blocks=5, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
 
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
@@ -481,7 +480,7 @@ class TestApiHotelAmenities(StormxSystemVerification):
         self.add_hotel_availability(hotel_id, 294, event_date, ap_block_type=1, block_price='150.00',
                                     blocks=5, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
 
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
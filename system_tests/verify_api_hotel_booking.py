@@ -1,6 +1,6 @@
 import datetime
 import json
-import requests
+from stormx_http import http_client
 from uuid import UUID
 from decimal import Decimal
 
@@ -23,7 +23,6 @@ class TestApiHotelBooking(StormxSystemVerification):
     """
     Verify general hotel booking behavior.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -64,7 +63,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_id=leader_picked_hotel['hotel_id'],
             room_count=1,
         )
-        response = requests.post(url, headers=headers, params=leader_query_parameters, json=leader_booking_payload)
+        response = http_client.post(url, headers=headers, params=leader_query_parameters, json=leader_booking_payload)
         if response.status_code != 200:
             self.fail('unexpected response: ' + str(response.status_code) + ' ' + response.text)
         self.assertEqual(response.status_code, 200)
@@ -96,7 +95,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_id=follower_picked_hotel['hotel_id'],
             room_count=1,
         )
-        response = requests.get(url, headers=headers, params=follower_query_parameters, json=follower_booking_payload)
+        response = http_client.get(url, headers=headers, params=follower_query_parameters, json=follower_booking_payload)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 401, 'Unauthorized', '', '', [])
@@ -105,8 +104,8 @@ class TestApiHotelBooking(StormxSystemVerification):
         url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
 
-        response1 = requests.get(url=url1, headers=headers).json()
-        response2 = requests.get(url=url2, headers=headers).json()
+        response1 = http_client.get(url=url1, headers=headers).json()
+        response2 = http_client.get(url=url2, headers=headers).json()
         self.assertEqual(len(response1['data']['voucher']['meal_vouchers']), 2)
         self.assertEqual(len(response2['data']['voucher']['meal_vouchers']), 2)
         self.assertGreater(len(response1['data']['voucher']['hotel_voucher']), 0)
@@ -162,7 +161,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_id='ean-aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa',
             room_count=1
         )
-        booking_response = requests.post(pax_hotel_url, headers=headers, params=leader_query_parameters, json=booking_payload)
+        booking_response = http_client.post(pax_hotel_url, headers=headers, params=leader_query_parameters, json=booking_payload)
         self.assertEqual(booking_response.status_code, 404)
         booking_response_json = booking_response.json()
         self.assertEqual(booking_response_json['meta']['error_code'], 'HOTEL_OFFER_EXPIRED_OR_NOT_FOUND')
@@ -176,7 +175,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_id='ean-aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa',
             room_count=1
         )
-        booking_response = requests.post(agent_hotel_url, headers=headers, json=agent_booking_payload)
+        booking_response = http_client.post(agent_hotel_url, headers=headers, json=agent_booking_payload)
         self.assertEqual(booking_response.status_code, 404)
         booking_response_json = booking_response.json()
         self.assertEqual(booking_response_json['meta']['error_code'], 'HOTEL_OFFER_EXPIRED_OR_NOT_FOUND')
@@ -212,7 +211,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_id=leader_picked_hotel['hotel_id'],
             room_count=1,
         )
-        response = requests.post(url, headers=headers, params=leader_query_parameters, json=leader_booking_payload)
+        response = http_client.post(url, headers=headers, params=leader_query_parameters, json=leader_booking_payload)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.reason, 'OK')
         response_json = response.json()
@@ -240,7 +239,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_id=follower_picked_hotel['hotel_id'],
             room_count=1,
         )
-        response = requests.get(url, headers=headers, params=follower_query_parameters, json=follower_booking_payload)
+        response = http_client.get(url, headers=headers, params=follower_query_parameters, json=follower_booking_payload)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 401, 'Unauthorized', '', '', [])
@@ -249,8 +248,8 @@ class TestApiHotelBooking(StormxSystemVerification):
         url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
 
-        response1 = requests.get(url=url1, headers=headers).json()
-        response2 = requests.get(url=url2, headers=headers).json()
+        response1 = http_client.get(url=url1, headers=headers).json()
+        response2 = http_client.get(url=url2, headers=headers).json()
         self.assertEqual(len(response1['data']['voucher']['meal_vouchers']), 0)
         self.assertEqual(len(response2['data']['voucher']['meal_vouchers']), 0)
         self.assertIsNotNone(response1['data']['voucher']['hotel_voucher'])
@@ -299,7 +298,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             room_count=str(room_count),
         )
 
-        response = requests.post(url, headers=headers, json=booking_payload)
+        response = http_client.post(url, headers=headers, json=booking_payload)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -335,7 +334,7 @@ class TestApiHotelBooking(StormxSystemVerification):
                 self.assertEqual(meal_voucher['billing_zip_code'], '60173')
                 self.assertEqual(meal_voucher['provider'], 'tvl')
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
         for passenger in voucher_resp_json['data']['passengers']:
@@ -365,8 +364,8 @@ class TestApiHotelBooking(StormxSystemVerification):
         url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
 
-        response1 = requests.get(url=url1, headers=headers).json()
-        response2 = requests.get(url=url2, headers=headers).json()
+        response1 = http_client.get(url=url1, headers=headers).json()
+        response2 = http_client.get(url=url2, headers=headers).json()
 
         self.assertEqual(len(response1['data']['voucher']['meal_vouchers']), 2)
         for meal_voucher in response1['data']['voucher']['meal_vouchers']:
@@ -444,7 +443,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             room_count=str(room_count),
         )
 
-        response = requests.post(url, headers=headers, json=booking_payload)
+        response = http_client.post(url, headers=headers, json=booking_payload)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -480,7 +479,7 @@ class TestApiHotelBooking(StormxSystemVerification):
                 self.assertEqual(meal_voucher['billing_zip_code'], '60173')
                 self.assertEqual(meal_voucher['provider'], 'tvl')
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
         for passenger in voucher_resp_json['data']['passengers']:
@@ -504,8 +503,8 @@ class TestApiHotelBooking(StormxSystemVerification):
         url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
 
-        response1 = requests.get(url=url1, headers=headers).json()
-        response2 = requests.get(url=url2, headers=headers).json()
+        response1 = http_client.get(url=url1, headers=headers).json()
+        response2 = http_client.get(url=url2, headers=headers).json()
 
         self.assertEqual(len(response1['data']['voucher']['meal_vouchers']), 2)
         for meal_voucher in response1['data']['voucher']['meal_vouchers']:
@@ -587,7 +586,7 @@ class TestApiHotelBooking(StormxSystemVerification):
                 hotel_message=expected_hotel_message
             )
 
-            response = requests.post(url, headers=headers, json=booking_payload)
+            response = http_client.post(url, headers=headers, json=booking_payload)
             if response.status_code != 200:
                 display_response(response)
             self.assertEqual(response.status_code, 200)
@@ -598,7 +597,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             self.assertEqual(response_json['data']['hotel_voucher']['hotel_message'], expected_hotel_message)
             UUID(response_json['data']['voucher_id'], version=4)
 
-            voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
+            voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
             self.assertEqual(voucher_resp.status_code, 200)
             voucher_resp_json = voucher_resp.json()
             self.assertIs(voucher_resp_json['error'], False)
@@ -610,8 +609,8 @@ class TestApiHotelBooking(StormxSystemVerification):
             url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
             headers = self._generate_airline_headers(customer=customer)
 
-            response1 = requests.get(url=url1, headers=headers).json()
-            response2 = requests.get(url=url2, headers=headers).json()
+            response1 = http_client.get(url=url1, headers=headers).json()
+            response2 = http_client.get(url=url2, headers=headers).json()
 
             self.assertEqual(response1['data']['voucher']['hotel_voucher']['provider'], 'tvl')
             self.assertEqual(response2['data']['voucher']['hotel_voucher']['provider'], 'tvl')
@@ -640,7 +639,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
             room_count = 1
 
-            hotels = requests.get(url=url + '?port='+ port +'&room_count=1&provider=ean', headers=headers).json()
+            hotels = http_client.get(url=url + '?port='+ port +'&room_count=1&provider=ean', headers=headers).json()
 
             self.assertGreater(len(hotels['data']), 0)
             picked_hotel_id = hotels['data'][0]['hotel_id']
@@ -652,7 +651,7 @@ class TestApiHotelBooking(StormxSystemVerification):
                 hotel_message=expected_hotel_message
             )
 
-            response = requests.post(url, headers=headers, json=booking_payload)
+            response = http_client.post(url, headers=headers, json=booking_payload)
             if response.status_code != 200:
                 display_response(response)
             self.assertEqual(response.status_code, 200)
@@ -663,7 +662,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             self.assertEqual(response_json['data']['hotel_voucher']['hotel_message'], expected_hotel_message)
             UUID(response_json['data']['voucher_id'], version=4)
 
-            voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
+            voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
             self.assertEqual(voucher_resp.status_code, 200)
             voucher_resp_json = voucher_resp.json()
             self.assertIs(voucher_resp_json['error'], False)
@@ -675,8 +674,8 @@ class TestApiHotelBooking(StormxSystemVerification):
             url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
             headers = self._generate_airline_headers(customer=customer)
 
-            response1 = requests.get(url=url1, headers=headers).json()
-            response2 = requests.get(url=url2, headers=headers).json()
+            response1 = http_client.get(url=url1, headers=headers).json()
+            response2 = http_client.get(url=url2, headers=headers).json()
 
             self.assertEqual(response1['data']['voucher']['hotel_voucher']['provider'], 'ean')
             self.assertEqual(response2['data']['voucher']['hotel_voucher']['provider'], 'ean')
@@ -712,7 +711,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         offer_url = self._api_host + '/api/v1/offer/hotels?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
 
-        response = requests.post(offer_url, headers=headers, json=booking_payload)
+        response = http_client.post(offer_url, headers=headers, json=booking_payload)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -726,15 +725,15 @@ class TestApiHotelBooking(StormxSystemVerification):
         url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
 
-        response1 = requests.get(url=url1, headers=headers).json()
-        response2 = requests.get(url=url2, headers=headers).json()
+        response1 = http_client.get(url=url1, headers=headers).json()
+        response2 = http_client.get(url=url2, headers=headers).json()
 
         self.assertEqual(response1['data']['voucher']['hotel_voucher']['provider'], 'tvl')
         self.assertEqual(response2['data']['voucher']['hotel_voucher']['provider'], 'tvl')
         self.assertIsNone(response1['data']['voucher']['hotel_voucher']['hotel_message'])
         self.assertIsNone(response2['data']['voucher']['hotel_voucher']['hotel_message'])
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + response1['data']['passenger']['voucher_id'], headers=headers)
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + response1['data']['passenger']['voucher_id'], headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
         self.assertIs(voucher_resp_json['error'], False)
@@ -768,7 +767,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_message=hotel_message
         )
 
-        response = requests.post(url, headers=headers, json=booking_payload)
+        response = http_client.post(url, headers=headers, json=booking_payload)
         self.assertEqual(response.status_code, 400)
         response_json = response.json()
         self._validate_error_message(response_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.',
@@ -794,7 +793,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         room_count = 1
 
-        hotels = requests.get(url=url + '?port=' + port + '&room_count=1&provider=ean', headers=headers).json()
+        hotels = http_client.get(url=url + '?port=' + port + '&room_count=1&provider=ean', headers=headers).json()
         self.assertGreater(len(hotels['data']), 0, msg='no expedia in port ' + repr(port))
 
         picked_hotel_id = hotels['data'][0]['hotel_id']
@@ -805,7 +804,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             room_count=str(room_count)
         )
 
-        response = requests.post(url, headers=headers, json=booking_payload)
+        response = http_client.post(url, headers=headers, json=booking_payload)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -816,7 +815,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertIsNone(response_json['data']['hotel_voucher']['hotel_message'])
         UUID(response_json['data']['voucher_id'], version=4)
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
         self.assertIs(voucher_resp_json['error'], False)
@@ -828,8 +827,8 @@ class TestApiHotelBooking(StormxSystemVerification):
         url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
 
-        response1 = requests.get(url=url1, headers=headers).json()
-        response2 = requests.get(url=url2, headers=headers).json()
+        response1 = http_client.get(url=url1, headers=headers).json()
+        response2 = http_client.get(url=url2, headers=headers).json()
 
         self.assertEqual(response1['data']['voucher']['hotel_voucher']['provider'], 'ean')
         self.assertEqual(response2['data']['voucher']['hotel_voucher']['provider'], 'ean')
@@ -859,11 +858,11 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # visit offer link
-        resp = requests.get(url=passengers[0]['offer_url'])
+        resp = http_client.get(url=passengers[0]['offer_url'])
         embedded_json = self._get_landing_page_embedded_json(resp)
         expected_offer_opened_date = embedded_json['passenger']['offer_opened_date']
 
-        response = requests.post(url, headers=headers, json=booking_payload)
+        response = http_client.post(url, headers=headers, json=booking_payload)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         self.assertIn('voucher_id', response_json['data'])
@@ -891,7 +890,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertTrue(validate_offer_opened_date1)
         self.assertTrue(validate_offer_opened_date2)
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'], headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
         self.assertIn('voucher_id', voucher_resp_json['data'])
@@ -935,11 +934,11 @@ class TestApiHotelBooking(StormxSystemVerification):
         })
         aa_passenger_payload = self._generate_n_passenger_payload(1)
 
-        delta_import_response = requests.post(url=offer_url, headers=delta_headers, json=delta_passenger_payload)
+        delta_import_response = http_client.post(url=offer_url, headers=delta_headers, json=delta_passenger_payload)
         self.assertEqual(delta_import_response.status_code, 201)
         delta_import_response_json = delta_import_response.json()
 
-        aa_import_response = requests.post(url=offer_url, headers=aa_headers, json=aa_passenger_payload)
+        aa_import_response = http_client.post(url=offer_url, headers=aa_headers, json=aa_passenger_payload)
         self.assertEqual(aa_import_response.status_code, 201)
         aa_import_response_json = aa_import_response.json()
 
@@ -956,27 +955,27 @@ class TestApiHotelBooking(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=aa_headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=aa_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         delta_voucher_url = self._api_host + '/api/v1/voucher/' + str(delta_passenger['voucher_id'])
         aa_voucher_url = self._api_host + '/api/v1/voucher/' + str(booking_response.json()['data']['voucher_id'])
 
-        delta_voucher_resp = requests.get(url=delta_voucher_url, headers=delta_headers)
+        delta_voucher_resp = http_client.get(url=delta_voucher_url, headers=delta_headers)
         delta_voucher_resp_json = delta_voucher_resp.json()
         self.assertEqual(delta_voucher_resp_json['error'], False)
         self.assertEqual(delta_voucher_resp.status_code, 200)
         self.assertEqual(delta_voucher_resp_json['data']['voucher_id'], delta_passenger['voucher_id'])
 
-        aa_voucher_resp = requests.get(url=aa_voucher_url, headers=aa_headers)
+        aa_voucher_resp = http_client.get(url=aa_voucher_url, headers=aa_headers)
         aa_voucher_resp_json = aa_voucher_resp.json()
         self.assertEqual(aa_voucher_resp_json['error'], False)
         self.assertEqual(aa_voucher_resp.status_code, 200)
         self.assertEqual(aa_voucher_resp_json['data']['voucher_id'], booking_response.json()['data']['voucher_id'])
 
         # multi tenant functionality tests
-        aa_delta_resp = requests.get(url=delta_voucher_url, headers=aa_headers)
-        delta_aa_resp = requests.get(url=aa_voucher_url, headers=delta_headers)
+        aa_delta_resp = http_client.get(url=delta_voucher_url, headers=aa_headers)
+        delta_aa_resp = http_client.get(url=aa_voucher_url, headers=delta_headers)
         self.assertEqual(aa_delta_resp.status_code, 404)
         self.assertEqual(delta_aa_resp.status_code, 404)
 
@@ -1000,7 +999,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         passenger_offer_url = passenger['offer_url']
 
         # passenger visits offer link ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -1035,11 +1034,11 @@ class TestApiHotelBooking(StormxSystemVerification):
                 self.assertEqual(len(meal_voucher['card_number']), 16)
                 self.assertGreaterEqual(len(meal_voucher['cvc2']), 3)
                 self.assertEqual(len(meal_voucher['expiration']), 7)
-                qr_code_image_response = requests.get(meal_voucher['qr_code_url'], headers=headers)
+                qr_code_image_response = http_client.get(meal_voucher['qr_code_url'], headers=headers)
                 self.assertEqual(qr_code_image_response.status_code, 200)
 
         # passenger visits offer link again ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -1057,7 +1056,7 @@ class TestApiHotelBooking(StormxSystemVerification):
                 self.assertEqual(len(meal_voucher['card_number']), 16)
                 self.assertGreaterEqual(len(meal_voucher['cvc2']), 3)
                 self.assertEqual(len(meal_voucher['expiration']), 7)
-                qr_code_image_response = requests.get(meal_voucher['qr_code_url'], headers=headers)
+                qr_code_image_response = http_client.get(meal_voucher['qr_code_url'], headers=headers)
                 self.assertEqual(qr_code_image_response.status_code, 200)
 
         for field in passenger_sanitized_fields:
@@ -1073,7 +1072,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         # other passenger visits their own offer link ----
         other_passenger = passengers[1]
         other_passenger_offer_url = other_passenger['offer_url']
-        response = requests.get(other_passenger_offer_url, headers=headers)
+        response = http_client.get(other_passenger_offer_url, headers=headers)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -1108,7 +1107,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         passenger_offer_url = passenger['offer_url']
 
         # passenger visits offer link ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertIsNone(embedded_json['confirmation'])
@@ -1134,11 +1133,11 @@ class TestApiHotelBooking(StormxSystemVerification):
                 self.assertEqual(len(meal_voucher['card_number']), 16)
                 self.assertGreaterEqual(len(meal_voucher['cvc2']), 3)
                 self.assertEqual(len(meal_voucher['expiration']), 7)
-                qr_code_image_response = requests.get(meal_voucher['qr_code_url'], headers=headers)
+                qr_code_image_response = http_client.get(meal_voucher['qr_code_url'], headers=headers)
                 self.assertEqual(qr_code_image_response.status_code, 200)
 
         # passenger visits offer link again ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertIsNotNone(embedded_json['confirmation'])
@@ -1178,7 +1177,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         passenger_offer_url = passenger['offer_url']
 
         # passenger visits offer link ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertIsNone(embedded_json['confirmation'])
@@ -1205,7 +1204,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             self.assertEqual(p['meal_vouchers'], [])
 
         # passenger visits offer link again ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertEqual(embedded_json['confirmation']['hotel_voucher']['hotel_id'], picked_hotel['hotel_id'])
@@ -1237,7 +1236,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             notify=True
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1258,7 +1257,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_id=picked_hotel,
             room_count=1,
         )
-        response = requests.post(hotel_url, headers=pax_headers, params=booking_query_parameters, json=booking_payload)
+        response = http_client.post(hotel_url, headers=pax_headers, params=booking_query_parameters, json=booking_payload)
         self.assertEqual(response.status_code, 200)
         booking_response_json = response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -1285,7 +1284,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             pax_record_locator_group=passenger_payload[0]['pax_record_locator_group']
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1315,7 +1314,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             hotel_id=picked_hotel,
             room_count=1,
         )
-        response = requests.post(hotel_url, headers=pax_headers, params=booking_query_parameters, json=booking_payload)
+        response = http_client.post(hotel_url, headers=pax_headers, params=booking_query_parameters, json=booking_payload)
         self.assertEqual(response.status_code, 200)
         booking_response_json = response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -1386,7 +1385,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             port_accommodation='ORD'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1395,7 +1394,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         passenger2 = response_json['data'][1]
 
         hotel_url = self._api_host + '/api/v1/hotels?handicap=true&room_count=1&port=ORD'
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1409,7 +1408,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         booking_url = self._api_host + '/api/v1/hotels'
 
-        booking_response = requests.post(booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -1439,7 +1438,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         check_out_date = (event_date_jfk_day2 + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
 
@@ -1455,7 +1454,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1496,7 +1495,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         number_of_nights = 2
 
         # # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=SNA&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=SNA&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertNotIn(hotel_id_sna, hotel_ids)
 
@@ -1506,7 +1505,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         for passenger in passengers_payload:
             passenger['port_accommodation'] = 'SNA'
             passenger['number_of_nights'] = 2
-        passengers = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload).json()['data']
+        passengers = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload).json()['data']
 
         # setup booking payload
         booking_payload = dict(
@@ -1517,7 +1516,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay and validate it fails
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 400)
         self._validate_error_message(hotel_booking_resp.json(), 400, 'Bad Request', 'INSUFFICIENT_INVENTORY',
                                      'Not enough inventory found for Hilton Irvine/Orange County Airport hotel', [])
@@ -1546,7 +1545,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         check_out_date = (event_date_jfk_day2 + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
 
@@ -1563,7 +1562,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1599,7 +1598,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         check_out_date = (event_date_jfk_day2 + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
 
@@ -1617,7 +1616,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1654,7 +1653,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         check_out_date = (event_date_jfk_day2 + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
 
@@ -1669,7 +1668,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1701,7 +1700,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         check_out_date = (event_date_jfk + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
 
@@ -1716,7 +1715,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1752,7 +1751,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         offer_hotel_url = self._api_host + '/api/v1/offer/hotels?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=offer_hotel_url + '&room_count=' + str(room_count)).json()
+        hotel_search_resp = http_client.get(url=offer_hotel_url + '&room_count=' + str(room_count)).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
         for hotel in hotel_search_resp['data']:
@@ -1767,7 +1766,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=offer_hotel_url, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=offer_hotel_url, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1779,7 +1778,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         full_state_url = self._api_host + '/api/v1/passenger/' + passengers[0]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
-        full_state_resp = requests.get(url=full_state_url, headers=headers)
+        full_state_resp = http_client.get(url=full_state_url, headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_json = full_state_resp.json()['data']
         voucher_id = full_state_json['passenger']['voucher_id']
@@ -1792,7 +1791,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(full_state_json['voucher']['hotel_voucher']['check_out_date'], check_out_date)
 
         voucher_url = self._api_host + '/api/v1/voucher/' + voucher_id
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_json = voucher_resp.json()['data']
         self.assertEqual(len(voucher_json['hotel_voucher']['room_vouchers']), 2)
@@ -1827,7 +1826,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         offer_hotel_url = self._api_host + '/api/v1/offer/hotels?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=offer_hotel_url + '&room_count=' + str(room_count)).json()
+        hotel_search_resp = http_client.get(url=offer_hotel_url + '&room_count=' + str(room_count)).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
         for hotel in hotel_search_resp['data']:
@@ -1842,7 +1841,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=offer_hotel_url, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=offer_hotel_url, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1854,7 +1853,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         full_state_url = self._api_host + '/api/v1/passenger/' + passengers[0]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
-        full_state_resp = requests.get(url=full_state_url, headers=headers)
+        full_state_resp = http_client.get(url=full_state_url, headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_json = full_state_resp.json()['data']
         voucher_id = full_state_json['passenger']['voucher_id']
@@ -1867,7 +1866,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(full_state_json['voucher']['hotel_voucher']['check_out_date'], check_out_date)
 
         voucher_url = self._api_host + '/api/v1/voucher/' + voucher_id
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_json = voucher_resp.json()['data']
         self.assertEqual(len(voucher_json['hotel_voucher']['room_vouchers']), 2)
@@ -1899,7 +1898,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         offer_hotel_url = self._api_host + '/api/v1/offer/hotels?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=offer_hotel_url + '&room_count=' + str(room_count)).json()
+        hotel_search_resp = http_client.get(url=offer_hotel_url + '&room_count=' + str(room_count)).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
         for hotel in hotel_search_resp['data']:
@@ -1914,7 +1913,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=offer_hotel_url, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=offer_hotel_url, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1926,7 +1925,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         full_state_url = self._api_host + '/api/v1/passenger/' + passengers[0]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
-        full_state_resp = requests.get(url=full_state_url, headers=headers)
+        full_state_resp = http_client.get(url=full_state_url, headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_json = full_state_resp.json()['data']
         voucher_id = full_state_json['passenger']['voucher_id']
@@ -1939,7 +1938,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(full_state_json['voucher']['hotel_voucher']['check_out_date'], check_out_date)
 
         voucher_url = self._api_host + '/api/v1/voucher/' + voucher_id
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_json = voucher_resp.json()['data']
         self.assertEqual(len(voucher_json['hotel_voucher']['room_vouchers']), 1)
@@ -1971,7 +1970,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         offer_hotel_url = self._api_host + '/api/v1/offer/hotels?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=offer_hotel_url + '&room_count=' + str(room_count)).json()
+        hotel_search_resp = http_client.get(url=offer_hotel_url + '&room_count=' + str(room_count)).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
         for hotel in hotel_search_resp['data']:
@@ -1986,7 +1985,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=offer_hotel_url, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=offer_hotel_url, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -1998,7 +1997,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         full_state_url = self._api_host + '/api/v1/passenger/' + passengers[0]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
-        full_state_resp = requests.get(url=full_state_url, headers=headers)
+        full_state_resp = http_client.get(url=full_state_url, headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_json = full_state_resp.json()['data']
         voucher_id = full_state_json['passenger']['voucher_id']
@@ -2011,7 +2010,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(full_state_json['voucher']['hotel_voucher']['check_out_date'], check_out_date)
 
         voucher_url = self._api_host + '/api/v1/voucher/' + voucher_id
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_json = voucher_resp.json()['data']
         self.assertEqual(len(voucher_json['hotel_voucher']['room_vouchers']), 1)
@@ -2035,9 +2034,11 @@ class TestApiHotelBooking(StormxSystemVerification):
         event_date_jfk = self._get_event_date('America/New_York')
         event_date_jfk_day2 = event_date_jfk + datetime.timedelta(days=1)
         event_date_jfk_day3 = event_date_jfk + datetime.timedelta(days=2)
-        self.add_hotel_availability(hotel_id_jfk.split('-')[1], 294, event_date_jfk, ap_block_type=1, block_price='100.99', blocks=5, pay_type='0')
-        self.add_hotel_availability(hotel_id_jfk.split('-')[1], 294, event_date_jfk_day2, ap_block_type=1, block_price='100.99', blocks=5, pay_type='0')
-        self.add_hotel_availability(hotel_id_jfk.split('-')[1], 294, event_date_jfk_day3, ap_block_type=1, block_price='100.99', blocks=5, pay_type='0')
+        self.seed_inventory([
+            dict(hotel_id=hotel_id_jfk.split('-')[1], airline_id=294, availability_date=availability_date,
+                 ap_block_type=1, block_price='100.99', blocks=5, pay_type='0')
+            for availability_date in (event_date_jfk, event_date_jfk_day2, event_date_jfk_day3)
+        ], resolve_block_ids=False)
 
         # setup some variables
         room_count = 1
@@ -2046,7 +2047,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         check_out_date = (event_date_jfk_day3 + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=JFK&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_jfk, hotel_ids)
 
@@ -2062,7 +2063,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -2092,7 +2093,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         ])
 
         # get an inventory and validate passenger noteis empty string
-        hotel_response = requests.get(hotel_url + '?room_count=1&port='+ port +'&provider=ean', headers=headers).json()
+        hotel_response = http_client.get(hotel_url + '?room_count=1&port='+ port +'&provider=ean', headers=headers).json()
         self.assertGreater(len(hotel_response['data']), 0, msg='no expedia inventory for port ' + repr(port))
         for hotel in hotel_response['data']:
             self.assertIn('passenger_note', hotel)
@@ -2104,13 +2105,13 @@ class TestApiHotelBooking(StormxSystemVerification):
         booking_payload = dict(hotel_id=hotel_id1, room_count=1, context_ids=[passenger['context_id'] for passenger in passengers])
 
         # book hotel validate response, and validate full state for booking
-        booking_resp = requests.post(url=hotel_url, headers=headers, json=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_resp.status_code, 200)
         booking_resp_json = booking_resp.json()['data']['hotel_voucher']
         self.assertEqual(booking_resp_json['hotel_id'], hotel_id1)
         self.assertIn('passenger_note', booking_resp_json)
         self.assertEqual(booking_resp_json['passenger_note'], expected_passenger_note)
-        full_state_resp = requests.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()['data']
         self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['hotel_id'], hotel_id1)
@@ -2150,7 +2151,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         # validate passenger notes
         validated_hotel1_passenger_note = False
         validated_hotel2_passenger_note = False
-        hotel_response = requests.get(hotel_url + '?room_count=1&port=LAX', headers=headers).json()
+        hotel_response = http_client.get(hotel_url + '?room_count=1&port=LAX', headers=headers).json()
         for hotel in hotel_response['data']:
             self.assertIn('passenger_note', hotel)
             if hotel['hotel_id'] == 'tvl-' + str(hotel_id1):
@@ -2164,7 +2165,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         # validate passenger notes are port specific
         validated_hotel_passenger_note = False
-        hotel_response = requests.get(hotel_url + '?room_count=1&port=SNA', headers=headers).json()
+        hotel_response = http_client.get(hotel_url + '?room_count=1&port=SNA', headers=headers).json()
         for hotel in hotel_response['data']:
             self.assertIn('passenger_note', hotel)
             if hotel['hotel_id'] == 'tvl-' + str(hotel_id1):
@@ -2183,13 +2184,13 @@ class TestApiHotelBooking(StormxSystemVerification):
         booking_payload3 = dict(hotel_id='tvl-' + str(hotel_id1), room_count=1, context_ids=[passenger['context_id'] for passenger in passengers3])
 
         # book hotel validate response, and validate full state for booking 1
-        booking_resp = requests.post(url=hotel_url, headers=headers, json=booking_payload1)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, json=booking_payload1)
         self.assertEqual(booking_resp.status_code, 200)
         booking_resp_json = booking_resp.json()['data']['hotel_voucher']
         self.assertEqual(booking_resp_json['hotel_id'], 'tvl-' + str(hotel_id1))
         self.assertIn('passenger_note', booking_resp_json)
         self.assertEqual(booking_resp_json['passenger_note'], '')
-        full_state_resp = requests.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passengers[0]['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()['data']
         self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['hotel_id'], 'tvl-' + str(hotel_id1))
@@ -2197,13 +2198,13 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['passenger_note'], '')
 
         # book hotel validate response, and validate full state for booking 2
-        booking_resp = requests.post(url=hotel_url, headers=headers, json=booking_payload2)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, json=booking_payload2)
         self.assertEqual(booking_resp.status_code, 200)
         booking_resp_json = booking_resp.json()['data']['hotel_voucher']
         self.assertEqual(booking_resp_json['hotel_id'], 'tvl-' + str(hotel_id2))
         self.assertIn('passenger_note', booking_resp_json)
         self.assertEqual(booking_resp_json['passenger_note'], expected_passenger_note)
-        full_state_resp = requests.get(url=passenger_url + passengers2[0]['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passengers2[0]['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()['data']
         self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['hotel_id'], 'tvl-' + str(hotel_id2))
@@ -2211,13 +2212,13 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['passenger_note'], expected_passenger_note)
 
         # book hotel validate response, and validate full state for booking 3
-        booking_resp = requests.post(url=hotel_url, headers=headers, json=booking_payload3)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, json=booking_payload3)
         self.assertEqual(booking_resp.status_code, 200)
         booking_resp_json = booking_resp.json()['data']['hotel_voucher']
         self.assertEqual(booking_resp_json['hotel_id'], 'tvl-' + str(hotel_id1))
         self.assertIn('passenger_note', booking_resp_json)
         self.assertEqual(booking_resp_json['passenger_note'], expected_passenger_note2)
-        full_state_resp = requests.get(url=passenger_url + passengers3[0]['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passengers3[0]['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()['data']
         self.assertEqual(full_state_resp_json['voucher']['hotel_voucher']['hotel_id'], 'tvl-' + str(hotel_id1))
@@ -2237,7 +2238,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             life_stage='child'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2267,7 +2268,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         passenger_payload = self._generate_n_passenger_payload(1)
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2291,25 +2292,25 @@ class TestApiHotelBooking(StormxSystemVerification):
             'room_count': 5
         }
 
-        hotel_resp1 = requests.post(url=passenger_hotel_url, data=booking_payload)
+        hotel_resp1 = http_client.post(url=passenger_hotel_url, data=booking_payload)
         self.assertEqual(hotel_resp1.status_code, 400)
         hotel_resp_json = hotel_resp1.json()
         log_error_system_tests_output(pretty_print_json(hotel_resp_json))
         self._validate_error_message(hotel_resp_json, 400, 'Bad Request', 'MAX_ROOMS_EXCEEDED', 'Rooms requested exceeds max rooms allowed.', [])
 
-        hotel_resp2 = requests.post(url=passenger_hotel_url, data=bad_booking_payload)
+        hotel_resp2 = http_client.post(url=passenger_hotel_url, data=bad_booking_payload)
         self.assertEqual(hotel_resp2.status_code, 400)
         hotel_resp_json = hotel_resp2.json()
         log_error_system_tests_output(pretty_print_json(hotel_resp_json))
         self._validate_error_message(hotel_resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', expected_error_message_airline_rooms)
 
-        hotel_resp3 = requests.post(url=airline_hotel_url, data=bad_booking_payload, headers=headers)
+        hotel_resp3 = http_client.post(url=airline_hotel_url, data=bad_booking_payload, headers=headers)
         self.assertEqual(hotel_resp3.status_code, 400)
         hotel_resp_json = hotel_resp3.json()
         log_error_system_tests_output(pretty_print_json(hotel_resp_json))
         self._validate_error_message(hotel_resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', expected_error_message_airline_rooms)
 
-        hotel_resp4 = requests.post(url=airline_hotel_url, data=booking_payload, headers=headers)
+        hotel_resp4 = http_client.post(url=airline_hotel_url, data=booking_payload, headers=headers)
         self.assertEqual(hotel_resp4.status_code, 200)
         hotel_resp_json = hotel_resp4.json()['data']
         self.assertEqual(len(hotel_resp_json['passengers']), 1)
@@ -2330,7 +2331,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'context_ids': ['conny']
         }
 
-        resp = requests.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
         self.assertEqual(resp.status_code, 400, '')
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', [{'field': 'hotel_id', 'message': 'invalid hotel_id'}])
@@ -2341,7 +2342,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'context_ids': ['conny']
         }
 
-        resp = requests.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
         self.assertEqual(resp.status_code, 400, '')
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', [{'field': 'hotel_id', 'message': 'invalid hotel_id'}])
@@ -2352,7 +2353,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'context_ids': ['conny']
         }
 
-        resp = requests.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
         self.assertEqual(resp.status_code, 400, '')
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', [{'field': 'hotel_id', 'message': 'invalid hotel_id'}])
@@ -2363,7 +2364,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'context_ids': ['conny']
         }
 
-        resp = requests.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
         self.assertEqual(resp.status_code, 400, '')
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', [{'field': 'hotel_id', 'message': 'invalid hotel_id'}])
@@ -2374,7 +2375,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'context_ids': ['conny']
         }
 
-        resp = requests.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/hotels', headers=headers, data=payload)
         self.assertEqual(resp.status_code, 400, '')
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', [{'field': 'hotel_id', 'message': 'invalid hotel_id'}])
@@ -2396,13 +2397,13 @@ class TestApiHotelBooking(StormxSystemVerification):
             'room_count': 1
         }
 
-        response = requests.post(url, headers=headers, json=payload)
+        response = http_client.post(url, headers=headers, json=payload)
         self.assertEqual(response.status_code, 404)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 404, 'Not Found', 'HOTEL_NOT_FOUND', 'Hotel not found for hotel_id: tvl-999999999', [])
 
-        response = requests.post(offer_url + '?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2'], json=payload)
+        response = http_client.post(offer_url + '?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2'], json=payload)
         self.assertEqual(response.status_code, 404)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2425,7 +2426,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'room_count': 1
         }
 
-        response = requests.post(url, headers=headers, json=payload)
+        response = http_client.post(url, headers=headers, json=payload)
         self.assertEqual(response.status_code, 400)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2435,7 +2436,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(response_json['meta']['message'], 'Bad Request')
         self.assertEqual(response_json['meta']['error_code'], 'PASSENGER_INVALID_STATUS')
 
-        response = requests.post(offer_url + '?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2'], json=payload)
+        response = http_client.post(offer_url + '?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2'], json=payload)
         self.assertEqual(response.status_code, 401)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2458,7 +2459,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'room_count': 1
         }
 
-        response = requests.post(url, headers=headers, json=payload)
+        response = http_client.post(url, headers=headers, json=payload)
         self.assertEqual(response.status_code, 400)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2480,7 +2481,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'room_count': 1
         }
 
-        response = requests.post(url, headers=headers, json=payload)
+        response = http_client.post(url, headers=headers, json=payload)
         self.assertEqual(response.status_code, 404)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2501,7 +2502,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'room_count': 1
         }
 
-        response = requests.post(url + '?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2'], json=payload)
+        response = http_client.post(url + '?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2'], json=payload)
         self.assertEqual(response.status_code, 400)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2519,7 +2520,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         headers = self._generate_airline_headers(customer)
         passenger_payload = self._generate_n_passenger_payload(1)
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -2537,14 +2538,14 @@ class TestApiHotelBooking(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         self.assertIn('hotel_on_airport', booking_response.json()['data']['hotel_voucher'])
         self.assertNotIn('property_code', booking_response.json()['data']['hotel_voucher'])
 
         voucher_url = self._api_host + '/api/v1/voucher/' + str(booking_response.json()['data']['voucher_id'])
 
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         voucher_resp_json = voucher_resp.json()
         self.assertEqual(voucher_resp_json['error'], False)
         self.assertEqual(voucher_resp.status_code, 200)
@@ -2553,7 +2554,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertNotIn('property_code', voucher_resp_json['data']['hotel_voucher'])
         self.assertEqual(voucher_resp_json['data']['hotel_voucher']['fees'], [])
 
-        full_state = requests.get(url=offer_url + '/' + passenger['context_id'] + '/state', headers=headers).json()
+        full_state = http_client.get(url=offer_url + '/' + passenger['context_id'] + '/state', headers=headers).json()
         self.assertIn('hotel_on_airport', full_state['data']['voucher']['hotel_voucher'])
         self.assertNotIn('property_code', full_state['data']['voucher']['hotel_voucher'])
         self.assertEqual(full_state['data']['voucher']['hotel_voucher']['fees'], [])
@@ -2576,19 +2577,19 @@ class TestApiHotelBooking(StormxSystemVerification):
             number_of_nights='a string'
         )
 
-        resp = requests.post(url=hotel_url, headers=headers, json=payload)
+        resp = http_client.post(url=hotel_url, headers=headers, json=payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', [{'field': 'number_of_nights', 'message': 'A valid integer is required.'}])
 
         payload['number_of_nights'] = 0
-        resp = requests.post(url=hotel_url, headers=headers, json=payload)
+        resp = http_client.post(url=hotel_url, headers=headers, json=payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', [{'field': 'number_of_nights', 'message': 'Ensure this value is greater than or equal to 1.'}])
 
         payload['number_of_nights'] = 10
-        resp = requests.post(url=hotel_url, headers=headers, json=payload)
+        resp = http_client.post(url=hotel_url, headers=headers, json=payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel booking.', [{'field': 'number_of_nights', 'message': 'Ensure this value is less than or equal to 7.'}])
@@ -2604,7 +2605,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         passenger_url = self._api_host + '/api/v1/passenger'
 
         # verify no inventory
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2615,7 +2616,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.add_hotel_availability(98771, 71, event_date, ap_block_type=1, block_price='75.00', blocks=1, pay_type='0')
 
         # search for handicap rooms and ensure you get ROH
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2629,7 +2630,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             handicap=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2641,7 +2642,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         )
 
         # booking a handicap pax on ROH inv
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
@@ -2649,13 +2650,13 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(hotel_voucher['hotel_id'], hotel_id)
 
         # full state verify booking success and pax is handicap
-        full_state = requests.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
+        full_state = http_client.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
         hotel_voucher = full_state['data']['voucher']['hotel_voucher']
         self.assertEqual(hotel_voucher['hotel_id'], hotel_id)
         self.assertEqual(full_state['data']['passenger']['handicap'], True)
 
         # verify no inventory
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2671,7 +2672,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         passengers = self._create_2_passengers(customer=customer)
 
-        hotel_response = requests.get(hotel_url + '?room_count=1&port=LAX&provider=tvl', headers=headers)
+        hotel_response = http_client.get(hotel_url + '?room_count=1&port=LAX&provider=tvl', headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertGreater(len(hotel_response_json['data']), 0)
@@ -2684,7 +2685,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_response = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         tvl_voucher = booking_response_json['data']
@@ -2705,7 +2706,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         port = 'PHX'
 
         passengers = self._generate_n_passenger_payload(1, port_accommodation=port, life_stage='young_adult')
-        import_response = requests.post(self._api_host + '/api/v1/passenger', headers=headers, json=passengers)
+        import_response = http_client.post(self._api_host + '/api/v1/passenger', headers=headers, json=passengers)
         self.assertEqual(import_response.status_code, 201)
         passengers = import_response.json()['data']
 
@@ -2715,7 +2716,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             'provider': 'tvl'
         }
 
-        hotel_response = requests.get(hotel_url, headers=headers, params=query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=headers, params=query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertGreater(len(hotel_response_json['data']), 0,
@@ -2729,7 +2730,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_response = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
         if booking_response.status_code != 200:
             self.fail('unexpected response: ' + str(booking_response.status_code) + ' ' + booking_response.text)
         self.assertEqual(booking_response.status_code, 200)
@@ -2765,7 +2766,7 @@ class TestApiHotelBooking(StormxSystemVerification):
                 try:
                     passengers = self._create_2_passengers(customer=customer, port_accommodation=port)
 
-                    hotel_response = requests.get(hotel_url + '?room_count=1&port=' + port + '&provider=' + provider,
+                    hotel_response = http_client.get(hotel_url + '?room_count=1&port=' + port + '&provider=' + provider,
                                                   headers=headers)
                     self.assertEqual(hotel_response.status_code, 200)
                     hotel_response_json = hotel_response.json()
@@ -2779,7 +2780,7 @@ class TestApiHotelBooking(StormxSystemVerification):
                         room_count=1
                     )
 
-                    booking_response = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+                    booking_response = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
                     self.assertEqual(booking_response.status_code, 200)
 
                     booking_response_json = booking_response.json()
@@ -2866,7 +2867,7 @@ class TestApiHotelBooking(StormxSystemVerification):
             passengers_payload_group_2[0], passengers_payload_group_2[1]
         ]
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertEqual(len(resp_json['data']), 4)
@@ -2907,7 +2908,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         voucher_id2 = passenger_3['voucher_id']
 
         voucher_id = passenger_3['voucher_id']
-        voucher_resp = requests.get(url=voucher_url + voucher_id, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url + voucher_id, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
         self.assertEqual(len(voucher_resp_json['data']['passengers']), 2)
@@ -2966,7 +2967,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         voucher_id1 = booking_response_data['voucher_id']
 
         # validate voucher 1
-        voucher_resp = requests.get(url=voucher_url + voucher_id1, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url + voucher_id1, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
 
@@ -3005,7 +3006,7 @@ class TestApiHotelBooking(StormxSystemVerification):
 
         # validate all passengers via full state
         # passenger 1
-        full_state_resp = requests.get(url=passenger_url + passenger_1['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passenger_1['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         passenger_1 = full_state_resp_json['data']
@@ -3031,7 +3032,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertLess(datetime.datetime.strptime(meal_1['active_to'], '%Y-%m-%d %H:%M'), datetime.datetime.strptime(meal_2['active_to'], '%Y-%m-%d %H:%M'))
 
         # passenger 2
-        full_state_resp = requests.get(url=passenger_url + passenger_2['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passenger_2['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         passenger_2 = full_state_resp_json['data']
@@ -3042,7 +3043,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(passenger_1['passenger']['voucher_id'], voucher_id1)
 
         # passenger 3
-        full_state_resp = requests.get(url=passenger_url + passenger_3['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passenger_3['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         passenger_3 = full_state_resp_json['data']
@@ -3055,7 +3056,7 @@ class TestApiHotelBooking(StormxSystemVerification):
         self.assertEqual(passenger_3['passenger']['voucher_id'], voucher_id2)
 
         # passenger 4
-        full_state_resp = requests.get(url=passenger_url + passenger_4['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + passenger_4['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         passenger_4 = full_state_resp_json['data']
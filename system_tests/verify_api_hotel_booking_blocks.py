@@ -2,7 +2,7 @@ import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
 
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import StormxSystemVerification
 
@@ -11,7 +11,6 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
     """
     Verify hotel bookings with a focus on correct block prioritization.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -61,7 +60,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertIsNotNone(expected_block_obj)
         self.assertEqual(expected_block_obj['ap_block'], '2')
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1', headers=headers).json()['data']
         self.assertEqual(len(hotels), 3)
 
         # validate hotel sort order and values
@@ -89,7 +88,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
             hotel_id=hotel_id_2
         )
 
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
         voucher = hotel_booking_resp.json()['data']
         self.assertEqual(voucher['hotel_voucher']['hotel_id'], hotel_id_2)
@@ -116,7 +115,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertIsNotNone(expected_block_obj)
         self.assertEqual(expected_block_obj['ap_block'], '1')
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1', headers=headers).json()['data']
         self.assertEqual(len(hotels), 3)
 
         self.assertEqual(hotels[0]['hotel_id'], hotel_id_2)
@@ -166,7 +165,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertEqual(response_json['success'], '1')
         self.assertIsNotNone(response_json['voucher']['voucher_id'])
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl', headers=headers)
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl', headers=headers)
         self.assertEqual(hotels.status_code, 200)
         self.assertEqual(len(hotels.json()['data']), 0)
 
@@ -220,7 +219,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertIsNotNone(expected_block_obj2)
         self.assertEqual(expected_block_obj2['ap_block'], '2')
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=3', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=3', headers=headers).json()['data']
         self.assertEqual(len(hotels), 2)
 
         # validate hotel sort order and values
@@ -246,7 +245,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         validated_block1 = False
         validated_block2 = False
         expected_total_amount = Decimal('0.00')
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
         voucher = hotel_booking_resp.json()['data']
         self.assertEqual(voucher['hotel_voucher']['hotel_id'], hotel_id_2)
@@ -289,7 +288,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertIsNotNone(expected_block_obj2)
         self.assertEqual(expected_block_obj2['ap_block'], '1')
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1', headers=headers).json()['data']
         self.assertEqual(len(hotels), 3)
 
         self.assertEqual(hotels[0]['hotel_id'], hotel_id_2)
@@ -350,7 +349,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertEqual(response_json['success'], '1')
         self.assertIsNotNone(response_json['voucher']['voucher_id'])
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl', headers=headers)
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl', headers=headers)
         self.assertEqual(hotels.status_code, 200)
         self.assertEqual(len(hotels.json()['data']), 0)
 
@@ -417,10 +416,10 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertEqual(expected_block_obj['ap_block'], '2')
         self.assertIsNone(expected_block_obj2)  # TODO: need service to grab next day inventory blocks
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1', headers=headers).json()['data']
         self.assertEqual(len(hotels), 4)
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1&number_of_nights=2', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1&number_of_nights=2', headers=headers).json()['data']
         self.assertEqual(len(hotels), 3)
 
         # validate hotel sort order and values
@@ -458,7 +457,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         validated_block1 = False
         validated_block2 = False
         expected_total_amount = Decimal('0.00')
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
         voucher = hotel_booking_resp.json()['data']
         self.assertEqual(voucher['hotel_voucher']['hotel_id'], hotel_id_2)
@@ -501,7 +500,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertIsNone(expected_block_obj2)
         self.assertEqual(expected_block_obj['ap_block'], '1')
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1&number_of_nights=2', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1&number_of_nights=2', headers=headers).json()['data']
         self.assertEqual(len(hotels), 3)
 
         self.assertEqual(hotels[0]['hotel_id'], hotel_id_2)
@@ -552,7 +551,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
             number_of_nights=2
         )
 
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         response_json = self.create_quick_voucher(airline_id, hotel_id_2.split('-')[1], port_id,
@@ -571,7 +570,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
             number_of_nights=2
         )
 
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         passengers = self._create_2_passengers(customer, port_accommodation='FAT')
@@ -583,7 +582,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
             number_of_nights=2
         )
 
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         response_json = self.create_quick_voucher(airline_id, hotel_id_4.split('-')[1], port_id,
@@ -593,11 +592,11 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertEqual(response_json['success'], '1')
         self.assertIsNotNone(response_json['voucher']['voucher_id'])
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl', headers=headers)
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl', headers=headers)
         self.assertEqual(hotels.status_code, 200)
         self.assertEqual(len(hotels.json()['data']), 0)
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl&number_of_nights=2', headers=headers)
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl&number_of_nights=2', headers=headers)
         self.assertEqual(hotels.status_code, 200)
         self.assertEqual(len(hotels.json()['data']), 0)
 
@@ -672,10 +671,10 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertIsNone(expected_block_obj2)  # TODO: need service to grab next day inventory blocks
         self.assertIsNone(expected_block_obj3)  # TODO: need service to grab next day inventory blocks
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=2', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=2', headers=headers).json()['data']
         self.assertEqual(len(hotels), 4)
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=2&number_of_nights=2', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=2&number_of_nights=2', headers=headers).json()['data']
         self.assertEqual(len(hotels), 3)
 
         # validate hotel sort order and values
@@ -716,7 +715,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         validated_block2 = False
         validated_block3 = False
         expected_total_amount = Decimal('0.00')
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
         voucher = hotel_booking_resp.json()['data']
         self.assertEqual(voucher['hotel_voucher']['hotel_id'], hotel_id_2)
@@ -776,7 +775,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertIsNone(expected_block_obj2)  # TODO: need service to grab next day inventory blocks
         self.assertIsNone(expected_block_obj3)  # TODO: need service to grab next day inventory blocks
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=2&number_of_nights=2', headers=headers).json()['data']
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=2&number_of_nights=2', headers=headers).json()['data']
         self.assertEqual(len(hotels), 3)
 
         self.assertEqual(hotels[0]['hotel_id'], hotel_id_3)
@@ -840,7 +839,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
             number_of_nights=2
         )
 
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         response_json = self.create_quick_voucher(airline_id, hotel_id_2.split('-')[1], port_id,
@@ -859,7 +858,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
             number_of_nights=2
         )
 
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         passengers = self._create_2_passengers(customer, port_accommodation='FAT')
@@ -871,7 +870,7 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
             number_of_nights=2
         )
 
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         response_json = self.create_quick_voucher(airline_id, hotel_id_4.split('-')[1], port_id,
@@ -881,18 +880,18 @@ class TestApiHotelBookingBlocks(StormxSystemVerification):
         self.assertEqual(response_json['success'], '1')
         self.assertIsNotNone(response_json['voucher']['voucher_id'])
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl', headers=headers)
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl', headers=headers)
         self.assertEqual(hotels.status_code, 200)
         self.assertEqual(len(hotels.json()['data']), 0)
 
-        hotels = requests.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl&number_of_nights=2', headers=headers)
+        hotels = http_client.get(url=hotels_url + '?port=FAT&room_count=1&provider=tvl&number_of_nights=2', headers=headers)
         self.assertEqual(hotels.status_code, 200)
         self.assertEqual(len(hotels.json()['data']), 0)
 
         validated_block1 = False
         validated_block2 = False
         validated_block3 = False
-        full_state = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         room_vouchers = full_state['voucher']['hotel_voucher']['room_vouchers']
         for room_voucher in room_vouchers:
             if room_voucher['rate'] == '70.00':
@@ -1,4 +1,4 @@
-import requests
+from stormx_http import http_client
 from uuid import UUID
 
 from StormxApp.tests.data_utilities import (
@@ -17,7 +17,6 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
     """
     Verify voucher cancellation.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -41,7 +40,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             phone_numbers=['+12223334444']
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passengers = import_response_json['data']
@@ -61,7 +60,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         booking_response_json = booking_response.json()['data']
@@ -75,7 +74,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         passenger2 = booking_response_json['passengers'][1]
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -92,13 +91,13 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['hotel_accommodation_status'], 'canceled_voucher')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger1['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger2['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
@@ -113,7 +112,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         headers = self._generate_airline_headers(customer)
 
         passenger_payload = self._generate_n_passenger_payload(3)
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -130,7 +129,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         for passenger in booking_response.json()['data']['passengers']:
@@ -145,7 +144,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertIsNone(passenger['canceled_date'])
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -174,7 +173,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['canceled_date'], expected_canceled_date)
             self.assertIsNone(passenger['declined_date'])
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + voucher_id, headers=headers)
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + voucher_id, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
         for passenger in voucher_resp_json['data']['passengers']:
@@ -189,7 +188,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertIsNone(passenger['declined_date'])
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(get_passenger_response['data']['transport_accommodation_status'], None)
@@ -201,7 +200,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNone(get_passenger_response['data']['declined_date'])
 
         get_passenger_url2 = self._api_host + '/api/v1/passenger/' + passenger2['context_id']
-        get_passenger_response2 = requests.get(url=get_passenger_url2, headers=headers).json()
+        get_passenger_response2 = http_client.get(url=get_passenger_url2, headers=headers).json()
         self.assertEqual(get_passenger_response2['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response2['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(get_passenger_response2['data']['transport_accommodation_status'], None)
@@ -213,7 +212,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNone(get_passenger_response2['data']['declined_date'])
 
         get_passenger_url3 = self._api_host + '/api/v1/passenger/' + passenger3['context_id']
-        get_passenger_response3 = requests.get(url=get_passenger_url3, headers=headers).json()
+        get_passenger_response3 = http_client.get(url=get_passenger_url3, headers=headers).json()
         self.assertEqual(get_passenger_response3['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response3['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(get_passenger_response3['data']['transport_accommodation_status'], None)
@@ -234,7 +233,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         headers = self._generate_airline_headers(customer)
 
         passenger_payload = self._generate_n_passenger_payload(3)
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -247,7 +246,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['transport_accommodation_status'], None)
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -265,19 +264,19 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['hotel_accommodation_status'], 'canceled_offer')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response['data']['transport_accommodation_status'], None)
 
         get_passenger_url2 = self._api_host + '/api/v1/passenger/' + passenger2['context_id']
-        get_passenger_response2 = requests.get(url=get_passenger_url2, headers=headers).json()
+        get_passenger_response2 = http_client.get(url=get_passenger_url2, headers=headers).json()
         self.assertEqual(get_passenger_response2['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response2['data']['meal_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response2['data']['transport_accommodation_status'], None)
 
         get_passenger_url3 = self._api_host + '/api/v1/passenger/' + passenger3['context_id']
-        get_passenger_response3 = requests.get(url=get_passenger_url3, headers=headers).json()
+        get_passenger_response3 = http_client.get(url=get_passenger_url3, headers=headers).json()
         self.assertEqual(get_passenger_response3['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response3['data']['meal_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response3['data']['transport_accommodation_status'], None)
@@ -302,7 +301,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -319,11 +318,11 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -341,19 +340,19 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['hotel_accommodation_status'], 'canceled_voucher')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'not_offered')
         self.assertEqual(get_passenger_response['data']['transport_accommodation_status'], None)
 
         get_passenger_url2 = self._api_host + '/api/v1/passenger/' + passenger2['context_id']
-        get_passenger_response2 = requests.get(url=get_passenger_url2, headers=headers).json()
+        get_passenger_response2 = http_client.get(url=get_passenger_url2, headers=headers).json()
         self.assertEqual(get_passenger_response2['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response2['data']['meal_accommodation_status'], 'not_offered')
         self.assertEqual(get_passenger_response2['data']['transport_accommodation_status'], None)
 
         get_passenger_url3 = self._api_host + '/api/v1/passenger/' + passenger3['context_id']
-        get_passenger_response3 = requests.get(url=get_passenger_url3, headers=headers).json()
+        get_passenger_response3 = http_client.get(url=get_passenger_url3, headers=headers).json()
         self.assertEqual(get_passenger_response3['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response3['data']['meal_accommodation_status'], 'not_offered')
         self.assertEqual(get_passenger_response3['data']['transport_accommodation_status'], None)
@@ -378,7 +377,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -386,7 +385,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         passenger3 = import_response_json['data'][2]
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -404,19 +403,19 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['hotel_accommodation_status'], 'canceled_offer')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'not_offered')
         self.assertEqual(get_passenger_response['data']['transport_accommodation_status'], None)
 
         get_passenger_url2 = self._api_host + '/api/v1/passenger/' + passenger2['context_id']
-        get_passenger_response2 = requests.get(url=get_passenger_url2, headers=headers).json()
+        get_passenger_response2 = http_client.get(url=get_passenger_url2, headers=headers).json()
         self.assertEqual(get_passenger_response2['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response2['data']['meal_accommodation_status'], 'not_offered')
         self.assertEqual(get_passenger_response2['data']['transport_accommodation_status'], None)
 
         get_passenger_url3 = self._api_host + '/api/v1/passenger/' + passenger3['context_id']
-        get_passenger_response3 = requests.get(url=get_passenger_url3, headers=headers).json()
+        get_passenger_response3 = http_client.get(url=get_passenger_url3, headers=headers).json()
         self.assertEqual(get_passenger_response3['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response3['data']['meal_accommodation_status'], 'not_offered')
         self.assertEqual(get_passenger_response3['data']['transport_accommodation_status'], None)
@@ -435,7 +434,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -454,7 +453,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         booking_response_json_pax_data = booking_response.json()['data']['passengers'][0]
@@ -463,7 +462,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertEqual(booking_response_json_pax_data['transport_accommodation_status'], None)
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -484,12 +483,12 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['hotel_accommodation_status'], 'canceled_voucher')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'not_offered')
         self.assertEqual(get_passenger_response['data']['transport_accommodation_status'], None)
 
-        canceled_state_resp = requests.get(url=get_passenger_url + '/state', headers=headers).json()
+        canceled_state_resp = http_client.get(url=get_passenger_url + '/state', headers=headers).json()
         self.assertEqual(canceled_state_resp['data']['passenger']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(canceled_state_resp['data']['voucher']['status'], 'canceled')
         self.assertIsNotNone(canceled_state_resp['data']['voucher']['hotel_voucher'])
@@ -507,13 +506,13 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -531,7 +530,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['hotel_accommodation_status'], 'canceled_offer')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'not_offered')
         self.assertEqual(get_passenger_response['data']['transport_accommodation_status'], None)
@@ -549,7 +548,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             pax_record_locator_group=generate_pax_record_locator_group()
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
 
         passenger = passenger_payload[0]
@@ -557,7 +556,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         passenger3 = passenger_payload[2]
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -575,19 +574,19 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             self.assertEqual(passenger['hotel_accommodation_status'], 'canceled_offer')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response['data']['transport_accommodation_status'], None)
 
         get_passenger_url2 = self._api_host + '/api/v1/passenger/' + passenger2['context_id']
-        get_passenger_response2 = requests.get(url=get_passenger_url2, headers=headers).json()
+        get_passenger_response2 = http_client.get(url=get_passenger_url2, headers=headers).json()
         self.assertEqual(get_passenger_response2['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response2['data']['meal_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response2['data']['transport_accommodation_status'], None)
 
         get_passenger_url3 = self._api_host + '/api/v1/passenger/' + passenger3['context_id']
-        get_passenger_response3 = requests.get(url=get_passenger_url3, headers=headers).json()
+        get_passenger_response3 = http_client.get(url=get_passenger_url3, headers=headers).json()
         self.assertEqual(get_passenger_response3['data']['hotel_accommodation_status'], 'offered')
         self.assertEqual(get_passenger_response3['data']['meal_accommodation_status'], 'offered')
         self.assertEqual(get_passenger_response3['data']['transport_accommodation_status'], None)
@@ -609,7 +608,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNotNone(passenger['voucher_id'])
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         cancel_resp_json = cancel_resp.json()
         self.assertEqual(cancel_resp.status_code, 400)
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
@@ -624,14 +623,14 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         customer = 'Purple Rain Airlines'
         headers = self._generate_airline_headers(customer)
 
-        passengers = self._create_2_passengers(customer)
+        passengers = self._lease_2_passengers(customer)
         passenger = passengers[0]
         self.assertEqual(passenger['meal_accommodation_status'], 'offered')
         self.assertEqual(passenger['hotel_accommodation_status'], 'offered')
         self.assertIsNone(passenger['transport_accommodation_status'])
 
         deny_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/decline?include_pnr=true&meals=true'
-        deny_resp = requests.put(url=deny_url, headers=headers)
+        deny_resp = http_client.put(url=deny_url, headers=headers)
         self.assertEqual(deny_resp.status_code, 200)
 
         deny_resp_json = deny_resp.json()
@@ -641,7 +640,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNone(deny_resp_json['data']['passengers'][0]['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 400)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
@@ -656,14 +655,14 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         customer = 'Purple Rain Airlines'
         headers = self._generate_airline_headers(customer)
 
-        passengers = self._create_2_passengers(customer)
+        passengers = self._lease_2_passengers(customer)
         passenger = passengers[0]
         self.assertEqual(passenger['meal_accommodation_status'], 'offered')
         self.assertEqual(passenger['hotel_accommodation_status'], 'offered')
         self.assertIsNone(passenger['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 200)
 
         cancel_resp_json = cancel_resp.json()
@@ -673,7 +672,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNone(cancel_resp_json['data']['passengers'][0]['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 400)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
@@ -696,7 +695,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNotNone(passenger['voucher_id'])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 400)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
@@ -711,14 +710,14 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         customer = 'Purple Rain Airlines'
         headers = self._generate_airline_headers(customer)
 
-        passengers = self._create_2_passengers(customer)
+        passengers = self._lease_2_passengers(customer)
         passenger = passengers[0]
         self.assertEqual(passenger['meal_accommodation_status'], 'offered')
         self.assertEqual(passenger['hotel_accommodation_status'], 'offered')
         self.assertIsNone(passenger['transport_accommodation_status'])
 
         deny_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/decline?include_pnr=true&meals=true'
-        deny_resp = requests.put(url=deny_url, headers=headers)
+        deny_resp = http_client.put(url=deny_url, headers=headers)
         self.assertEqual(deny_resp.status_code, 200)
 
         deny_resp_json = deny_resp.json()
@@ -728,7 +727,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNone(deny_resp_json['data']['passengers'][0]['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 400)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
@@ -743,14 +742,14 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         customer = 'Purple Rain Airlines'
         headers = self._generate_airline_headers(customer)
 
-        passengers = self._create_2_passengers(customer)
+        passengers = self._lease_2_passengers(customer)
         passenger = passengers[0]
         self.assertEqual(passenger['meal_accommodation_status'], 'offered')
         self.assertEqual(passenger['hotel_accommodation_status'], 'offered')
         self.assertIsNone(passenger['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 200)
 
         cancel_resp_json = cancel_resp.json()
@@ -760,7 +759,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNone(cancel_resp_json['data']['passengers'][0]['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 400)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
@@ -780,35 +779,35 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         passenger2 = passengers[1]
 
         cancel_url = self._api_host + '/api/v1/offer/cancel'
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 401)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
         self._validate_error_message(cancel_resp_json, 401, expected_401_message, '', '', [])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passenger['ak1']
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 401)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
         self._validate_error_message(cancel_resp_json, 401, expected_401_message, '', '', [])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak2=' + passenger['ak2']
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 401)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
         self._validate_error_message(cancel_resp_json, 401, expected_401_message, '', '', [])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=googoogaga' + '&ak2=' + passenger2['ak2']
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 401)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
         self._validate_error_message(cancel_resp_json, 401, expected_401_message, '', '', [])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passenger['ak1'] + '&ak2=' + passenger2['ak2']
-        cancel_resp = requests.put(url=cancel_url, headers=headers)
+        cancel_resp = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_resp.status_code, 401)
         cancel_resp_json = cancel_resp.json()
         log_error_system_tests_output(pretty_print_json(cancel_resp_json))
@@ -830,7 +829,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             phone_numbers=[]
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -849,7 +848,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         booking_response_json = booking_response.json()['data']
@@ -858,7 +857,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertIsNone(booking_response_json['passengers'][0]['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -874,7 +873,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertEqual(canceled_passengers[0]['hotel_accommodation_status'], 'canceled_voucher')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'not_offered')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
@@ -896,7 +895,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
 
         passengers = self._create_2_passengers(customer=customer, port_accommodation=port)
 
-        hotel_response = requests.get(hotel_url + '?room_count=1&port=' + port + '&provider=ean', headers=headers)
+        hotel_response = http_client.get(hotel_url + '?room_count=1&port=' + port + '&provider=ean', headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertGreater(len(hotel_response_json['data']), 0, msg='no expedia inventory for ' + repr(port))
@@ -909,7 +908,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_response = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertEqual(booking_response_json['meta']['error_code'], '')
@@ -925,7 +924,7 @@ class TestApiHotelBookingCancel(StormxSystemVerification):
         self.assertEqual({passenger['context_id'] for passenger in passengers},
                          {passenger['context_id'] for passenger in ean_voucher['passengers']})
 
-        cancel_response = requests.put(url=passenger_url + '/' + passengers[0]['context_id'] + '/cancel',
+        cancel_response = http_client.put(url=passenger_url + '/' + passengers[0]['context_id'] + '/cancel',
                                        headers=headers)
         self.assertEqual(cancel_response.status_code, 400)
         self._validate_error_message(cancel_response.json(), 400, 'Bad Request', 'PASSENGER_CANNOT_CANCEL',
@@ -3,7 +3,7 @@ import copy
 import json
 import unittest
 
-import requests
+from stormx_http import http_client
 
 from StormxApp.tests.data_utilities import (
     generate_context_id,
@@ -32,7 +32,6 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
     """
     Verify functionality related to declining hotel offers.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -46,7 +45,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         customer = 'Purple Rain Airlines'
         headers = self._generate_airline_headers(customer=customer)
 
-        passengers = self._create_2_passengers(customer=customer)
+        passengers = self._lease_2_passengers(customer=customer)
         passenger = passengers[0]
         context_id = passenger['context_id']
         context_id2 = passengers[1]['context_id']
@@ -54,7 +53,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertTrue(context_id2)
         self.assertNotEqual(context_id, context_id2)
         url = url_template.format(context_id=context_id)
-        response = requests.put(url, headers=headers)
+        response = http_client.put(url, headers=headers)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.reason, 'OK')
         response_json = response.json()
@@ -78,7 +77,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             self.assertEqual(passenger['declined_date'], expected_declined_date)
             self.assertIsNone(passenger['canceled_date'])
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + voucher_id, headers=headers)
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + voucher_id, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
         for passenger in voucher_resp_json['data']['passengers']:
@@ -95,7 +94,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             self.assertIsNone(passenger['canceled_date'])
 
         passenger1_url = self._api_host + '/api/v1/passenger/' + context_id
-        pax1_resp = requests.get(passenger1_url, headers=headers)
+        pax1_resp = http_client.get(passenger1_url, headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         pax1_resp_json = pax1_resp.json()
         self.assertEqual(pax1_resp_json['data']['hotel_accommodation_status'], 'declined')
@@ -104,7 +103,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertEqual(pax1_resp_json['data']['declined_date'], expected_declined_date)
 
         passenger2_url = self._api_host + '/api/v1/passenger/' + context_id2
-        pax2_resp = requests.get(passenger2_url, headers=headers)
+        pax2_resp = http_client.get(passenger2_url, headers=headers)
         self.assertEqual(pax2_resp.status_code, 200)
         pax2_resp_json = pax2_resp.json()
         self.assertEqual(pax2_resp_json['data']['hotel_accommodation_status'], 'offered')
@@ -114,9 +113,9 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
 
         full_state_1 = self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=context_id)
         full_state_2 = self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=context_id2)
-        full_state_1_response = requests.get(full_state_1, headers=headers)
+        full_state_1_response = http_client.get(full_state_1, headers=headers)
         full_state_1_response_json = full_state_1_response.json()
-        full_state_2_response = requests.get(full_state_2, headers=headers)
+        full_state_2_response = http_client.get(full_state_2, headers=headers)
         full_state_2_response_json = full_state_2_response.json()
 
         self.assertEqual(full_state_1_response.status_code, 200)
@@ -139,7 +138,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         passenger_payload = self._generate_n_passenger_payload(1)
 
-        import_response_json = requests.post(passenger_url, headers=headers, json=passenger_payload).json()
+        import_response_json = http_client.post(passenger_url, headers=headers, json=passenger_payload).json()
 
         self.assertEqual(import_response_json['data'][0]['hotel_accommodation_status'], 'offered')
         self.assertEqual(import_response_json['data'][0]['meal_accommodation_status'], 'offered')
@@ -149,7 +148,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         ak2 = import_response_json['data'][0]['ak2']
 
         passenger_headers = self._generate_passenger_headers()
-        response = requests.put(decline_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=passenger_headers)
+        response = http_client.put(decline_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=passenger_headers)
         self.assertEqual(response.status_code, 200)
         decline_response_json = response.json()
         self.assertEqual(decline_response_json['data']['passengers'][0]['hotel_accommodation_status'], 'declined')
@@ -171,13 +170,13 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         passenger_payload[0].update({
             'hotel_accommodation': False
         })
-        import_response_json = requests.post(passenger_url, headers=headers, json=passenger_payload).json()
+        import_response_json = http_client.post(passenger_url, headers=headers, json=passenger_payload).json()
 
         ak1 = import_response_json['data'][0]['ak1']
         ak2 = import_response_json['data'][0]['ak2']
 
         passenger_headers = self._generate_passenger_headers()
-        response = requests.put(decline_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=passenger_headers)
+        response = http_client.put(decline_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=passenger_headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -198,12 +197,12 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             'hotel_accommodation': False
         })
 
-        import_response_json = requests.post(passenger_url, headers=headers, json=passenger_payload).json()
+        import_response_json = http_client.post(passenger_url, headers=headers, json=passenger_payload).json()
         self.assertEqual(import_response_json['meta']['status'], 201)
         context_id = import_response_json['data'][0]['context_id']
 
         decline_url = passenger_url + '/' + context_id + '/decline'
-        response = requests.put(decline_url, headers=headers)
+        response = http_client.put(decline_url, headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -220,13 +219,13 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         passenger_payload = self._generate_n_passenger_payload(2)
 
-        import_response_json = requests.post(passenger_url, headers=headers, json=passenger_payload).json()
+        import_response_json = http_client.post(passenger_url, headers=headers, json=passenger_payload).json()
 
         ak1 = import_response_json['data'][0]['ak1']
         ak2 = import_response_json['data'][0]['ak2']
 
         passenger_headers = self._generate_passenger_headers()
-        response = requests.put(decline_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=passenger_headers)
+        response = http_client.put(decline_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=passenger_headers)
         self.assertEqual(response.status_code, 200)
 
         for passenger in response.json()['data']['passengers']:
@@ -237,8 +236,8 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         passenger_1 = import_response_json['data'][0]
         passenger_2 = import_response_json['data'][1]
 
-        passenger_1_resp = requests.get(passenger_url + '/' + passenger_1['context_id'], headers=headers).json()
-        passenger_2_resp = requests.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
+        passenger_1_resp = http_client.get(passenger_url + '/' + passenger_1['context_id'], headers=headers).json()
+        passenger_2_resp = http_client.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
         self.assertEqual(passenger_1_resp['data']['hotel_accommodation_status'], 'declined')
         self.assertEqual(passenger_1_resp['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(passenger_1_resp['data']['transport_accommodation_status'], None)
@@ -248,7 +247,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
 
         voucher_id = passenger_1_resp['data']['voucher_id']
         voucher_url = self._api_host + '/api/v1/voucher/' + str(voucher_id)
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
 
         passengers = voucher_resp.json()['data']['passengers']
@@ -268,12 +267,12 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         passenger_payload = self._generate_n_passenger_payload(2)
 
-        import_response_json = requests.post(passenger_url, headers=headers, json=passenger_payload).json()
+        import_response_json = http_client.post(passenger_url, headers=headers, json=passenger_payload).json()
 
         passenger_1 = import_response_json['data'][0]
         passenger_2 = import_response_json['data'][1]
 
-        response = requests.put(passenger_url + '/' + passenger_1['context_id'] + '/decline?include_pnr=True', headers=headers)
+        response = http_client.put(passenger_url + '/' + passenger_1['context_id'] + '/decline?include_pnr=True', headers=headers)
         self.assertEqual(response.status_code, 200)
 
         voucher_json_data = response.json()['data']
@@ -287,8 +286,8 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             for meal in passenger['meal_vouchers']:
                 UUID(meal['id'], version=4)
 
-        passenger_1_resp = requests.get(passenger_url + '/' + passenger_1['context_id'], headers=headers).json()
-        passenger_2_resp = requests.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
+        passenger_1_resp = http_client.get(passenger_url + '/' + passenger_1['context_id'], headers=headers).json()
+        passenger_2_resp = http_client.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
         self.assertEqual(passenger_1_resp['data']['hotel_accommodation_status'], 'declined')
         self.assertEqual(passenger_1_resp['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(passenger_1_resp['data']['transport_accommodation_status'], None)
@@ -298,7 +297,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
 
         voucher_id = passenger_1_resp['data']['voucher_id']
         voucher_url = self._api_host + '/api/v1/voucher/' + str(voucher_id)
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
 
         passengers = voucher_resp.json()['data']['passengers']
@@ -324,23 +323,23 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         passenger_payload = self._generate_n_passenger_payload(4)
 
-        import_response_json = requests.post(passenger_url, headers=headers, json=passenger_payload).json()
+        import_response_json = http_client.post(passenger_url, headers=headers, json=passenger_payload).json()
 
         passenger_1 = import_response_json['data'][0]
         passenger_2 = import_response_json['data'][1]
         passenger_3 = import_response_json['data'][2]
         passenger_4 = import_response_json['data'][3]
 
-        response = requests.put(passenger_url + '/' + passenger_1['context_id'] + '/decline', headers=headers)
+        response = http_client.put(passenger_url + '/' + passenger_1['context_id'] + '/decline', headers=headers)
         self.assertEqual(response.status_code, 200)
         passengers = response.json()['data']['passengers']
         self.assertEqual(len(passengers), 1)
         self.assertEqual(passengers[0]['context_id'], passenger_1['context_id'])
 
-        passenger_1_resp = requests.get(passenger_url + '/' + passenger_1['context_id'], headers=headers).json()
-        passenger_2_resp = requests.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
-        passenger_3_resp = requests.get(passenger_url + '/' + passenger_3['context_id'], headers=headers).json()
-        passenger_4_resp = requests.get(passenger_url + '/' + passenger_4['context_id'], headers=headers).json()
+        passenger_1_resp = http_client.get(passenger_url + '/' + passenger_1['context_id'], headers=headers).json()
+        passenger_2_resp = http_client.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
+        passenger_3_resp = http_client.get(passenger_url + '/' + passenger_3['context_id'], headers=headers).json()
+        passenger_4_resp = http_client.get(passenger_url + '/' + passenger_4['context_id'], headers=headers).json()
         self.assertEqual(passenger_1_resp['data']['hotel_accommodation_status'], 'declined')
         self.assertEqual(passenger_1_resp['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(passenger_1_resp['data']['transport_accommodation_status'], None)
@@ -354,15 +353,15 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertEqual(passenger_4_resp['data']['meal_accommodation_status'], 'offered')
         self.assertEqual(passenger_4_resp['data']['transport_accommodation_status'], None)
 
-        response2 = requests.put(passenger_url + '/' + passenger_2['context_id'] + '/decline?include_pnr=False', headers=headers)
+        response2 = http_client.put(passenger_url + '/' + passenger_2['context_id'] + '/decline?include_pnr=False', headers=headers)
         self.assertEqual(response2.status_code, 200)
         passengers2 = response2.json()['data']['passengers']
         self.assertEqual(len(passengers2), 1)
         self.assertEqual(passengers2[0]['context_id'], passenger_2['context_id'])
 
-        passenger_2_resp = requests.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
-        passenger_3_resp = requests.get(passenger_url + '/' + passenger_3['context_id'], headers=headers).json()
-        passenger_4_resp = requests.get(passenger_url + '/' + passenger_4['context_id'], headers=headers).json()
+        passenger_2_resp = http_client.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
+        passenger_3_resp = http_client.get(passenger_url + '/' + passenger_3['context_id'], headers=headers).json()
+        passenger_4_resp = http_client.get(passenger_url + '/' + passenger_4['context_id'], headers=headers).json()
         self.assertEqual(passenger_2_resp['data']['hotel_accommodation_status'], 'declined')
         self.assertEqual(passenger_2_resp['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(passenger_2_resp['data']['transport_accommodation_status'], None)
@@ -373,15 +372,15 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertEqual(passenger_4_resp['data']['meal_accommodation_status'], 'offered')
         self.assertEqual(passenger_4_resp['data']['transport_accommodation_status'], None)
 
-        response3 = requests.put(passenger_url + '/' + passenger_3['context_id'] + '/decline?include_pnr=True', headers=headers)
+        response3 = http_client.put(passenger_url + '/' + passenger_3['context_id'] + '/decline?include_pnr=True', headers=headers)
         self.assertEqual(response3.status_code, 200)
         passengers3 = response3.json()['data']['passengers']
         self.assertEqual(len(passengers3), 2)
         self.assertIn(passengers3[0]['context_id'], [passenger_3['context_id'], passenger_4['context_id']])
         self.assertIn(passengers3[1]['context_id'], [passenger_3['context_id'], passenger_4['context_id']])
 
-        passenger_3_resp = requests.get(passenger_url + '/' + passenger_3['context_id'], headers=headers).json()
-        passenger_4_resp = requests.get(passenger_url + '/' + passenger_4['context_id'], headers=headers).json()
+        passenger_3_resp = http_client.get(passenger_url + '/' + passenger_3['context_id'], headers=headers).json()
+        passenger_4_resp = http_client.get(passenger_url + '/' + passenger_4['context_id'], headers=headers).json()
         self.assertEqual(passenger_3_resp['data']['hotel_accommodation_status'], 'declined')
         self.assertEqual(passenger_3_resp['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(passenger_3_resp['data']['transport_accommodation_status'], None)
@@ -401,19 +400,19 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             pax_record_locator_group=generate_pax_record_locator_group()
         ))
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
 
         passenger_1 = passenger_payload[0]
         passenger_2 = passenger_payload[1]
         passenger_3 = passenger_payload[2]
 
-        response = requests.put(passenger_url + '/' + passenger_1['context_id'] + '/decline?include_pnr=True', headers=headers)
+        response = http_client.put(passenger_url + '/' + passenger_1['context_id'] + '/decline?include_pnr=True', headers=headers)
         self.assertEqual(response.status_code, 200)
 
-        passenger_1_resp = requests.get(passenger_url + '/' + passenger_1['context_id'], headers=headers).json()
-        passenger_2_resp = requests.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
-        passenger_3_resp = requests.get(passenger_url + '/' + passenger_3['context_id'], headers=headers).json()
+        passenger_1_resp = http_client.get(passenger_url + '/' + passenger_1['context_id'], headers=headers).json()
+        passenger_2_resp = http_client.get(passenger_url + '/' + passenger_2['context_id'], headers=headers).json()
+        passenger_3_resp = http_client.get(passenger_url + '/' + passenger_3['context_id'], headers=headers).json()
         self.assertEqual(passenger_1_resp['data']['hotel_accommodation_status'], 'declined')
         self.assertEqual(passenger_1_resp['data']['meal_accommodation_status'], 'accepted')
         self.assertEqual(passenger_1_resp['data']['transport_accommodation_status'], None)
@@ -437,7 +436,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
 
         passenger = import_resp.json()['data'][0]
@@ -445,7 +444,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertEqual(passenger['meal_accommodation_status'], 'not_offered')
         self.assertIsNone(passenger['transport_accommodation_status'])
 
-        decline_resp = requests.put(passenger_url + '/' + passenger['context_id'] + '/decline', headers=headers)
+        decline_resp = http_client.put(passenger_url + '/' + passenger['context_id'] + '/decline', headers=headers)
         self.assertEqual(decline_resp.status_code, 200)
 
         decline_resp_json_data = decline_resp.json()['data']['passengers'][0]
@@ -466,7 +465,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
 
         passenger = import_resp.json()['data'][0]
@@ -475,7 +474,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertIsNone(passenger['transport_accommodation_status'])
 
         decline_offer_url = self._api_host + '/api/v1/offer/decline?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        decline_resp = requests.put(decline_offer_url)
+        decline_resp = http_client.put(decline_offer_url)
         self.assertEqual(decline_resp.status_code, 200)
 
         decline_resp_json_data = decline_resp.json()['data']['passengers'][0]
@@ -497,7 +496,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
 
         passenger = import_resp.json()['data'][0]
@@ -505,7 +504,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertEqual(passenger['meal_accommodation_status'], 'not_offered')
         self.assertIsNone(passenger['transport_accommodation_status'])
 
-        decline_resp = requests.put(passenger_url + '/' + passenger['context_id'] + '/decline?meals=true', headers=headers)
+        decline_resp = http_client.put(passenger_url + '/' + passenger['context_id'] + '/decline?meals=true', headers=headers)
         self.assertEqual(decline_resp.status_code, 400)
         decline_resp_json = decline_resp.json()
         log_error_system_tests_output(pretty_print_json(decline_resp_json))
@@ -520,7 +519,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         passenger_payload = self._generate_n_passenger_payload(1)
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
 
         passenger = import_resp.json()['data'][0]
@@ -528,7 +527,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertEqual(passenger['meal_accommodation_status'], 'offered')
         self.assertIsNone(passenger['transport_accommodation_status'])
 
-        decline_resp = requests.put(passenger_url + '/' + passenger['context_id'] + '/decline?meals=true', headers=headers)
+        decline_resp = http_client.put(passenger_url + '/' + passenger['context_id'] + '/decline?meals=true', headers=headers)
         self.assertEqual(decline_resp.status_code, 200)
 
         decline_resp_json_data = decline_resp.json()['data']['passengers'][0]
@@ -545,7 +544,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         passenger_payload = self._generate_n_passenger_payload(1)
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
 
         passenger = import_resp.json()['data'][0]
@@ -554,7 +553,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         self.assertIsNone(passenger['transport_accommodation_status'])
 
         decline_offer_url = self._api_host + '/api/v1/offer/decline?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2'] + '&meals=true'
-        decline_resp = requests.put(decline_offer_url)
+        decline_resp = http_client.put(decline_offer_url)
         self.assertEqual(decline_resp.status_code, 200)
 
         decline_resp_json_data = decline_resp.json()['data']['passengers'][0]
@@ -571,7 +570,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         passenger_payload = self._generate_n_passenger_payload(2)
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
         passengers = import_resp.json()['data']
         self.assertEqual(len(passengers), 2)
@@ -581,7 +580,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             self.assertEqual(passenger['meal_accommodation_status'], 'offered')
             self.assertIsNone(passenger['transport_accommodation_status'])
 
-        decline_resp = requests.put(passenger_url + '/' + passengers[0]['context_id'] + '/decline?include_pnr=true&meals=true', headers=headers)
+        decline_resp = http_client.put(passenger_url + '/' + passengers[0]['context_id'] + '/decline?include_pnr=true&meals=true', headers=headers)
         self.assertEqual(decline_resp.status_code, 200)
 
         passengers = decline_resp.json()['data']['passengers']
@@ -608,7 +607,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
 
         passengers = import_resp.json()['data']
@@ -617,7 +616,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             self.assertEqual(passenger['meal_accommodation_status'], 'not_offered')
             self.assertIsNone(passenger['transport_accommodation_status'])
 
-        decline_resp = requests.put(passenger_url + '/' + passengers[0]['context_id'] + '/decline?meals=true', headers=headers)
+        decline_resp = http_client.put(passenger_url + '/' + passengers[0]['context_id'] + '/decline?meals=true', headers=headers)
         self.assertEqual(decline_resp.status_code, 400)
         decline_resp_json = decline_resp.json()
         log_error_system_tests_output(pretty_print_json(decline_resp_json))
@@ -640,7 +639,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         context_id_meals = passenger_payload[0]['context_id']
         context_id_no_meals = passenger_payload[1]['context_id']
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
         passengers = import_resp.json()['data']
         self.assertEqual(len(passengers), 2)
@@ -657,7 +656,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             else:
                 self.assertTrue(False)
 
-        decline_resp = requests.put(passenger_url + '/' + passengers[0]['context_id'] + '/decline?include_pnr=true&meals=false', headers=headers)
+        decline_resp = http_client.put(passenger_url + '/' + passengers[0]['context_id'] + '/decline?include_pnr=true&meals=false', headers=headers)
         self.assertEqual(decline_resp.status_code, 200)
 
         passengers = decline_resp.json()['data']['passengers']
@@ -678,7 +677,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
 
         voucher_id = decline_resp.json()['data']['voucher_id']
         voucher_url = self._api_host + '/api/v1/voucher/' + str(voucher_id)
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
 
         passengers = voucher_resp.json()['data']['passengers']
@@ -714,7 +713,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         context_id_meals = passenger_payload[0]['context_id']
         context_id_no_meals = passenger_payload[1]['context_id']
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
         passengers = import_resp.json()['data']
         self.assertEqual(len(passengers), 2)
@@ -732,7 +731,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
                 self.assertTrue(False)
 
         decline_url = self._api_host + '/api/v1/offer/decline?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
-        decline_resp = requests.put(decline_url)
+        decline_resp = http_client.put(decline_url)
         self.assertEqual(decline_resp.status_code, 200)
 
         passengers = decline_resp.json()['data']['passengers']
@@ -754,12 +753,12 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
                 self.assertTrue(False)
 
         pax_meals_url = self._api_host + '/api/v1/passenger/' + context_id_meals
-        pax_meals_resp = requests.get(url=pax_meals_url, headers=headers)
+        pax_meals_resp = http_client.get(url=pax_meals_url, headers=headers)
         self.assertEqual(pax_meals_resp.status_code, 200)
         voucher_id = pax_meals_resp.json()['data']['voucher_id']
 
         voucher_url = self._api_host + '/api/v1/voucher/' + str(voucher_id)
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
 
         passengers = voucher_resp.json()['data']['passengers']
@@ -781,7 +780,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
                 self.assertTrue(False)
 
         full_state_url = self._api_host + '/api/v1/passenger/' + context_id_meals + '/state'
-        full_state_resp = requests.get(url=full_state_url, headers=headers)
+        full_state_resp = http_client.get(url=full_state_url, headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         meal_vouchers = full_state_resp_json['data']['voucher']['meal_vouchers']
@@ -807,7 +806,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         context_id_meals = passenger_payload[0]['context_id']
         context_id_no_meals = passenger_payload[1]['context_id']
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
         passengers = import_resp.json()['data']
         self.assertEqual(len(passengers), 2)
@@ -825,7 +824,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
                 self.assertTrue(False)
 
         decline_url = self._api_host + '/api/v1/offer/decline?ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
-        decline_resp = requests.put(decline_url)
+        decline_resp = http_client.put(decline_url)
         self.assertEqual(decline_resp.status_code, 200)
 
         passengers = decline_resp.json()['data']['passengers']
@@ -847,12 +846,12 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
                 self.assertTrue(False)
 
         pax_meals_url = self._api_host + '/api/v1/passenger/' + context_id_meals
-        pax_meals_resp = requests.get(url=pax_meals_url, headers=headers)
+        pax_meals_resp = http_client.get(url=pax_meals_url, headers=headers)
         self.assertEqual(pax_meals_resp.status_code, 200)
         voucher_id = pax_meals_resp.json()['data']['voucher_id']
 
         voucher_url = self._api_host + '/api/v1/voucher/' + str(voucher_id)
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
 
         passengers = voucher_resp.json()['data']['passengers']
@@ -874,7 +873,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
                 self.assertTrue(False)
 
         full_state_url = self._api_host + '/api/v1/passenger/' + context_id_meals + '/state'
-        full_state_resp = requests.get(url=full_state_url, headers=headers)
+        full_state_resp = http_client.get(url=full_state_url, headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         meal_vouchers = full_state_resp_json['data']['voucher']['meal_vouchers']
@@ -899,7 +898,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         context_id_meals = passenger_payload[0]['context_id']
         context_id_no_meals = passenger_payload[1]['context_id']
 
-        import_resp = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_resp.status_code, 201)
         passengers = import_resp.json()['data']
         self.assertEqual(len(passengers), 2)
@@ -916,7 +915,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             else:
                 self.assertTrue(False)
 
-        decline_resp = requests.put(passenger_url + '/' + passengers[0]['context_id'] + '/decline?include_pnr=true&meals=true', headers=headers)
+        decline_resp = http_client.put(passenger_url + '/' + passengers[0]['context_id'] + '/decline?include_pnr=true&meals=true', headers=headers)
         self.assertEqual(decline_resp.status_code, 200)
 
         passengers = decline_resp.json()['data']['passengers']
@@ -952,7 +951,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
         passenger_offer_url = passenger['offer_url']
 
         # passenger visits offer link ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertIsNone(embedded_json['confirmation'])
@@ -972,7 +971,7 @@ class TestApiHotelBookingDecline(StormxSystemVerification):
             self.assertEqual(p['meal_vouchers'], [])
 
         # passenger visits offer link again ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertIsNone(embedded_json['confirmation'])
@@ -1,4 +1,4 @@
-import requests
+from stormx_http import http_client
 
 from uuid import UUID
 
@@ -9,7 +9,6 @@ class TestApiHotelBookingDirectBilling(StormxSystemVerification):
     """
     Verify that direct billing bookings work correctly.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -50,7 +49,7 @@ class TestApiHotelBookingDirectBilling(StormxSystemVerification):
         # passenger's voucher ----
         passenger = passengers[0]
         passenger_offer_url = passenger['offer_url']
-        response = requests.get(passenger_offer_url, headers=self._generate_passenger_headers())
+        response = http_client.get(passenger_offer_url, headers=self._generate_passenger_headers())
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
 
@@ -62,7 +61,7 @@ class TestApiHotelBookingDirectBilling(StormxSystemVerification):
             hotel_id=hotel_id_int,
             check_in_key=check_in_key
         )
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
         self.assertEqual(resp.status_code, 200)
         cc_data = resp.json()['data']
 
@@ -91,7 +90,7 @@ class TestApiHotelBookingDirectBilling(StormxSystemVerification):
         detail_payload = dict(
             voucher_uuid=voucher_uuid
         )
-        resp = requests.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
 
         cc_data_2 = resp.json()['data']
 
@@ -1,7 +1,7 @@
 import json
 from decimal import Decimal
 
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import (
     StormxSystemVerification,
@@ -19,7 +19,6 @@ class TestApiHotelBookingExpedia(StormxSystemVerification):
 
     This set of tests especially focuses on the the endpoint `POST /api/v1/hotels`.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -59,7 +58,7 @@ class TestApiHotelBookingExpedia(StormxSystemVerification):
                 hotel_id=leader_picked_hotel['hotel_id'],
                 room_count=1,
             )
-            booking_response = requests.post(url, headers=booking_headers, params=leader_query_parameters,
+            booking_response = http_client.post(url, headers=booking_headers, params=leader_query_parameters,
                                              json=leader_booking_payload)
             return booking_response.status_code, booking_response.json()
 
@@ -2,7 +2,7 @@ import datetime
 from uuid import UUID
 from decimal import Decimal
 
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import StormxSystemVerification
 
@@ -11,7 +11,6 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
     """
     Verify the internal booking endpoint (`/api/v1/tvl/airline/{airline_id}/hotels`).
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -35,7 +34,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             port_accommodation='ORD'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -57,7 +56,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -72,7 +71,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         self.assertEqual(booking_response_json['data']['hotel_voucher']['check_out_date'], check_out_date)
         UUID(booking_response_json['data']['voucher_id'], version=4)
 
-        full_state = requests.get(url=url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state = http_client.get(url=url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         room_voucher = full_state['voucher']['hotel_voucher']['room_vouchers'][0]
         self.assertEqual(room_voucher['count'], 1)
         self.assertEqual(room_voucher['rate'], '99.50')
@@ -96,7 +95,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             port_accommodation='ORD'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -119,7 +118,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -135,7 +134,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         UUID(booking_response_json['data']['voucher_id'], version=4)
         self.assertIsNone(booking_response_json['data']['hotel_voucher']['hotel_message'])
 
-        full_state = requests.get(url=url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state = http_client.get(url=url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         room_voucher = full_state['voucher']['hotel_voucher']['room_vouchers'][0]
         self.assertEqual(room_voucher['count'], 1)
         self.assertEqual(room_voucher['rate'], '99.00')
@@ -162,7 +161,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             number_of_nights=2
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -185,7 +184,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -219,7 +218,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             number_of_nights=2
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -242,7 +241,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -277,7 +276,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             number_of_nights=2
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -299,7 +298,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -332,7 +331,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             port_accommodation='LAX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -350,7 +349,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_BOOKING_REQUEST', 'Provided hotel_id is not in passenger port of accommodation', [])
@@ -375,7 +374,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
                 port_accommodation='ORD'
             ))
 
-            response = requests.post(url, headers=headers, json=passenger_payload)
+            response = http_client.post(url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
@@ -393,7 +392,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             )
 
             booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-            booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+            booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
             self.assertEqual(booking_response.status_code, 200)
             booking_response_json = booking_response.json()
             self.assertIs(booking_response_json['error'], False)
@@ -419,7 +418,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             port_accommodation='LAX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -436,7 +435,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             hotel_rate=0.00
         )
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -445,7 +444,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         booking_payload['hotel_rate'] = 0
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -453,7 +452,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
 
         booking_payload['hotel_rate'] = '0.00'
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -462,7 +461,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         booking_payload['hotel_rate'] = '0'
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -471,7 +470,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         booking_payload['hotel_rate'] = 1000
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -480,7 +479,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         booking_payload['hotel_rate'] = '1000.00'
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -489,7 +488,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         booking_payload['hotel_rate'] = ''
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -497,7 +496,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
 
         del(booking_payload['hotel_rate'])
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -520,7 +519,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             port_accommodation='ORD'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -538,7 +537,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -547,7 +546,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         booking_payload['block_type'] = 'contract_block'
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -556,7 +555,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         booking_payload['block_type'] = 1
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -565,7 +564,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         booking_payload['block_type'] = 0
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -574,7 +573,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         del(booking_payload['block_type'])
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 400)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 400, 'Bad Request', 'INVALID_INPUT',
@@ -597,7 +596,7 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
             port_accommodation='ORD'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -615,13 +614,13 @@ class TestApiHotelBookingInternal(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/71/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 404)
         booking_response_json = booking_response.json()
         self._validate_error_message(booking_response_json, 404, 'Not Found', 'PASSENGER_NOT_FOUND', 'Not all Passengers found for given context_id list.', [])
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
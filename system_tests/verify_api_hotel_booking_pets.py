@@ -1,7 +1,7 @@
 from uuid import UUID
 from decimal import Decimal
 
-import requests
+from stormx_http import http_client
 
 
 from stormx_verification_framework import (
@@ -15,7 +15,6 @@ class TestApiHotelBookingPets(StormxSystemVerification):
     """
     Verify some of the pet and service pet scenarios for hotel bookings.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -43,7 +42,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -54,7 +53,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             hotel_id='tvl-80657'
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
@@ -66,7 +65,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
         self.assertGreater(Decimal(fee['rate']), 0)
         self.assertEqual(Decimal(fee['total']), fee['count'] * Decimal(fee['rate']))
 
-        full_state = requests.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
+        full_state = http_client.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
         hotel_voucher = full_state['data']['voucher']['hotel_voucher']
         fee = hotel_voucher['fees'][0]
         self.assertEqual(fee['type'], 'pet')
@@ -105,7 +104,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             service_pet=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -116,7 +115,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             hotel_id='tvl-87521'
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
@@ -178,7 +177,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             service_pet=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -189,7 +188,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             hotel_id='tvl-87521'
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
@@ -243,7 +242,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -257,13 +256,13 @@ class TestApiHotelBookingPets(StormxSystemVerification):
         ak1 = response_json['data'][0]['ak1']
         ak2 = response_json['data'][0]['ak2']
 
-        book_resp = requests.post(hotel_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=pax_headers, json=payload)
+        book_resp = http_client.post(hotel_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=pax_headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
         self.assertNotIn('fees', book_resp_json['data']['hotel_voucher'])
 
-        full_state = requests.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
+        full_state = http_client.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
         voucher_id = full_state['data']['passenger']['voucher_id']
         hotel_voucher = full_state['data']['voucher']['hotel_voucher']
         fee = hotel_voucher['fees'][0]
@@ -273,7 +272,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
         self.assertEqual(Decimal(fee['total']), fee['count'] * Decimal(fee['rate']))
         self.assertEqual(hotel_voucher['total_amount'], str(Decimal(fee['total']) + Decimal(hotel_voucher['room_vouchers'][0]['rate']) + Decimal(hotel_voucher['tax'])))
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + voucher_id, headers=headers).json()
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + voucher_id, headers=headers).json()
         hotel_voucher = voucher_resp['data']['hotel_voucher']
         fee = hotel_voucher['fees'][0]
         self.assertEqual(fee['type'], 'pet')
@@ -316,7 +315,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             pet=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -327,7 +326,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             hotel_id='tvl-80657'
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
@@ -373,7 +372,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -384,7 +383,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             hotel_id='tvl-80657'
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
@@ -430,7 +429,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             pet=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -441,7 +440,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             hotel_id='tvl-80657'
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
@@ -475,7 +474,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -486,7 +485,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             hotel_id='tvl-80657'
         )
 
-        book_resp = requests.post(hotel_url, headers=headers, json=payload)
+        book_resp = http_client.post(hotel_url, headers=headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
@@ -498,7 +497,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
         self.assertGreater(Decimal(fee['rate']), 0)
         self.assertEqual(Decimal(fee['total']), fee['count'] * Decimal(fee['rate']))
 
-        full_state = requests.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
+        full_state = http_client.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
         hotel_voucher = full_state['data']['voucher']['hotel_voucher']
         fee = hotel_voucher['fees'][0]
         self.assertEqual(fee['type'], 'pet')
@@ -527,13 +526,13 @@ class TestApiHotelBookingPets(StormxSystemVerification):
                                                                    pax_status='nonPremium',
                                                                    **pax_scenario)
             failure_message = 'failed for scenario ' + repr(pax_scenario) + ' in port ' + repr(port) + '.'
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
             passengers = response_json['data']
 
-            hotel_response = requests.get(hotel_url, headers=headers, params={'room_count': '1',
+            hotel_response = http_client.get(hotel_url, headers=headers, params={'room_count': '1',
                                                                               'port': port,
                                                                               'provider': 'ean',
                                                                               'pet': pax_scenario['pet'],
@@ -551,7 +550,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
                     room_count=1,
                     hotel_id=selected_hotel['hotel_id']
                 )
-                book_resp = requests.post(hotel_url, headers=headers, json=payload)
+                book_resp = http_client.post(hotel_url, headers=headers, json=payload)
                 self.assertEqual(book_resp.status_code, 200, msg=failure_message)
                 book_resp_json = book_resp.json()
                 self.assertEqual(book_resp_json['error'], False)
@@ -585,7 +584,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
             pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -599,13 +598,13 @@ class TestApiHotelBookingPets(StormxSystemVerification):
         ak1 = response_json['data'][0]['ak1']
         ak2 = response_json['data'][0]['ak2']
 
-        book_resp = requests.post(hotel_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=pax_headers, json=payload)
+        book_resp = http_client.post(hotel_url + '?ak1=' + ak1 + '&ak2=' + ak2, headers=pax_headers, json=payload)
         self.assertEqual(book_resp.status_code, 200)
         book_resp_json = book_resp.json()
         self.assertIs(book_resp_json['error'], False)
         self.assertNotIn('fees', book_resp_json['data']['hotel_voucher'])
 
-        full_state = requests.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
+        full_state = http_client.get(url=passenger_url + '/' + response_json['data'][0]['context_id'] + '/state', headers=headers).json()
         voucher_id = full_state['data']['passenger']['voucher_id']
         hotel_voucher = full_state['data']['voucher']['hotel_voucher']
         fee = hotel_voucher['fees'][0]
@@ -615,7 +614,7 @@ class TestApiHotelBookingPets(StormxSystemVerification):
         self.assertEqual(Decimal(fee['total']), fee['count'] * Decimal(fee['rate']))
         self.assertEqual(hotel_voucher['total_amount'], str(Decimal(fee['total']) + Decimal(hotel_voucher['room_vouchers'][0]['rate']) + Decimal(hotel_voucher['tax'])))
 
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + voucher_id, headers=headers).json()
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + voucher_id, headers=headers).json()
         hotel_voucher = voucher_resp['data']['hotel_voucher']
         fee = hotel_voucher['fees'][0]
         self.assertEqual(fee['type'], 'pet')
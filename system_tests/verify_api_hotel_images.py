@@ -1,4 +1,4 @@
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import StormxSystemVerification, uses_expedia
 
@@ -9,7 +9,6 @@ class TestApiHotelImages(StormxSystemVerification):
 
     This set of tests especially focuses on the the endpoint `POST /api/v1/hotels`.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -60,7 +59,7 @@ class TestApiHotelImages(StormxSystemVerification):
         # verify hotel image the passenger is presented ----
         passenger = passengers[0]
         passenger_offer_url = passenger['offer_url']
-        response = requests.get(passenger_offer_url, headers=self._generate_passenger_headers())
+        response = http_client.get(passenger_offer_url, headers=self._generate_passenger_headers())
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertEqual(embedded_json['confirmation']['hotel_voucher']['image_url'], listing_image_url)
@@ -109,7 +108,7 @@ class TestApiHotelImages(StormxSystemVerification):
         # verify hotel image the passenger is presented ----
         passenger = passengers[0]
         passenger_offer_url = passenger['offer_url']
-        response = requests.get(passenger_offer_url, headers=self._generate_passenger_headers())
+        response = http_client.get(passenger_offer_url, headers=self._generate_passenger_headers())
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertIsNone(embedded_json['confirmation']['hotel_voucher']['image_url'])
@@ -157,7 +156,7 @@ class TestApiHotelImages(StormxSystemVerification):
         # verify hotel image the passenger is presented ----
         passenger = passengers[0]
         passenger_offer_url = passenger['offer_url']
-        response = requests.get(passenger_offer_url, headers=self._generate_passenger_headers())
+        response = http_client.get(passenger_offer_url, headers=self._generate_passenger_headers())
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertEqual(embedded_json['confirmation']['hotel_voucher']['image_url'], listing_image_url)
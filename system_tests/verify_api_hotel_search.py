@@ -3,7 +3,7 @@ import unittest
 from decimal import Decimal
 
 import pytz
-import requests
+from stormx_http import http_client
 
 from StormxApp.constants import StormxConstants
 from stormx_verification_framework import (
@@ -20,7 +20,6 @@ class TestApiHotelSearch(StormxSystemVerification):
     """
     Verify general hotel search behavior.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -34,7 +33,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         customer = 'Delta Air Lines'
         headers = self._generate_passenger_headers()
 
-        passengers = self._create_2_passengers(customer=customer)
+        passengers = self._lease_2_passengers(customer=customer)
 
         for passenger in passengers:
             query_parameters = dict(
@@ -42,7 +41,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 ak2=passenger['ak2'],
                 room_count='1',
             )
-            response = requests.get(url, headers=headers, params=query_parameters)
+            response = http_client.get(url, headers=headers, params=query_parameters)
             self.assertEqual(response.status_code, 200)
             response_json = response.json()
             self.assertIs(response_json['error'], False)
@@ -61,14 +60,14 @@ class TestApiHotelSearch(StormxSystemVerification):
         customer = 'Delta Air Lines'
         headers = self._generate_airline_headers(customer)
 
-        passengers = self._create_2_passengers(customer=customer)
+        passengers = self._lease_2_passengers(customer=customer)
 
         for passenger in passengers:
             query_parameters = dict(
                 port=passenger['port_accommodation'],
                 room_count='1'
             )
-            response = requests.get(url, headers=headers, params=query_parameters)
+            response = http_client.get(url, headers=headers, params=query_parameters)
             self.assertEqual(response.status_code, 200)
             response_json = response.json()
             self.assertIs(response_json['error'], False)
@@ -87,7 +86,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         customer = 'Delta Air Lines'
         headers = self._generate_airline_headers(customer=customer)
 
-        passengers = self._create_2_passengers(customer=customer)
+        passengers = self._lease_2_passengers(customer=customer)
         passenger = passengers[0]
 
         query_parameters = dict(
@@ -95,7 +94,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count='1',
         )
 
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         hotels = response_json['data']
@@ -106,7 +105,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         validate public hotel objects do not contain various fields
         """
         customer = 'Purple Rain Airlines'
-        passengers = self._create_2_passengers(customer=customer)
+        passengers = self._lease_2_passengers(customer=customer)
 
         hotels = self._get_passenger_hotel_offerings(passengers[0])
         for hotel in hotels:
@@ -128,7 +127,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             notify=False
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -143,7 +142,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         self.assertGreater(len(response_json['data']), 0)
@@ -160,7 +159,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         for port in active_ports:
             hotel_url = self._api_host + '/api/v1/hotels?room_count=1&port=' + port
 
-            hotel_response = requests.get(hotel_url, headers=headers)
+            hotel_response = http_client.get(hotel_url, headers=headers)
             self.assertEqual(hotel_response.status_code, 200)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False)
@@ -190,7 +189,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 port_accommodation=port
             ))
 
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
@@ -204,7 +203,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 room_count=1
             )
 
-            hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+            hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
             self.assertEqual(hotel_response.status_code, 200)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False)
@@ -232,7 +231,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 if len(provider) > 0:
                     hotel_url += '&provider=' + provider
 
-                hotel_response = requests.get(hotel_url, headers=headers)
+                hotel_response = http_client.get(hotel_url, headers=headers)
                 failure_message = 'provider=' + repr(provider) + ' failed in port ' + repr(port) + 'with room count room_count ' + repr(room_count) + '.'
                 self.assertEqual(hotel_response.status_code, 200, msg=failure_message)
                 hotel_response_json = hotel_response.json()
@@ -259,7 +258,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             if len(provider) > 0:
                 hotel_url += '&provider=' + provider
 
-            hotel_response = requests.get(hotel_url, headers=headers)
+            hotel_response = http_client.get(hotel_url, headers=headers)
             self.assertEqual(hotel_response.status_code, 200)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False)
@@ -303,7 +302,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 hotel_url += '&provider=' + provider
 
             failure_message = 'provider=' + repr(provider) + ' failed.'
-            hotel_response = requests.get(hotel_url, headers=headers)
+            hotel_response = http_client.get(hotel_url, headers=headers)
             self.assertEqual(hotel_response.status_code, 200, msg=failure_message)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False, msg=failure_message)
@@ -327,7 +326,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 pax_status=pax_status
             ))
 
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
@@ -341,7 +340,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 room_count=1
             )
 
-            hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+            hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
             self.assertEqual(hotel_response.status_code, 200)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False)
@@ -376,7 +375,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 pax_status='nonPremium'
             ))
 
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
@@ -390,7 +389,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 room_count=1
             )
 
-            hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+            hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
             self.assertEqual(hotel_response.status_code, 200)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False)
@@ -431,7 +430,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 pax_status=pax_status
             ))
 
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
@@ -445,7 +444,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 room_count=1
             )
 
-            hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+            hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
             self.assertEqual(hotel_response.status_code, 200)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False)
@@ -486,7 +485,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 pax_status='nonPremium'
             ))
 
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
@@ -500,7 +499,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 room_count=1
             )
 
-            hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+            hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
             self.assertEqual(hotel_response.status_code, 200)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False)
@@ -545,7 +544,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                     port_accommodation='LHR'
                 ))
 
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
@@ -559,7 +558,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 room_count=1
             )
 
-            hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+            hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
             self.assertEqual(hotel_response.status_code, 200)
             hotel_response_json = hotel_response.json()
             self.assertIs(hotel_response_json['error'], False)
@@ -589,7 +588,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             if len(provider) > 0:
                 hotel_url += '&provider=' + provider
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -627,7 +626,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             service_pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -641,7 +640,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -663,7 +662,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(85725, 72, event_date, ap_block_type=1, block_price='150.00', blocks=5, pay_type='0')
         self.add_hotel_availability(85765, 72, event_date, ap_block_type=1, block_price='150.00', blocks=5, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -692,7 +691,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         hotel_url2 = self._api_host + '/api/v1/hotels?room_count=1&port=ORD&is_premium=true&service_pet=true'
 
-        hotel_response2 = requests.get(hotel_url2, headers=headers)
+        hotel_response2 = http_client.get(hotel_url2, headers=headers)
         self.assertEqual(hotel_response2.status_code, 200)
         hotel_response_json2 = hotel_response2.json()
         self.assertIs(hotel_response_json2['error'], False)
@@ -733,7 +732,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             service_pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -747,7 +746,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=2
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -778,19 +777,19 @@ class TestApiHotelSearch(StormxSystemVerification):
         headers = self._generate_airline_headers(customer=customer)
         hotel_url = self._api_host + '/api/v1/hotels?room_count=1&port=LAX&number_of_nights='
 
-        hotel_response = requests.get(hotel_url + str(0), headers=headers)  # validates min requirement
+        hotel_response = http_client.get(hotel_url + str(0), headers=headers)  # validates min requirement
         self.assertEqual(hotel_response.status_code, 400)
         hotel_response_json = hotel_response.json()
         log_error_system_tests_output(pretty_print_json(hotel_response_json))
         self._validate_error_message(hotel_response_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel search.', expected_min_value_error_detail)
 
-        hotel_response = requests.get(hotel_url + str(101), headers=headers)  # validates max requirement
+        hotel_response = http_client.get(hotel_url + str(101), headers=headers)  # validates max requirement
         self.assertEqual(hotel_response.status_code, 400)
         hotel_response_json = hotel_response.json()
         log_error_system_tests_output(pretty_print_json(hotel_response_json))
         self._validate_error_message(hotel_response_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel search.', expected_max_value_error_detail)
 
-        hotel_response = requests.get(hotel_url + 'aString', headers=headers)  # validates int requirement
+        hotel_response = http_client.get(hotel_url + 'aString', headers=headers)  # validates int requirement
         self.assertEqual(hotel_response.status_code, 400)
         hotel_response_json = hotel_response.json()
         log_error_system_tests_output(pretty_print_json(hotel_response_json))
@@ -815,7 +814,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         proposed_check_in_date = initial_night_of_stay.strftime('%Y-%m-%d')
         proposed_check_out_date = (initial_night_of_stay + datetime.timedelta(1)).strftime('%Y-%m-%d')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -852,7 +851,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         expected_check_out_date = (event_date_hnl_day2 + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=HNL&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=HNL&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         self.assertGreater(len(hotel_search_resp['data']), 0)
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_hnl, hotel_ids)
@@ -887,7 +886,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         proposed_check_in_date = initial_night_of_stay.strftime('%Y-%m-%d')
         proposed_check_out_date = (initial_night_of_stay + datetime.timedelta(number_of_nights)).strftime('%Y-%m-%d')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -941,7 +940,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             if len(provider) > 0:
                 hotel_url += '&provider=' + provider
 
-            hotel_response = requests.get(hotel_url, headers=headers)
+            hotel_response = http_client.get(hotel_url, headers=headers)
             failure_message = 'provider=' + repr(provider) + ' failed for port ' + repr(port) + '.'
             self.assertEqual(hotel_response.status_code, 200, msg=failure_message)
             hotel_response_json = hotel_response.json()
@@ -985,7 +984,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -999,7 +998,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1021,7 +1020,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(80657, 294, event_date, ap_block_type=1, block_price='150.00', blocks=2, pay_type='0')
         self.add_hotel_availability(98719, 294, event_date, ap_block_type=1, block_price='100.00', blocks=2, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1063,7 +1062,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             service_pet=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1077,7 +1076,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=2
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1100,7 +1099,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(80657, 294, event_date, ap_block_type=1, block_price='150.00', blocks=2, pay_type='0')
         self.add_hotel_availability(98719, 294, event_date, ap_block_type=1, block_price='100.00', blocks=2, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1153,7 +1152,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             service_pet=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1167,7 +1166,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=2
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1192,7 +1191,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(100304, 294, event_date, ap_block_type=1, block_price='100.00', blocks=2, pay_type='0')
         self.add_hotel_availability(100306, 294, event_date, ap_block_type=1, block_price='50.00', blocks=2, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1226,7 +1225,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(100304, 294, event_date, ap_block_type=1, block_price='100.00', blocks=2, pay_type='0')
         self.add_hotel_availability(100306, 294, event_date, ap_block_type=1, block_price='50.00', blocks=2, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1275,7 +1274,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             pax_status='nonPremium'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1289,7 +1288,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -1344,7 +1343,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         )
 
         # validate no StormX inventory exists for LAS
-        resp_json = requests.get(url=hotel_url + '?provider=tvl&room_count=1&port=' + port, headers=aa_headers).json()
+        resp_json = http_client.get(url=hotel_url + '?provider=tvl&room_count=1&port=' + port, headers=aa_headers).json()
         self.assertEqual(len(resp_json['data']), 0)
 
         # premium inventory
@@ -1353,7 +1352,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         # public non premium hotel query
         # only premium inventory exists so premium hotel should display
-        resp_json = requests.get(url=offer_hotel_url, params=aa_query_parameters).json()
+        resp_json = http_client.get(url=offer_hotel_url, params=aa_query_parameters).json()
         self.assertGreater(len(resp_json['data']), 0)
         hotel_ids = [hotel['hotel_id'] for hotel in resp_json['data']]
         self.assertIn(premium_hotel, hotel_ids)
@@ -1361,7 +1360,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         # public premium hotel query
         # only premium inventory exists so premium hotel should display
-        resp_json = requests.get(url=offer_hotel_url, params=ba_query_parameters).json()
+        resp_json = http_client.get(url=offer_hotel_url, params=ba_query_parameters).json()
         self.assertGreater(len(resp_json['data']), 0)
         hotel_ids = [hotel['hotel_id'] for hotel in resp_json['data']]
         self.assertIn(premium_hotel, hotel_ids)
@@ -1373,7 +1372,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         # public non premium hotel query
         # premium and non premium inventory exists so non premium hotel should display only
-        resp_json = requests.get(url=offer_hotel_url, params=aa_query_parameters).json()
+        resp_json = http_client.get(url=offer_hotel_url, params=aa_query_parameters).json()
         self.assertGreater(len(resp_json['data']), 0)
         hotel_ids = [hotel['hotel_id'] for hotel in resp_json['data']]
         self.assertNotIn(premium_hotel, hotel_ids)
@@ -1381,7 +1380,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         # public premium hotel query
         # premium and non premium inventory exists so premium and non premium hotel should display
-        resp_json = requests.get(url=offer_hotel_url, params=ba_query_parameters).json()
+        resp_json = http_client.get(url=offer_hotel_url, params=ba_query_parameters).json()
         self.assertGreater(len(resp_json['data']), 0)
         hotel_ids = [hotel['hotel_id'] for hotel in resp_json['data']]
         self.assertIn(premium_hotel, hotel_ids)
@@ -1393,7 +1392,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             hotel_id=non_premium_hotel,
             room_count=4
         )
-        resp = requests.post(url=hotel_url, headers=aa_headers, data=payload)
+        resp = http_client.post(url=hotel_url, headers=aa_headers, data=payload)
         self.assertEqual(resp.status_code, 200)
 
         # use premium hotel inventory
@@ -1402,7 +1401,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             hotel_id=premium_hotel,
             room_count=4
         )
-        resp = requests.post(url=hotel_url, headers=ba_headers, data=payload)
+        resp = http_client.post(url=hotel_url, headers=ba_headers, data=payload)
         self.assertEqual(resp.status_code, 200)
 
 
@@ -1419,25 +1418,25 @@ class TestApiHotelSearch(StormxSystemVerification):
         hotel_url4 = self._api_host + '/api/v1/hotels?room_count=1&port=0YUa'
         hotel_url5 = self._api_host + '/api/v1/hotels?room_count=1&port=0Y'
 
-        response = requests.get(hotel_url1, headers=headers)
+        response = http_client.get(hotel_url1, headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'INVALID_PORT', 'XXX is not a valid choice for port', [])
 
-        response = requests.get(hotel_url2, headers=headers)
+        response = http_client.get(hotel_url2, headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'INVALID_PORT', '011 is not a valid choice for port', [])
 
-        response = requests.get(hotel_url3, headers=headers)
+        response = http_client.get(hotel_url3, headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'INVALID_PORT', '0YU is not a valid choice for port', [])
 
-        response = requests.get(hotel_url4, headers=headers)
+        response = http_client.get(hotel_url4, headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1445,7 +1444,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                                      'Invalid input criteria for hotel search.',
                                      [{'field': 'port', 'message': 'Ensure this field has no more than 3 characters.'}])
 
-        response = requests.get(hotel_url5, headers=headers)
+        response = http_client.get(hotel_url5, headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1715,7 +1714,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                         if 'rate' not in pax_hotel:
                             pax_hotel['rate'] = hotel['rate']
 
-            premium_hotels = requests.get(url=self._api_host + '/api/v1/hotels?provider=tvl&port=' + port + '&room_count=1&is_premium=true', headers=headers).json()['data']
+            premium_hotels = http_client.get(url=self._api_host + '/api/v1/hotels?provider=tvl&port=' + port + '&room_count=1&is_premium=true', headers=headers).json()['data']
             self.assertGreater(len(premium_hotels), 0)
             self.assertTrue(premium_hotels[0]['premium'])
 
@@ -1744,7 +1743,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                         if 'rate' not in pax_hotel:
                             pax_hotel['rate'] = hotel['rate']
 
-            premium_hotels = requests.get(url=self._api_host + '/api/v1/hotels?port=' + port + '&room_count=1&is_premium=true', headers=headers).json()['data']
+            premium_hotels = http_client.get(url=self._api_host + '/api/v1/hotels?port=' + port + '&room_count=1&is_premium=true', headers=headers).json()['data']
             self.assertGreater(len(premium_hotels), 0)
 
             self._test_hotel_availability_sorted(pax_availability, num_of_hotels)
@@ -1863,7 +1862,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(100508, 0, event_date, ap_block_type=0, block_price='109.99', blocks=1,
                                     pay_type='0')
 
-        purple_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=1', headers=purple_rain_headers)
+        purple_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=1', headers=purple_rain_headers)
         self.assertEqual(purple_hotels_resp.status_code, 200)
         purple_hotels = purple_hotels_resp.json()['data']
         self.assertEqual(len(purple_hotels), 2)
@@ -1885,7 +1884,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.assertTrue(has_hotel_id_pr)
         self.assertTrue(has_hotel_id_all)
 
-        aa_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=1', headers=aa_headers)
+        aa_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=1', headers=aa_headers)
         self.assertEqual(aa_hotels_resp.status_code, 200)
         aa_hotels = aa_hotels_resp.json()['data']
         self.assertEqual(len(aa_hotels), 2)
@@ -1907,7 +1906,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.assertTrue(has_hotel_id_aa)
         self.assertTrue(has_hotel_id_all)
 
-        delta_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=1', headers=delta_headers)
+        delta_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=1', headers=delta_headers)
         self.assertEqual(delta_hotels_resp.status_code, 200)
         delta_hotels = delta_hotels_resp.json()['data']
         self.assertEqual(len(delta_hotels), 1)
@@ -1927,7 +1926,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             'context_ids': [pr_pax['context_id']]
         }
 
-        pr_bad_book = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        pr_bad_book = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(pr_bad_book.status_code, 400)
         pr_bad_book_json = pr_bad_book.json()
         self._validate_error_message(pr_bad_book_json, 400, 'Bad Request', 'INSUFFICIENT_INVENTORY',
@@ -1939,7 +1938,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             'context_ids': [aa_pax['context_id']]
         }
 
-        aa_bad_book = requests.post(url=hotel_url, json=aa_booking_payload, headers=aa_headers)
+        aa_bad_book = http_client.post(url=hotel_url, json=aa_booking_payload, headers=aa_headers)
         self.assertEqual(aa_bad_book.status_code, 400)
         aa_bad_book_json = aa_bad_book.json()
         self._validate_error_message(aa_bad_book_json, 400, 'Bad Request', 'INSUFFICIENT_INVENTORY',
@@ -1951,7 +1950,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             'context_ids': [delta_pax['context_id']]
         }
 
-        delta_bad_book = requests.post(url=hotel_url, json=delta_booking_payload, headers=delta_headers)
+        delta_bad_book = http_client.post(url=hotel_url, json=delta_booking_payload, headers=delta_headers)
         self.assertEqual(delta_bad_book.status_code, 400)
         delta_bad_book_json = delta_bad_book.json()
         self._validate_error_message(delta_bad_book_json, 400, 'Bad Request', 'INSUFFICIENT_INVENTORY',
@@ -1985,7 +1984,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(96373, 0, event_date, ap_block_type=0, block_price='50.00', blocks=3, pay_type='0')
 
         # ensure hard block rate returned
-        purple_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=1', headers=purple_rain_headers)
+        purple_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=1', headers=purple_rain_headers)
         self.assertEqual(purple_hotels_resp.status_code, 200)
         purple_hotels = purple_hotels_resp.json()['data']
         self.assertEqual(len(purple_hotels), 1)
@@ -1995,7 +1994,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.assertEqual(purple_hotels[0]['hard_block_count'], 1)
 
         # ensure avg rate is returned
-        purple_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=2', headers=purple_rain_headers)
+        purple_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=2', headers=purple_rain_headers)
         self.assertEqual(purple_hotels_resp.status_code, 200)
         purple_hotels = purple_hotels_resp.json()['data']
         self.assertEqual(len(purple_hotels), 1)
@@ -2006,7 +2005,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         pr_hotel = purple_hotels[0]
 
         # ensure hard block rate is returned
-        aa_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=2', headers=aa_headers)
+        aa_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=2', headers=aa_headers)
         self.assertEqual(aa_hotels_resp.status_code, 200)
         aa_hotels = aa_hotels_resp.json()['data']
         self.assertEqual(len(aa_hotels), 1)
@@ -2016,7 +2015,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.assertEqual(aa_hotels[0]['hard_block_count'], 2)
 
         # ensure avg rate is returned
-        aa_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=3', headers=aa_headers)
+        aa_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=3', headers=aa_headers)
         self.assertEqual(aa_hotels_resp.status_code, 200)
         aa_hotels = aa_hotels_resp.json()['data']
         self.assertEqual(len(aa_hotels), 1)
@@ -2027,7 +2026,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         aa_hotel = aa_hotels[0]
 
         # ensure soft block rate is returned
-        delta_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=1', headers=delta_headers)
+        delta_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=1', headers=delta_headers)
         self.assertEqual(delta_hotels_resp.status_code, 200)
         delta_hotels = delta_hotels_resp.json()['data']
         self.assertEqual(len(delta_hotels), 1)
@@ -2047,7 +2046,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             'context_ids': [pr_pax['context_id']]
         }
 
-        pr_bad_book = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        pr_bad_book = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(pr_bad_book.status_code, 400)
         pr_bad_book_json = pr_bad_book.json()
         self._validate_error_message(pr_bad_book_json, 400, 'Bad Request', 'INSUFFICIENT_INVENTORY',
@@ -2059,7 +2058,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             'context_ids': [aa_pax['context_id']]
         }
 
-        aa_bad_book = requests.post(url=hotel_url, json=aa_booking_payload, headers=aa_headers)
+        aa_bad_book = http_client.post(url=hotel_url, json=aa_booking_payload, headers=aa_headers)
         self.assertEqual(aa_bad_book.status_code, 400)
         aa_bad_book_json = aa_bad_book.json()
         self._validate_error_message(aa_bad_book_json, 400, 'Bad Request', 'INSUFFICIENT_INVENTORY',
@@ -2071,7 +2070,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             'context_ids': [delta_pax['context_id']]
         }
 
-        delta_bad_book = requests.post(url=hotel_url, json=delta_booking_payload, headers=delta_headers)
+        delta_bad_book = http_client.post(url=hotel_url, json=delta_booking_payload, headers=delta_headers)
         self.assertEqual(delta_bad_book.status_code, 400)
         delta_bad_book_json = delta_bad_book.json()
         self._validate_error_message(delta_bad_book_json, 400, 'Bad Request', 'INSUFFICIENT_INVENTORY',
@@ -2128,7 +2127,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                          total_counter + Decimal(aa_booking['hotel_voucher']['tax']))
 
         # ensure soft block rate is returned and inventory has decremented
-        delta_hotels_resp = requests.get(url=hotel_url + '?port=LAS&room_count=1', headers=delta_headers)
+        delta_hotels_resp = http_client.get(url=hotel_url + '?port=LAS&room_count=1', headers=delta_headers)
         self.assertEqual(delta_hotels_resp.status_code, 200)
         delta_hotels = delta_hotels_resp.json()['data']
         self.assertEqual(len(delta_hotels), 1)
@@ -2156,7 +2155,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         this port was used by Dave to realize this was needed to be done in production.
         """
         passenger = self._create_2_passengers('Purple Rain Airlines', port_accommodation='GEG', port_origin='GEG')  # validation done on method call
-        hotel_search = requests.get(url=self._api_host + '/api/v1/hotels?provider=tvl&room_count=1&port=' + passenger[0]['port_accommodation'], headers=self._generate_airline_headers('Purple Rain Airlines'))
+        hotel_search = http_client.get(url=self._api_host + '/api/v1/hotels?provider=tvl&room_count=1&port=' + passenger[0]['port_accommodation'], headers=self._generate_airline_headers('Purple Rain Airlines'))
         self.assertEqual(hotel_search.status_code, 200)
         self.assertEqual(hotel_search.json()['data'], [])
 
@@ -2214,14 +2213,14 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         passengers = self._create_2_passengers('Purple Rain Airlines', number_of_nights=2)
         pax_hotel_url = self._api_host + '/api/v1/offer/hotels?room_count=1&ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
-        resp = requests.get(url=pax_hotel_url)
+        resp = http_client.get(url=pax_hotel_url)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
 
         passengers = self._create_2_passengers('Purple Rain Airlines', number_of_nights=3)
         pax_hotel_url = self._api_host + '/api/v1/offer/hotels?room_count=1&ak1=' + passengers[0]['ak1'] + '&ak2=' + passengers[0]['ak2']
-        resp = requests.get(url=pax_hotel_url)
+        resp = http_client.get(url=pax_hotel_url)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -2241,7 +2240,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(100304, 71, event_date, ap_block_type=1, block_price='100.00', blocks=2, pay_type='0')
         self.add_hotel_availability(100306, 71, event_date, ap_block_type=1, block_price='50.00', blocks=2, pay_type='0')
 
-        hotel_response = requests.get(hotel_url + '&service_pet=true', headers=headers)
+        hotel_response = http_client.get(hotel_url + '&service_pet=true', headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2250,7 +2249,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         for hotel in hotel_response_json['data']:
             self.assertEqual(hotel['service_pets_allowed'], True)
 
-        hotel_response = requests.get(hotel_url + '&pet=true', headers=headers)
+        hotel_response = http_client.get(hotel_url + '&pet=true', headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2259,7 +2258,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         for hotel in hotel_response_json['data']:
             self.assertEqual(hotel['pets_allowed'], True)
 
-        hotel_response = requests.get(hotel_url + '&pet=true&service_pet=true', headers=headers)
+        hotel_response = http_client.get(hotel_url + '&pet=true&service_pet=true', headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2301,7 +2300,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             service_pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2315,7 +2314,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2341,7 +2340,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             pet=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2355,7 +2354,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2379,7 +2378,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2393,7 +2392,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2416,7 +2415,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         self.add_hotel_availability(98695, 71, event_date, ap_block_type=1, block_price='50.00', blocks=2, pay_type='0')
         self.add_hotel_availability(98734, 71, event_date, ap_block_type=1, block_price='75.00', blocks=2, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2467,7 +2466,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             pet=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2481,7 +2480,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=2
         )
 
-        hotel_response = requests.get(hotel_url, headers=pax_headers, params=search_query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=pax_headers, params=search_query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertIs(hotel_response_json['error'], False)
@@ -2566,7 +2565,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         hotel_url = self._api_host + '/api/v1/hotels?room_count=1&port=LAX'
 
         # validate tvl provider is used with provider query string parameter not provided
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertGreater(len(hotel_response_json['data']), 0)
@@ -2574,7 +2573,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             self.assertEqual(hotel['provider'], 'tvl')
 
         # validate tvl provider is used with provider query string parameter empty
-        hotel_response = requests.get(hotel_url + '&provider=', headers=headers)
+        hotel_response = http_client.get(hotel_url + '&provider=', headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertGreater(len(hotel_response_json['data']), 0)
@@ -2582,7 +2581,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             self.assertEqual(hotel['provider'], 'tvl')
 
         # validate tvl provider is used with provider query string parameter empty
-        hotel_response = requests.get(hotel_url + '&provider=tvl', headers=headers)
+        hotel_response = http_client.get(hotel_url + '&provider=tvl', headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertGreater(len(hotel_response_json['data']), 0)
@@ -2590,14 +2589,14 @@ class TestApiHotelSearch(StormxSystemVerification):
             self.assertEqual(hotel['provider'], 'tvl')
 
         # validate provider query string parameter must be from accepted providers list
-        hotel_response = requests.get(hotel_url + '&provider=XYZ', headers=headers)
+        hotel_response = http_client.get(hotel_url + '&provider=XYZ', headers=headers)
         self.assertEqual(hotel_response.status_code, 400)
         hotel_response_json = hotel_response.json()
         self._validate_error_message(hotel_response_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel search.',
                                      [{'field': 'provider', 'message': '"XYZ" is not a valid choice.'}])
 
         # validate provider query string parameter must be from accepted providers list
-        hotel_response = requests.get(hotel_url + '&provider=123', headers=headers)
+        hotel_response = http_client.get(hotel_url + '&provider=123', headers=headers)
         self.assertEqual(hotel_response.status_code, 400)
         hotel_response_json = hotel_response.json()
         self._validate_error_message(hotel_response_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel search.',
@@ -2618,7 +2617,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         hotel_url = self._api_host + '/api/v1/hotels?room_count=1&port=' + port + '&provider=ean'
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertGreater(len(hotel_response_json['data']), 0, 'missing expedia inventory in ' + repr(port))
@@ -2644,7 +2643,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         number_of_rooms = 9
 
         passengers = self._generate_n_passenger_payload(number_of_rooms, port_accommodation=port, life_stage='adult')
-        import_response = requests.post(self._api_host + '/api/v1/passenger', headers=headers, json=passengers)
+        import_response = http_client.post(self._api_host + '/api/v1/passenger', headers=headers, json=passengers)
         self.assertEqual(import_response.status_code, 201)
 
         query_parameters = {
@@ -2653,7 +2652,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             'provider': 'ean'
         }
 
-        hotel_response = requests.get(hotel_url, headers=headers, params=query_parameters)
+        hotel_response = http_client.get(hotel_url, headers=headers, params=query_parameters)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertTrue(hotel_response_json['error'])
@@ -2697,7 +2696,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         for provider in providers:
             for port in ports_map[provider]:
-                aa_hotels = requests.get(url=hotel_url + '&provider=' + provider + '&port=' + port,
+                aa_hotels = http_client.get(url=hotel_url + '&provider=' + provider + '&port=' + port,
                                          headers=aa_headers).json()
                 self.assertGreater(len(aa_hotels['data']), 0)
                 if provider == 'tvl':
@@ -2705,7 +2704,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 else:
                     self._test_expedia_hotel_availability_sorted(aa_hotels['data'], 10, 71, False, False)
 
-                aa_hotels = requests.get(url=hotel_url + '&provider=' + provider + '&port=' + port + '&is_premium=true',
+                aa_hotels = http_client.get(url=hotel_url + '&provider=' + provider + '&port=' + port + '&is_premium=true',
                                          headers=aa_headers).json()
                 self.assertGreater(len(aa_hotels['data']), 0)
                 if provider == 'tvl':
@@ -2713,7 +2712,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 else:
                     self._test_expedia_hotel_availability_sorted(aa_hotels['data'], 10, 71, True, False)
 
-                pr_hotels = requests.get(url=hotel_url + '&provider=' + provider + '&port=' + port,
+                pr_hotels = http_client.get(url=hotel_url + '&provider=' + provider + '&port=' + port,
                                          headers=pr_headers).json()
                 self.assertGreater(len(pr_hotels['data']), 0)
                 if provider == 'tvl':
@@ -2721,7 +2720,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 else:
                     self._test_expedia_hotel_availability_sorted(pr_hotels['data'], 10, 294, False, False)
 
-                pr_hotels = requests.get(url=hotel_url + '&provider=' + provider + '&port=' + port + '&is_premium=true',
+                pr_hotels = http_client.get(url=hotel_url + '&provider=' + provider + '&port=' + port + '&is_premium=true',
                                          headers=pr_headers).json()
                 self.assertGreater(len(pr_hotels['data']), 0, msg='no premium inventory for port ' + repr(port) + ' from provider ' + repr(provider))
                 if provider == 'tvl':
@@ -2736,7 +2735,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         hotel_url = self._api_host + '/api/v1/hotels'
 
         # get an inventory and validate passenger noteis empty string
-        response = requests.get(hotel_url + '?room_count=1&port=LAX&provider=ean', headers=headers)
+        response = http_client.get(hotel_url + '?room_count=1&port=LAX&provider=ean', headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_json['meta']['error_code'], '')
@@ -2754,14 +2753,14 @@ class TestApiHotelSearch(StormxSystemVerification):
         hotel_offer_url = self._api_host + '/api/v1/offer/hotels'
 
         # ensure no inventory in port to start test
-        resp = requests.get(url=hotels_url + '?room_count=1&port=YYC&provider=tvl', headers=headers).json()
+        resp = http_client.get(url=hotels_url + '?room_count=1&port=YYC&provider=tvl', headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertEqual(len(resp['data']), 0)
 
         # validate pax app expedia inventory solutions before adding inventory
         # non premium
         passenger_payload = self._generate_n_passenger_payload(1, port_accommodation='YYC', ticket_level='economy')
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2774,7 +2773,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertGreater(len(hotel_response_json['data']), 0)
         for hotel in hotel_response_json['data']:
             hotel_id_prefix = hotel['hotel_id'].split('-')
@@ -2784,7 +2783,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         # premium
         # TODO: need to update ticket_level or pax_status once configuration verified
         passenger_payload = self._generate_n_passenger_payload(1, port_accommodation='YYC', ticket_level='business')
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2797,7 +2796,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertGreater(len(hotel_response_json['data']), 0)
         hotel_id_prefix = hotel_response_json['data'][0]['hotel_id'].split('-')
         self.assertEqual(hotel_id_prefix[0], 'ean')
@@ -2816,7 +2815,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         # TODO: need to update ticket_level or pax_status once configuration verified
         passenger_payload = self._generate_n_passenger_payload(5, port_accommodation='YYC', ticket_level='business')
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2830,32 +2829,32 @@ class TestApiHotelSearch(StormxSystemVerification):
         )
 
         # validate both hard block hotels appear only
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 2)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-100824')
         self.assertEqual(hotel_response_json['data'][1]['hotel_id'], 'tvl-107112')
 
         # validate only one hard block hotel appears
         search_query_parameters.update(dict(room_count=3))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 1)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-100824')
 
         # validate only hard block and airline soft block hotel appears only
         search_query_parameters.update(dict(room_count=4))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 1)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-107112')
 
         # validate nothing appears (soft block non premium is omitted)
         search_query_parameters.update(dict(room_count=5))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 0)
 
         # validate only soft block hotel appears
         self.add_hotel_availability(96510, 0, event_date, ap_block_type=0, block_price='80.00', blocks=5, pay_type='0')
         search_query_parameters.update(dict(room_count=5))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 1)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-96510')
 
@@ -2864,19 +2863,19 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         # validate only non premium hard block now appears
         search_query_parameters.update(dict(room_count=5))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 1)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-96483')
 
         # validate only non premium hard block now appears
         search_query_parameters.update(dict(room_count=4))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 1)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-96483')
 
         # validate premium hard blocks appear before non premium hard blocks
         search_query_parameters.update(dict(room_count=1))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 3)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-100824')
         self.assertEqual(hotel_response_json['data'][1]['hotel_id'], 'tvl-107112')
@@ -2884,7 +2883,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         # validate premium hard blocks appear before non premium hard blocks
         search_query_parameters.update(dict(room_count=3))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 2)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-100824')
         self.assertEqual(hotel_response_json['data'][1]['hotel_id'], 'tvl-96483')
@@ -2892,7 +2891,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         # validate non premium public search
         passenger_payload = self._generate_n_passenger_payload(1, port_accommodation='YYC', ticket_level='economy')
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2906,32 +2905,32 @@ class TestApiHotelSearch(StormxSystemVerification):
         )
 
         search_query_parameters.update(dict(room_count=1))
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertEqual(len(hotel_response_json['data']), 3)
         self.assertEqual(hotel_response_json['data'][0]['hotel_id'], 'tvl-96483')
         self.assertEqual(hotel_response_json['data'][1]['hotel_id'], 'tvl-100824')
         self.assertEqual(hotel_response_json['data'][2]['hotel_id'], 'tvl-107112')
 
         # validate general non public sorting for united crew
-        resp = requests.get(url=hotels_url + '?room_count=1&port=YYC&provider=tvl', headers=headers).json()
+        resp = http_client.get(url=hotels_url + '?room_count=1&port=YYC&provider=tvl', headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertEqual(len(resp['data']), 5)
         self._test_hotel_availability_sorted(resp['data'], 5, False, False)
 
         # validate premium tvl non public
-        resp = requests.get(url=hotels_url + '?room_count=1&port=YYC&provider=tvl&is_premium=true', headers=headers).json()
+        resp = http_client.get(url=hotels_url + '?room_count=1&port=YYC&provider=tvl&is_premium=true', headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertEqual(len(resp['data']), 3)
         self._test_hotel_availability_sorted(resp['data'], 3, True, True)
 
         # validate general expedia inventory
-        resp = requests.get(url=hotels_url + '?room_count=1&port=LAX&provider=ean', headers=headers).json()
+        resp = http_client.get(url=hotels_url + '?room_count=1&port=LAX&provider=ean', headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertGreater(len(resp['data']), 0)
         self._test_expedia_hotel_availability_sorted(resp['data'], 10, 343, False, False)
 
         # validate premium expedia inventory
-        resp = requests.get(url=hotels_url + '?room_count=1&port=LAX&provider=ean&is_premium=true', headers=headers).json()
+        resp = http_client.get(url=hotels_url + '?room_count=1&port=LAX&provider=ean&is_premium=true', headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertGreater(len(resp['data']), 0)
         self._test_expedia_hotel_availability_sorted(resp['data'], 10, 343, True, True)
@@ -2947,7 +2946,7 @@ class TestApiHotelSearch(StormxSystemVerification):
         for hotel in hotel_data:
             passenger_payload = self._generate_n_passenger_payload(1)
             passenger_payload[0].update(dict(port_accommodation='YYC'))
-            passenger = requests.post(passenger_url, headers=headers, json=passenger_payload).json()['data'][0]
+            passenger = http_client.post(passenger_url, headers=headers, json=passenger_payload).json()['data'][0]
 
             booking_payload = {
                 'context_ids': [passenger['context_id']],
@@ -2955,7 +2954,7 @@ class TestApiHotelSearch(StormxSystemVerification):
                 'room_count': hotel['room_count']
             }
 
-            resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+            resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
             self.assertEqual(resp.status_code, 200)
 
     def test_aa_public_premium_expedia(self):
@@ -2970,13 +2969,13 @@ class TestApiHotelSearch(StormxSystemVerification):
         hotel_offer_url = self._api_host + '/api/v1/offer/hotels'
 
         # ensure no inventory in port to start test
-        resp = requests.get(url=hotels_url + '?room_count=1&port=YYC&provider=tvl', headers=headers).json()
+        resp = http_client.get(url=hotels_url + '?room_count=1&port=YYC&provider=tvl', headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertEqual(len(resp['data']), 0)
 
         # non premium
         passenger_payload = self._generate_n_passenger_payload(1, port_accommodation='YYC', pax_status='non-premium', ticket_level='economy')
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2989,7 +2988,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertGreater(len(hotel_response_json['data']), 0)
         hotel_id_prefix = hotel_response_json['data'][0]['hotel_id'].split('-')
         self.assertEqual(hotel_id_prefix[0], 'ean')
@@ -2997,7 +2996,7 @@ class TestApiHotelSearch(StormxSystemVerification):
 
         # premium
         passenger_payload = self._generate_n_passenger_payload(1, port_accommodation='YYC', ticket_level='business')
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -3010,7 +3009,7 @@ class TestApiHotelSearch(StormxSystemVerification):
             room_count=1
         )
 
-        hotel_response_json = requests.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
+        hotel_response_json = http_client.get(hotel_offer_url, headers=pax_headers, params=search_query_parameters).json()
         self.assertGreater(len(hotel_response_json['data']), 0)
         hotel_id_prefix = hotel_response_json['data'][0]['hotel_id'].split('-')
         self.assertEqual(hotel_id_prefix[0], 'ean')
@@ -1,4 +1,4 @@
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import StormxSystemVerification
 
@@ -7,7 +7,6 @@ class TestApiHotelSearchInternal(StormxSystemVerification):
     """
     Verify hotel search behavior for the internal hotel search endpoint (`/api/v1/tvl/airline/{airline_id}/hotels`).
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -21,14 +20,14 @@ class TestApiHotelSearchInternal(StormxSystemVerification):
         no_inv_airline_id = '265'
         stormx_headers = self._generate_tvl_stormx_headers()
 
-        no_inv_resp = requests.get(
+        no_inv_resp = http_client.get(
             url=self._api_host + '/api/v1/tvl/airline/' + no_inv_airline_id + '/hotels?port=YYZ&room_count=1&provider=tvl',
             headers=stormx_headers)
         self.assertEqual(no_inv_resp.status_code, 200)
         no_inv_resp_json = no_inv_resp.json()
         self.assertEqual(len(no_inv_resp_json['data']), 0)
 
-        inv_resp = requests.get(
+        inv_resp = http_client.get(
             url=self._api_host + '/api/v1/tvl/airline/' + airline_id + '/hotels?port=LAX&room_count=1&provider=tvl',
             headers=stormx_headers)
         self.assertEqual(inv_resp.status_code, 200)
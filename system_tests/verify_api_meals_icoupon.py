@@ -1,4 +1,4 @@
-import requests
+from stormx_http import http_client
 from uuid import UUID
 
 from stormx_verification_framework import (
@@ -16,7 +16,6 @@ class TestApiMealsICoupon(StormxSystemVerification):
     """
     Verify general hotel booking behavior.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -47,7 +46,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
         passenger_context_ids = [p['context_id'] for p in passengers_payload]
         passenger_1_context_id = passenger_context_ids[0]
         passenger_2_context_id = passenger_context_ids[1]
-        response = requests.post(passenger_url, headers=headers,
+        response = http_client.post(passenger_url, headers=headers,
                                  json=passengers_payload)  # TODO: replace with API client.
         #display_response(response)
         self.assertEqual(response.status_code, 201)
@@ -68,7 +67,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             room_count=str(room_count),
         )
 
-        response = requests.post(url, headers=headers, json=booking_payload)
+        response = http_client.post(url, headers=headers, json=booking_payload)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -140,7 +139,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
         self.assertEqual(len(meal_11['id']), 36)
 
         # verify voucher endpoint for passenger 1 ----
-        voucher_resp = requests.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'],
+        voucher_resp = http_client.get(url=self._api_host + '/api/v1/voucher/' + response_json['data']['voucher_id'],
                                     headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
         voucher_resp_json = voucher_resp.json()
@@ -178,7 +177,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
         # verify meal vouchers on passenger 1 full state
         url1 = self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=passenger_1_context_id)
         headers = self._generate_airline_headers(customer=customer)
-        response1 = requests.get(url=url1, headers=headers).json()
+        response1 = http_client.get(url=url1, headers=headers).json()
         meal_vouchers = response1['data']['voucher']['meal_vouchers']
         self.assertEqual(len(meal_vouchers), 2)
         for meal in meal_vouchers:
@@ -223,7 +222,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'GBP', 'meal_amount': '9.00', 'provider': 'icoupon', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'FEATURE_NOT_SUPPORTED', 'iCoupon is currently not enabled.', [])
 
@@ -257,7 +256,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'USD', 'meal_amount': '9.00', 'provider': 'icoupon', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'MEAL_CANNOT_BE_PROCESSED',
                                      'The requested meal currency USD is not the same as the expected local currency GBP', [])
@@ -268,7 +267,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'GBP', 'meal_amount': '9.00', 'provider': 'icoupon', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'MEAL_CANNOT_BE_PROCESSED',
                                      'The requested meal currency GBP is not the same as the expected local currency HUF', [])
@@ -286,7 +285,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'GBP', 'meal_amount': '9.00', 'provider': 'icoupon', 'number_of_days': 2},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'FEATURE_NOT_SUPPORTED', 'iCoupon meal vouchers only support number_of_days=1.', [])
 
@@ -308,13 +307,13 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'GBP', 'meal_amount': '9.00', 'provider': 'icoupon', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 201)
         passenger = response.json()['data'][0]
 
         # public decline
         decline_url = self._api_host + '/api/v1/offer/decline?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        response = requests.put(decline_url, headers=headers)
+        response = http_client.put(decline_url, headers=headers)
         self.assertEqual(response.status_code, 200)
 
     def test_icoupon_airline_decline(self):
@@ -335,13 +334,13 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'GBP', 'meal_amount': '9.00', 'provider': 'icoupon', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 201)
         passenger = response.json()['data'][0]
 
         # decline
         decline_offer_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/decline'
-        response = requests.put(decline_offer_url, headers=headers)
+        response = http_client.put(decline_offer_url, headers=headers)
         self.assertEqual(response.status_code, 200)
 
     def test_icoupon_offer_hotel(self):
@@ -362,7 +361,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'HUF', 'meal_amount': '9.00', 'provider': 'icoupon', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 201)
         passenger = response.json()['data'][0]
 
@@ -374,7 +373,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
 
         # public hotels
         offer_url = self._api_host + '/api/v1/offer/hotels?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        response = requests.post(offer_url, headers=headers, json=payload)
+        response = http_client.post(offer_url, headers=headers, json=payload)
         self.assertEqual(response.status_code, 200)
 
     def test_meal_validator(self):
@@ -391,7 +390,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'HUF', 'meal_amount': '9.00', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
                                      [{'field': '[0].meals[0].currency_code', 'message': '"HUF" is not a valid choice.'}])
@@ -403,7 +402,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'HUF', 'meal_amount': '9.00', 'number_of_days': 1, 'provider': 'tvl'},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
                                      [{'field': '[0].meals[1].currency_code', 'message': '"HUF" is not a valid choice.'}])
@@ -415,7 +414,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'USD', 'meal_amount': '9.00', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
                                      [{'field': '[1].meals[0].currency_code', 'message': 'This field is required.'}])
@@ -427,7 +426,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'meal_amount': '9.00', 'number_of_days': 1, 'currency_code': None}
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
                                      [{'field': '[1].meals[1].currency_code', 'message': 'This field may not be null.'}])
@@ -439,7 +438,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'meal_amount': '9.00', 'number_of_days': 1, 'currency_code': 'MOM'}
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
                                      [{'field': '[2].meals[1].currency_code', 'message': '"MOM" is not a valid choice.'}])
@@ -451,7 +450,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'meal_amount': '9.00', 'number_of_days': 1, 'currency_code': 'MOM'}
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
                                      [{'field': '[2].meals[1].currency_code', 'message': '"MOM" is not a valid choice.'}])
@@ -464,7 +463,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'currency_code': 'USD', 'meal_amount': '9.00', 'number_of_days': 1},
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
                                      [{'field': '[2].meals[1].currency_code', 'message': '"COP" is not a valid choice.'}])
@@ -477,7 +476,7 @@ class TestApiMealsICoupon(StormxSystemVerification):
             {'meal_amount': '9.00', 'number_of_days': 1, 'currency_code': 'COP'}
         ]
 
-        response = requests.post(passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(response.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
                                      [{'field': '[2].meals[2].currency_code', 'message': '"COP" is not a valid choice.'}])
@@ -3,7 +3,7 @@ import copy
 import json
 import unittest
 
-import requests
+from stormx_http import http_client
 
 from StormxApp.tests.data_utilities import (
     generate_context_id,
@@ -36,7 +36,6 @@ class TestApiNotifications(StormxSystemVerification):
     """
     Verify functionality related to notifications.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -53,7 +52,7 @@ class TestApiNotifications(StormxSystemVerification):
             notify=True
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -72,7 +71,7 @@ class TestApiNotifications(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         booking_response_json = booking_response.json()['data']
@@ -81,7 +80,7 @@ class TestApiNotifications(StormxSystemVerification):
         self.assertIsNone(booking_response_json['passengers'][0]['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -97,7 +96,7 @@ class TestApiNotifications(StormxSystemVerification):
         self.assertEqual(canceled_passengers[0]['hotel_accommodation_status'], 'canceled_voucher')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
@@ -113,7 +112,7 @@ class TestApiNotifications(StormxSystemVerification):
             notify=True
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -132,7 +131,7 @@ class TestApiNotifications(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         booking_response_json = booking_response.json()['data']
@@ -141,7 +140,7 @@ class TestApiNotifications(StormxSystemVerification):
         self.assertIsNone(booking_response_json['passengers'][0]['transport_accommodation_status'])
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -157,7 +156,7 @@ class TestApiNotifications(StormxSystemVerification):
         self.assertEqual(canceled_passengers[0]['hotel_accommodation_status'], 'canceled_voucher')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
@@ -176,7 +175,7 @@ class TestApiNotifications(StormxSystemVerification):
             phone_numbers=phone_list
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -188,7 +187,7 @@ class TestApiNotifications(StormxSystemVerification):
         self._test_passenger_notifications(passenger['notifications'], email_list, phone_list, 1, 1, 2, 0, False, True)
 
         cancel_url = self._api_host + '/api/v1/offer/cancel?ak1=' + passenger['ak1'] + '&ak2=' + passenger['ak2']
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -204,7 +203,7 @@ class TestApiNotifications(StormxSystemVerification):
         self.assertEqual(canceled_passengers[0]['hotel_accommodation_status'], 'canceled_offer')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'canceled_offer')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
@@ -225,7 +224,7 @@ class TestApiNotifications(StormxSystemVerification):
             phone_numbers=phone_list
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -237,7 +236,7 @@ class TestApiNotifications(StormxSystemVerification):
         self._test_passenger_notifications(passenger['notifications'], email_list, phone_list, 1, 1, 2, 0, False, False)
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -253,7 +252,7 @@ class TestApiNotifications(StormxSystemVerification):
         self.assertEqual(canceled_passengers[0]['hotel_accommodation_status'], 'canceled_offer')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_offer')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'canceled_offer')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
@@ -278,7 +277,7 @@ class TestApiNotifications(StormxSystemVerification):
             phone_numbers=['+12223334444']
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passengers = import_response_json['data']
@@ -298,7 +297,7 @@ class TestApiNotifications(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=booking_url, headers=headers, json=booking_payload)
+        booking_response = http_client.post(url=booking_url, headers=headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
 
         booking_response_json = booking_response.json()['data']
@@ -312,7 +311,7 @@ class TestApiNotifications(StormxSystemVerification):
         passenger2 = booking_response_json['passengers'][1]
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger1['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
@@ -329,13 +328,13 @@ class TestApiNotifications(StormxSystemVerification):
             self.assertEqual(passenger['hotel_accommodation_status'], 'canceled_voucher')
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger1['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger2['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
         self.assertIsNone(get_passenger_response['data']['transport_accommodation_status'])
@@ -367,9 +366,9 @@ class TestApiNotifications(StormxSystemVerification):
         notification_url = self._api_host + '/api/v1/passenger/' + context_ids[0] + '/notifications'
         notification_payload_email = {'email': 'stormx.test3@tvlinc.com'}
         notification_payload_text = {'text': '+13334444'}
-        notification_resp = requests.post(url=notification_url, headers=headers, data=notification_payload_email)
+        notification_resp = http_client.post(url=notification_url, headers=headers, data=notification_payload_email)
         self.assertEqual(notification_resp.status_code, 200)
-        notification_resp = requests.post(url=notification_url, headers=headers, data=notification_payload_text)
+        notification_resp = http_client.post(url=notification_url, headers=headers, data=notification_payload_text)
         self.assertEqual(notification_resp.status_code, 200)
 
         emails.append('stormx.test3@tvlinc.com')
@@ -377,7 +376,7 @@ class TestApiNotifications(StormxSystemVerification):
 
         voucher_id = booking_response_data['voucher_id']
         voucher_url = self._api_host + '/api/v1/voucher/' + str(voucher_id)
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         voucher_resp_json = voucher_resp.json()
 
         self.assertEqual(voucher_resp.status_code, 200)
@@ -427,7 +426,7 @@ class TestApiNotifications(StormxSystemVerification):
             hotel_accommodation=False
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        import_resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
         for passenger in import_resp_json['data']:
@@ -435,13 +434,13 @@ class TestApiNotifications(StormxSystemVerification):
             for notification in passenger['notifications']:
                 self.assertEqual(notification['notification_type'], 'confirmation')
 
-        pax1_resp = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         pax1_resp_notifications = pax1_resp.json()['data']['notifications']
 
         self._test_passenger_notifications(pax1_resp_notifications, emails1, phone_numbers1, 2, 2, 0, 4)
 
-        pax1_state_resp = requests.get(url=passenger_url + '/' + context_id1 + '/state', headers=headers)
+        pax1_state_resp = http_client.get(url=passenger_url + '/' + context_id1 + '/state', headers=headers)
         self.assertEqual(pax1_state_resp.status_code, 200)
         pax_1_state_notifications = pax1_state_resp.json()['data']['passenger']['notifications']
 
@@ -465,12 +464,12 @@ class TestApiNotifications(StormxSystemVerification):
             notify=True
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        import_resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
         passenger = import_resp_json['data'][0]
 
-        pax1_resp = requests.get(url=passenger_url + '/' + passenger['context_id'], headers=headers)
+        pax1_resp = http_client.get(url=passenger_url + '/' + passenger['context_id'], headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         pax1_resp_json = pax1_resp.json()
 
@@ -483,7 +482,7 @@ class TestApiNotifications(StormxSystemVerification):
         picked_hotel = hotel_offerings[0]
         self._passenger_book_hotel(passenger, picked_hotel, [passenger['context_id']], room_count=desired_room_count)
 
-        pax1_resp2 = requests.get(url=passenger_url + '/' + passenger['context_id'], headers=headers)
+        pax1_resp2 = http_client.get(url=passenger_url + '/' + passenger['context_id'], headers=headers)
         self.assertEqual(pax1_resp2.status_code, 200)
         pax1_resp_json2 = pax1_resp2.json()
 
@@ -530,7 +529,7 @@ class TestApiNotifications(StormxSystemVerification):
             notify=True
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        import_resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
         passenger = import_resp_json['data'][0]
@@ -543,19 +542,19 @@ class TestApiNotifications(StormxSystemVerification):
         picked_hotel = hotel_offerings[0]
         self._passenger_book_hotel(passenger, picked_hotel, context_ids, room_count=desired_room_count)
 
-        pax1_resp = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         notifications1 = pax1_resp.json()['data']['notifications']
 
         self._test_passenger_notifications(notifications1, emails1, phone_numbers1, 4, 4, 4, 4)
 
-        pax2_resp = requests.get(url=passenger_url + '/' + context_id2, headers=headers)
+        pax2_resp = http_client.get(url=passenger_url + '/' + context_id2, headers=headers)
         self.assertEqual(pax2_resp.status_code, 200)
         notifications2 = pax2_resp.json()['data']['notifications']
 
         self._test_passenger_notifications(notifications2, emails2, phone_numbers2, 4, 4, 4, 4)
 
-        pax3_resp = requests.get(url=passenger_url + '/' + context_id3, headers=headers)
+        pax3_resp = http_client.get(url=passenger_url + '/' + context_id3, headers=headers)
         self.assertEqual(pax3_resp.status_code, 200)
         notifications3 = pax3_resp.json()['data']['notifications']
 
@@ -587,11 +586,11 @@ class TestApiNotifications(StormxSystemVerification):
             hotel_accommodation=False
         ))
 
-        delta_import_response = requests.post(url=import_url, headers=delta_headers, json=passenger1_payload)
+        delta_import_response = http_client.post(url=import_url, headers=delta_headers, json=passenger1_payload)
         self.assertEqual(delta_import_response.status_code, 201)
         import_response_json = delta_import_response.json()
 
-        delta_import_response2 = requests.post(url=import_url, headers=delta_headers, json=passenger2_payload)
+        delta_import_response2 = http_client.post(url=import_url, headers=delta_headers, json=passenger2_payload)
         self.assertEqual(delta_import_response2.status_code, 201)
         import_response2_json = delta_import_response2.json()
 
@@ -622,71 +621,71 @@ class TestApiNotifications(StormxSystemVerification):
         error_message_bad_operation = 'Passenger cannot send notification. Offer is not in final state.'
 
         # multi tenant check
-        security_1 = requests.post(url=notify_url_2, headers=american_headers, json=notification_data_email)
+        security_1 = http_client.post(url=notify_url_2, headers=american_headers, json=notification_data_email)
         self.assertEqual(security_1.status_code, 404)
         response_json = security_1.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 404, 'Not Found', 'PASSENGER_NOT_FOUND', 'Passenger not found for ' + passenger2['context_id'], [])
 
         # test bad data inputs
-        public_bad_1 = requests.post(url=public_notify_url_1, headers=delta_headers, json=notification_data_bad)
+        public_bad_1 = http_client.post(url=public_notify_url_1, headers=delta_headers, json=notification_data_bad)
         self.assertEqual(public_bad_1.status_code, 400)
         response_json = public_bad_1.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'CANNOT_NOTIFY', error_message_bad_operation, [])
 
-        bad_1 = requests.post(url=notify_url_1, headers=delta_headers, json=notification_data_bad)
+        bad_1 = http_client.post(url=notify_url_1, headers=delta_headers, json=notification_data_bad)
         self.assertEqual(bad_1.status_code, 400)
         response_json = bad_1.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'CANNOT_NOTIFY', error_message_bad_input, [])
 
-        public_bad_2 = requests.post(url=public_notify_url_2, headers=delta_headers, json=dict())
+        public_bad_2 = http_client.post(url=public_notify_url_2, headers=delta_headers, json=dict())
         self.assertEqual(public_bad_2.status_code, 400)
         response_json = public_bad_2.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'CANNOT_NOTIFY', error_message_bad_input, [])
 
-        bad_2 = requests.post(url=notify_url_2, headers=delta_headers, json=dict())
+        bad_2 = http_client.post(url=notify_url_2, headers=delta_headers, json=dict())
         self.assertEqual(bad_2.status_code, 400)
         response_json = bad_2.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'CANNOT_NOTIFY', error_message_bad_input, [])
 
-        public_bad_1 = requests.post(url=public_notify_url_1, headers=delta_headers, json=notification_data_email)
+        public_bad_1 = http_client.post(url=public_notify_url_1, headers=delta_headers, json=notification_data_email)
         self.assertEqual(public_bad_1.status_code, 400)
         response_json = public_bad_1.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'CANNOT_NOTIFY', error_message_bad_operation, [])
 
-        public_bad_2 = requests.post(url=public_notify_url_1, headers=delta_headers, json=notification_data_text)
+        public_bad_2 = http_client.post(url=public_notify_url_1, headers=delta_headers, json=notification_data_text)
         self.assertEqual(public_bad_2.status_code, 400)
         response_json = public_bad_2.json()
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'CANNOT_NOTIFY', error_message_bad_operation, [])
 
         # test good cases
-        notify_1 = requests.post(url=notify_url_1, headers=delta_headers, json=notification_data_email)
+        notify_1 = http_client.post(url=notify_url_1, headers=delta_headers, json=notification_data_email)
         self.assertEqual(notify_1.status_code, 200)
         self._test_passenger_notifications([notify_1.json()['data']], emails, phone_numbers, 1, 0, 1, 0, False)
 
-        notify_2 = requests.post(url=notify_url_1, headers=delta_headers, json=notification_data_text)
+        notify_2 = http_client.post(url=notify_url_1, headers=delta_headers, json=notification_data_text)
         self.assertEqual(notify_2.status_code, 200)
         self._test_passenger_notifications([notify_2.json()['data']], emails, phone_numbers, 0, 1, 1, 0, False)
 
-        notify_3 = requests.post(url=notify_url_2, headers=delta_headers, json=notification_data_email)
+        notify_3 = http_client.post(url=notify_url_2, headers=delta_headers, json=notification_data_email)
         self.assertEqual(notify_3.status_code, 200)
         self._test_passenger_notifications([notify_3.json()['data']], emails, phone_numbers, 1, 0, 0, 1, False)
 
-        notify_4 = requests.post(url=notify_url_2, headers=delta_headers, json=notification_data_text)
+        notify_4 = http_client.post(url=notify_url_2, headers=delta_headers, json=notification_data_text)
         self.assertEqual(notify_4.status_code, 200)
         self._test_passenger_notifications([notify_4.json()['data']], emails, phone_numbers, 0, 1, 0, 1, False)
 
-        public_notify_1 = requests.post(url=public_notify_url_2, headers=delta_headers, json=notification_data_email)
+        public_notify_1 = http_client.post(url=public_notify_url_2, headers=delta_headers, json=notification_data_email)
         self.assertEqual(public_notify_1.status_code, 200)
         self._test_passenger_notifications([public_notify_1.json()['data']], emails, phone_numbers, 1, 0, 0, 1, False, True)
 
-        public_notify_2 = requests.post(url=public_notify_url_2, headers=delta_headers, json=notification_data_text)
+        public_notify_2 = http_client.post(url=public_notify_url_2, headers=delta_headers, json=notification_data_text)
         self.assertEqual(public_notify_2.status_code, 200)
         self._test_passenger_notifications([public_notify_2.json()['data']], emails, phone_numbers, 0, 1, 0, 1, False, True)
 
@@ -699,7 +698,7 @@ class TestApiNotifications(StormxSystemVerification):
         headers = self._generate_airline_headers(customer)
 
         passenger_payload = self._generate_n_passenger_payload(1)
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
@@ -714,13 +713,13 @@ class TestApiNotifications(StormxSystemVerification):
         self.assertEqual(book_resp['passengers'][0]['meal_accommodation_status'], 'accepted')
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_voucher')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
 
@@ -738,19 +737,19 @@ class TestApiNotifications(StormxSystemVerification):
         emails = ['a@b.com']
         phone_numbers = ['+15595595599']
 
-        notify_1 = requests.post(url=notify_url_1, headers=headers, json=notification_data_email)
+        notify_1 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_email)
         self.assertEqual(notify_1.status_code, 200)
         self._test_passenger_notifications([notify_1.json()['data']], emails, phone_numbers, 1, 0, 0, 1, False)
 
-        notify_2 = requests.post(url=notify_url_1, headers=headers, json=notification_data_text)
+        notify_2 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(notify_2.status_code, 200)
         self._test_passenger_notifications([notify_2.json()['data']], emails, phone_numbers, 0, 1, 0, 1, False)
 
-        public_notify_1 = requests.post(url=public_notify_url_1, headers=headers, json=notification_data_email)
+        public_notify_1 = http_client.post(url=public_notify_url_1, headers=headers, json=notification_data_email)
         self.assertEqual(public_notify_1.status_code, 200)
         self._test_passenger_notifications([public_notify_1.json()['data']], emails, phone_numbers, 1, 0, 0, 1, False, True)
 
-        public_notify_2 = requests.post(url=public_notify_url_1, headers=headers, json=notification_data_text)
+        public_notify_2 = http_client.post(url=public_notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(public_notify_2.status_code, 200)
         self._test_passenger_notifications([public_notify_2.json()['data']], emails, phone_numbers, 0, 1, 0, 1, False, True)
 
@@ -765,19 +764,19 @@ class TestApiNotifications(StormxSystemVerification):
         headers = self._generate_airline_headers(customer)
 
         passenger_payload = self._generate_n_passenger_payload(1)
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
 
         cancel_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel'
-        cancel_response = requests.put(url=cancel_url, headers=headers)
+        cancel_response = http_client.put(url=cancel_url, headers=headers)
         self.assertEqual(cancel_response.status_code, 200)
         cancel_response_json = cancel_response.json()
         self.assertIs(cancel_response_json['error'], False)
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'canceled_offer')
 
         notify_url_1 = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications'
@@ -791,25 +790,25 @@ class TestApiNotifications(StormxSystemVerification):
             'text': '+15595595599'
         })
 
-        notify_1 = requests.post(url=notify_url_1, headers=headers, json=notification_data_email)
+        notify_1 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_email)
         self.assertEqual(notify_1.status_code, 400)
         notify_resp_json = notify_1.json()
         log_error_system_tests_output(pretty_print_json(notify_resp_json))
         self._validate_error_message(notify_resp_json, 400, 'Bad Request', 'CANNOT_NOTIFY', expected_error_message, [])
 
-        notify_2 = requests.post(url=notify_url_1, headers=headers, json=notification_data_text)
+        notify_2 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(notify_2.status_code, 400)
         notify_resp_json2 = notify_2.json()
         log_error_system_tests_output(pretty_print_json(notify_resp_json2))
         self._validate_error_message(notify_resp_json2, 400, 'Bad Request', 'CANNOT_NOTIFY', expected_error_message, [])
 
-        public_notify_1 = requests.post(url=public_notify_url_1, headers=headers, json=notification_data_email)
+        public_notify_1 = http_client.post(url=public_notify_url_1, headers=headers, json=notification_data_email)
         self.assertEqual(public_notify_1.status_code, 400)
         public_notify_json = public_notify_1.json()
         log_error_system_tests_output(pretty_print_json(public_notify_json))
         self._validate_error_message(public_notify_json, 400, 'Bad Request', 'CANNOT_NOTIFY', expected_error_message, [])
 
-        public_notify_2 = requests.post(url=public_notify_url_1, headers=headers, json=notification_data_text)
+        public_notify_2 = http_client.post(url=public_notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(public_notify_2.status_code, 400)
         public_notify_json2 = public_notify_2.json()
         log_error_system_tests_output(pretty_print_json(public_notify_json2))
@@ -824,19 +823,19 @@ class TestApiNotifications(StormxSystemVerification):
         headers = self._generate_airline_headers(customer)
 
         passenger_payload = self._generate_n_passenger_payload(1)
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
 
         decline_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/decline'
-        deny_response = requests.put(url=decline_url, headers=headers)
+        deny_response = http_client.put(url=decline_url, headers=headers)
         self.assertEqual(deny_response.status_code, 200)
         deny_response_json = deny_response.json()
         self.assertIs(deny_response_json['error'], False)
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'declined')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'accepted')
 
@@ -854,19 +853,19 @@ class TestApiNotifications(StormxSystemVerification):
         emails = ['a@b.com']
         phone_numbers = ['+15595595599']
 
-        notify_1 = requests.post(url=notify_url_1, headers=headers, json=notification_data_email)
+        notify_1 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_email)
         self.assertEqual(notify_1.status_code, 200)
         self._test_passenger_notifications([notify_1.json()['data']], emails, phone_numbers, 1, 0, 0, 1, False)
 
-        notify_2 = requests.post(url=notify_url_1, headers=headers, json=notification_data_text)
+        notify_2 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(notify_2.status_code, 200)
         self._test_passenger_notifications([notify_2.json()['data']], emails, phone_numbers, 0, 1, 0, 1, False)
 
-        public_notify_1 = requests.post(url=public_notify_url_1, headers=headers, json=notification_data_email)
+        public_notify_1 = http_client.post(url=public_notify_url_1, headers=headers, json=notification_data_email)
         self.assertEqual(public_notify_1.status_code, 200)
         self._test_passenger_notifications([public_notify_1.json()['data']], emails, phone_numbers, 1, 0, 0, 1, False, True)
 
-        public_notify_2 = requests.post(url=public_notify_url_1, headers=headers, json=notification_data_text)
+        public_notify_2 = http_client.post(url=public_notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(public_notify_2.status_code, 200)
         self._test_passenger_notifications([public_notify_2.json()['data']], emails, phone_numbers, 0, 1, 0, 1, False, True)
 
@@ -885,19 +884,19 @@ class TestApiNotifications(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        import_response = requests.post(url=offer_url, headers=headers, json=passenger_payload)
+        import_response = http_client.post(url=offer_url, headers=headers, json=passenger_payload)
         self.assertEqual(import_response.status_code, 201)
         import_response_json = import_response.json()
         passenger = import_response_json['data'][0]
 
         decline_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/decline'
-        deny_response = requests.put(url=decline_url, headers=headers)
+        deny_response = http_client.put(url=decline_url, headers=headers)
         self.assertEqual(deny_response.status_code, 200)
         deny_response_json = deny_response.json()
         self.assertIs(deny_response_json['error'], False)
 
         get_passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
-        get_passenger_response = requests.get(url=get_passenger_url, headers=headers).json()
+        get_passenger_response = http_client.get(url=get_passenger_url, headers=headers).json()
         self.assertEqual(get_passenger_response['data']['hotel_accommodation_status'], 'declined')
         self.assertEqual(get_passenger_response['data']['meal_accommodation_status'], 'not_offered')
 
@@ -908,13 +907,13 @@ class TestApiNotifications(StormxSystemVerification):
             'email': 'a@b.com'
         })
 
-        notify_resp = requests.post(url=notify_url, headers=headers, json=notification_data)
+        notify_resp = http_client.post(url=notify_url, headers=headers, json=notification_data)
         self.assertEqual(notify_resp.status_code, 400)
         notify_resp_json = notify_resp.json()
         log_error_system_tests_output(pretty_print_json(notify_resp_json))
         self._validate_error_message(notify_resp_json, 400, 'Bad Request', 'CANNOT_NOTIFY', expected_error_message, [])
 
-        public_notify_resp = requests.post(url=public_notify_url, headers=headers, json=notification_data)
+        public_notify_resp = http_client.post(url=public_notify_url, headers=headers, json=notification_data)
         self.assertEqual(public_notify_resp.status_code, 400)
         public_notify_json = public_notify_resp.json()
         log_error_system_tests_output(pretty_print_json(public_notify_json))
@@ -940,14 +939,14 @@ class TestApiNotifications(StormxSystemVerification):
             notify=True
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        import_resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
         passenger = import_resp_json['data'][0]
         context_ids = [passenger['context_id'] for passenger in import_resp_json['data']]
         self._test_passenger_notifications(passenger['notifications'], emails1, phone_numbers1, 2, 2, 4, 0, False)
 
-        pax1_resp = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         notifications1 = pax1_resp.json()['data']['notifications']
         self._test_passenger_notifications(notifications1, emails1, phone_numbers1, 2, 2, 4, 0)
@@ -965,11 +964,11 @@ class TestApiNotifications(StormxSystemVerification):
         emails1.append('a@b.com')
         phone_numbers1.append('+15595595599')
 
-        notify_1 = requests.post(url=notify_url_1, headers=headers, json=notification_data_email)
+        notify_1 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_email)
         self.assertEqual(notify_1.status_code, 200)
         self._test_passenger_notifications([notify_1.json()['data']], emails1, phone_numbers1, 1, 0, 1, 0, False)
 
-        pax1_resp2 = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp2 = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp2.status_code, 200)
         notifications2 = pax1_resp2.json()['data']['notifications']
         self._test_passenger_notifications(notifications2, emails1, phone_numbers1, 3, 2, 5, 0)
@@ -983,16 +982,16 @@ class TestApiNotifications(StormxSystemVerification):
         confirmations = [notification for passenger in book_resp['passengers'] for notification in passenger['notifications']]
         self._test_passenger_notifications(confirmations, emails1, phone_numbers1, 6, 4, 5, 5, public_notification=True)
 
-        pax1_resp3 = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp3 = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp3.status_code, 200)
         notifications3 = pax1_resp3.json()['data']['notifications']
         self._test_passenger_notifications(notifications3, emails1, phone_numbers1, 6, 4, 5, 5)
 
-        notify_2 = requests.post(url=notify_url_1, headers=headers, json=notification_data_text)
+        notify_2 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(notify_2.status_code, 200)
         self._test_passenger_notifications([notify_2.json()['data']], emails1, phone_numbers1, 0, 1, 0, 1, False)
 
-        pax1_resp4 = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp4 = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp4.status_code, 200)
         notifications4 = pax1_resp4.json()['data']['notifications']
         self._test_passenger_notifications(notifications4, emails1, phone_numbers1, 6, 5, 5, 6)
@@ -1018,13 +1017,13 @@ class TestApiNotifications(StormxSystemVerification):
             hotel_accommodation=False
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        import_resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
         passenger = import_resp_json['data'][0]
         self.assertEqual(len(passenger['notifications']), 0)
 
-        pax1_resp = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         notifications1 = pax1_resp.json()['data']['notifications']
         self._test_passenger_notifications(notifications1, emails1, phone_numbers1, 0, 0, 0, 0)
@@ -1040,7 +1039,7 @@ class TestApiNotifications(StormxSystemVerification):
             notify=False
         ))
 
-        import_resp2 = requests.post(url=passenger_url, headers=headers, json=passengers_payload2)
+        import_resp2 = http_client.post(url=passenger_url, headers=headers, json=passengers_payload2)
         self.assertEqual(import_resp2.status_code, 201)
         import_resp_json2 = import_resp2.json()
         passenger2 = import_resp_json2['data'][0]
@@ -1056,7 +1055,7 @@ class TestApiNotifications(StormxSystemVerification):
         confirmations = [notification for passenger in book_resp['passengers'] for notification in passenger['notifications']]
         self._test_passenger_notifications(confirmations, emails1, phone_numbers1, 0, 0, 0, 0)
 
-        pax1_resp2 = requests.get(url=passenger_url + '/' + context_id2, headers=headers)
+        pax1_resp2 = http_client.get(url=passenger_url + '/' + context_id2, headers=headers)
         self.assertEqual(pax1_resp2.status_code, 200)
         notifications2 = pax1_resp2.json()['data']['notifications']
         self._test_passenger_notifications(notifications2, emails1, phone_numbers1, 0, 0, 0, 0)
@@ -1077,7 +1076,7 @@ class TestApiNotifications(StormxSystemVerification):
             notify=False
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        import_resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
         passenger = import_resp_json['data'][0]
@@ -1092,7 +1091,7 @@ class TestApiNotifications(StormxSystemVerification):
 
         phone_numbers = ['+15595595599']
 
-        notify_1 = requests.post(url=notify_url_1, headers=headers, json=notification_data_text)
+        notify_1 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(notify_1.status_code, 200)
         self._test_passenger_notifications([notify_1.json()['data']], [], phone_numbers, 0, 1, 1, 0, False)
 
@@ -1105,7 +1104,7 @@ class TestApiNotifications(StormxSystemVerification):
         confirmations = [notification for passenger in book_resp['passengers'] for notification in passenger['notifications']]
         self._test_passenger_notifications(confirmations, [], phone_numbers, 0, 1, 1, 0, public_notification=True)
 
-        pax1_resp = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         notifications = pax1_resp.json()['data']['notifications']
         self._test_passenger_notifications(notifications, [], phone_numbers, 0, 1, 1, 0)
@@ -1136,7 +1135,7 @@ class TestApiNotifications(StormxSystemVerification):
             notify=False
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        import_resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
         self.assertEqual(len(import_resp_json['data']), 2)
@@ -1156,11 +1155,11 @@ class TestApiNotifications(StormxSystemVerification):
             'email': emails1[0]
         })
 
-        notify_1 = requests.post(url=notify_url_1, headers=headers, json=notification_data_text)
+        notify_1 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_text)
         self.assertEqual(notify_1.status_code, 200)
         self._test_passenger_notifications([notify_1.json()['data']], emails1, phone_numbers1, 0, 1, 1, 0, False)
 
-        notify_2 = requests.post(url=notify_url_1, headers=headers, json=notification_data_email)
+        notify_2 = http_client.post(url=notify_url_1, headers=headers, json=notification_data_email)
         self.assertEqual(notify_2.status_code, 200)
         self._test_passenger_notifications([notify_2.json()['data']], emails1, phone_numbers1, 1, 0, 1, 0, False)
 
@@ -1173,12 +1172,12 @@ class TestApiNotifications(StormxSystemVerification):
         confirmations = [notification for passenger in book_resp['passengers'] for notification in passenger['notifications']]
         self._test_passenger_notifications(confirmations, emails1, phone_numbers1, 5, 5, 6, 4, public_notification=True)
 
-        pax1_resp = requests.get(url=passenger_url + '/' + passenger['context_id'], headers=headers)
+        pax1_resp = http_client.get(url=passenger_url + '/' + passenger['context_id'], headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         notifications = pax1_resp.json()['data']['notifications']
         self._test_passenger_notifications(notifications, emails1, phone_numbers1, 5, 5, 6, 4)
 
-        pax2_resp = requests.get(url=passenger_url + '/' + passenger2['context_id'], headers=headers)
+        pax2_resp = http_client.get(url=passenger_url + '/' + passenger2['context_id'], headers=headers)
         self.assertEqual(pax2_resp.status_code, 200)
         notifications2 = pax2_resp.json()['data']['notifications']
         self._test_passenger_notifications(notifications2, emails1, phone_numbers1, 0, 0, 0, 0)
@@ -1197,7 +1196,7 @@ class TestApiNotifications(StormxSystemVerification):
             'email': 'testblackholetravellianceinc.com'
         }
 
-        notify_resp = requests.post(url=notify_url, json=notification_data_text, headers=headers)
+        notify_resp = http_client.post(url=notify_url, json=notification_data_text, headers=headers)
         self.assertEqual(notify_resp.status_code, 400)
         self._validate_error_message(notify_resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger notifications.',
@@ -1207,7 +1206,7 @@ class TestApiNotifications(StormxSystemVerification):
             'email': 'testareallylongnameyoukowwhatImeanonthenotificationsendpointyadadad@blackhole.travellianceinc.com'
         }
 
-        notify_resp = requests.post(url=notify_url, json=notification_data_text, headers=headers)
+        notify_resp = http_client.post(url=notify_url, json=notification_data_text, headers=headers)
         self.assertEqual(notify_resp.status_code, 400)
         self._validate_error_message(notify_resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger notifications.',
@@ -1227,7 +1226,7 @@ class TestApiNotifications(StormxSystemVerification):
             'text': '15591234567'
         }
 
-        notify_resp = requests.post(url=notify_url, json=notification_data_text, headers=headers)
+        notify_resp = http_client.post(url=notify_url, json=notification_data_text, headers=headers)
         self.assertEqual(notify_resp.status_code, 400)
         self._validate_error_message(notify_resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger notifications.',
@@ -1237,7 +1236,7 @@ class TestApiNotifications(StormxSystemVerification):
             'text': '+155912345670178945642345961489641531987198513521981981'
         }
 
-        notify_resp = requests.post(url=notify_url, json=notification_data_text, headers=headers)
+        notify_resp = http_client.post(url=notify_url, json=notification_data_text, headers=headers)
         self.assertEqual(notify_resp.status_code, 400)
         self._validate_error_message(notify_resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger notifications.',
@@ -1282,38 +1281,38 @@ class TestApiNotifications(StormxSystemVerification):
         passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
         notification_url = passenger_url + '/notifications'
 
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
-        notify_resp = requests.post(url=notification_url, headers=headers, json=existing_email_data)
+        notify_resp = http_client.post(url=notification_url, headers=headers, json=existing_email_data)
         self.assertEqual(notify_resp.status_code, 200)
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
-        notify_resp = requests.post(url=notification_url, headers=headers, json=existing_text_data)
+        notify_resp = http_client.post(url=notification_url, headers=headers, json=existing_text_data)
         self.assertEqual(notify_resp.status_code, 200)
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
-        notify_resp = requests.post(url=notification_url, headers=headers, json=new_email_data)
+        notify_resp = http_client.post(url=notification_url, headers=headers, json=new_email_data)
         self.assertEqual(notify_resp.status_code, 200)
         emails1.append(new_email_data['email'])
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
-        notify_resp = requests.post(url=notification_url, headers=headers, json=new_text_data)
+        notify_resp = http_client.post(url=notification_url, headers=headers, json=new_text_data)
         self.assertEqual(notify_resp.status_code, 200)
         phone_numbers1.append(new_text_data['text'])
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
         passenger_state_url = passenger_url + '/state'
-        state_resp = requests.get(url=passenger_state_url, headers=headers)
+        state_resp = http_client.get(url=passenger_state_url, headers=headers)
         self.assertEqual(state_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, state_resp.json()['data']['passenger'])
 
@@ -1337,37 +1336,37 @@ class TestApiNotifications(StormxSystemVerification):
         passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
         notification_url = passenger_url + '/notifications'
 
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
-        notify_resp = requests.post(url=notification_url, headers=headers, json=existing_email_data)
+        notify_resp = http_client.post(url=notification_url, headers=headers, json=existing_email_data)
         self.assertEqual(notify_resp.status_code, 200)
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
-        notify_resp = requests.post(url=notification_url, headers=headers, json=existing_text_data)
+        notify_resp = http_client.post(url=notification_url, headers=headers, json=existing_text_data)
         self.assertEqual(notify_resp.status_code, 200)
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
-        notify_resp = requests.post(url=notification_url, headers=headers, json=new_email_data)
+        notify_resp = http_client.post(url=notification_url, headers=headers, json=new_email_data)
         self.assertEqual(notify_resp.status_code, 200)
         emails1.append(new_email_data['email'])
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
-        notify_resp = requests.post(url=notification_url, headers=headers, json=new_text_data)
+        notify_resp = http_client.post(url=notification_url, headers=headers, json=new_text_data)
         self.assertEqual(notify_resp.status_code, 200)
         phone_numbers1.append(new_text_data['text'])
-        passenger_resp = requests.get(url=passenger_url, headers=headers)
+        passenger_resp = http_client.get(url=passenger_url, headers=headers)
         self.assertEqual(passenger_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, passenger_resp.json()['data'])
 
         passenger_state_url = passenger_url + '/state'
-        state_resp = requests.get(url=passenger_state_url, headers=headers)
+        state_resp = http_client.get(url=passenger_state_url, headers=headers)
         self.assertEqual(state_resp.status_code, 200)
         self._test_passenger_contact_info(emails1, phone_numbers1, state_resp.json()['data']['passenger'])
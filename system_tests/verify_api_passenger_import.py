@@ -1,6 +1,6 @@
 from uuid import UUID
 
-import requests
+from stormx_http import http_client
 
 from StormxApp.tests.data_utilities import (
     generate_pax_record_locator,
@@ -17,7 +17,6 @@ class TestApiPassengerImport(StormxSystemVerification):
     """
     Verify passenger import input validation and functionality.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -62,7 +61,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             pax_record_locator=pax_record_locator_50_chars,
             pax_record_locator_group=pax_record_locator_50_chars
         )
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['data'][0]['pax_record_locator'], pax_record_locator_50_chars)
@@ -74,7 +73,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             pax_record_locator=pax_record_locator_51_chars,
             pax_record_locator_group=pax_record_locator_51_chars
         )
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['meta']['error_description'], 'Invalid input criteria for passenger import.')
@@ -108,8 +107,8 @@ class TestApiPassengerImport(StormxSystemVerification):
         url2 = self._api_host + '/api/v1/passenger/' + passengers[1]['context_id'] + '/state'
         headers = self._generate_airline_headers(customer=customer)
 
-        response1 = requests.get(url=url1, headers=headers).json()
-        response2 = requests.get(url=url2, headers=headers).json()
+        response1 = http_client.get(url=url1, headers=headers).json()
+        response2 = http_client.get(url=url2, headers=headers).json()
         self.assertEqual(len(response1['data']['voucher']['meal_vouchers']), 2)
         self.assertEqual(len(response2['data']['voucher']['meal_vouchers']), 2)
         self.assertEqual(response1['data']['voucher']['hotel_voucher'], None)
@@ -128,7 +127,7 @@ class TestApiPassengerImport(StormxSystemVerification):
     #     headers = self._generate_airline_headers(customer=customer)
     #
     #     passengers_payload = self._generate_2_passenger_payload(transport_accommodation=True)
-    #     response = requests.post(url, headers=headers, json=passengers_payload)
+    #     response = http_client.post(url, headers=headers, json=passengers_payload)
     #     self.assertEqual(response.status_code, 400)
     #     response_json = response.json()
     #     self.assertIs(response_json['error'], True)
@@ -144,14 +143,14 @@ class TestApiPassengerImport(StormxSystemVerification):
 
         # verify 99 passengers are allowed.
         passengers_payload = self._generate_n_passenger_payload(99)
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 201)
         response_json = response.json()
         self.assertIs(response_json['error'], False)
 
         # verify 100 passengers are not allowed.
         passengers_payload = self._generate_n_passenger_payload(100)
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 400)
         response_json = response.json()
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -183,12 +182,12 @@ class TestApiPassengerImport(StormxSystemVerification):
     #     # note that these two groups of passengers have different pax_record_locator_groups.
     #     pax_record_locator = generate_pax_record_locator()
     #     passengers_payload = self._generate_n_passenger_payload(4, pax_record_locator=pax_record_locator)
-    #     response = requests.post(url, headers=headers, json=passengers_payload)
+    #     response = http_client.post(url, headers=headers, json=passengers_payload)
     #     self.assertEqual(response.status_code, 201)
     #     response_json = response.json()
     #     self.assertIs(response_json['error'], False)
     #     passengers_payload = self._generate_n_passenger_payload(5, pax_record_locator=pax_record_locator)
-    #     response = requests.post(url, headers=headers, json=passengers_payload)
+    #     response = http_client.post(url, headers=headers, json=passengers_payload)
     #     self.assertEqual(response.status_code, 201)
     #     response_json = response.json()
     #     self.assertIs(response_json['error'], False)
@@ -197,12 +196,12 @@ class TestApiPassengerImport(StormxSystemVerification):
     #     # note that these two groups of passengers have different pax_record_locator_groups.
     #     pax_record_locator = generate_pax_record_locator()
     #     passengers_payload = self._generate_n_passenger_payload(4, pax_record_locator=pax_record_locator)
-    #     response = requests.post(url, headers=headers, json=passengers_payload)
+    #     response = http_client.post(url, headers=headers, json=passengers_payload)
     #     self.assertEqual(response.status_code, 201)
     #     response_json = response.json()
     #     self.assertIs(response_json['error'], False)
     #     passengers_payload = self._generate_n_passenger_payload(5, pax_record_locator=pax_record_locator)
-    #     response = requests.post(url, headers=headers, json=passengers_payload)
+    #     response = http_client.post(url, headers=headers, json=passengers_payload)
     #     self.assertEqual(response.status_code, 400)
     #     response_json = response.json()
     #     self.assertIs(response_json['error'], True)
@@ -260,10 +259,10 @@ class TestApiPassengerImport(StormxSystemVerification):
     #
     #     # make request with certain `pax_record_locator` & `pax_record_locator_group`
     #     passengers_payload = self._generate_2_passenger_payload(**common_group_info)
-    #     response = requests.post(url, headers=headers, json=passengers_payload)
+    #     response = http_client.post(url, headers=headers, json=passengers_payload)
     #
     #     passengers_payload = self._generate_2_passenger_payload(**common_group_info)
-    #     response = requests.post(url, headers=headers, json=passengers_payload)
+    #     response = http_client.post(url, headers=headers, json=passengers_payload)
     #     self.assertEqual(response.status_code, 400)
     #     response_json = response.json()
     #     self.assertIs(response_json['error'], True)
@@ -299,7 +298,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meal_accommodation=True,
             pax_record_locator_group=generate_pax_record_locator_group(),
         ))
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 201)
         response_json = response.json()
         passengers = response_json['data']
@@ -323,7 +322,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             pax_record_locator=generate_pax_record_locator(),
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -344,7 +343,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             number_of_nights=2,
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -372,7 +371,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             number_of_nights=2,
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -383,7 +382,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             number_of_nights=1,
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 201)
 
     def test_validate_booking_different_number_of_nights(self):
@@ -400,7 +399,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             number_of_nights=2,
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -429,7 +428,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             hotel_id=hotel_id_jfk
         )
 
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 400)
         hotel_booking_json = hotel_booking_resp.json()
 
@@ -452,7 +451,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -475,7 +474,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         del passengers_payload[0]['emails']
         del passengers_payload[0]['phone_numbers']
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -494,7 +493,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         # bad phone number ----
         phone_numbers = ['My cell: 555 1234']
         passengers_payload = self._generate_n_passenger_payload(1, emails=[], phone_numbers=phone_numbers, notify=True)
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(
@@ -515,7 +514,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         # bad phone number ----
         phone_numbers = ['+1']
         passengers_payload = self._generate_n_passenger_payload(1, emails=[], phone_numbers=phone_numbers, notify=True)
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self._validate_error_message(
@@ -532,7 +531,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         # good phone number ----
         phone_numbers = ['+14805551234']
         passengers_payload = self._generate_n_passenger_payload(1, emails=[], phone_numbers=phone_numbers, notify=True)
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertIs(response_json['error'], False)
@@ -554,7 +553,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         ))
         del passengers_payload[0]['meals']
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -569,7 +568,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meals=[dict()]
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -587,7 +586,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meals=[dict()]
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -605,7 +604,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meals=[{'currency_code': 'bad_input', 'meal_amount': 12, 'number_of_days': 1}]
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -621,7 +620,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meals=[{'currency_code': 'USD', 'meal_amount': 12, 'number_of_days': 1}, {'currency_code': 'USD', 'meal_amount': 12, 'number_of_days': 'bad input'}]
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -641,7 +640,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             ]
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -657,7 +656,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meals=list()
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -675,7 +674,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         passengers_payload = self._generate_n_passenger_payload(1)
         del passengers_payload[0]['pet']
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -700,7 +699,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             hotel_accommodation=False,
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -716,7 +715,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         ))
         del passengers_payload[0]['meals']
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 201)
 
         # empty meal object, meal=False, hotel=True
@@ -727,7 +726,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meals=[dict()]
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_json['error'], True)
@@ -746,7 +745,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             meals=list()
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         self.assertEqual(response.status_code, 201)
 
 
@@ -760,7 +759,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         headers = self._generate_airline_headers(customer)
         import_url = self._api_host + '/api/v1/passenger'
 
-        import_resp = requests.post(url=import_url, headers=headers, json=[])
+        import_resp = http_client.post(url=import_url, headers=headers, json=[])
         import_resp_json = import_resp.json()
 
         self.assertEqual(import_resp.status_code, 400)
@@ -781,7 +780,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             handicap=True
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['data'][0]['context_id'], passengers_payload[0]['context_id'])
@@ -804,7 +803,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             notify=True
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -827,7 +826,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             notify=False
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -849,7 +848,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             notify=False
         ))
 
-        response2 = requests.post(url, headers=headers, json=passengers_payload)
+        response2 = http_client.post(url, headers=headers, json=passengers_payload)
         response_json2 = response2.json()
         self.assertEqual(response2.status_code, 201)
         self.assertEqual(response_json2['error'], False)
@@ -872,7 +871,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             notify=False
         ))
 
-        response3 = requests.post(url, headers=headers, json=passengers_payload2)
+        response3 = http_client.post(url, headers=headers, json=passengers_payload2)
         response_json3 = response3.json()
         self.assertEqual(response3.status_code, 201)
         self.assertEqual(response_json3['error'], False)
@@ -882,9 +881,9 @@ class TestApiPassengerImport(StormxSystemVerification):
         carrie = [p for p in response_json3['data'] if p['first_name'] == 'Carrie'][0]
         self.assertEqual(adam['life_stage'], 'adult')
         self.assertEqual(carrie['life_stage'], 'child')
-        adam_full_state = requests.get(url=self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=adam['context_id']), headers=headers)
+        adam_full_state = http_client.get(url=self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=adam['context_id']), headers=headers)
         self.assertEqual(adam_full_state.json()['data']['passenger']['life_stage'], 'adult')
-        carrie_full_state = requests.get(url=self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=carrie['context_id']), headers=headers)
+        carrie_full_state = http_client.get(url=self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=carrie['context_id']), headers=headers)
         self.assertEqual(carrie_full_state.json()['data']['passenger']['life_stage'], 'child')
 
     def test_children_cannot_get_auth_keys(self):
@@ -902,7 +901,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             notify=False
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
 
         if response_json['data'][0]['life_stage'] == 'child':
@@ -934,7 +933,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             port_accommodation='ORD'
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -953,7 +952,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             number_of_nights=2
         ))
 
-        response = requests.post(url, headers=headers, json=passengers_payload)
+        response = http_client.post(url, headers=headers, json=passengers_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -978,7 +977,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         del passenger_payload[0]['emails']
         del passenger_payload[0]['phone_numbers']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -992,7 +991,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             emails=[]
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1006,7 +1005,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             emails=[]
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1020,7 +1019,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             emails=None
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1034,7 +1033,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             emails=None
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1049,7 +1048,7 @@ class TestApiPassengerImport(StormxSystemVerification):
 
         del passenger_payload[0]['emails']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1064,7 +1063,7 @@ class TestApiPassengerImport(StormxSystemVerification):
 
         del passenger_payload[0]['emails']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1079,7 +1078,7 @@ class TestApiPassengerImport(StormxSystemVerification):
 
         del passenger_payload[0]['phone_numbers']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1094,7 +1093,7 @@ class TestApiPassengerImport(StormxSystemVerification):
 
         del passenger_payload[0]['phone_numbers']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1114,7 +1113,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             notify=True
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1127,7 +1126,7 @@ class TestApiPassengerImport(StormxSystemVerification):
 
         del passenger_payload[0]['emails']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1140,7 +1139,7 @@ class TestApiPassengerImport(StormxSystemVerification):
 
         del passenger_payload[0]['phone_numbers']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1152,7 +1151,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             emails=[]
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1164,7 +1163,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             emails=None
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1176,7 +1175,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             phone_numbers=[]
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1188,7 +1187,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             phone_number=None
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1213,7 +1212,7 @@ class TestApiPassengerImport(StormxSystemVerification):
 
         del passenger_payload[0]['scheduled_depart']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1234,7 +1233,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             ticket_level=None
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1253,7 +1252,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         for field in optional_fields:
             del passenger_payload[0][field]
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1275,7 +1274,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             context_id=passenger_payload[0]['context_id'] + '_aBc'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1284,9 +1283,9 @@ class TestApiPassengerImport(StormxSystemVerification):
         context_id_lower_case = context_id.lower()
         context_id_upper_case = context_id.upper()
 
-        response2 = requests.get(passenger_url + '/' + context_id, headers=headers)
-        response3 = requests.get(passenger_url + '/' + context_id_lower_case, headers=headers)
-        response4 = requests.get(passenger_url + '/' + context_id_upper_case, headers=headers)
+        response2 = http_client.get(passenger_url + '/' + context_id, headers=headers)
+        response3 = http_client.get(passenger_url + '/' + context_id_lower_case, headers=headers)
+        response4 = http_client.get(passenger_url + '/' + context_id_upper_case, headers=headers)
 
         response_json2 = response2.json()
         self.assertEqual(response2.status_code, 200)
@@ -1318,7 +1317,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             context_id=passenger_payload[0]['context_id'] + '_aBc__--_abc'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1344,7 +1343,7 @@ class TestApiPassengerImport(StormxSystemVerification):
                 context_id=passenger_payload[0]['context_id'] + invalid_character
             ))
 
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 400)
             log_error_system_tests_output(pretty_print_json(response_json))
@@ -1357,7 +1356,7 @@ class TestApiPassengerImport(StormxSystemVerification):
                 context_id=passenger_payload[0]['context_id'] + invalid_character
             ))
 
-            response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+            response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 400)
             log_error_system_tests_output(pretty_print_json(response_json))
@@ -1379,7 +1378,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             port_origin='OY'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=[passenger_payload[0]])
+        response = http_client.post(passenger_url, headers=headers, json=[passenger_payload[0]])
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1387,7 +1386,7 @@ class TestApiPassengerImport(StormxSystemVerification):
                                      'Invalid input criteria for passenger import.',
                                      [{'field': '[0].port_origin', 'message': 'Ensure this field has no more than 3 characters.'}])
 
-        response = requests.post(passenger_url, headers=headers, json=[passenger_payload[1]])
+        response = http_client.post(passenger_url, headers=headers, json=[passenger_payload[1]])
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1420,25 +1419,25 @@ class TestApiPassengerImport(StormxSystemVerification):
             port_accommodation='OY'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=[passenger_payload[0]])
+        response = http_client.post(passenger_url, headers=headers, json=[passenger_payload[0]])
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'INVALID_PORT', 'XXX is not a valid choice for port_accommodation', [])
 
-        response = requests.post(passenger_url, headers=headers, json=[passenger_payload[1]])
+        response = http_client.post(passenger_url, headers=headers, json=[passenger_payload[1]])
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'INVALID_PORT', '011 is not a valid choice for port_accommodation', [])
 
-        response = requests.post(passenger_url, headers=headers, json=[passenger_payload[2]])
+        response = http_client.post(passenger_url, headers=headers, json=[passenger_payload[2]])
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
         self._validate_error_message(response_json, 400, 'Bad Request', 'INVALID_PORT', '0YU is not a valid choice for port_accommodation', [])
 
-        response = requests.post(passenger_url, headers=headers, json=[passenger_payload[3]])
+        response = http_client.post(passenger_url, headers=headers, json=[passenger_payload[3]])
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1446,7 +1445,7 @@ class TestApiPassengerImport(StormxSystemVerification):
                                      'Invalid input criteria for passenger import.',
                                      [{'field': '[0].port_accommodation', 'message': 'Ensure this field has no more than 3 characters.'}])
 
-        response = requests.post(passenger_url, headers=headers, json=[passenger_payload[4]])
+        response = http_client.post(passenger_url, headers=headers, json=[passenger_payload[4]])
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1504,7 +1503,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             pax_record_locator_group=group_c
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1540,9 +1539,9 @@ class TestApiPassengerImport(StormxSystemVerification):
         voucher_b_url = self._api_host + '/api/v1/voucher/' + str(group_b_voucher_id)
         voucher_c_url = self._api_host + '/api/v1/voucher/' + str(group_c_voucher_id)
 
-        voucher_a_resp = requests.get(url=voucher_a_url, headers=headers)
-        voucher_b_resp = requests.get(url=voucher_b_url, headers=headers)
-        voucher_c_resp = requests.get(url=voucher_c_url, headers=headers)
+        voucher_a_resp = http_client.get(url=voucher_a_url, headers=headers)
+        voucher_b_resp = http_client.get(url=voucher_b_url, headers=headers)
+        voucher_c_resp = http_client.get(url=voucher_c_url, headers=headers)
 
         self.assertEqual(voucher_a_resp.status_code, 200)
         self.assertEqual(voucher_b_resp.status_code, 200)
@@ -1577,8 +1576,8 @@ class TestApiPassengerImport(StormxSystemVerification):
         import_url = self._api_host + '/api/v1/passenger'
         passenger_payload = self._generate_n_passenger_payload(1)
 
-        american_import_resp = requests.post(url=import_url, headers=american_headers, json=passenger_payload)
-        delta_import_resp = requests.post(url=import_url, headers=delta_headers, json=passenger_payload)
+        american_import_resp = http_client.post(url=import_url, headers=american_headers, json=passenger_payload)
+        delta_import_resp = http_client.post(url=import_url, headers=delta_headers, json=passenger_payload)
 
         self.assertEqual(american_import_resp.status_code, 201)
         self.assertEqual(delta_import_resp.status_code, 201)
@@ -1590,12 +1589,12 @@ class TestApiPassengerImport(StormxSystemVerification):
         self.assertGreaterEqual(len(aa_hotel_offerings), 0)
 
         self._passenger_book_hotel(passenger_aa, aa_hotel_offerings[0], [passenger_aa['context_id']])
-        aa_get_pax_resp = requests.get(url=import_url + '/' + passenger_aa['context_id'], headers=american_headers)
+        aa_get_pax_resp = http_client.get(url=import_url + '/' + passenger_aa['context_id'], headers=american_headers)
         self.assertEqual(aa_get_pax_resp.status_code, 200)
         aa_voucher_id = aa_get_pax_resp.json()['data']['voucher_id']
         self.assertIsNotNone(aa_voucher_id)
 
-        delta_get_pax_resp = requests.get(url=import_url + '/' + passenger_delta['context_id'], headers=delta_headers)
+        delta_get_pax_resp = http_client.get(url=import_url + '/' + passenger_delta['context_id'], headers=delta_headers)
         self.assertEqual(delta_get_pax_resp.status_code, 200)
         self.assertIsNone(delta_get_pax_resp.json()['data']['voucher_id'])
 
@@ -1603,28 +1602,28 @@ class TestApiPassengerImport(StormxSystemVerification):
         self.assertGreaterEqual(len(delta_hotel_offerings), 0)
 
         self._passenger_book_hotel(passenger_delta, delta_hotel_offerings[0], [passenger_delta['context_id']])
-        delta_get_pax_resp2 = requests.get(url=import_url + '/' + passenger_delta['context_id'], headers=delta_headers)
+        delta_get_pax_resp2 = http_client.get(url=import_url + '/' + passenger_delta['context_id'], headers=delta_headers)
         self.assertEqual(delta_get_pax_resp2.status_code, 200)
 
         delta_pax_json = delta_get_pax_resp2.json()
         delta_voucher_id = delta_pax_json['data']['voucher_id']
         self.assertIsNotNone(delta_voucher_id)
 
-        aa_get_pax_resp2 = requests.get(url=import_url + '/' + passenger_aa['context_id'], headers=american_headers)
+        aa_get_pax_resp2 = http_client.get(url=import_url + '/' + passenger_aa['context_id'], headers=american_headers)
         self.assertEqual(aa_get_pax_resp2.status_code, 200)
         self.assertEqual(aa_get_pax_resp2.json()['data']['voucher_id'], aa_voucher_id)
         self.assertNotEqual(aa_voucher_id, delta_voucher_id)
 
         voucher_url = self._api_host + '/api/v1/voucher/'
 
-        aa_get_voucher_resp = requests.get(url=voucher_url + str(aa_voucher_id), headers=american_headers)
+        aa_get_voucher_resp = http_client.get(url=voucher_url + str(aa_voucher_id), headers=american_headers)
         self.assertEqual(aa_get_voucher_resp.status_code, 200)
-        aa_get_delta_voucher_resp = requests.get(url=voucher_url + str(delta_voucher_id), headers=american_headers)
+        aa_get_delta_voucher_resp = http_client.get(url=voucher_url + str(delta_voucher_id), headers=american_headers)
         self.assertEqual(aa_get_delta_voucher_resp.status_code, 404)
 
-        delta_get_voucher_resp = requests.get(url=voucher_url + str(delta_voucher_id), headers=delta_headers)
+        delta_get_voucher_resp = http_client.get(url=voucher_url + str(delta_voucher_id), headers=delta_headers)
         self.assertEqual(delta_get_voucher_resp.status_code, 200)
-        delta_get_aa_voucher_resp = requests.get(url=voucher_url + str(aa_voucher_id), headers=delta_headers)
+        delta_get_aa_voucher_resp = http_client.get(url=voucher_url + str(aa_voucher_id), headers=delta_headers)
         self.assertEqual(delta_get_aa_voucher_resp.status_code, 404)
 
     def test_same_context_id_different_airline_on_airline_api(self):
@@ -1637,8 +1636,8 @@ class TestApiPassengerImport(StormxSystemVerification):
         import_url = self._api_host + '/api/v1/passenger'
         passenger_payload = self._generate_n_passenger_payload(1)
 
-        american_import_resp = requests.post(url=import_url, headers=american_headers, json=passenger_payload)
-        delta_import_resp = requests.post(url=import_url, headers=delta_headers, json=passenger_payload)
+        american_import_resp = http_client.post(url=import_url, headers=american_headers, json=passenger_payload)
+        delta_import_resp = http_client.post(url=import_url, headers=delta_headers, json=passenger_payload)
 
         self.assertEqual(american_import_resp.status_code, 201)
         self.assertEqual(delta_import_resp.status_code, 201)
@@ -1650,12 +1649,12 @@ class TestApiPassengerImport(StormxSystemVerification):
         self.assertGreaterEqual(len(aa_hotel_offerings), 0)
 
         self._airline_book_hotel('American Airlines', aa_hotel_offerings[0], [passenger_aa['context_id']])
-        aa_get_pax_resp = requests.get(url=import_url + '/' + passenger_aa['context_id'], headers=american_headers)
+        aa_get_pax_resp = http_client.get(url=import_url + '/' + passenger_aa['context_id'], headers=american_headers)
         self.assertEqual(aa_get_pax_resp.status_code, 200)
         aa_voucher_id = aa_get_pax_resp.json()['data']['voucher_id']
         self.assertIsNotNone(aa_voucher_id)
 
-        delta_get_pax_resp = requests.get(url=import_url + '/' + passenger_delta['context_id'], headers=delta_headers)
+        delta_get_pax_resp = http_client.get(url=import_url + '/' + passenger_delta['context_id'], headers=delta_headers)
         self.assertEqual(delta_get_pax_resp.status_code, 200)
         self.assertIsNone(delta_get_pax_resp.json()['data']['voucher_id'])
 
@@ -1663,28 +1662,28 @@ class TestApiPassengerImport(StormxSystemVerification):
         self.assertGreaterEqual(len(delta_hotel_offerings), 0)
 
         self._airline_book_hotel('Delta Air Lines', delta_hotel_offerings[0], [passenger_delta['context_id']])
-        delta_get_pax_resp2 = requests.get(url=import_url + '/' + passenger_delta['context_id'], headers=delta_headers)
+        delta_get_pax_resp2 = http_client.get(url=import_url + '/' + passenger_delta['context_id'], headers=delta_headers)
         self.assertEqual(delta_get_pax_resp2.status_code, 200)
 
         delta_pax_json = delta_get_pax_resp2.json()
         delta_voucher_id = delta_pax_json['data']['voucher_id']
         self.assertIsNotNone(delta_voucher_id)
 
-        aa_get_pax_resp2 = requests.get(url=import_url + '/' + passenger_aa['context_id'], headers=american_headers)
+        aa_get_pax_resp2 = http_client.get(url=import_url + '/' + passenger_aa['context_id'], headers=american_headers)
         self.assertEqual(aa_get_pax_resp2.status_code, 200)
         self.assertEqual(aa_get_pax_resp2.json()['data']['voucher_id'], aa_voucher_id)
         self.assertNotEqual(aa_voucher_id, delta_voucher_id)
 
         voucher_url = self._api_host + '/api/v1/voucher/'
 
-        aa_get_voucher_resp = requests.get(url=voucher_url + str(aa_voucher_id), headers=american_headers)
+        aa_get_voucher_resp = http_client.get(url=voucher_url + str(aa_voucher_id), headers=american_headers)
         self.assertEqual(aa_get_voucher_resp.status_code, 200)
-        aa_get_delta_voucher_resp = requests.get(url=voucher_url + str(delta_voucher_id), headers=american_headers)
+        aa_get_delta_voucher_resp = http_client.get(url=voucher_url + str(delta_voucher_id), headers=american_headers)
         self.assertEqual(aa_get_delta_voucher_resp.status_code, 404)
 
-        delta_get_voucher_resp = requests.get(url=voucher_url + str(delta_voucher_id), headers=delta_headers)
+        delta_get_voucher_resp = http_client.get(url=voucher_url + str(delta_voucher_id), headers=delta_headers)
         self.assertEqual(delta_get_voucher_resp.status_code, 200)
-        delta_get_aa_voucher_resp = requests.get(url=voucher_url + str(aa_voucher_id), headers=delta_headers)
+        delta_get_aa_voucher_resp = http_client.get(url=voucher_url + str(aa_voucher_id), headers=delta_headers)
         self.assertEqual(delta_get_aa_voucher_resp.status_code, 404)
 
     def test_import_passengers__bad_phone_number(self):
@@ -1698,7 +1697,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         bad_phone_number = '+1234567'  # minimum phone number i 8.
         passengers_payload = self._generate_n_passenger_payload(1, phone_numbers=[bad_phone_number],
                                                                 notify=True, emails=[])
-        response = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        response = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         expected_errors = [{
             'field': '[0].phone_numbers[0]',
             'message': "phone number must be in the E.164 format and always start with a '+'. "
@@ -1727,7 +1726,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         if delete_phone_numbers:
             del passenger_payload[0]['phone_numbers']
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         passenger_json = response.json()['data'][0]
         self.assertEqual(response.status_code, 201)
         self.assertIn('emails', passenger_json)
@@ -1736,7 +1735,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         self.assertEqual(len(passenger_json['phone_numbers']), 0)
 
         get_passenger_url = passenger_url + '/' + passenger_json['context_id']
-        response = requests.get(get_passenger_url, headers=headers)
+        response = http_client.get(get_passenger_url, headers=headers)
         passenger_json = response.json()['data']
         self.assertEqual(response.status_code, 200)
         self.assertIn('emails', passenger_json)
@@ -1745,7 +1744,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         self.assertEqual(len(passenger_json['phone_numbers']), 0)
 
         state_passenger_url = get_passenger_url + '/state'
-        response = requests.get(state_passenger_url, headers=headers)
+        response = http_client.get(state_passenger_url, headers=headers)
         passenger_json = response.json()['data']['passenger']
         self.assertEqual(response.status_code, 200)
         self.assertIn('emails', passenger_json)
@@ -1789,7 +1788,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             pnr_create_date='2018-05-14'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1820,7 +1819,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         passenger_payload_1 = self._generate_n_passenger_payload(1)
         passenger_payload_2 = self._generate_n_passenger_payload(1)
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_1)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_1)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1830,7 +1829,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         pnr_group = passenger_payload_1[0]['pax_record_locator_group']
         pnr_url = self._api_host + '/api/v1/pnr?pnr_create_date=' + pnr_create_date + '&pax_record_locator_group=' + pnr_group
 
-        response = requests.get(pnr_url, headers=headers)
+        response = http_client.get(pnr_url, headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_json['error'], False)
@@ -1847,7 +1846,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             port_accommodation='JFK'
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1858,7 +1857,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             number_of_nights=2
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         # TODO: change to expected_nights_error_message once interface allows multi-night-booking (test will brake :D)
@@ -1870,7 +1869,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             hotel_accommodation=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1881,7 +1880,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             pax_record_locator=previous_record_locator
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -1891,12 +1890,12 @@ class TestApiPassengerImport(StormxSystemVerification):
             pax_record_locator=passenger_payload_1[0]['pax_record_locator']
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
 
-        response = requests.get(pnr_url, headers=headers)
+        response = http_client.get(pnr_url, headers=headers)
         response_json = response.json()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_json['error'], False)
@@ -1931,7 +1930,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         )
 
         public_hotel_url = self._api_host + '/api/v1/offer/hotels?ak1=' + passenger_1['ak1'] + '&ak2=' + passenger_1['ak2']
-        hotel_resp = requests.post(public_hotel_url, json=booking_payload)
+        hotel_resp = http_client.post(public_hotel_url, json=booking_payload)
         self.assertEqual(hotel_resp.status_code, 400)
         hotel_resp_json = hotel_resp.json()
         log_error_system_tests_output(pretty_print_json(hotel_resp_json))
@@ -1944,7 +1943,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         )
 
         public_hotel_url = self._api_host + '/api/v1/offer/hotels?ak1=' + passenger_1['ak1'] + '&ak2=' + passenger_1['ak2']
-        hotel_resp = requests.post(public_hotel_url, json=booking_payload)
+        hotel_resp = http_client.post(public_hotel_url, json=booking_payload)
         self.assertEqual(hotel_resp.status_code, 200)
         hotel_resp_json = hotel_resp.json()
         self.assertEqual(len(hotel_resp_json['data']['passengers']), 2)
@@ -1977,7 +1976,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         passenger_payload_1 = self._generate_n_passenger_payload(1)
         passenger_payload_2 = self._generate_n_passenger_payload(1)
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_1)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_1)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -1991,7 +1990,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             number_of_nights=2
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2002,7 +2001,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         picked_hotel = hotel_offerings[0]
         self._passenger_book_hotel(passenger_1, picked_hotel, [passenger_1['context_id']])
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2022,7 +2021,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         passenger_payload_1 = self._generate_n_passenger_payload(1)
         passenger_payload_2 = self._generate_n_passenger_payload(1)
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_1)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_1)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -2036,7 +2035,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             hotel=False
         ))
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2047,7 +2046,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         picked_hotel = hotel_offerings[0]
         self._passenger_book_hotel(passenger_1, picked_hotel, [passenger_1['context_id']])
 
-        response = requests.post(passenger_url, headers=headers, json=passenger_payload_2)
+        response = http_client.post(passenger_url, headers=headers, json=passenger_payload_2)
         response_json = response.json()
         self.assertEqual(response.status_code, 400)
         log_error_system_tests_output(pretty_print_json(response_json))
@@ -2065,13 +2064,13 @@ class TestApiPassengerImport(StormxSystemVerification):
         import_url = self._api_host + '/api/v1/passenger'
         passengers = self._generate_n_passenger_payload(1)
 
-        resp = requests.post(url=import_url, headers=headers, json={})  # send empty dict instead of list(dict)
+        resp = http_client.post(url=import_url, headers=headers, json={})  # send empty dict instead of list(dict)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         log_error_system_tests_output(pretty_print_json(resp_json))
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', expected_error_message, [])
 
-        resp = requests.post(url=import_url, headers=headers, json=passengers[0])  # send dict instead of list(dict)
+        resp = http_client.post(url=import_url, headers=headers, json=passengers[0])  # send dict instead of list(dict)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         log_error_system_tests_output(pretty_print_json(resp_json))
@@ -2091,7 +2090,7 @@ class TestApiPassengerImport(StormxSystemVerification):
                                                    meals=[{'meal_amount': 12, 'currency_code': currency, 'number_of_days': 1}],
                                                    hotel_accommodation=False)[0]['voucher_id']
 
-            resp = requests.get(headers=headers, url=voucher_url + voucher_id).json()
+            resp = http_client.get(headers=headers, url=voucher_url + voucher_id).json()
             self.assertEqual(resp['data']['voucher_id'], voucher_id)
 
             for passenger in resp['data']['passengers']:
@@ -2114,7 +2113,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             first_name=name_length_51
         ))
 
-        resp = requests.post(url, headers=headers, json=passengers)
+        resp = http_client.post(url, headers=headers, json=passengers)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
@@ -2128,7 +2127,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             last_name=name_length_51
         ))
 
-        resp = requests.post(url, headers=headers, json=passengers)
+        resp = http_client.post(url, headers=headers, json=passengers)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
@@ -2138,7 +2137,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             last_name=name_length_50
         ))
 
-        resp = requests.post(url, headers=headers, json=passengers)
+        resp = http_client.post(url, headers=headers, json=passengers)
         self.assertEqual(resp.status_code, 201)
         pax_data = resp.json()['data']
         self.assertEqual(len(pax_data), 2)
@@ -2185,7 +2184,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         payload[0].update(dict(
             number_of_nights=-1
         ))
-        resp = requests.post(url=url, headers=headers, json=payload)
+        resp = http_client.post(url=url, headers=headers, json=payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.', [{'message': 'Ensure this value is greater than or equal to 0.', 'field': '[0].number_of_nights'}])
@@ -2194,7 +2193,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         payload[0].update(dict(
             number_of_nights=0
         ))
-        resp = requests.post(url=url, headers=headers, json=payload)
+        resp = http_client.post(url=url, headers=headers, json=payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_ACCOMMODATION', 'number_of_nights must be greater than 0 for passengers with hotel_accommodations.', [])
@@ -2203,7 +2202,7 @@ class TestApiPassengerImport(StormxSystemVerification):
         payload[0].update(dict(
             number_of_nights=8
         ))
-        resp = requests.post(url=url, headers=headers, json=payload)
+        resp = http_client.post(url=url, headers=headers, json=payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.', [{'message': 'Ensure this value is less than or equal to 7.', 'field': '[0].number_of_nights'}])
@@ -2221,7 +2220,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             phone_numbers=['15591234567']
         ))
 
-        resp = requests.post(url=passenger_url, json=passenger_payload, headers=headers)
+        resp = http_client.post(url=passenger_url, json=passenger_payload, headers=headers)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger import.',
@@ -2231,7 +2230,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             phone_numbers=['+155912345679819851651654165373546816581650651']
         ))
 
-        resp = requests.post(url=passenger_url, json=passenger_payload, headers=headers)
+        resp = http_client.post(url=passenger_url, json=passenger_payload, headers=headers)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger import.',
@@ -2250,7 +2249,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             emails=['testblackholetravellianceinc.com']
         ))
 
-        resp = requests.post(url=passenger_url, json=passenger_payload, headers=headers)
+        resp = http_client.post(url=passenger_url, json=passenger_payload, headers=headers)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger import.',
@@ -2260,7 +2259,7 @@ class TestApiPassengerImport(StormxSystemVerification):
             emails=['testareallylongnameyoukowwhatImeanonthenotificationsendpointyadadad@blackhole.travellianceinc.com']
         ))
 
-        resp = requests.post(url=passenger_url, json=passenger_payload, headers=headers)
+        resp = http_client.post(url=passenger_url, json=passenger_payload, headers=headers)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger import.',
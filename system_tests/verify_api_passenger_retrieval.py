@@ -1,7 +1,7 @@
 import datetime
 from uuid import UUID
 
-import requests
+from stormx_http import http_client
 
 from StormxApp.tests.data_utilities import (
     generate_pax_record_locator,
@@ -19,7 +19,6 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
     """
     Verify that endpoints that fetch information about passengers function properly.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -39,7 +38,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             context_id = passenger['context_id']
             self.assertTrue(context_id)
             url = url_template.format(context_id=context_id)
-            response = requests.get(url, headers=headers)
+            response = http_client.get(url, headers=headers)
             self.assertEqual(response.status_code, 200)
 
     def test_get_passenger_by_context_id__bad_context_id(self):
@@ -53,7 +52,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         passengers = self._create_2_passengers(customer=customer)
 
         url = url_template.format(context_id='GARBAGE_CONTEXT_ID_THAT_DOES_NOT_EXIST')
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         self.assertEqual(response.status_code, 404)
 
     def test_get_passengers_by_flight_place_and_time(self):
@@ -75,7 +74,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         passengers += self._create_2_passengers(customer=customer, **passenger_flight_info)
 
         query_parameters = passenger_flight_info
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         returned_passengers = response.json()['data']
         self.assertEqual(len(returned_passengers), 6)
@@ -100,7 +99,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             context_id = passenger['context_id']
             self.assertTrue(context_id)
             url = url_template.format(context_id=context_id)
-            response = requests.get(url, headers=headers)
+            response = http_client.get(url, headers=headers)
             self.assertEqual(response.status_code, 200)
             response_json = response.json()
 
@@ -129,7 +128,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             pax_record_locator_group=passengers[0]['pax_record_locator_group'],
             pnr_create_date=passengers[0]['pnr_create_date'],
         )
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         returned_passengers = response_json['data']
@@ -150,7 +149,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         query_parameters = dict(
             pax_record_locator_group=passengers[0]['pax_record_locator_group'],
         )
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         returned_passengers = response_json['data']
@@ -160,7 +159,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         query_parameters = dict(
             pax_record_locator=passengers[0]['pax_record_locator'],
         )
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         returned_passengers = response_json['data']
@@ -195,7 +194,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         query_parameters = dict(
             pax_record_locator=passengers[0]['pax_record_locator'],
         )
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         returned_passengers = response_json['data']
@@ -206,7 +205,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             pax_record_locator=passengers[0]['pax_record_locator'],
             pnr_create_date=pnr_create_date_string
         )
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         returned_passengers = response_json['data']
@@ -217,7 +216,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             pax_record_locator=passengers[0]['pax_record_locator'],
             pnr_create_date=pnr_create_date_old_string
         )
-        response = requests.get(url, headers=headers, params=query_parameters)
+        response = http_client.get(url, headers=headers, params=query_parameters)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         returned_passengers = response_json['data']
@@ -273,7 +272,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             notify=True
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        import_resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
         for passenger in import_resp_json['data']:
@@ -281,43 +280,43 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             for notification in passenger['notifications']:
                 self.assertEqual(notification['notification_type'], 'offer')
 
-        pax1_resp = requests.get(url=passenger_url + '/' + context_id1, headers=headers)
+        pax1_resp = http_client.get(url=passenger_url + '/' + context_id1, headers=headers)
         self.assertEqual(pax1_resp.status_code, 200)
         pax1_resp_notifications = pax1_resp.json()['data']['notifications']
 
         self._test_passenger_notifications(pax1_resp_notifications, emails1, phone_numbers1, 2, 2, 4, 0)
 
-        pax1_state_resp = requests.get(url=passenger_url + '/' + context_id1 + '/state', headers=headers)
+        pax1_state_resp = http_client.get(url=passenger_url + '/' + context_id1 + '/state', headers=headers)
         self.assertEqual(pax1_state_resp.status_code, 200)
         pax1_state_notifications = pax1_state_resp.json()['data']['passenger']['notifications']
 
         self._test_passenger_notifications(pax1_state_notifications, emails1, phone_numbers1, 2, 2, 4, 0)
 
-        pax2_resp = requests.get(url=passenger_url + '/' + context_id2, headers=headers)
+        pax2_resp = http_client.get(url=passenger_url + '/' + context_id2, headers=headers)
         self.assertEqual(pax2_resp.status_code, 200)
         pax2_resp_notifications = pax2_resp.json()['data']['notifications']
 
         self._test_passenger_notifications(pax2_resp_notifications, emails2, phone_numbers2, 2, 2, 4, 0)
 
-        pax2_state_resp = requests.get(url=passenger_url + '/' + context_id2 + '/state', headers=headers)
+        pax2_state_resp = http_client.get(url=passenger_url + '/' + context_id2 + '/state', headers=headers)
         self.assertEqual(pax2_state_resp.status_code, 200)
         pax2_state_notifications = pax2_state_resp.json()['data']['passenger']['notifications']
 
         self._test_passenger_notifications(pax2_state_notifications, emails2, phone_numbers2, 2, 2, 4, 0)
 
-        pax3_resp = requests.get(url=passenger_url + '/' + context_id3, headers=headers)
+        pax3_resp = http_client.get(url=passenger_url + '/' + context_id3, headers=headers)
         self.assertEqual(pax3_resp.status_code, 200)
         pax3_resp_notifications = pax3_resp.json()['data']['notifications']
 
         self._test_passenger_notifications(pax3_resp_notifications, emails3, phone_numbers3, 2, 2, 4, 0)
 
-        pax3_state_resp = requests.get(url=passenger_url + '/' + context_id3 + '/state', headers=headers)
+        pax3_state_resp = http_client.get(url=passenger_url + '/' + context_id3 + '/state', headers=headers)
         self.assertEqual(pax3_state_resp.status_code, 200)
         pax3_state_notifications = pax3_state_resp.json()['data']['passenger']['notifications']
 
         self._test_passenger_notifications(pax3_state_notifications, emails3, phone_numbers3, 2, 2, 4, 0)
 
-        related_resp = requests.get(url=passenger_url + '/' + context_id1 + '/related', headers=headers)
+        related_resp = http_client.get(url=passenger_url + '/' + context_id1 + '/related', headers=headers)
         self.assertEqual(related_resp.status_code, 200)
         related_resp_json = related_resp.json()
         self.assertEqual(len(related_resp_json['data']), 2)
@@ -327,7 +326,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             self._test_passenger_notifications(passenger['notifications'], emails2 + emails3,
                                                phone_numbers2 + phone_numbers3, 2, 2, 4, 0)
 
-        flight_resp = requests.get(url=passenger_url + '?flight_number=' + flight_number + '&disrupt_depart=' + flight_date + '&port_accommodation=' + port, headers=headers)
+        flight_resp = http_client.get(url=passenger_url + '?flight_number=' + flight_number + '&disrupt_depart=' + flight_date + '&port_accommodation=' + port, headers=headers)
         self.assertEqual(flight_resp.status_code, 200)
         flight_resp_json = flight_resp.json()
         self.assertEqual(len(flight_resp_json['data']), 3)
@@ -337,7 +336,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             self._test_passenger_notifications(passenger['notifications'], emails1 + emails2 + emails3,
                                                phone_numbers1 + phone_numbers2 + phone_numbers3, 2, 2, 4, 0)
 
-        pnr_resp = requests.get(url=pnr_url + '?pax_record_locator_group=' + pnr_group + '&pnr_create_date=' + pnr_create_date, headers=headers)
+        pnr_resp = http_client.get(url=pnr_url + '?pax_record_locator_group=' + pnr_group + '&pnr_create_date=' + pnr_create_date, headers=headers)
         self.assertEqual(pnr_resp.status_code, 200)
         pnr_resp_json = pnr_resp.json()
         self.assertEqual(len(pnr_resp_json['data']), 3)
@@ -361,7 +360,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             self.assertIn('transport_accommodation_status', passenger)
 
         voucher_url = self._api_host + '/api/v1/voucher/' + str(passengers[0]['voucher_id'])
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
 
         for passenger in voucher_resp.json()['data']['passengers']:
@@ -371,7 +370,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             self.assertIn('transport_accommodation_status', passenger)
 
         full_state_url = self._api_host + '/api/v1/passenger/' + passengers[0]['context_id'] + '/state'
-        full_state_resp = requests.get(url=full_state_url, headers=headers)
+        full_state_resp = http_client.get(url=full_state_url, headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
 
         passenger = full_state_resp.json()['data']['passenger']
@@ -392,7 +391,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         passenger_url = self._api_host + '/api/v1/passenger'
 
         pax_payload = self._generate_n_passenger_payload(1)
-        import_resp = requests.post(url=passenger_url, headers=airline_headers, json=pax_payload)
+        import_resp = http_client.post(url=passenger_url, headers=airline_headers, json=pax_payload)
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
 
@@ -400,10 +399,10 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         tvl_passenger_url_good = self._api_host + '/api/v1/tvl/airline/' + airline_id_good + '/passenger/' + context_id
         tvl_passenger_url_bad = self._api_host + '/api/v1/tvl/airline/' + airline_id_bad + '/passenger/' + context_id
 
-        tvl_context_resp_bad = requests.get(url=tvl_passenger_url_bad, headers=stormx_headers)
+        tvl_context_resp_bad = http_client.get(url=tvl_passenger_url_bad, headers=stormx_headers)
         self.assertEqual(tvl_context_resp_bad.status_code, 404)
 
-        tvl_context_resp_good = requests.get(url=tvl_passenger_url_good, headers=stormx_headers)
+        tvl_context_resp_good = http_client.get(url=tvl_passenger_url_good, headers=stormx_headers)
         self.assertEqual(tvl_context_resp_good.status_code, 200)
         tvl_context_json = tvl_context_resp_good.json()
         self.assertEqual(tvl_context_json['data']['context_id'], context_id)
@@ -426,7 +425,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             pnr_create_date=pax_payload2[0]['pnr_create_date']
         ))
 
-        import_resp = requests.post(url=passenger_url, headers=airline_headers, json=[pax_payload1[0], pax_payload2[0]])
+        import_resp = http_client.post(url=passenger_url, headers=airline_headers, json=[pax_payload1[0], pax_payload2[0]])
         self.assertEqual(import_resp.status_code, 201)
         import_resp_json = import_resp.json()
 
@@ -442,10 +441,10 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         tvl_pnr_url_group_2 = self._api_host + '/api/v1/tvl/airline/' + airline_id_good + '/pnr?pnr_create_date=' + passenger_1['pnr_create_date'] + '&pax_record_locator_group=' + passenger_2['pax_record_locator_group']
         tvl_pnr_url = self._api_host + '/api/v1/tvl/airline/' + airline_id_good + '/pnr?pnr_create_date=' + passenger_1['pnr_create_date'] + '&pax_record_locator_group=' + passenger_1['pax_record_locator_group'] + '&pax_record_locator=' + passenger_1['pax_record_locator']
 
-        tvl_pnr_bad = requests.get(url=tvl_pnr_url_bad, headers=stormx_headers)
+        tvl_pnr_bad = http_client.get(url=tvl_pnr_url_bad, headers=stormx_headers)
         self.assertEqual(tvl_pnr_bad.status_code, 404)
 
-        tvl_pnr_good = requests.get(url=tvl_pnr_url_good, headers=stormx_headers)
+        tvl_pnr_good = http_client.get(url=tvl_pnr_url_good, headers=stormx_headers)
         self.assertEqual(tvl_pnr_good.status_code, 200)
         tvl_context_json = tvl_pnr_good.json()
         self.assertEqual(len(tvl_context_json['data']), 2)
@@ -454,7 +453,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             self.assertEqual(passenger['pax_record_locator'], passenger_1['pax_record_locator'])
         self.assertNotEqual(tvl_context_json['data'][0]['pax_record_locator_group'], tvl_context_json['data'][1]['pax_record_locator_group'])
 
-        tvl_pnr_1 = requests.get(url=tvl_pnr_url_group_1, headers=stormx_headers)
+        tvl_pnr_1 = http_client.get(url=tvl_pnr_url_group_1, headers=stormx_headers)
         self.assertEqual(tvl_pnr_1.status_code, 200)
         tvl_pnr_1_json = tvl_pnr_1.json()
         self.assertEqual(len(tvl_pnr_1_json['data']), 1)
@@ -463,7 +462,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             self.assertEqual(passenger['pax_record_locator'], passenger_1['pax_record_locator'])
             self.assertEqual(passenger['pax_record_locator_group'], passenger_1['pax_record_locator_group'])
 
-        tvl_pnr_2 = requests.get(url=tvl_pnr_url_group_2, headers=stormx_headers)
+        tvl_pnr_2 = http_client.get(url=tvl_pnr_url_group_2, headers=stormx_headers)
         self.assertEqual(tvl_pnr_2.status_code, 200)
         tvl_pnr_2_json = tvl_pnr_2.json()
         self.assertEqual(len(tvl_pnr_2_json['data']), 1)
@@ -472,7 +471,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             self.assertEqual(passenger['pax_record_locator'], passenger_1['pax_record_locator'])
             self.assertEqual(passenger['pax_record_locator_group'], passenger_2['pax_record_locator_group'])
 
-        tvl_pnr = requests.get(url=tvl_pnr_url, headers=stormx_headers)
+        tvl_pnr = http_client.get(url=tvl_pnr_url, headers=stormx_headers)
         self.assertEqual(tvl_pnr.status_code, 200)
         tvl_pnr_json = tvl_pnr.json()
         self.assertEqual(len(tvl_pnr_json['data']), 1)
@@ -491,12 +490,12 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         api_pnr_url = self._api_host + '/api/v1/pnr?pnr_create_date=2018-07-18'
         tvl_pnr_url = self._api_host + '/api/v1/tvl/airline/294/pnr?pnr_create_date=2018-07-18'
 
-        resp = requests.get(url=api_pnr_url, headers=airline_headers)
+        resp = http_client.get(url=api_pnr_url, headers=airline_headers)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 400, 'Bad Request', 'INVALID_PNR_SEARCH', error_description, [])
 
-        resp2 = requests.get(url=tvl_pnr_url, headers=stormx_headers)
+        resp2 = http_client.get(url=tvl_pnr_url, headers=stormx_headers)
         self.assertEqual(resp2.status_code, 400)
         resp_json2 = resp2.json()
         self._validate_error_message(resp_json2, 400, 'Bad Request', 'INVALID_PNR_SEARCH', error_description, [])
@@ -515,7 +514,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             context_id = passenger['context_id']
             self.assertTrue(context_id)
             url = url_template.format(context_id=context_id)
-            response = requests.get(url, headers=headers)
+            response = http_client.get(url, headers=headers)
             self.assertEqual(response.status_code, 200)
             self.assertEqual(response.reason, 'OK')
             response_json = response.json()
@@ -524,6 +523,30 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
             # display_response(response)
             # TODO: verify fields. also, this method might make a nice utility.
 
+    def test_get_passenger_state_by_context_id__bulk(self):
+        """
+        verify that the full state of many passengers imported in concurrent requests can be looked up concurrently.
+        """
+        customer = 'Delta Air Lines'
+        client = self.get_async_api_client(concurrency=20)
+        try:
+            passenger_batches = [self._generate_2_passenger_payload() for _ in range(30)]
+            import_responses = client.run(client.import_passenger_batches(customer, passenger_batches))
+            context_ids = []
+            for response in import_responses:
+                self.assertEqual(response.status_code, 201)
+                context_ids.extend(passenger['context_id'] for passenger in response.json()['data'])
+            self.assertEqual(len(context_ids), 60)
+
+            state_responses = client.run(client.get_passenger_full_states(customer, context_ids))
+            for context_id, response in zip(context_ids, state_responses):
+                self.assertEqual(response.status_code, 200)
+                response_json = response.json()
+                self.assertIs(response_json['error'], False)
+                self.assertEqual(response_json['data']['passenger']['context_id'], context_id)
+        finally:
+            client.close()
+
     def test_passenger_offer_opened_date(self):
         """
         validates passenger.offer_opened_date is returned
@@ -544,30 +567,30 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         offer_url = passenger['offer_url']
 
         # validate passenger.offer_opened_date is null
-        resp = requests.get(url=passenger_url, headers=headers).json()
+        resp = http_client.get(url=passenger_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('offer_opened_date', resp['data'])
         self.assertIsNone(resp['data']['offer_opened_date'])
 
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('offer_opened_date', resp['data']['passenger'])
         self.assertIsNone(resp['data']['passenger']['offer_opened_date'])
         modified_date = resp['data']['passenger']['modified_date']
 
         # visit offer link
-        resp = requests.get(url=offer_url)
+        resp = http_client.get(url=offer_url)
         embedded_json = self._get_landing_page_embedded_json(resp)
         expected_offer_opened_date = embedded_json['passenger']['offer_opened_date']
 
         # validate passenger.offer_opened_date is now populated and modified_date has changed
-        resp = requests.get(url=passenger_url, headers=headers).json()
+        resp = http_client.get(url=passenger_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('offer_opened_date', resp['data'])
         self.assertEqual(resp['data']['offer_opened_date'], expected_offer_opened_date)
         self.assertNotEqual(resp['data']['modified_date'], modified_date)
 
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('offer_opened_date', resp['data']['passenger'])
         self.assertEqual(resp['data']['passenger']['offer_opened_date'], expected_offer_opened_date)
@@ -575,18 +598,18 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         expected_modified_date = resp['data']['passenger']['modified_date']
 
         # re visit offer link
-        resp = requests.get(url=offer_url)
+        resp = http_client.get(url=offer_url)
         embedded_json = self._get_landing_page_embedded_json(resp)
         self.assertEqual(embedded_json['passenger']['offer_opened_date'], expected_offer_opened_date)
 
         # validate that passenger.offer_opened_date and modified_date has not changed
-        resp = requests.get(url=passenger_url, headers=headers).json()
+        resp = http_client.get(url=passenger_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('offer_opened_date', resp['data'])
         self.assertEqual(resp['data']['offer_opened_date'], expected_offer_opened_date)
         self.assertEqual(resp['data']['modified_date'], expected_modified_date)
 
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('offer_opened_date', resp['data']['passenger'])
         self.assertEqual(resp['data']['passenger']['modified_date'], expected_modified_date)
@@ -607,12 +630,12 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
         full_state_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/state'
 
-        resp = requests.get(url=passenger_url, headers=headers).json()
+        resp = http_client.get(url=passenger_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data'])
         self.assertIsNone(resp['data']['voucher_id'])
 
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data']['passenger'])
         self.assertIsNone(resp['data']['passenger']['voucher_id'])
@@ -640,12 +663,12 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         voucher_url = self._api_host + '/api/v1/voucher/' + passenger['voucher_id']
         full_state_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/state'
 
-        resp = requests.get(url=passenger_url, headers=headers).json()
+        resp = http_client.get(url=passenger_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data'])
         UUID(resp['data']['voucher_id'], version=4)
 
-        resp = requests.get(url=voucher_url, headers=headers).json()
+        resp = http_client.get(url=voucher_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         if resp['data']['passengers'][0]['context_id'] == passenger['context_id']:
             meal_vouchers = resp['data']['passengers'][0]['meal_vouchers']
@@ -656,7 +679,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         for meal in meal_vouchers:
             self.assertEqual(meal['provider'], 'tvl')
 
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data']['passenger'])
         UUID(resp['data']['passenger']['voucher_id'], version=4)
@@ -688,12 +711,12 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         voucher_url = self._api_host + '/api/v1/voucher/' + passenger['voucher_id']
         full_state_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/state'
 
-        resp = requests.get(url=passenger_url, headers=headers).json()
+        resp = http_client.get(url=passenger_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data'])
         UUID(resp['data']['voucher_id'], version=4)
 
-        resp = requests.get(url=voucher_url, headers=headers).json()
+        resp = http_client.get(url=voucher_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         if resp['data']['passengers'][0]['context_id'] == passenger['context_id']:
             meal_vouchers = resp['data']['passengers'][0]['meal_vouchers']
@@ -704,7 +727,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         for meal in meal_vouchers:
             self.assertEqual(meal['provider'], 'tvl')
 
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data']['passenger'])
         UUID(resp['data']['passenger']['voucher_id'], version=4)
@@ -735,13 +758,13 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
         full_state_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/state'
 
-        resp = requests.get(url=passenger_url, headers=headers).json()
+        resp = http_client.get(url=passenger_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data'])
         self.assertIsNone(resp['data']['voucher_id'])
 
         # validate full state returns no voucher
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data']['passenger'])
         self.assertIsNone(resp['data']['passenger']['voucher_id'])
@@ -766,14 +789,14 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
         self.assertEqual(booking_response_json['data']['hotel_voucher']['hotel_id'], hotel_id)
 
         # validate full state contains voucher
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data']['passenger'])
         UUID(resp['data']['passenger']['voucher_id'], version=4)
@@ -801,13 +824,13 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         passenger_url = self._api_host + '/api/v1/passenger/' + passenger['context_id']
         full_state_url = self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/state'
 
-        resp = requests.get(url=passenger_url, headers=headers).json()
+        resp = http_client.get(url=passenger_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data'])
         self.assertIsNone(resp['data']['voucher_id'])
 
         # validate full state returns no voucher
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data']['passenger'])
         self.assertIsNone(resp['data']['passenger']['voucher_id'])
@@ -832,14 +855,14 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
         self.assertEqual(booking_response_json['data']['hotel_voucher']['hotel_id'], hotel_id)
 
         # validate full state contains voucher
-        resp = requests.get(url=full_state_url, headers=headers).json()
+        resp = http_client.get(url=full_state_url, headers=headers).json()
         self.assertEqual(resp['meta']['status'], 200)
         self.assertIn('voucher_id', resp['data']['passenger'])
         UUID(resp['data']['passenger']['voucher_id'], version=4)
@@ -867,7 +890,7 @@ class TestApiPassengerRetrieval(StormxSystemVerification):
         passenger = self._create_2_passengers(customer=customer)[0]
 
         url = url_template.format(context_id=passenger['context_id'])
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
 
         self._validate_error_message(response.json(), 400, 'Bad Request', 'FEATURE_NOT_SUPPORTED',
                                      'Airline queue not configured. Cannot send passenger queue message.', [])
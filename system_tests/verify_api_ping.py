@@ -1,4 +1,4 @@
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import StormxSystemVerification
 
@@ -7,7 +7,6 @@ class TestApiPing(StormxSystemVerification):
     """
     Verify `/api/v1/ping` endpoint behavior.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -48,7 +47,7 @@ class TestApiPing(StormxSystemVerification):
         ]
         for customer in VALID_CUSTOMERS_TO_CHECK:
             headers = self._generate_airline_headers(customer=customer)
-            response = requests.get(url, headers=headers)
+            response = http_client.get(url, headers=headers)
             self.assertEqual(response.status_code, 200, msg=repr(customer) + ' access failed.')
             # TODO: verify json.
 
@@ -58,5 +57,5 @@ class TestApiPing(StormxSystemVerification):
         """
         url = self._api_host + '/api/v1/ping'
         headers = self._generate_airline_headers(customer='INVALID_CREDENTIALS')
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         self.assertEqual(response.status_code, 403)  # TODO: should be a 401 for an unknown user, not a 403, IMO.
@@ -1,4 +1,4 @@
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import StormxSystemVerification
 
@@ -13,7 +13,6 @@ class TestApiShuttleTracker(StormxSystemVerification):
     """
     Verify shuttle tracker behavior.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -51,14 +50,14 @@ class TestApiShuttleTracker(StormxSystemVerification):
             hotel_id=str(hotel['hotel_id']),
             room_count=str(room_count),
         )
-        booking_response_json = requests.post(self._api_host + '/api/v1/hotels', headers=headers,
+        booking_response_json = http_client.post(self._api_host + '/api/v1/hotels', headers=headers,
                                               params=booking_params, json=booking_payload).json()
         self.assertIs(booking_response_json['error'], False)
         self.assertTrue(booking_response_json['data']['hotel_voucher']['shuttle_tracker_url'].startswith('http'))
 
         # verify shuttle_tracker_url is available in passenger full state
         url = self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=passenger_context_ids[0])
-        full_state_json = requests.get(url=url, headers=headers).json()
+        full_state_json = http_client.get(url=url, headers=headers).json()
         self.assertTrue(full_state_json['data']['voucher']['hotel_voucher']['shuttle_tracker_url'].startswith('http'))
 
     def test_shuttle_tracker_airline_api_disabled(self):
@@ -89,14 +88,14 @@ class TestApiShuttleTracker(StormxSystemVerification):
             hotel_id=str(hotel['hotel_id']),
             room_count=str(room_count),
         )
-        booking_response_json = requests.post(self._api_host + '/api/v1/hotels', headers=headers,
+        booking_response_json = http_client.post(self._api_host + '/api/v1/hotels', headers=headers,
                                               params=booking_params, json=booking_payload).json()
         self.assertIs(booking_response_json['error'], False)
         self.assertIsNone(booking_response_json['data']['hotel_voucher']['shuttle_tracker_url'])
 
         # verify shuttle_tracker_url is not available in passenger full state
         url = self._api_host + '/api/v1/passenger/{context_id}/state'.format(context_id=passenger_context_ids[0])
-        full_state_json = requests.get(url=url, headers=headers).json()
+        full_state_json = http_client.get(url=url, headers=headers).json()
         self.assertIsNone(full_state_json['data']['voucher']['hotel_voucher']['shuttle_tracker_url'])
 
     def test_shuttle_tracker_passenger_api_enabled(self):
@@ -132,7 +131,7 @@ class TestApiShuttleTracker(StormxSystemVerification):
             room_count=str(room_count)
         )
         offer_url = self._api_host + '/api/v1/offer/hotels'
-        booking_response_json = requests.post(offer_url, headers=headers, params=booking_params, json=booking_payload).json()
+        booking_response_json = http_client.post(offer_url, headers=headers, params=booking_params, json=booking_payload).json()
         self.assertIs(booking_response_json['error'], False)
         self.assertTrue(booking_response_json['data']['hotel_voucher']['shuttle_tracker_url'].startswith('http'))
 
@@ -169,6 +168,6 @@ class TestApiShuttleTracker(StormxSystemVerification):
             room_count=str(room_count)
         )
         offer_url = self._api_host + '/api/v1/offer/hotels'
-        booking_response_json = requests.post(offer_url, headers=headers, params=booking_params, json=booking_payload).json()
+        booking_response_json = http_client.post(offer_url, headers=headers, params=booking_params, json=booking_payload).json()
         self.assertIs(booking_response_json['error'], False)
         self.assertIsNone(booking_response_json['data']['hotel_voucher']['shuttle_tracker_url'])
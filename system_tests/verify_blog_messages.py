@@ -27,7 +27,7 @@ class TestBlogMessages(StormxSystemVerification):
                                                  cls.user_types)
 
         cls.user_list.append({'username': cls.support_username, 'user_type': 'tva',
-                              'cookies': cls.login_to_stormx(cls.support_username, cls.support_user_password)})
+                              'cookies': cls.login_to_stormx_cached(cls.support_username, cls.support_user_password)})
 
     def test_create_blog_message(self):
         """
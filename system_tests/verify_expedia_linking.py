@@ -29,7 +29,7 @@ class TestExpediaLinking(StormxSystemVerification):
                                                  cls.user_types)
 
         cls.user_list.append({'username': cls.support_username, 'user_type': 'tva',
-                              'cookies': cls.login_to_stormx(cls.support_username, cls.support_user_password)})
+                              'cookies': cls.login_to_stormx_cached(cls.support_username, cls.support_user_password)})
 
     def test_add_duplicate_expedia_id(self):
         """
@@ -1,4 +1,4 @@
-import requests
+from stormx_http import http_client
 import json
 from stormx_verification_framework import StormxSystemVerification
 from uuid import UUID
@@ -9,7 +9,6 @@ class TestHotelAllowances(StormxSystemVerification):
     """
     validate hotel allowances
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -25,7 +24,7 @@ class TestHotelAllowances(StormxSystemVerification):
         # validate not_offered status on no allowances passed up
         passengers_payload = self._generate_n_passenger_payload(1)
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         passenger = resp.json()['data'][0]
         self.assertEqual(passenger['context_id'], passengers_payload[0]['context_id'])
@@ -41,7 +40,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=None
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         passenger = resp.json()['data'][0]
         self.assertEqual(passenger['context_id'], passengers_payload[0]['context_id'])
@@ -56,7 +55,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict()
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -68,7 +67,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=None)
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         self.assertEqual(resp.json()['data'][0]['context_id'], passengers_payload[0]['context_id'])
 
@@ -78,7 +77,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=None)
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         self.assertEqual(resp.json()['data'][0]['context_id'], passengers_payload[0]['context_id'])
 
@@ -88,7 +87,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=None, amenity=None)
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         self.assertEqual(resp.json()['data'][0]['context_id'], passengers_payload[0]['context_id'])
 
@@ -98,7 +97,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict())
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
 
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
@@ -111,7 +110,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict())
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
 
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
@@ -124,7 +123,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict())
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for passenger import.', [{'field': '[1].hotel_allowances.amenity.amount', 'message': 'This field is required.'},
@@ -136,7 +135,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=-1, lunch=1, dinner=0))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -150,7 +149,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=-1, lunch=1, dinner=0))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -167,7 +166,7 @@ class TestHotelAllowances(StormxSystemVerification):
             )
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
 
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for passenger import.',
@@ -190,7 +189,7 @@ class TestHotelAllowances(StormxSystemVerification):
             )
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -212,7 +211,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=True
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params).json()
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params).json()
         self._validate_error_message(resp, 400, 'Bad Request', 'INVALID_JSON',
                                      'There was an error parsing the JSON data. Please verify the data is in valid JSON form.', [])
 
@@ -223,7 +222,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances='{}'
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params).json()
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params).json()
         self._validate_error_message(resp, 400, 'Bad Request', 'INVALID_ACCOMMODATION', 'meals or amenity is required for hotel_allowances.', [])
 
         # validate hotel_allowances.meals
@@ -233,7 +232,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=json.dumps(dict(meals='test'))
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params).json()
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params).json()
         self._validate_error_message(resp, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel search.',
                                      [{'field': 'hotel_allowances.meals', 'message': 'Must be a valid boolean.'}])
 
@@ -244,7 +243,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=json.dumps(dict(amenity='test'))
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params).json()
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params).json()
         self._validate_error_message(resp, 400, 'Bad Request', 'INVALID_INPUT',
                                      'Invalid input criteria for hotel search.',
                                      [{'field': 'hotel_allowances.amenity', 'message': 'Must be a valid boolean.'}])
@@ -256,7 +255,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances='null'
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params).json()
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params).json()
         self._validate_error_message(resp, 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel search.',
                                      [{'field': 'hotel_allowances', 'message': 'This field may not be null.'}])
 
@@ -267,7 +266,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=json.dumps(dict(amenity=None, meals=None))
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params)
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT', 'Invalid input criteria for hotel search.',
                                      [{'field': 'hotel_allowances.amenity', 'message': 'This field may not be null.'},
                                       {'field': 'hotel_allowances.meals', 'message': 'This field may not be null.'}])
@@ -287,7 +286,7 @@ class TestHotelAllowances(StormxSystemVerification):
                 hotel_allowances=dict(amenity=dict(amount='100.00', currency_code=currency_code))
             ))
 
-            resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+            resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
             self.assertEqual(resp.status_code, 400)
             resp_json = resp.json()
 
@@ -316,7 +315,7 @@ class TestHotelAllowances(StormxSystemVerification):
                 hotel_allowances=dict(amenity=dict(amount=currency_code['amount'], currency_code=currency_code['code']))
             ))
 
-            resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+            resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
             self.assertEqual(resp.status_code, 201)
             resp_json = resp.json()
             self.assertGreater(len(resp_json['data']), 0)
@@ -342,7 +341,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=1, lunch=0, dinner=0))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -357,7 +356,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('America/Los_Angeles')
         self.add_hotel_availability(98734, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate error returned
         self.assertEqual(booking_resp.status_code, 400)
@@ -368,7 +367,7 @@ class TestHotelAllowances(StormxSystemVerification):
         hotel_id_high_allowance = 'tvl-100511'
         self.add_hotel_availability(100511, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -408,7 +407,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=0, lunch=1, dinner=0))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -423,7 +422,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('America/Los_Angeles')
         self.add_hotel_availability(98734, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate error returned
         self.assertEqual(booking_resp.status_code, 400)
@@ -434,7 +433,7 @@ class TestHotelAllowances(StormxSystemVerification):
         hotel_id_high_allowance = 'tvl-100511'
         self.add_hotel_availability(100511, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -474,7 +473,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=0, lunch=0, dinner=1))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -489,7 +488,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('America/Los_Angeles')
         self.add_hotel_availability(98734, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate error returned
         self.assertEqual(booking_resp.status_code, 400)
@@ -500,7 +499,7 @@ class TestHotelAllowances(StormxSystemVerification):
         hotel_id_high_allowance = 'tvl-100511'
         self.add_hotel_availability(100511, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -540,7 +539,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict(amount=20, currency_code='USD'))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -555,7 +554,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('America/Los_Angeles')
         self.add_hotel_availability(98734, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate error returned
         self.assertEqual(booking_resp.status_code, 400)
@@ -566,7 +565,7 @@ class TestHotelAllowances(StormxSystemVerification):
         hotel_id_high_allowance = 'tvl-100511'
         self.add_hotel_availability(100511, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -603,7 +602,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict(amount=15, currency_code='EUR'))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -618,7 +617,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('America/Los_Angeles')
         self.add_hotel_availability(98734, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate error returned
         self.assertEqual(booking_resp.status_code, 400)
@@ -629,7 +628,7 @@ class TestHotelAllowances(StormxSystemVerification):
         hotel_id_high_allowance = 'tvl-100511'
         self.add_hotel_availability(100511, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -668,7 +667,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='YYZ'
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -679,7 +678,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('America/Los_Angeles')
         self.add_hotel_availability(88403, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
         booking_payload = dict(hotel_id=hotel_id_high_allowance, context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate error returned
         self.assertEqual(booking_resp.status_code, 400)
@@ -714,7 +713,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=json.dumps(dict(meals=True))
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params)
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -761,7 +760,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=json.dumps(dict(amenity=True))
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params)
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -790,7 +789,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=json.dumps(dict(meals=True, amenity=True))
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params)
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -820,7 +819,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=json.dumps(dict(meals=True))
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params)
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -833,7 +832,7 @@ class TestHotelAllowances(StormxSystemVerification):
             provider='ean'
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params)
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -855,7 +854,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -871,7 +870,7 @@ class TestHotelAllowances(StormxSystemVerification):
             room_count=1
         )
 
-        resp = requests.get(url=hotel_url, params=query_params)
+        resp = http_client.get(url=hotel_url, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -881,7 +880,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('Europe/Madrid')
         self.add_hotel_availability(91160, 71, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
-        resp = requests.get(url=hotel_url, params=query_params)
+        resp = http_client.get(url=hotel_url, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -891,7 +890,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('Europe/Madrid')
         self.add_hotel_availability(91161, 71, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
-        resp = requests.get(url=hotel_url, params=query_params)
+        resp = http_client.get(url=hotel_url, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -904,7 +903,7 @@ class TestHotelAllowances(StormxSystemVerification):
         # book hotel with allowance
         query_params = dict(ak1=passenger['ak1'], ak2=passenger['ak2'])
         booking_payload = dict(hotel_id='tvl-91161', context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload, params=query_params)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload, params=query_params)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -942,7 +941,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='JFK'
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -954,7 +953,7 @@ class TestHotelAllowances(StormxSystemVerification):
             room_count=1
         )
 
-        resp = requests.get(url=hotel_url, params=query_params)
+        resp = http_client.get(url=hotel_url, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         # tvl
@@ -972,7 +971,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='FAT'
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -984,7 +983,7 @@ class TestHotelAllowances(StormxSystemVerification):
             room_count=1
         )
 
-        resp = requests.get(url=hotel_url, params=query_params)
+        resp = http_client.get(url=hotel_url, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         # ean
@@ -1010,7 +1009,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1030,7 +1029,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('Europe/Madrid')
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
-        resp = requests.get(url=hotel_url, params=query_params)
+        resp = http_client.get(url=hotel_url, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -1046,7 +1045,7 @@ class TestHotelAllowances(StormxSystemVerification):
         # book hotel with allowance
         query_params = dict(ak1=passenger['ak1'], ak2=passenger['ak2'])
         booking_payload = dict(hotel_id='tvl-91163', context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, data=booking_payload, params=query_params)
+        booking_resp = http_client.post(url=hotel_url, data=booking_payload, params=query_params)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -1089,7 +1088,7 @@ class TestHotelAllowances(StormxSystemVerification):
             provider='ean'
         )
 
-        resp = requests.get(url=hotel_url, headers=headers, params=query_params)
+        resp = http_client.get(url=hotel_url, headers=headers, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -1114,7 +1113,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1133,7 +1132,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('Europe/Madrid')
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
-        resp = requests.get(url=hotel_url, params=query_params, headers=headers)
+        resp = http_client.get(url=hotel_url, params=query_params, headers=headers)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -1147,7 +1146,7 @@ class TestHotelAllowances(StormxSystemVerification):
 
         # book hotel with allowance
         booking_payload = dict(hotel_id='tvl-91163', context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -1199,7 +1198,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1218,7 +1217,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('Europe/Madrid')
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1,pay_type='0')
 
-        resp = requests.get(url=hotel_url, params=query_params, headers=headers)
+        resp = http_client.get(url=hotel_url, params=query_params, headers=headers)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -1232,7 +1231,7 @@ class TestHotelAllowances(StormxSystemVerification):
 
         # book hotel with allowance
         booking_payload = dict(hotel_id='tvl-91163', context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -1287,7 +1286,7 @@ class TestHotelAllowances(StormxSystemVerification):
             service_pet=True
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1302,7 +1301,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('Europe/Madrid')
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
-        resp = requests.get(url=hotel_url, params=query_params, headers=headers)
+        resp = http_client.get(url=hotel_url, params=query_params, headers=headers)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -1317,7 +1316,7 @@ class TestHotelAllowances(StormxSystemVerification):
 
         # book hotel with allowance
         booking_payload = dict(hotel_id='tvl-91163', context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -1368,7 +1367,7 @@ class TestHotelAllowances(StormxSystemVerification):
             service_pet=True
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1384,7 +1383,7 @@ class TestHotelAllowances(StormxSystemVerification):
         event_date = self._get_event_date('Europe/Madrid')
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
-        resp = requests.get(url=hotel_url, params=query_params)
+        resp = http_client.get(url=hotel_url, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotels = resp.json()['data']
@@ -1399,7 +1398,7 @@ class TestHotelAllowances(StormxSystemVerification):
         # book hotel with allowance
         query_params = dict(ak1=passenger['ak1'], ak2=passenger['ak2'])
         booking_payload = dict(hotel_id='tvl-91163', context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, data=booking_payload, params=query_params)
+        booking_resp = http_client.post(url=hotel_url, data=booking_payload, params=query_params)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -1450,7 +1449,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='DUB'
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1473,7 +1472,7 @@ class TestHotelAllowances(StormxSystemVerification):
         # add inventory with allowances (under settings max)
         self.add_hotel_availability(91218, 294, event_date, ap_block_type=1, block_price='100.00', blocks=5, pay_type='0')
 
-        resp = requests.get(url=hotel_url_public, params=query_params)
+        resp = http_client.get(url=hotel_url_public, params=query_params)
         self.assertEqual(resp.status_code, 200)
 
         hotel_ids = []
@@ -1503,7 +1502,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=json.dumps(dict(meals=True, amenity=True))
         )
 
-        resp = requests.get(url=hotel_url_airline, params=query_params, headers=headers)
+        resp = http_client.get(url=hotel_url_airline, params=query_params, headers=headers)
         self.assertEqual(resp.status_code, 200)
 
         hotel_ids = []
@@ -1538,7 +1537,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=20, lunch=0, dinner=0))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -1552,7 +1551,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=0, lunch=15, dinner=0))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -1566,7 +1565,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=0, lunch=0, dinner=99))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -1580,7 +1579,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(meals=dict(breakfast=14, lunch=14, dinner=14))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
 
         # validate amenity amount max 8 digits
@@ -1589,7 +1588,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict(amount='999999999', currency_code='USD'))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -1601,7 +1600,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict(amount='99999999.99', currency_code='USD'))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -1613,7 +1612,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict(amount='999999.999', currency_code='USD'))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         resp_json = resp.json()
 
@@ -1626,7 +1625,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict(amount='999999.99', currency_code='USD'))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
 
         passengers_payload = self._generate_n_passenger_payload(1)
@@ -1634,7 +1633,7 @@ class TestHotelAllowances(StormxSystemVerification):
             hotel_allowances=dict(amenity=dict(amount='9999999', currency_code='USD'))
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         resp_json = resp.json()
         self.assertEqual(resp.status_code, 400)
 
@@ -1661,7 +1660,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1678,7 +1677,7 @@ class TestHotelAllowances(StormxSystemVerification):
 
         # book hotel with allowance
         booking_payload = dict(hotel_id='tvl-91163', context_ids=[passenger['context_id'], passenger2['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -1745,7 +1744,7 @@ class TestHotelAllowances(StormxSystemVerification):
                              )
                          )
 
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         hotel_voucher_full_state = full_state_1['voucher']['hotel_voucher']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         self.assertEqual(hotel_voucher_full_state['hotel_allowances_voucher_total'], hotel_voucher['hotel_allowances_voucher_total'])
@@ -1760,7 +1759,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertEqual(hotel_allowances['meals']['dinner']['total'], '8.00')
         self.assertEqual(hotel_allowances['amenity']['amount'], '2.50')
 
-        full_state_2 = requests.get(url=passenger_url + '/' + passenger2['context_id'] + '/state', headers=headers).json()['data']
+        full_state_2 = http_client.get(url=passenger_url + '/' + passenger2['context_id'] + '/state', headers=headers).json()['data']
         hotel_voucher_full_state = full_state_2['voucher']['hotel_voucher']
         hotel_allowances = full_state_2['voucher']['hotel_allowances_voucher']
         self.assertEqual(hotel_voucher_full_state['hotel_allowances_voucher_total'], hotel_voucher['hotel_allowances_voucher_total'])
@@ -1793,7 +1792,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1818,8 +1817,8 @@ class TestHotelAllowances(StormxSystemVerification):
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
         # full state checks
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
-        full_state_2 = requests.get(url=passenger_url + '/' + passenger2['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_2 = http_client.get(url=passenger_url + '/' + passenger2['context_id'] + '/state', headers=headers).json()['data']
 
         passenger = full_state_1['passenger']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'not_offered')
@@ -1835,7 +1834,7 @@ class TestHotelAllowances(StormxSystemVerification):
 
         # book hotel with allowance
         booking_payload = dict(hotel_id='tvl-91163', context_ids=[passenger['context_id'], passenger2['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -1899,14 +1898,14 @@ class TestHotelAllowances(StormxSystemVerification):
                              )
                          )
 
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         hotel_voucher_full_state = full_state_1['voucher']['hotel_voucher']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         self.assertEqual(hotel_voucher_full_state['hotel_allowances_voucher_total'], hotel_voucher['hotel_allowances_voucher_total'])
         self.assertIsNone(hotel_allowances['meals'])
         self.assertIsNone(hotel_allowances['amenity'])
 
-        full_state_2 = requests.get(url=passenger_url + '/' + passenger2['context_id'] + '/state', headers=headers).json()['data']
+        full_state_2 = http_client.get(url=passenger_url + '/' + passenger2['context_id'] + '/state', headers=headers).json()['data']
         hotel_voucher_full_state = full_state_2['voucher']['hotel_voucher']
         hotel_allowances = full_state_2['voucher']['hotel_allowances_voucher']
         self.assertEqual(hotel_voucher_full_state['hotel_allowances_voucher_total'], hotel_voucher['hotel_allowances_voucher_total'])
@@ -1947,7 +1946,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -1963,7 +1962,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
         # full state checks
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         passenger = full_state_1['passenger']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'offered')
@@ -1974,7 +1973,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['meals'])
 
         # decline hotel with allowance
-        decline_resp = requests.put(url=passenger_url + '/' + passenger['context_id'] + '/decline', headers=headers)
+        decline_resp = http_client.put(url=passenger_url + '/' + passenger['context_id'] + '/decline', headers=headers)
         self.assertEqual(decline_resp.status_code, 200)
         passenger = decline_resp.json()['data']['passengers'][0]
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
@@ -1986,7 +1985,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['meals'])
 
         # full state check
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         passenger = full_state_1['passenger']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'declined')
@@ -2011,7 +2010,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -2027,7 +2026,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
         # full state checks
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         passenger = full_state_1['passenger']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'offered')
@@ -2039,7 +2038,7 @@ class TestHotelAllowances(StormxSystemVerification):
 
         # book hotel with allowance
         booking_payload = dict(hotel_id='tvl-91163', context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -2062,7 +2061,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['meals']['lunch'])
 
         # full state check
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         passenger = full_state_1['passenger']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'accepted')
@@ -2079,7 +2078,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['meals']['lunch'])
 
         # cancel hotel with allowance
-        cancel_resp = requests.put(url=passenger_url + '/' + passenger['context_id'] + '/cancel', headers=headers).json()
+        cancel_resp = http_client.put(url=passenger_url + '/' + passenger['context_id'] + '/cancel', headers=headers).json()
         self.assertEqual(len(cancel_resp['data']['passengers']), 1)
         hotel_allowances = cancel_resp['data']['passengers'][0]['hotel_allowances_voucher']
         passenger = cancel_resp['data']['passengers'][0]
@@ -2098,7 +2097,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['meals']['lunch'])
 
         # full state check
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         passenger = full_state_1['passenger']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'canceled_voucher')
@@ -2128,7 +2127,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -2144,7 +2143,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
         # full state checks
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         passenger = full_state_1['passenger']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'offered')
@@ -2155,7 +2154,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['meals'])
 
         # cancel hotel with no allowance
-        cancel_resp = requests.put(url=passenger_url + '/' + passenger['context_id'] + '/cancel', headers=headers).json()
+        cancel_resp = http_client.put(url=passenger_url + '/' + passenger['context_id'] + '/cancel', headers=headers).json()
         self.assertEqual(len(cancel_resp['data']['passengers']), 1)
         hotel_allowances = cancel_resp['data']['passengers'][0]['hotel_allowances_voucher']
         passenger = cancel_resp['data']['passengers'][0]
@@ -2167,7 +2166,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['amenity'])
 
         # full state check
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         passenger = full_state_1['passenger']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'canceled_offer')
@@ -2191,7 +2190,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -2207,7 +2206,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.add_hotel_availability(91163, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
         # full state checks
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         passenger = full_state_1['passenger']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'offered')
@@ -2218,7 +2217,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['meals'])
 
         # cancel hotel with no allowance
-        cancel_resp = requests.put(url=passenger_url + '/' + passenger['context_id'] + '/cancel', headers=headers).json()
+        cancel_resp = http_client.put(url=passenger_url + '/' + passenger['context_id'] + '/cancel', headers=headers).json()
         self.assertEqual(len(cancel_resp['data']['passengers']), 1)
         hotel_allowances = cancel_resp['data']['passengers'][0]['hotel_allowances_voucher']
         passenger = cancel_resp['data']['passengers'][0]
@@ -2230,7 +2229,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['amenity'])
 
         # full state check
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         passenger = full_state_1['passenger']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'canceled_offer')
@@ -2255,7 +2254,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -2271,7 +2270,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.add_hotel_availability(91158, 294, event_date, ap_block_type=1, block_price='100.00', blocks=1, pay_type='0')
 
         # full state checks
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         passenger = full_state_1['passenger']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'offered')
@@ -2283,7 +2282,7 @@ class TestHotelAllowances(StormxSystemVerification):
 
         # book hotel with allowance
         booking_payload = dict(hotel_id='tvl-91158', context_ids=[passenger['context_id']], room_count=1)
-        booking_resp = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_resp = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
 
         # validate success
         self.assertEqual(booking_resp.status_code, 200)
@@ -2303,7 +2302,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertIsNone(hotel_allowances['amenity'])
 
         # full state check
-        full_state_1 = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
+        full_state_1 = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers).json()['data']
         passenger = full_state_1['passenger']
         hotel_allowances = full_state_1['voucher']['hotel_allowances_voucher']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'accepted')
@@ -2330,7 +2329,7 @@ class TestHotelAllowances(StormxSystemVerification):
             port_accommodation='MAD'
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertGreater(len(resp_json['data']), 0)
@@ -2340,7 +2339,7 @@ class TestHotelAllowances(StormxSystemVerification):
         self.assertEqual(passenger['hotel_allowance_status']['dinner'], 'offered')
         self.assertEqual(passenger['hotel_allowance_status']['amenity'], 'offered')
 
-        passenger = requests.get(url=passenger_url + '/' + passenger['context_id'], headers=headers).json()['data']
+        passenger = http_client.get(url=passenger_url + '/' + passenger['context_id'], headers=headers).json()['data']
         self.assertEqual(passenger['hotel_allowance_status']['breakfast'], 'not_offered')
         self.assertEqual(passenger['hotel_allowance_status']['lunch'], 'offered')
         self.assertEqual(passenger['hotel_allowance_status']['dinner'], 'offered')
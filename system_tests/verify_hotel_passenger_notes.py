@@ -32,7 +32,7 @@ class TestHotelPassengerNotes(StormxSystemVerification):
 
         cls.user_list.append({'username': cls.support_username,
                               'user_type': 'tva',
-                              'cookies': cls.login_to_stormx(
+                              'cookies': cls.login_to_stormx_cached(
                                   cls.support_username,
                                   cls.support_user_password)})
 
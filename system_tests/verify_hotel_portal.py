@@ -2,7 +2,7 @@ import random
 from datetime import datetime
 from decimal import Decimal
 
-import requests
+from stormx_http import http_client
 
 import faker
 from stormx_verification_framework import StormxSystemVerification
@@ -34,7 +34,7 @@ class TestHotelPortal(StormxSystemVerification):
         url = self.base_url + 'stats'
 
         # verify response when nobody is logged in ----
-        response = requests.get(url)
+        response = http_client.get(url)
         self.assertEqual(response.status_code, 401)
         self.assertEqual(
             response.json(),
@@ -48,7 +48,7 @@ class TestHotelPortal(StormxSystemVerification):
 
         self.setup_test_hotel()
         self.setup_hotel_user_cookie()
-        response = requests.get(url, cookies=self.cookie)
+        response = http_client.get(url, cookies=self.cookie)
 
         self.assertEqual(response.status_code, 200)   # PHP Proxy response
         response_json = response.json()
@@ -64,7 +64,7 @@ class TestHotelPortal(StormxSystemVerification):
         for user_type in self.hotel_user_types:
             user_id, cookie = self.create_hotel_user_cookie(user_type=user_type['id'])
 
-            response = requests.get(url, cookies=cookie)
+            response = http_client.get(url, cookies=cookie)
 
             self.assertEqual(response.status_code, 200)   # PHP Proxy response
             response_json = response.json()
@@ -80,7 +80,7 @@ class TestHotelPortal(StormxSystemVerification):
 
         url = self.base_url + 'stats'
 
-        response = requests.get(url, cookies=self._support_cookies)
+        response = http_client.get(url, cookies=self._support_cookies)
 
         self.assertEqual(response.status_code, 401)   # PHP Proxy response
         response_json = response.json()
@@ -95,7 +95,7 @@ class TestHotelPortal(StormxSystemVerification):
 
             rooms = random.randint(1, 65535)  # max positive smallint limit
 
-            response = requests.post(url, cookies=cookie, data={'rooms': rooms})
+            response = http_client.post(url, cookies=cookie, data={'rooms': rooms})
 
             self.assertEqual(response.status_code, 200)   # PHP Proxy response
             response_json = response.json()
@@ -110,7 +110,7 @@ class TestHotelPortal(StormxSystemVerification):
 
         rooms = random.randint(1, 65535)  # max positive smallint limit
 
-        response = requests.post(url, cookies=self._support_cookies, data={'rooms': rooms})
+        response = http_client.post(url, cookies=self._support_cookies, data={'rooms': rooms})
 
         self.assertEqual(response.status_code, 200)   # PHP Proxy response
         response_json = response.json()
@@ -128,7 +128,7 @@ class TestHotelPortal(StormxSystemVerification):
         # case 1 - invalid rooms - above max positive smallint limit
         rooms = 65536
 
-        response = requests.post(url, cookies=self.cookie, data={'rooms': rooms})
+        response = http_client.post(url, cookies=self.cookie, data={'rooms': rooms})
 
         self.assertEqual(response.status_code, 400)   # PHP Proxy response
         response_json = response.json()
@@ -137,7 +137,7 @@ class TestHotelPortal(StormxSystemVerification):
 
         # case 2 - no rooms param in request
         rooms = 65536
-        response = requests.post(url, cookies=self.cookie)
+        response = http_client.post(url, cookies=self.cookie)
 
         self.assertEqual(response.status_code, 400)   # PHP Proxy response
         response_json = response.json()
@@ -152,7 +152,7 @@ class TestHotelPortal(StormxSystemVerification):
 
         rooms = random.randint(1, 65535)
 
-        response = requests.post(url, cookies=cookie, data={'rooms': rooms})
+        response = http_client.post(url, cookies=cookie, data={'rooms': rooms})
 
         self.assertEqual(response.status_code, 401)   # PHP Proxy response
         response_json = response.json()
@@ -173,7 +173,7 @@ class TestHotelPortal(StormxSystemVerification):
         }
         for user_type in self.hotel_user_types:
             user_id, cookie = self.create_hotel_user_cookie(user_type=user_type['id'])
-            response = requests.post(url, cookies=cookie, data=block)
+            response = http_client.post(url, cookies=cookie, data=block)
 
             self.assertEqual(response.status_code, 200)   # PHP Proxy response
             response_json = response.json()
@@ -207,7 +207,7 @@ class TestHotelPortal(StormxSystemVerification):
         ]
 
         for block in blocks:
-            response = requests.post(url, cookies=self.cookie, data=block)
+            response = http_client.post(url, cookies=self.cookie, data=block)
             self.assertEqual(response.status_code, 200)   # PHP Proxy response
             response_json = response.json()
 
@@ -224,7 +224,7 @@ class TestHotelPortal(StormxSystemVerification):
 
         # Get rate cap reasons
         url = self.base_url + 'stats'
-        response = requests.get(url, cookies=self.cookie)
+        response = http_client.get(url, cookies=self.cookie)
 
         self.assertEqual(response.status_code, 200)   # PHP Proxy response
         response_json = response.json()
@@ -248,7 +248,7 @@ class TestHotelPortal(StormxSystemVerification):
                 'rate_cap_reason': reason['id']
             }
 
-            response = requests.post(url, cookies=self.cookie, data=block)
+            response = http_client.post(url, cookies=self.cookie, data=block)
             response_json = response.json()
 
             self.assertEqual(response_json['meta']['status'], 200)  # API response
@@ -266,7 +266,7 @@ class TestHotelPortal(StormxSystemVerification):
 
         # Get inventory stats
         url = self.base_url + 'stats'
-        response = requests.get(url, cookies=self.cookie)
+        response = http_client.get(url, cookies=self.cookie)
 
         self.assertEqual(response.status_code, 200)   # PHP Proxy response
         response_json = response.json()
@@ -295,7 +295,7 @@ class TestHotelPortal(StormxSystemVerification):
                     'room_type': room_type_inventory['room_type']['code']
                 }
 
-                response = requests.post(url, cookies=self.cookie, data=new_block)
+                response = http_client.post(url, cookies=self.cookie, data=new_block)
                 response_json = response.json()
 
                 self.assertEqual(response_json['meta']['status'], 200)  # API response
@@ -306,7 +306,7 @@ class TestHotelPortal(StormxSystemVerification):
 
                 # Add block with rate exceeding cap limit
                 new_block['room_rate'] += 1
-                response = requests.post(url, cookies=self.cookie, data=new_block)
+                response = http_client.post(url, cookies=self.cookie, data=new_block)
 
                 self.assertEqual(response.status_code, 400)   # PHP Proxy response
                 response_json = response.json()
@@ -344,7 +344,7 @@ class TestHotelPortal(StormxSystemVerification):
         ]
 
         for block in blocks:
-            response = requests.post(url, cookies=self._support_cookies, data=block)
+            response = http_client.post(url, cookies=self._support_cookies, data=block)
             response_json = response.json()
 
             self.assertEqual(response_json['meta']['status'], 200)  # API response
@@ -368,7 +368,7 @@ class TestHotelPortal(StormxSystemVerification):
                 'room_type': "roh",
                 'block_type': block_type,
             }
-            response = requests.post(url, cookies=self._support_cookies, data=block)
+            response = http_client.post(url, cookies=self._support_cookies, data=block)
             response_json = response.json()
 
             self.assertEqual(response_json['meta']['status'], 200)  # API response
@@ -388,7 +388,7 @@ class TestHotelPortal(StormxSystemVerification):
         # CASE 1 - missing required data
         block = {}
 
-        response = requests.post(url, cookies=self.cookie, data=block)
+        response = http_client.post(url, cookies=self.cookie, data=block)
 
         self.assertEqual(response.status_code, 400)   # PHP Proxy response
         response_json = response.json()
@@ -403,7 +403,7 @@ class TestHotelPortal(StormxSystemVerification):
             'room_rate': fake.pydecimal(left_digits=7, right_digits=2, positive=True, min_value=1, max_value=self.rate_cap_limit),
         }
 
-        response = requests.post(url, cookies=self.cookie, data=block)
+        response = http_client.post(url, cookies=self.cookie, data=block)
 
         self.assertEqual(response.status_code, 400)   # PHP Proxy response
         response_json = response.json()
@@ -418,7 +418,7 @@ class TestHotelPortal(StormxSystemVerification):
             'room_rate': fake.pydecimal(left_digits=7, right_digits=2, positive=True, min_value=1, max_value=self.rate_cap_limit),
         }
 
-        response = requests.post(url, cookies=self.cookie, data=block)
+        response = http_client.post(url, cookies=self.cookie, data=block)
 
         self.assertEqual(response.status_code, 400)   # PHP Proxy response
         response_json = response.json()
@@ -433,7 +433,7 @@ class TestHotelPortal(StormxSystemVerification):
             'room_rate': fake.pydecimal(left_digits=7, right_digits=2, positive=True, min_value=1, max_value=self.rate_cap_limit),
         }
 
-        response = requests.post(url, cookies=self.cookie, data=block)
+        response = http_client.post(url, cookies=self.cookie, data=block)
 
         self.assertEqual(response.status_code, 400)   # PHP Proxy response
         response_json = response.json()
@@ -448,7 +448,7 @@ class TestHotelPortal(StormxSystemVerification):
             'room_rate': 'abc',
         }
 
-        response = requests.post(url, cookies=self.cookie, data=block)
+        response = http_client.post(url, cookies=self.cookie, data=block)
 
         self.assertEqual(response.status_code, 400)   # PHP Proxy response
         response_json = response.json()
@@ -466,7 +466,7 @@ class TestHotelPortal(StormxSystemVerification):
             'rate_cap_reason': 99
         }
 
-        response = requests.post(url, cookies=self.cookie, data=block)
+        response = http_client.post(url, cookies=self.cookie, data=block)
 
         self.assertEqual(response.status_code, 400)   # PHP Proxy response
         response_json = response.json()
@@ -487,7 +487,7 @@ class TestHotelPortal(StormxSystemVerification):
             'room_rate': fake.pydecimal(left_digits=7, right_digits=2, positive=True, min_value=1, max_value=self.rate_cap_limit),
         }
 
-        response = requests.post(url, cookies=cookie, data=block)
+        response = http_client.post(url, cookies=cookie, data=block)
 
         self.assertEqual(response.status_code, 401)   # PHP Proxy response
         response_json = response.json()
@@ -1,7 +1,7 @@
 from decimal import Decimal
 from uuid import UUID
 
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import (
     StormxSystemVerification,
@@ -16,7 +16,6 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         * `/api/v1/tvl/hotel_voucher_unlock`
         * `/api/v1/tvl/hotel_voucher_details`
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -37,17 +36,17 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         headers = self._generate_tvl_stormx_user_headers(user_id=hotel_user_id)
 
         for url in urls:
-            resp = requests.post(url=url, headers=headers)  # no post data
+            resp = http_client.post(url=url, headers=headers)  # no post data
             self.assertEqual(resp.status_code, 404)
             resp_json = resp.json()
             self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
 
-            resp = requests.post(url=url, headers=headers, json={})  # empty post data
+            resp = http_client.post(url=url, headers=headers, json={})  # empty post data
             self.assertEqual(resp.status_code, 404)
             resp_json = resp.json()
             self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
 
-            resp = requests.post(url=url, headers=headers, json={'meaningless': 'field'})  # meaningless post data
+            resp = http_client.post(url=url, headers=headers, json={'meaningless': 'field'})  # meaningless post data
             self.assertEqual(resp.status_code, 404)
             resp_json = resp.json()
             self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
@@ -65,17 +64,17 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         missing_user_id_headers = self._generate_tvl_stormx_headers()
 
         for url in urls:
-            resp = requests.post(url=url)  # missing headers
+            resp = http_client.post(url=url)  # missing headers
             self.assertEqual(resp.status_code, 403)
             resp_json = resp.json()
             self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
 
-            resp = requests.post(url=url, headers=bad_headers)  # headers with wrong token
+            resp = http_client.post(url=url, headers=bad_headers)  # headers with wrong token
             self.assertEqual(resp.status_code, 403)
             resp_json = resp.json()
             self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
 
-            resp = requests.post(url=url, headers=missing_user_id_headers)  # missing user_id with good token headers
+            resp = http_client.post(url=url, headers=missing_user_id_headers)  # missing user_id with good token headers
             self.assertEqual(resp.status_code, 403)
             resp_json = resp.json()
             self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
@@ -94,7 +93,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         headers = self._generate_tvl_stormx_user_headers_bad(user_id=hotel_user_id)
 
         for url in urls:
-            resp = requests.post(url=url, headers=headers)
+            resp = http_client.post(url=url, headers=headers)
             self.assertEqual(resp.status_code, 403)
             resp_json = resp.json()
             self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
@@ -124,7 +123,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         ]
 
         for post_data in post_data_sets:
-            resp = requests.post(url=url, headers=headers, json=post_data)
+            resp = http_client.post(url=url, headers=headers, json=post_data)
             self.assertEqual(resp.status_code, 404)
             resp_json = resp.json()
             self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
@@ -146,7 +145,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         ]
 
         for post_data in post_data_sets:
-            resp = requests.post(url=url, headers=headers, json=post_data)
+            resp = http_client.post(url=url, headers=headers, json=post_data)
             self.assertEqual(resp.status_code, 404)
             resp_json = resp.json()
             self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
@@ -190,7 +189,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             port_accommodation='PHX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -207,7 +206,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -229,31 +228,31 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
 
         for user in users:
             user_headers = self._generate_tvl_stormx_user_headers(user_id=user)
-            resp = requests.post(url=voucher_hotel_unlock_url, headers=user_headers, json=unlock_payload)
+            resp = http_client.post(url=voucher_hotel_unlock_url, headers=user_headers, json=unlock_payload)
             self.assertEqual(resp.status_code, 403)
             resp_json = resp.json()
             self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
 
         for user in users_can_view:
             user_headers = self._generate_tvl_stormx_user_headers(user_id=user)
-            resp = requests.post(url=voucher_hotel_details_url, headers=user_headers, json=detail_payload)
+            resp = http_client.post(url=voucher_hotel_details_url, headers=user_headers, json=detail_payload)
             self.assertEqual(resp.status_code, 200)
             cc_json = resp.json()
             self._validate_hotel_voucher_cc(cc_json['data'])
 
         for user in users_cannot_view:
             user_headers = self._generate_tvl_stormx_user_headers(user_id=user)
-            resp = requests.post(url=voucher_hotel_details_url, headers=user_headers, json=detail_payload)
+            resp = http_client.post(url=voucher_hotel_details_url, headers=user_headers, json=detail_payload)
             self.assertEqual(resp.status_code, 403)
             resp_json = resp.json()
             self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
 
-        resp = requests.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
@@ -306,7 +305,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             port_accommodation='PHX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -323,7 +322,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -344,22 +343,22 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             check_in_key=check_in_key
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=bad_post_data)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=bad_post_data)
         self.assertEqual(resp.status_code, 404)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_bad, json=good_post_data)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_bad, json=good_post_data)
         self.assertEqual(resp.status_code, 404)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=good_post_data)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=good_post_data)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=good_post_data)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=good_post_data)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 200, 'OK', 'HOTEL_VOUCHER_ALREADY_UNLOCKED', 'Hotel payment cannot be unlocked. Hotel payment is already unlocked.', [])
@@ -387,7 +386,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             port_accommodation='PHX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -404,7 +403,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -425,22 +424,22 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             'voucher_uuid': voucher_uuid
         }
 
-        resp = requests.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=details_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=details_payload)
         self.assertEqual(resp.status_code, 404)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
 
-        resp = requests.post(url=voucher_hotel_details_url, headers=stormx_user_headers_bad, json=details_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=stormx_user_headers_bad, json=details_payload)
         self.assertEqual(resp.status_code, 404)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
 
-        resp = requests.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=details_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=details_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
@@ -466,7 +465,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             port_accommodation='PHX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -483,7 +482,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -492,7 +491,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         voucher_uuid = booking_response_json['data']['voucher_id']
         check_in_key = booking_response_json['data']['hotel_voucher']['hotel_key']
 
-        cancel_resp = requests.put(url=url + '/' + passenger['context_id'] + '/cancel', headers=headers)
+        cancel_resp = http_client.put(url=url + '/' + passenger['context_id'] + '/cancel', headers=headers)
         self.assertEqual(cancel_resp.status_code, 200)
 
         stormx_user_headers_good = self._generate_tvl_stormx_user_headers(user_id=hotel_user_good)
@@ -506,12 +505,12 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
 
-        resp = requests.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
         self.assertEqual(resp.status_code, 404)
         resp_json = resp.json()
         self._validate_error_message(resp_json, 404, 'Not Found', '', '', [])
@@ -536,7 +535,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             port_accommodation='PHX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -553,7 +552,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -573,17 +572,17 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
 
-        resp = requests.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
 
-        cancel_resp = requests.put(url=url + '/' + passenger['context_id'] + '/cancel', headers=headers)
+        cancel_resp = http_client.put(url=url + '/' + passenger['context_id'] + '/cancel', headers=headers)
         self.assertEqual(cancel_resp.status_code, 400)
         cancel_resp_json = cancel_resp.json()
         self._validate_error_message(cancel_resp_json, 400, 'Bad Request', 'PASSENGER_CANNOT_CANCEL',
@@ -617,7 +616,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             'context_ids': [passengers[0]['context_id'], passengers[1]['context_id']]
         }
 
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(len(resp_json['data']['hotel_voucher']['room_vouchers']), 2)
@@ -651,7 +650,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
@@ -670,7 +669,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         expected_total = '%.4f' % (fees_sum + Decimal(cc['rates'][0]['rate']) + Decimal(cc['rates'][1]['rate']) + Decimal(cc['tax']))
         self.assertEqual(cc['amount'], expected_total)
 
-        resp = requests.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=stormx_user_headers_good, json=detail_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self._validate_hotel_voucher_cc(cc_json['data'])
@@ -712,7 +711,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
 
         passengers = self._create_2_passengers(customer=customer, port_accommodation=port)
 
-        hotel_response = requests.get(hotel_url + '?room_count=1&port=' + port + '&provider=ean', headers=headers)
+        hotel_response = http_client.get(hotel_url + '?room_count=1&port=' + port + '&provider=ean', headers=headers)
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
         self.assertGreater(len(hotel_response_json['data']), 0)
@@ -725,7 +724,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             room_count=1
         )
 
-        booking_response = requests.post(url=hotel_url, headers=headers, data=booking_payload)
+        booking_response = http_client.post(url=hotel_url, headers=headers, data=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         ean_voucher = booking_response_json['data']
@@ -746,10 +745,10 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=ean_voucher['voucher_id']
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=hotel_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=hotel_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)  # serializer forces length 5 check_in_key
 
-        resp = requests.post(url=voucher_hotel_details_url, headers=user_headers, json=detail_payload)
+        resp = http_client.post(url=voucher_hotel_details_url, headers=user_headers, json=detail_payload)
         self.assertEqual(resp.status_code, 403)
         resp_json = resp.json()
         self.assertEqual(resp_json, {'detail': 'You do not have permission to perform this action.'})
@@ -775,7 +774,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             port_accommodation='PHX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -791,7 +790,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -808,7 +807,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
 
         unlock_payload = dict(
@@ -818,7 +817,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
 
         unlock_payload = dict(
@@ -827,7 +826,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
 
         unlock_payload = dict(
@@ -836,7 +835,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
 
     def test_meal_transaction_unlock_reason(self):
@@ -846,7 +845,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         customer = 'Purple Rain Airlines'
 
         passengers = self._create_2_passengers(customer=customer, port_accommodation='PHX', hotel_accommodation=False)
-        embedded_json = self._get_landing_page_embedded_json(requests.get(url=passengers[0]['offer_url']))
+        embedded_json = self._get_landing_page_embedded_json(http_client.get(url=passengers[0]['offer_url']))
         card = embedded_json['confirmation']['passengers'][0]['meal_vouchers'][0]
 
         merchant_info = dict(
@@ -888,12 +887,12 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             room_count=room_count
         )
 
-        booking_response = requests.post(hotel_url, headers=airline_headers, json=booking_payload)
+        booking_response = http_client.post(hotel_url, headers=airline_headers, json=booking_payload)
         check_in_key = booking_response.json()['data']['hotel_voucher']['hotel_key']
 
         unlock_payload = dict(hotel_id=hotel_id, check_in_key=check_in_key)
         voucher_hotel_unlock_url = self._api_host + '/api/v1/tvl/hotel_voucher_unlock'
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 200)
 
         cc_json = resp.json()
@@ -939,7 +938,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             port_accommodation='PHX'
         ))
 
-        response = requests.post(url, headers=headers, json=passenger_payload)
+        response = http_client.post(url, headers=headers, json=passenger_payload)
         response_json = response.json()
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response_json['error'], False)
@@ -955,7 +954,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
         )
 
         booking_url = self._api_host + '/api/v1/tvl/airline/71/hotels'
-        booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+        booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
         self.assertEqual(booking_response.status_code, 200)
         booking_response_json = booking_response.json()
         self.assertIs(booking_response_json['error'], False)
@@ -972,7 +971,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
 
         unlock_payload = dict(
@@ -982,7 +981,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
 
         unlock_payload = dict(
@@ -991,7 +990,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
 
         unlock_payload = dict(
@@ -1000,7 +999,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             voucher_uuid=voucher_uuid
         )
 
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers, json=unlock_payload)
         self.assertEqual(resp.status_code, 404)
 
     def test_tvl_hotel_voucher_unlock_by_ops(self):
@@ -1028,7 +1027,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
                 port_accommodation='PHX'
             ))
 
-            response = requests.post(url, headers=headers, json=passenger_payload)
+            response = http_client.post(url, headers=headers, json=passenger_payload)
             response_json = response.json()
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response_json['error'], False)
@@ -1045,7 +1044,7 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
             )
 
             booking_url = self._api_host + '/api/v1/tvl/airline/294/hotels'
-            booking_response = requests.post(booking_url, headers=stormx_headers, json=booking_payload)
+            booking_response = http_client.post(booking_url, headers=stormx_headers, json=booking_payload)
             self.assertEqual(booking_response.status_code, 200)
             booking_response_json = booking_response.json()
             self.assertIs(booking_response_json['error'], False)
@@ -1060,12 +1059,12 @@ class TestHotelVoucherUnlock(StormxSystemVerification):
                 check_in_key=check_in_key
             )
 
-            resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=good_post_data)
+            resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=good_post_data)
             self.assertEqual(resp.status_code, 200)
             cc_json = resp.json()
             self._validate_hotel_voucher_cc(cc_json['data'])
 
-            resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=good_post_data)
+            resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=good_post_data)
             self.assertEqual(resp.status_code, 200)
             resp_json = resp.json()
             self._validate_error_message(resp_json, 200, 'OK', 'HOTEL_VOUCHER_ALREADY_UNLOCKED', 'Hotel payment cannot be unlocked. Hotel payment is already unlocked.', [])
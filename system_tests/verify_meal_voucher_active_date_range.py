@@ -2,7 +2,7 @@ import datetime
 from uuid import UUID
 
 import pytz
-import requests
+from stormx_http import http_client
 
 from StormxApp.constants import StormxConstants
 from stormx_verification_framework import (
@@ -16,7 +16,6 @@ class TestMealVoucherActiveDateRange(StormxSystemVerification):
     """
     Verify that meal voucher credit cards' active date ranges are correct on vouchers.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -35,7 +34,7 @@ class TestMealVoucherActiveDateRange(StormxSystemVerification):
         ))
 
         import_url = self._api_host + '/api/v1/passenger'
-        import_resp = requests.post(url=import_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(url=import_url, headers=headers, json=passenger_payload)
         self.assertGreaterEqual(import_resp.status_code, 201)
         passenger = import_resp.json()['data'][0]
 
@@ -47,7 +46,7 @@ class TestMealVoucherActiveDateRange(StormxSystemVerification):
         UUID(booking_response_data['voucher_id'], version=4)
 
         voucher_url = self._api_host + '/api/v1/voucher/' + str(booking_response_data['voucher_id'])
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
 
         voucher_resp_json = voucher_resp.json()
@@ -98,12 +97,12 @@ class TestMealVoucherActiveDateRange(StormxSystemVerification):
         ))
 
         import_url = self._api_host + '/api/v1/passenger'
-        import_resp = requests.post(url=import_url, headers=headers, json=passenger_payload)
+        import_resp = http_client.post(url=import_url, headers=headers, json=passenger_payload)
         self.assertGreaterEqual(import_resp.status_code, 201)
         passenger = import_resp.json()['data'][0]
 
         voucher_url = self._api_host + '/api/v1/voucher/' + str(passenger['voucher_id'])
-        voucher_resp = requests.get(url=voucher_url, headers=headers)
+        voucher_resp = http_client.get(url=voucher_url, headers=headers)
         self.assertEqual(voucher_resp.status_code, 200)
 
         voucher_resp_json = voucher_resp.json()
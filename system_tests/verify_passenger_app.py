@@ -1,6 +1,6 @@
 import unittest
 
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import (
     StormxSystemVerification,
@@ -14,7 +14,6 @@ class TestPassengerApp(StormxSystemVerification):
     """
     Verify that some backend aspects of the passenger app are functioning properly.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -37,7 +36,7 @@ class TestPassengerApp(StormxSystemVerification):
         passenger_offer_url = passenger['offer_url']
 
         # passenger visits offer link ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         self.assertEqual(response.status_code, 200)
         embedded_json = self._get_landing_page_embedded_json(response)
         self.assertIsNotNone(embedded_json['confirmation'])
@@ -51,7 +50,7 @@ class TestPassengerApp(StormxSystemVerification):
                 self.assertEqual(len(meal_voucher['card_number']), 16)
                 self.assertGreaterEqual(len(meal_voucher['cvc2']), 3)
                 self.assertEqual(len(meal_voucher['expiration']), 7)
-                qr_code_image_response = requests.get(meal_voucher['qr_code_url'], headers=headers)
+                qr_code_image_response = http_client.get(meal_voucher['qr_code_url'], headers=headers)
                 self.assertEqual(qr_code_image_response.status_code, 200)
 
         for field in passenger_sanitized_fields:
@@ -82,7 +81,7 @@ class TestPassengerApp(StormxSystemVerification):
         passenger_offer_url = passenger['offer_url']
 
         # passenger visits offer link ----
-        response = requests.get(passenger_offer_url, headers=headers)
+        response = http_client.get(passenger_offer_url, headers=headers)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
@@ -109,14 +108,14 @@ class TestPassengerApp(StormxSystemVerification):
         # simulate passenger app requests related to rides ----
 
         url = '/api/v1/offer/tvl/ride/airport-pickup-estimate'
-        response = requests.get(self._api_host + url, headers=headers, params=auth_keys)
+        response = http_client.get(self._api_host + url, headers=headers, params=auth_keys)
         if response.status_code != 200:
             display_response(response)
         self.assertEqual(response.status_code, 200)
         # TODO: assert more
 
         url = '/api/v1/offer/tvl/ride/airport-pickup-options'
-        response = requests.get(self._api_host + url, headers=headers, params=auth_keys)
+        response = http_client.get(self._api_host + url, headers=headers, params=auth_keys)
         self.assertEqual(response.status_code, 200)
         # TODO: assert more
         #display_response(response)
@@ -127,7 +126,7 @@ class TestPassengerApp(StormxSystemVerification):
         ride_request_payload = {
             'location_id': selected_pickup_location['id']
         }
-        response = requests.post(self._api_host + url, headers=headers, params=auth_keys, json=ride_request_payload)
+        response = http_client.post(self._api_host + url, headers=headers, params=auth_keys, json=ride_request_payload)
         #display_response(response)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
@@ -137,7 +136,7 @@ class TestPassengerApp(StormxSystemVerification):
         # TODO: assert destination, origin, and passenger details
 
         url = '/api/v1/offer/tvl/ride/status'
-        response = requests.get(self._api_host + url, headers=headers, params=auth_keys)
+        response = http_client.get(self._api_host + url, headers=headers, params=auth_keys)
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         #display_response(response)
@@ -156,12 +155,12 @@ class TestPassengerApp(StormxSystemVerification):
         #     'X-Lyft-Signature': 'sha256=36kDT4a6W0glwWud/fz079/wQsHlPGie+C73ESbRf2Q=',  # TODO: set different.
         # }
         # payload = {}
-        # response = requests.post(self._api_host + url, headers=headers_from_lyft_system, json=payload)
+        # response = http_client.post(self._api_host + url, headers=headers_from_lyft_system, json=payload)
         # self.assertEqual(response.status_code, 200)
         # # TODO: assert morecall some webhooks too.
         #
         # url = '/api/v1/offer/tvl/ride/cancel'
-        # response = requests.post(self._api_host + url, headers=headers, params=auth_keys)
+        # response = http_client.post(self._api_host + url, headers=headers, params=auth_keys)
         # self.assertEqual(response.status_code, 200)
         # # TODO: assert more
 
@@ -182,12 +181,12 @@ class TestPassengerApp(StormxSystemVerification):
             ak1='aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa',
             ak2='aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa',
         )
-        response = requests.get(url, headers=headers, params=bad_auth_key_pair)
+        response = http_client.get(url, headers=headers, params=bad_auth_key_pair)
         self.assertEqual(response.status_code, 404)
         self.assertIn(expected_embedded_message, response.text)
 
         # no auth keys ----
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         self.assertEqual(response.status_code, 404)
         self.assertIn(expected_embedded_message, response.text)
 
@@ -195,7 +194,7 @@ class TestPassengerApp(StormxSystemVerification):
         garbage_params = dict(
             abcd='1234'
         )
-        response = requests.get(url, headers=headers, params=garbage_params)
+        response = http_client.get(url, headers=headers, params=garbage_params)
         self.assertEqual(response.status_code, 404)
         self.assertIn(expected_embedded_message, response.text)
 
@@ -205,12 +204,12 @@ class TestPassengerApp(StormxSystemVerification):
 
         # good signing, bad offer (garbage that came from someone messing around on the short url site.) ---
         url = self._api_host + '/offer/sms-redirect/eyJzIjoiQW9zTUQ5YmNKIn0.Dr_cqQ.iKhDHUovjwAih7lkWgbfU6i1vwE'
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         self.assertEqual(response.status_code, 404)
         self.assertIn(expected_embedded_message, response.text)
 
         # bad signing, garbage redirect that did not come from short url site.. ----
         url = self._api_host + '/offer/sms-redirect/aaaaaaaaaaaaaaaaaaaaaaa.aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa'
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         self.assertEqual(response.status_code, 404)
         self.assertIn(expected_embedded_message, response.text)
@@ -1,14 +1,12 @@
-import requests
-from time import sleep
+from stormx_http import http_client
 from uuid import UUID
-from stormx_verification_framework import StormxSystemVerification, should_skip_local_test
+from stormx_verification_framework import StormxSystemVerification, should_skip_local_test, wait_until
 
 
 class TestPassengerPay(StormxSystemVerification):
     """
     validate passenger pay feature (StormX API / Roomstorm)
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -29,7 +27,7 @@ class TestPassengerPay(StormxSystemVerification):
             number_of_nights=2
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'FEATURE_NOT_SUPPORTED',
                                      'Passenger pay feature is currently not supported for multi night reservations.', [])
@@ -48,7 +46,7 @@ class TestPassengerPay(StormxSystemVerification):
             meal_accommodation=False
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT', 'All passengers on PNR group must contain same airline_pay value.', [])
 
@@ -67,11 +65,11 @@ class TestPassengerPay(StormxSystemVerification):
             notify=True
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[0]])
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[0]])
         self.assertEqual(resp.status_code, 201)
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[1]])
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[1]])
         self.assertEqual(resp.status_code, 201)
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[2]])
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[2]])
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT', 'All passengers on PNR group must contain same airline_pay value.', [])
 
@@ -96,13 +94,13 @@ class TestPassengerPay(StormxSystemVerification):
 
         passengers = []
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[0]])
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[0]])
         self.assertEqual(resp.status_code, 201)
         passengers.append(resp.json()['data'][0])
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[1]])
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[1]])
         self.assertEqual(resp.status_code, 201)
         passengers.append(resp.json()['data'][0])
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[2]])
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=[passengers_payload[2]])
         self.assertEqual(resp.status_code, 201)
         passengers.append(resp.json()['data'][0])
 
@@ -126,7 +124,7 @@ class TestPassengerPay(StormxSystemVerification):
             hotel_accommodation=False
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT', 'All passenger pay passengers must have hotel_accommodation=true.', [])
 
@@ -139,7 +137,7 @@ class TestPassengerPay(StormxSystemVerification):
             airline_pay=False
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT', 'All passenger pay passengers must have hotel_accommodation=true.', [])
 
@@ -157,7 +155,7 @@ class TestPassengerPay(StormxSystemVerification):
             meal_accommodation=True
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'All passenger pay passengers must have meal_accommodation, and transport_accommodation set to false.', [])
@@ -172,7 +170,7 @@ class TestPassengerPay(StormxSystemVerification):
             meal_accommodation=True
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 400)
         self._validate_error_message(resp.json(), 400, 'Bad Request', 'INVALID_INPUT',
                                      'All passenger pay passengers must have meal_accommodation, and transport_accommodation set to false.', [])
@@ -192,7 +190,7 @@ class TestPassengerPay(StormxSystemVerification):
             notify=False
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
 
         passengers_payload = self._generate_n_passenger_payload(2)
@@ -207,7 +205,7 @@ class TestPassengerPay(StormxSystemVerification):
             notify=False
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
 
     @should_skip_local_test
@@ -227,7 +225,7 @@ class TestPassengerPay(StormxSystemVerification):
             phone_numbers=['+12223333']
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         passenger = resp_json['data'][0]
@@ -260,7 +258,7 @@ class TestPassengerPay(StormxSystemVerification):
             phone_numbers=['+12223333']
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertEqual(len(resp_json['data']), 2)
@@ -317,7 +315,7 @@ class TestPassengerPay(StormxSystemVerification):
         ))
         passengers_payload = [passengers_payload_airline_pay[0], passengers_payload_pax_pay[0]]
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertEqual(len(resp_json['data']), 2)
@@ -380,7 +378,7 @@ class TestPassengerPay(StormxSystemVerification):
         ))
         passengers_payload = [passengers_payload_airline_pay[0], passengers_payload_pax_pay[0]]
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         self.assertEqual(len(resp_json['data']), 2)
@@ -430,7 +428,7 @@ class TestPassengerPay(StormxSystemVerification):
             phone_numbers=['+12223333']
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         passenger = resp_json['data'][0]
@@ -443,7 +441,7 @@ class TestPassengerPay(StormxSystemVerification):
             'email': 'test@blackhole.tvlinc.com'
         }
 
-        notify_resp = requests.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
+        notify_resp = http_client.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
         self.assertEqual(notify_resp.status_code, 400)
         notify_json = notify_resp.json()
         self._validate_error_message(notify_json, 400, 'Bad Request', 'CANNOT_NOTIFY', 'Passenger has no passenger pay url.', [])
@@ -465,7 +463,7 @@ class TestPassengerPay(StormxSystemVerification):
             phone_numbers=['+12223333']
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         passenger = resp_json['data'][0]
@@ -480,7 +478,7 @@ class TestPassengerPay(StormxSystemVerification):
             'hotel_id': 'tvl-12345'
         }
 
-        booking_resp = requests.post(url=self._api_host + '/api/v1/hotels', headers=headers, json=payload)
+        booking_resp = http_client.post(url=self._api_host + '/api/v1/hotels', headers=headers, json=payload)
         self.assertEqual(booking_resp.status_code, 400)
         booking_resp_json = booking_resp.json()
         self._validate_error_message(booking_resp_json, 400, 'Bad Request', 'PASSENGER_INVALID_STATUS', 'Passenger pay passengers cannot use this endpoint.', [])
@@ -502,7 +500,7 @@ class TestPassengerPay(StormxSystemVerification):
             phone_numbers=['+12223333']
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         passenger = resp_json['data'][0]
@@ -511,7 +509,7 @@ class TestPassengerPay(StormxSystemVerification):
         self.assertEqual(passenger['airline_pay'], False)
         self._test_passenger_notifications(passenger['notifications'], ['test@blackhole.tvlinc.com'], ['+12223333'], 1, 1, 0, 0, False, False, 2)
 
-        decline_resp = requests.put(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/decline', headers=headers)
+        decline_resp = http_client.put(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/decline', headers=headers)
         self.assertEqual(decline_resp.status_code, 400)
         decline_resp_json = decline_resp.json()
         self._validate_error_message(decline_resp_json, 400, 'Bad Request', 'PASSENGER_CANNOT_DECLINE', 'Passenger pay passengers cannot use this endpoint.', [])
@@ -533,7 +531,7 @@ class TestPassengerPay(StormxSystemVerification):
             phone_numbers=['+12223333']
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         passenger = resp_json['data'][0]
@@ -542,7 +540,7 @@ class TestPassengerPay(StormxSystemVerification):
         self.assertEqual(passenger['airline_pay'], False)
         self._test_passenger_notifications(passenger['notifications'], ['test@blackhole.tvlinc.com'], ['+12223333'], 1, 1, 0, 0, False, False, 2)
 
-        decline_resp = requests.put(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel', headers=headers)
+        decline_resp = http_client.put(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/cancel', headers=headers)
         self.assertEqual(decline_resp.status_code, 400)
         decline_resp_json = decline_resp.json()
         self._validate_error_message(decline_resp_json, 400, 'Bad Request', 'PASSENGER_CANNOT_CANCEL', 'Passenger pay passengers cannot use this endpoint.', [])
@@ -566,7 +564,7 @@ class TestPassengerPay(StormxSystemVerification):
             phone_numbers=['+12223333']
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         passenger = resp_json['data'][0]
@@ -580,13 +578,13 @@ class TestPassengerPay(StormxSystemVerification):
             'email': 'test@blackhole.tvlinc.com'
         }
 
-        notify_resp = requests.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
+        notify_resp = http_client.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
         self.assertEqual(notify_resp.status_code, 400)
         notify_json = notify_resp.json()
         self._validate_error_message(notify_json, 400, 'Bad Request', 'CANNOT_NOTIFY', 'Passenger has no passenger pay url.', [])
 
         # get full state and validate offer_url is None (waiting for async job)
-        full_state_resp = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         self.assertEqual(full_state_resp_json['data']['passenger']['context_id'], passenger['context_id'])
@@ -595,11 +593,14 @@ class TestPassengerPay(StormxSystemVerification):
         self.assertEqual(full_state_resp_json['data']['passenger']['airline_pay'], False)
         self.assertIsNone(full_state_resp_json['data']['passenger']['offer_url'])
 
-        # sleep for 2 minutes to wait for room storm to process our request and for our internal queue process to run
-        sleep(120)
+        # wait for room storm to process our request and for our internal queue process to run
+        self.wait_for_passenger_full_state(
+            customer, passenger['context_id'],
+            lambda full_state: full_state['passenger']['offer_url'] is not None and
+            all(notification['sent_date'] for notification in full_state['passenger']['notifications']))
 
         # get full state and validate offer_url is not None (async job should be done)
-        full_state_resp = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         self.assertEqual(full_state_resp_json['data']['passenger']['context_id'], passenger['context_id'])
@@ -616,13 +617,13 @@ class TestPassengerPay(StormxSystemVerification):
             'email': 'test@blackhole.tvlinc.com'
         }
 
-        notify_resp = requests.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
+        notify_resp = http_client.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
         self.assertEqual(notify_resp.status_code, 200)
         notify_json = notify_resp.json()['data']
         self._test_passenger_notifications([notify_json], ['test@blackhole.tvlinc.com'], [], 1, 0, 0, 0, False, False, 1)
 
         # validate notification is now on full state and all are sent
-        full_state_resp = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         self.assertEqual(full_state_resp_json['data']['passenger']['context_id'], passenger['context_id'])
@@ -647,7 +648,7 @@ class TestPassengerPay(StormxSystemVerification):
             notify=False
         ))
 
-        resp = requests.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
+        resp = http_client.post(url=self._api_host + '/api/v1/passenger', headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         resp_json = resp.json()
         passenger = resp_json['data'][0]
@@ -661,13 +662,13 @@ class TestPassengerPay(StormxSystemVerification):
             'email': 'test@blackhole.tvlinc.com'
         }
 
-        notify_resp = requests.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
+        notify_resp = http_client.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
         self.assertEqual(notify_resp.status_code, 400)
         notify_json = notify_resp.json()
         self._validate_error_message(notify_json, 400, 'Bad Request', 'CANNOT_NOTIFY', 'Passenger has no passenger pay url.', [])
 
         # get full state and validate offer_url is None (waiting for async job)
-        full_state_resp = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         self.assertEqual(full_state_resp_json['data']['passenger']['context_id'], passenger['context_id'])
@@ -677,11 +678,13 @@ class TestPassengerPay(StormxSystemVerification):
         self.assertIsNone(full_state_resp_json['data']['passenger']['offer_url'])
         self.assertEqual(len(full_state_resp_json['data']['passenger']['notifications']), 0)
 
-        # sleep for 2 minutes to wait for room storm to process our request and for our internal queue process to run
-        sleep(120)
+        # wait for room storm to process our request and for our internal queue process to run
+        self.wait_for_passenger_full_state(
+            customer, passenger['context_id'],
+            lambda full_state: full_state['passenger']['offer_url'] is not None)
 
         # get full state and validate offer_url is not None (async job should be done)
-        full_state_resp = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         self.assertEqual(full_state_resp_json['data']['passenger']['context_id'], passenger['context_id'])
@@ -696,13 +699,13 @@ class TestPassengerPay(StormxSystemVerification):
             'email': 'test@blackhole.tvlinc.com'
         }
 
-        notify_resp = requests.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
+        notify_resp = http_client.post(url=self._api_host + '/api/v1/passenger/' + passenger['context_id'] + '/notifications', headers=headers, json=payload)
         self.assertEqual(notify_resp.status_code, 200)
         notify_json = notify_resp.json()['data']
         self._test_passenger_notifications([notify_json], ['test@blackhole.tvlinc.com'], [], 1, 0, 0, 0, False, False, 1)
 
         # validate notification is now on full state
-        full_state_resp = requests.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
+        full_state_resp = http_client.get(url=passenger_url + '/' + passenger['context_id'] + '/state', headers=headers)
         self.assertEqual(full_state_resp.status_code, 200)
         full_state_resp_json = full_state_resp.json()
         self.assertEqual(full_state_resp_json['data']['passenger']['context_id'], passenger['context_id'])
@@ -730,7 +733,7 @@ class TestPassengerPay(StormxSystemVerification):
             phone_numbers=['+12223333']
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         pax_pay_passenger = resp.json()['data'][0]
         self.assertIsNone(pax_pay_passenger['offer_url'])
@@ -745,7 +748,7 @@ class TestPassengerPay(StormxSystemVerification):
             pax_record_locator=pax_pay_passenger['pax_record_locator']
         ))
 
-        resp = requests.post(url=passenger_url, headers=headers, json=passengers_payload)
+        resp = http_client.post(url=passenger_url, headers=headers, json=passengers_payload)
         self.assertEqual(resp.status_code, 201)
         airline_pay_passenger = resp.json()['data'][0]
 
@@ -753,8 +756,16 @@ class TestPassengerPay(StormxSystemVerification):
             pax_record_locator=pax_pay_passenger['pax_record_locator']
         )
 
-        sleep(60)  # sleep for 60 seconds to ensure async pax pay process is complete
-        pnr_search = requests.get(url=pnr_url, headers=headers, params=query_params)
+        # wait for the async pax pay process to complete
+        def pax_pay_offer_url_is_set():
+            response = http_client.get(url=pnr_url, headers=headers, params=query_params)
+            self.assertEqual(response.status_code, 200)  # an error fails the test now, only `offer_url` is awaited.
+            return any(
+                passenger['context_id'] == pax_pay_passenger['context_id'] and passenger['offer_url']
+                for passenger in response.json()['data'])
+
+        wait_until(pax_pay_offer_url_is_set, timeout=120, description='passenger pay offer url')
+        pnr_search = http_client.get(url=pnr_url, headers=headers, params=query_params)
         self.assertEqual(pnr_search.status_code, 200)
         pnr_search_json = pnr_search.json()
         self.assertEqual(len(pnr_search_json['data']), 2)
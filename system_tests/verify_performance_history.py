@@ -0,0 +1,121 @@
+"""
+Offline checks of the regression detection of `performance_history.py` (no StormX environment needed):
+
+    python -m unittest verify_performance_history
+
+The expected U statistics and p values are the ones of
+`scipy.stats.mannwhitneyu(candidate, baseline, alternative='greater', method='asymptotic')`.
+"""
+import unittest
+
+from performance_history import SYSTEM_TESTS_KIND, PerformanceHistory, mann_whitney_u
+
+
+class TestMannWhitneyU(unittest.TestCase):
+    """
+    Verify `mann_whitney_u()` against known U statistics and p values.
+    """
+
+    def assert_mann_whitney_u(self, baseline, candidate, expected_u_statistic, expected_p_value):
+        u_statistic, p_value = mann_whitney_u(baseline, candidate)
+        self.assertEqual(u_statistic, expected_u_statistic)
+        self.assertAlmostEqual(p_value, expected_p_value, places=12)
+
+    def test_mann_whitney_u__no_ties(self):
+        self.assert_mann_whitney_u({10: 1, 12: 1, 14: 1, 16: 1, 18: 1}, {13: 1, 15: 1, 17: 1, 19: 1, 21: 1},
+                                   19.0, 0.10503752039332925)
+
+    def test_mann_whitney_u__ties(self):
+        """
+        baseline [1, 2, 2, 3, 3, 3], candidate [2, 3, 3, 4, 4, 5]: tied values share their average rank.
+        """
+        self.assert_mann_whitney_u({1: 1, 2: 2, 3: 3}, {2: 1, 3: 2, 4: 2, 5: 1},
+                                   29.0, 0.039201467266633955)
+
+    def test_mann_whitney_u__weighted_values(self):
+        """
+        {value: count} samples are the same as the value repeated count times.
+        """
+        self.assert_mann_whitney_u({100: 3, 120: 2}, {110: 2, 120: 3, 150: 1},
+                                   23.0, 0.07291270699197411)
+
+    def test_mann_whitney_u__smaller_candidate(self):
+        self.assert_mann_whitney_u({5: 1, 6: 1, 7: 1, 8: 1}, {1: 1, 2: 1, 3: 1, 4: 1},
+                                   0.0, 0.9929310152720443)
+
+    def test_mann_whitney_u__empty_samples(self):
+        self.assertEqual(mann_whitney_u({}, {1: 3}), (0.0, 1.0))
+        self.assertEqual(mann_whitney_u({1: 3}, {}), (0.0, 1.0))
+
+    def test_mann_whitney_u__all_values_tied(self):
+        self.assertEqual(mann_whitney_u({7: 4}, {7: 5}), (10.0, 1.0))
+
+
+class TestCompareRevisions(unittest.TestCase):
+    """
+    Verify that `PerformanceHistory.compare_revisions()` only flags significant regressions, of at least
+    `min_ratio`, with at least `min_samples` on both sides.
+    """
+
+    def setUp(self):
+        self.history = PerformanceHistory(':memory:')
+        self.addCleanup(self.history.close)
+        self.history.record_run('staging', SYSTEM_TESTS_KIND, {
+            'endpoint: slower': list(range(100, 110)),
+            'endpoint: drift': {100: 500, 101: 500},
+            'endpoint: same': [100, 101, 102, 103, 104],
+            'endpoint: removed': [100, 101, 102],
+        }, revision='baseline')
+        self.history.record_run('staging', SYSTEM_TESTS_KIND, {
+            'endpoint: slower': list(range(150, 160)),
+            'endpoint: drift': {103: 500, 104: 500},
+            'endpoint: same': [100, 101, 102, 103, 104],
+        }, revision='candidate')
+
+    def comparisons_by_metric(self, **options):
+        return {comparison.metric: comparison
+                for comparison in self.history.compare_revisions('staging', SYSTEM_TESTS_KIND, 'candidate', **options)}
+
+    def test_compare_revisions__flags_significant_regressions(self):
+        comparisons = self.history.compare_revisions('staging', SYSTEM_TESTS_KIND, 'candidate')
+
+        self.assertEqual([comparison.metric for comparison in comparisons],
+                         ['endpoint: slower', 'endpoint: drift', 'endpoint: same'])
+        slower = comparisons[0]
+        self.assertTrue(slower.regression)
+        self.assertEqual((slower.baseline_count, slower.candidate_count), (10, 10))
+        self.assertEqual((slower.baseline_median, slower.candidate_median), (104, 154))
+        self.assertLess(slower.p_value, 0.01)
+        self.assertFalse(comparisons[2].regression)
+        self.assertEqual(comparisons[2].ratio, 1.0)
+
+    def test_compare_revisions__min_ratio(self):
+        """
+        a significant drift of 3% is not a regression, unless `min_ratio` allows it.
+        """
+        drift = self.comparisons_by_metric()['endpoint: drift']
+        self.assertLess(drift.p_value, 1e-100)
+        self.assertAlmostEqual(drift.ratio, 103 / 100.0)
+        self.assertFalse(drift.regression)
+
+        self.assertTrue(self.comparisons_by_metric(min_ratio=1.02)['endpoint: drift'].regression)
+        self.assertFalse(self.comparisons_by_metric(min_ratio=1.6)['endpoint: slower'].regression)
+
+    def test_compare_revisions__min_samples(self):
+        self.assertTrue(self.comparisons_by_metric(min_samples=10)['endpoint: slower'].regression)
+        self.assertFalse(self.comparisons_by_metric(min_samples=11)['endpoint: slower'].regression)
+
+    def test_compare_revisions__alpha(self):
+        self.assertFalse(self.comparisons_by_metric(alpha=1e-10)['endpoint: slower'].regression)
+
+    def test_compare_revisions__pools_the_runs_of_a_revision(self):
+        self.history.record_run('staging', SYSTEM_TESTS_KIND, {'endpoint: slower': list(range(150, 160))},
+                                revision='candidate')
+
+        slower = self.comparisons_by_metric(baseline_revision='baseline')['endpoint: slower']
+        self.assertEqual((slower.baseline_count, slower.candidate_count), (10, 20))
+        self.assertTrue(slower.regression)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import datetime
 import uuid
 
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import (
     StormxSystemVerification,
@@ -24,7 +24,7 @@ class TestStormxUI(StormxSystemVerification):
         """
         url = self._php_host + '/admin/index.php'
         headers = self._generate_stormx_php_headers()
-        response = requests.get(url, headers=headers, cookies=self._support_cookies)
+        response = http_client.get(url, headers=headers, cookies=self._support_cookies)
 
         self.assertIn('travellianceApp', response.text)
         self.assertNotIn('ERROR', response.text)
@@ -40,10 +40,10 @@ class TestStormxUI(StormxSystemVerification):
         url = self._php_host + '/admin/vouchers.php'
         headers = self._generate_stormx_php_headers()
 
-        response = requests.get(url, headers=headers, cookies=self._support_cookies)
+        response = http_client.get(url, headers=headers, cookies=self._support_cookies)
         self.assertIn('<title>Vouchers | Travelliance</title>', response.text)
 
-        response = requests.get(url, headers=headers, cookies={})
+        response = http_client.get(url, headers=headers, cookies={})
         self.assertIn('<title>Login | Travelliance</title>', response.text)
 
     def test_zero_rate_availability(self):
@@ -2098,10 +2098,10 @@ class TestStormxUI(StormxSystemVerification):
 
     def test_invalid_url_response(self):
         url = self._php_host + '/asdf/1234'
-        response = requests.get(url, allow_redirects=False)
+        response = http_client.get(url, allow_redirects=False)
         self.assertEqual(response.status_code, 404)
 
     def test_forbidden_url_response(self):
         url = self._php_host + '/admin/app/'
-        response = requests.get(url, allow_redirects=False)
+        response = http_client.get(url, allow_redirects=False)
         self.assertEqual(response.status_code, 403)
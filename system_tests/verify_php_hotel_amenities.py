@@ -1,7 +1,7 @@
 """This class contains unit tests for amenities and hotel amenities"""
 
 import uuid
-import requests
+from stormx_http import http_client
 import faker
 
 from stormx_verification_framework import (
@@ -819,7 +819,7 @@ class TestPhpAmenities(StormxSystemVerification):
         self.add_hotel_availability(hotel_id, 294, event_date, ap_block_type=1, block_price='150.00',
                                     blocks=5, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
 
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
@@ -899,7 +899,7 @@ class TestPhpAmenities(StormxSystemVerification):
         self.add_hotel_availability(hotel_id, 294, event_date, ap_block_type=1,
                                     block_price='150.00', blocks=5, pay_type='0')
 
-        hotel_response = requests.get(hotel_url, headers=headers)
+        hotel_response = http_client.get(hotel_url, headers=headers)
 
         self.assertEqual(hotel_response.status_code, 200)
         hotel_response_json = hotel_response.json()
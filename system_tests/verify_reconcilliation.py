@@ -2,7 +2,7 @@
 import json
 from decimal import Decimal
 
-import requests
+from stormx_http import http_client
 
 
 from stormx_verification_framework import StormxSystemVerification, display_response
@@ -13,8 +13,6 @@ class TestReconcilliation(StormxSystemVerification):
     Verify StormX reconciliation functionality.
     """
 
-    selected_environment_name = None
-
     @classmethod
     def setUpClass(cls):
         super(TestReconcilliation, cls).setUpClass()
@@ -51,7 +49,7 @@ class TestReconcilliation(StormxSystemVerification):
             hotel_rate=100
         )
         airline_headers = self._generate_airline_headers(customer)
-        booking_response = requests.post(hotel_url, headers=airline_headers, json=booking_payload)
+        booking_response = http_client.post(hotel_url, headers=airline_headers, json=booking_payload)
         check_in_key = booking_response.json()['data']['hotel_voucher']['hotel_key']
 
 
@@ -61,7 +59,7 @@ class TestReconcilliation(StormxSystemVerification):
             check_in_key=check_in_key
         )
         voucher_hotel_unlock_url = self._api_host + '/api/v1/tvl/hotel_voucher_unlock'
-        resp = requests.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
+        resp = http_client.post(url=voucher_hotel_unlock_url, headers=stormx_user_headers_good, json=unlock_payload)
         self.assertEqual(resp.status_code, 200)
         cc_json = resp.json()
         self.assertEqual(cc_json['meta']['error_code'], '')
@@ -94,7 +92,7 @@ class TestReconcilliation(StormxSystemVerification):
             ]
         )
         # visit offer link and gather meal cards.
-        resp = requests.get(url=passengers[0]['offer_url'])
+        resp = http_client.get(url=passengers[0]['offer_url'])
         embedded_json = self._get_landing_page_embedded_json(resp)
         meal_cards = []
         for passenger in embedded_json['confirmation']['passengers']:
@@ -28,7 +28,7 @@ class TestSystemPorts(StormxSystemVerification):
         cls.user_list = cls.create_airline_users_with_different_roles(cls.PORT_ID,
                                                                       cls.AIRLINE_ID)
         cls.user_list.append({'username': cls.SUPPORT_USERNAME,
-                              'cookies': cls.login_to_stormx(cls.SUPPORT_USERNAME,
+                              'cookies': cls.login_to_stormx_cached(cls.SUPPORT_USERNAME,
                                                              cls.SUPPORT_USERPASSWORD)})
 
     def test_ports_by_name_or_prefix(self):
@@ -1,6 +1,6 @@
 import datetime
 
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import (
     StormxSystemVerification,
@@ -11,7 +11,6 @@ class TestTaxes(StormxSystemVerification):
     """
     Verify that tax-related features of the API are functioning properly.
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
@@ -40,7 +39,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '14.35'
         expected_total_amount = '104.34'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -69,7 +68,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '28.71'
         expected_total_amount = '208.69'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -99,7 +98,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '28.71'
         expected_total_amount = '208.69'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -128,7 +127,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '15.43'
         expected_total_amount = '85.42'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -157,7 +156,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '30.85'
         expected_total_amount = '170.83'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -187,7 +186,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '30.85'
         expected_total_amount = '170.83'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -217,7 +216,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '35.26'
         expected_total_amount = '195.24'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -246,7 +245,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '22.60'
         expected_total_amount = '132.59'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -275,7 +274,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '45.20'
         expected_total_amount = '265.18'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -305,7 +304,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '45.20'
         expected_total_amount = '265.18'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -335,7 +334,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '38.80'
         expected_total_amount = '218.79'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -364,7 +363,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '8.08'
         expected_total_amount = '57.08'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -393,7 +392,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '31.28'
         expected_total_amount = '251.26'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -423,7 +422,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '31.28'
         expected_total_amount = '251.26'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -453,7 +452,7 @@ class TestTaxes(StormxSystemVerification):
 
         expected_tax = '23.71'
         expected_total_amount = '182.70'
-        resp = requests.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
+        resp = http_client.post(url=hotel_url, json=pr_booking_payload, headers=purple_rain_headers)
         self.assertEqual(resp.status_code, 200)
         resp_json = resp.json()
         self.assertEqual(resp_json['data']['hotel_voucher']['tax'], expected_tax)
@@ -481,7 +480,7 @@ class TestTaxes(StormxSystemVerification):
         check_out_date = (event_date_sea_day2 + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=SEA&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=SEA&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_sea, hotel_ids)
 
@@ -497,7 +496,7 @@ class TestTaxes(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         used_rate_1 = False
@@ -542,7 +541,7 @@ class TestTaxes(StormxSystemVerification):
         check_out_date = (event_date_sea + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
 
         # validate hotel is in multi night search results
-        hotel_search_resp = requests.get(url=hotels_url + '?port=SEA&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
+        hotel_search_resp = http_client.get(url=hotels_url + '?port=SEA&room_count=' + str(room_count) + '&number_of_nights=' + str(number_of_nights), headers=headers).json()
         hotel_ids = [hotel['hotel_id'] for hotel in hotel_search_resp['data']]
         self.assertIn(hotel_id_sea, hotel_ids)
 
@@ -558,7 +557,7 @@ class TestTaxes(StormxSystemVerification):
         )
 
         # book multi night stay
-        hotel_booking_resp = requests.post(url=hotels_url, headers=headers, json=booking_payload)
+        hotel_booking_resp = http_client.post(url=hotels_url, headers=headers, json=booking_payload)
         self.assertEqual(hotel_booking_resp.status_code, 200)
 
         # validate multi night voucher
@@ -36,7 +36,6 @@ class TestTvlInternalAPI(StormxSystemVerification):
     """
     Verify StormX internal API endpoints (i.e., /api/v1/tvl/....)
     """
-    selected_environment_name = None
 
     @classmethod
     def setUpClass(cls):
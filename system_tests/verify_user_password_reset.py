@@ -3,7 +3,7 @@
 import hashlib
 import faker
 import unittest
-import requests
+from stormx_http import http_client
 
 from stormx_verification_framework import StormxSystemVerification
 
@@ -120,7 +120,7 @@ class UserPasswordResetTestCase(StormxSystemVerification):
         data = {
             'username': username,
         }
-        response = requests.post(url, headers=self._generate_stormx_php_headers(), cookies=self._support_cookies,
+        response = http_client.post(url, headers=self._generate_stormx_php_headers(), cookies=self._support_cookies,
                                  data=data)
         return response.json()
 
@@ -141,6 +141,6 @@ class UserPasswordResetTestCase(StormxSystemVerification):
             'cPwd': confirm_new_password,
             'mode': 'reset'
         }
-        response = requests.post(url, headers=self._generate_stormx_php_headers(),
+        response = http_client.post(url, headers=self._generate_stormx_php_headers(),
                                  data=data)
         return response.json()